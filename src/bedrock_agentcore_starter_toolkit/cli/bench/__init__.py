@@ -0,0 +1 @@
+"""BedrockAgentCore Starter Toolkit cli bench package."""
@@ -0,0 +1,194 @@
+"""Bedrock AgentCore Bench CLI - Command line interface for load-testing agents."""
+
+import json
+import os
+from pathlib import Path
+from typing import List, Optional
+
+import typer
+from rich.table import Table
+
+from ...operations.runtime import BenchmarkResult, BenchStage, parse_bench_stage, run_invoke_benchmark
+from ...operations.runtime.bench import LOCAL_AGENT_PORT
+from ...operations.runtime.stub_agent import STUB_AGENT_PORT, StubAgent
+from ...utils.runtime.config import load_config
+from ..common import _handle_error, console
+from ..runtime.commands import _parse_custom_headers, _show_configuration_not_found_panel
+
+# Create a Typer app for bench commands
+bench_app = typer.Typer(help="Benchmark Bedrock AgentCore agents")
+
+
+@bench_app.command("invoke")
+def invoke(
+    payloads_file: str = typer.Argument(..., help="JSONL file with one JSON payload per line"),
+    agent: Optional[str] = typer.Option(
+        None, "--agent", "-a", help="Agent name (use 'agentcore configure list' to see available agents)"
+    ),
+    requests: Optional[int] = typer.Option(
+        None, "--requests", "-n", help="Number of requests to send (default: one per payload)"
+    ),
+    concurrency: int = typer.Option(1, "--concurrency", "-c", help="Maximum requests in flight"),
+    rate: Optional[float] = typer.Option(None, "--rate", "-r", help="Requests started per second (default: no limit)"),
+    stages: Optional[List[str]] = typer.Option(  # noqa: B008
+        None,
+        "--stage",
+        help="Timed stage SECONDS:CONCURRENCY[:RATE], repeatable to build a schedule "
+        "(replaces --requests, --concurrency and --rate)",
+    ),
+    sessions: Optional[int] = typer.Option(
+        None, "--sessions", "-s", help="Runtime sessions to spread requests over (default: the concurrency)"
+    ),
+    bearer_token: Optional[str] = typer.Option(
+        None, "--bearer-token", "-bt", help="Bearer token for OAuth authentication"
+    ),
+    local_mode: bool = typer.Option(False, "--local", "-l", help="Benchmark the agent running in a local container"),
+    port: int = typer.Option(LOCAL_AGENT_PORT, "--port", "-p", help="Port of the local container (with --local)"),
+    endpoint: Optional[str] = typer.Option(
+        None, "--endpoint", help="Benchmark a stand-in agent at this URL instead (e.g. 'agentcore bench stub')"
+    ),
+    user_id: Optional[str] = typer.Option(None, "--user-id", "-u", help="User id for authorization flows"),
+    headers: Optional[str] = typer.Option(
+        None,
+        "--headers",
+        help="Custom headers (format: 'Header1:value,Header2:value2'). "
+        "Headers will be auto-prefixed with 'X-Amzn-Bedrock-AgentCore-Runtime-Custom-' if not already present.",
+    ),
+    output: Optional[str] = typer.Option(None, "--output", "-o", help="Write the results as JSON to this file"),
+):
+    """Load-test agent invocations and report latency, errors and throughput.
+
+    Payloads are sent round-robin from the JSONL file, spread over runtime sessions that
+    each handle one request at a time.
+
+    Examples:
+        # 200 requests, 10 at a time
+        agentcore bench invoke payloads.jsonl -n 200 -c 10
+
+        # Ramp up: 30s at 4 concurrent requests, then 60s at 16 limited to 20 requests/s
+        agentcore bench invoke payloads.jsonl --stage 30:4 --stage 60:16:20 -o results.json
+
+        # Offline, against a stand-in agent
+        agentcore bench stub --port 8090 &
+        agentcore bench invoke payloads.jsonl -n 100 -c 8 --endpoint http://127.0.0.1:8090
+    """
+    config_path = Path.cwd() / ".bedrock_agentcore.yaml"
+    payloads_path = Path(payloads_file)
+    if not payloads_path.is_file():
+        _handle_error(f"Payloads file not found: {payloads_file}")
+
+    try:
+        if stages:
+            schedule = [parse_bench_stage(spec) for spec in stages]
+        else:
+            schedule = [
+                BenchStage(concurrency=concurrency, rate=rate, requests=requests or _count_payloads(payloads_path))
+            ]
+
+        custom_headers = _parse_custom_headers(headers) if headers else {}
+
+        final_bearer_token = None
+        if not endpoint:
+            # As with invoke, a bearer token is only used for agents with OAuth configured
+            agent_config = load_config(config_path).get_agent_config(agent)
+            if agent_config.authorizer_configuration is not None:
+                final_bearer_token = bearer_token or os.getenv("BEDROCK_AGENTCORE_BEARER_TOKEN")
+                if not final_bearer_token:
+                    console.print("[yellow]Warning: OAuth is configured but no bearer token provided[/yellow]")
+
+        with console.status("[cyan]Running benchmark...[/cyan]"):
+            result = run_invoke_benchmark(
+                payloads_file=payloads_path,
+                config_path=None if endpoint else config_path,
+                agent_name=agent,
+                stages=schedule,
+                sessions=sessions,
+                bearer_token=final_bearer_token,
+                user_id=user_id,
+                local_mode=local_mode,
+                local_port=port,
+                endpoint=endpoint,
+                custom_headers=custom_headers,
+            )
+
+        _print_benchmark(result)
+        if output:
+            path = Path(output)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(result.model_dump(), indent=2) + "\n", encoding="utf-8")
+            console.print(f"[dim]Results written to {path}[/dim]")
+
+    except FileNotFoundError:
+        _show_configuration_not_found_panel()
+        raise typer.Exit(1) from None
+    except ValueError as e:
+        _handle_error(str(e), e)
+    except Exception as e:
+        _handle_error(f"Benchmark failed: {e}", e)
+
+
+@bench_app.command("stub")
+def stub(
+    port: int = typer.Option(STUB_AGENT_PORT, "--port", "-p", help="Port to listen on"),
+    chunks: int = typer.Option(20, "--chunks", help="Events streamed per invocation"),
+    first_chunk_delay: float = typer.Option(0.1, "--first-chunk-delay", help="Seconds before the first event"),
+    chunk_delay: float = typer.Option(0.02, "--chunk-delay", help="Seconds between events"),
+):
+    """Serve a stand-in agent for offline benchmarking.
+
+    The stand-in speaks the agent container protocol (/invocations, /ping) and streams
+    synthetic events with fixed pacing, so the client side of a benchmark can be measured
+    without AWS access or a real agent.
+    """
+    console.print(f"[cyan]Stand-in agent listening on http://127.0.0.1:{port}[/cyan] (Ctrl+C to stop)")
+    StubAgent(chunks=chunks, first_chunk_delay=first_chunk_delay, chunk_delay=chunk_delay).run(port=port)
+
+
+def _count_payloads(payloads_file: Path) -> int:
+    with open(payloads_file, encoding="utf-8") as f:
+        return sum(1 for line in f if line.strip())
+
+
+def _format_seconds(seconds: float) -> str:
+    return f"{seconds * 1000:.0f}ms" if seconds < 10 else f"{seconds:.1f}s"
+
+
+def _print_benchmark(result: BenchmarkResult) -> None:
+    """Show the latency distributions, throughput and errors of a benchmark."""
+    table = Table(title=f"Benchmark: {result.target} ({result.mode})")
+    table.add_column("Metric", style="cyan")
+    for column in ("min", "mean", "p50", "p90", "p95", "p99", "max"):
+        table.add_column(column, justify="right")
+    for label, stats in (("Time to first byte", result.ttfb), ("Latency", result.latency)):
+        table.add_row(
+            label,
+            *(_format_seconds(getattr(stats, column)) for column in ("min", "mean", "p50", "p90", "p95", "p99", "max")),
+        )
+    console.print(table)
+
+    if len(result.stages) > 1:
+        stages = Table(title="Stages")
+        for column in ("Stage", "Concurrency", "Rate", "Requests", "Failed", "Req/s", "p50", "p99"):
+            stages.add_column(column, justify="right")
+        for number, stage in enumerate(result.stages, 1):
+            stages.add_row(
+                str(number),
+                str(stage.concurrency),
+                f"{stage.rate:g}/s" if stage.rate else "-",
+                str(stage.requests),
+                str(stage.failed),
+                f"{stage.requests_per_second:.1f}",
+                _format_seconds(stage.latency.p50),
+                _format_seconds(stage.latency.p99),
+            )
+        console.print(stages)
+
+    error_style = "red" if result.failed else "green"
+    console.print(
+        f"Requests: {result.requests} in {result.duration_seconds:.1f}s over {result.sessions} sessions "
+        f"([{error_style}]{result.failed} failed, {result.error_rate:.1%}[/{error_style}])\n"
+        f"Throughput: {result.requests_per_second:.1f} req/s, {result.events_per_second:.1f} events/s "
+        f"({result.events} streamed events)"
+    )
+    for error, count in sorted(result.errors.items(), key=lambda item: -item[1]):
+        console.print(f"  [red]{error}[/red]: {count}")
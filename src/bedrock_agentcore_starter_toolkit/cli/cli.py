@@ -2,6 +2,7 @@
 
 import typer
 
+from ..cli.bench.commands import bench_app
 from ..cli.gateway.commands import (
     create_mcp_gateway,
     create_mcp_gateway_target,
@@ -15,8 +16,10 @@ from .runtime.commands import (
     destroy,
     invoke,
     launch,
+    rollback,
     status,
     stop_session,
+    wheelhouse,
 )
 
 app = typer.Typer(name="agentcore", help="BedrockAgentCore CLI", add_completion=False, rich_markup_mode="rich")
@@ -30,7 +33,9 @@ app.command("status")(status)
 app.command("launch")(launch)
 app.command("import-agent")(import_agent)
 app.command("destroy")(destroy)
+app.command("rollback")(rollback)
 app.command("stop-session")(stop_session)
+app.command("wheelhouse")(wheelhouse)
 app.add_typer(configure_app)
 
 # gateway
@@ -41,6 +46,9 @@ app.add_typer(gateway_app, name="gateway")
 # memory
 app.add_typer(memory_app, name="memory")
 
+# bench
+app.add_typer(bench_app, name="bench")
+
 # import-agent
 app.command("import-agent")(import_agent)
 
@@ -12,9 +12,11 @@ from prompt_toolkit import prompt
 from prompt_toolkit.completion import PathCompleter
 from rich.panel import Panel
 from rich.syntax import Syntax
+from rich.table import Table
 
 from ...operations.identity.oauth2_callback_server import start_oauth2_callback_server
 from ...operations.runtime import (
+    build_agent_wheelhouse,
     configure_bedrock_agentcore,
     destroy_bedrock_agentcore,
     detect_entrypoint,
@@ -23,10 +25,15 @@ from ...operations.runtime import (
     get_status,
     infer_agent_name,
     invoke_bedrock_agentcore,
+    launch_all_bedrock_agentcore,
     launch_bedrock_agentcore,
+    rollback_bedrock_agentcore,
     validate_agent_name,
 )
+from ...operations.runtime.launch_all import DEFAULT_LAUNCH_WORKERS
+from ...operations.runtime.models import LaunchProfile
 from ...utils.runtime.config import load_config
+from ...utils.runtime.container import ContainerRuntime
 from ...utils.runtime.logs import get_agent_log_paths, get_aws_tail_commands, get_genai_observability_url
 from ..common import _handle_error, _print_success, console
 from .configuration_manager import ConfigurationManager
@@ -304,6 +311,13 @@ def configure(
     runtime: Optional[str] = typer.Option(
         None, "--runtime", "-rt", help="Python runtime version for direct_code_deploy (e.g., PYTHON_3_10, PYTHON_3_11)"
     ),
+    dockerfile_template: str = typer.Option(
+        "standard",
+        "--dockerfile-template",
+        "-dft",
+        help="Dockerfile template for container deployments: standard, or multistage "
+        "(uv cache mounts, venv builder stage, slim runtime image with precompiled bytecode)",
+    ),
 ):
     """Configure a Bedrock AgentCore agent interactively or with parameters.
 
@@ -318,6 +332,11 @@ def configure(
     if protocol and protocol.upper() not in ["HTTP", "MCP", "A2A"]:
         _handle_error("Error: --protocol must be either HTTP or MCP or A2A")
 
+    if dockerfile_template not in ContainerRuntime.DOCKERFILE_TEMPLATES:
+        _handle_error(
+            f"Error: --dockerfile-template must be one of: {', '.join(ContainerRuntime.DOCKERFILE_TEMPLATES)}"
+        )
+
     # Validate VPC configuration
     vpc_subnets = None
     vpc_security_groups = None
@@ -756,6 +775,7 @@ def configure(
             max_lifetime=max_lifetime,
             deployment_type=deployment_type,
             runtime_type=runtime_type,
+            dockerfile_template=dockerfile_template,
         )
 
         # Prepare authorization info for summary
@@ -843,10 +863,140 @@ def configure(
         _handle_error(f"Configuration failed: {e}", e)
 
 
+def _parse_env_vars(envs: Optional[List[str]]) -> Optional[dict]:
+    """Parse KEY=VALUE environment variable options."""
+    if not envs:
+        return None
+    env_vars = {}
+    for env_var in envs:
+        if "=" not in env_var:
+            _handle_error(f"Invalid environment variable format: {env_var}. Use KEY=VALUE format.")
+        key, value = env_var.split("=", 1)
+        env_vars[key] = value
+    return env_vars
+
+
+def _print_launch_profile(profile: LaunchProfile) -> None:
+    """Show how long each launch step took; nested steps are indented under their parent."""
+    table = Table(title=f"Launch Timing ({profile.total_seconds:.1f}s total)")
+    table.add_column("Step", style="cyan")
+    table.add_column("Start", justify="right")
+    table.add_column("Duration", justify="right")
+    table.add_column("% of Launch", justify="right")
+    for step in profile.steps:
+        label = "  " * step.name.count("/") + step.name.rsplit("/", 1)[-1]
+        share = step.duration_seconds / profile.total_seconds * 100 if profile.total_seconds else 0.0
+        duration = f"{step.duration_seconds:.1f}s"
+        if step.failed:
+            label, duration = f"[red]{label}[/red]", f"[red]{duration} (failed)[/red]"
+        table.add_row(label, f"+{step.start_seconds:.1f}s", duration, f"{share:.0f}%")
+    console.print(table)
+    console.print("[dim]Steps that start before the previous one ends run concurrently.[/dim]")
+
+
+def _write_launch_profile(profile_out: str, data: dict) -> None:
+    """Write launch timing as JSON, e.g. for CI to collect."""
+    path = Path(profile_out)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+    console.print(f"[dim]Launch profile written to {path}[/dim]")
+
+
+def _launch_all_agents(
+    config_path: Path,
+    max_workers: int,
+    local_build: bool,
+    envs: Optional[List[str]],
+    auto_update_on_conflict: bool,
+    force_rebuild_deps: bool,
+    package_workers: Optional[int],
+    optimize_package: bool,
+    precompile_bytecode: bool,
+    profile_out: Optional[str] = None,
+) -> None:
+    """Launch every configured agent and show a summary of the outcomes."""
+    env_vars = _parse_env_vars(envs)
+
+    def report(agent_name: str, event: str, outcome) -> None:
+        if outcome is None:
+            console.print(f"[cyan]🚀 {agent_name}[/cyan] [dim]launching...[/dim]")
+        elif outcome.succeeded:
+            console.print(f"[green]✅ {agent_name}[/green] [dim]deployed in {outcome.duration_seconds:.0f}s[/dim]")
+        else:
+            console.print(f"[red]❌ {agent_name}[/red] [dim]failed after {outcome.duration_seconds:.0f}s[/dim]")
+
+    try:
+        project_config = load_config(config_path)
+        console.print(
+            f"[cyan]🚀 Launching {len(project_config.agents)} agents "
+            f"({min(max_workers, len(project_config.agents))} at a time)...[/cyan]\n"
+        )
+        result = launch_all_bedrock_agentcore(
+            config_path,
+            max_workers=max_workers,
+            use_codebuild=not local_build,
+            env_vars=env_vars,
+            auto_update_on_conflict=auto_update_on_conflict,
+            force_rebuild_deps=force_rebuild_deps,
+            package_workers=package_workers,
+            optimize_package=optimize_package,
+            precompile_bytecode=precompile_bytecode,
+            progress=report,
+            console=console,
+        )
+    except FileNotFoundError:
+        _handle_error(".bedrock_agentcore.yaml not found. Run 'agentcore configure --entrypoint <file>' first")
+    except ValueError as e:
+        _handle_error(str(e), e)
+
+    table = Table(title=f"Launch Results ({len(result.succeeded)}/{len(result.results)} succeeded)")
+    table.add_column("Agent", style="cyan")
+    table.add_column("Status")
+    table.add_column("Duration", justify="right")
+    table.add_column("Agent ARN / Error", overflow="fold")
+    for outcome in result.results:
+        duration = f"{outcome.duration_seconds:.0f}s"
+        if outcome.succeeded:
+            table.add_row(outcome.agent_name, "[green]deployed[/green]", duration, outcome.result.agent_arn)
+        else:
+            table.add_row(outcome.agent_name, "[red]failed[/red]", duration, f"[red]{outcome.error}[/red]")
+    console.print()
+    console.print(table)
+    console.print(f"[dim]Total time: {result.duration_seconds:.0f}s[/dim]")
+
+    if profile_out:
+        _write_launch_profile(
+            profile_out,
+            {
+                "total_seconds": round(result.duration_seconds, 3),
+                "max_workers": result.max_workers,
+                "agents": [
+                    outcome.result.profile.model_dump()
+                    if outcome.succeeded and outcome.result.profile
+                    else {"agent_name": outcome.agent_name, "error": outcome.error}
+                    for outcome in result.results
+                ],
+            },
+        )
+
+    if result.failed:
+        raise typer.Exit(1)
+
+
 def launch(
     agent: Optional[str] = typer.Option(
         None, "--agent", "-a", help="Agent name (use 'agentcore configure list' to see available agents)"
     ),
+    all_agents: bool = typer.Option(
+        False, "--all", help="Launch every agent in the project configuration concurrently (cloud modes only)"
+    ),
+    max_workers: int = typer.Option(
+        DEFAULT_LAUNCH_WORKERS,
+        "--max-workers",
+        "-mw",
+        min=1,
+        help="Maximum number of agents launched at the same time with --all",
+    ),
     local: bool = typer.Option(False, "--local", "-l", help="Run locally for development and testing"),
     local_build: bool = typer.Option(
         False,
@@ -866,9 +1016,36 @@ def launch(
         "-frd",
         help="Force rebuild of dependencies even if cached (direct_code_deploy deployments only)",
     ),
+    package_workers: Optional[int] = typer.Option(
+        None,
+        "--package-workers",
+        "-pw",
+        min=1,
+        help="Threads used to compress the deployment package, defaults to CPU count "
+        "(direct_code_deploy deployments only)",
+    ),
+    optimize_package: bool = typer.Option(
+        False,
+        "--optimize-package",
+        "-op",
+        help="Strip tests, type stubs, docs, bytecode, unused locales and debug symbols from dependencies "
+        "(direct_code_deploy deployments only)",
+    ),
+    precompile_bytecode: bool = typer.Option(
+        False,
+        "--precompile-bytecode",
+        "-pb",
+        help="Ship precompiled bytecode for the runtime's Python version to cut cold start time "
+        "(direct_code_deploy deployments only)",
+    ),
     envs: List[str] = typer.Option(  # noqa: B008
         None, "--env", "-env", help="Environment variables for agent (format: KEY=VALUE)"
     ),
+    profile_out: Optional[str] = typer.Option(
+        None,
+        "--profile-out",
+        help="Write the duration of each launch step to this JSON file (cloud modes only)",
+    ),
     code_build: bool = typer.Option(
         False,
         "--code-build",
@@ -896,6 +1073,10 @@ def launch(
        - requires Docker/Finch/Podman
        - Use when you need custom build control but want cloud deployment
 
+    📚 --all: Launch every agent of the project (CodeBuild or --local-build)
+       - Up to --max-workers agents are packaged, built and deployed at a time
+       - A failing agent does not stop the others
+
     MIGRATION GUIDE:
     - OLD: agentcore launch --code-build  →  NEW: agentcore launch
     - OLD: agentcore launch --local       →  NEW: agentcore launch --local (unchanged)
@@ -914,13 +1095,30 @@ def launch(
 
     config_path = Path.cwd() / ".bedrock_agentcore.yaml"
 
+    if all_agents:
+        if agent or local:
+            _handle_error("Error: --all cannot be used with --agent or --local")
+        _launch_all_agents(
+            config_path,
+            max_workers=max_workers,
+            local_build=local_build,
+            envs=envs,
+            auto_update_on_conflict=auto_update_on_conflict,
+            force_rebuild_deps=force_rebuild_deps,
+            package_workers=package_workers,
+            optimize_package=optimize_package,
+            precompile_bytecode=precompile_bytecode,
+            profile_out=profile_out,
+        )
+        return
+
     # Load config early to determine deployment type for proper messaging
     project_config = load_config(config_path)
     agent_config = project_config.get_agent_config(agent)
     deployment_type = agent_config.deployment_type
 
     # Validate deployment type compatibility early
-    if local_build or force_rebuild_deps:
+    if local_build or force_rebuild_deps or package_workers is not None or optimize_package or precompile_bytecode:
         if local_build and deployment_type == "direct_code_deploy":
             _handle_error(
                 "Error: --local-build is only supported for container deployment type.\n"
@@ -935,6 +1133,24 @@ def launch(
                 "Container deployments always rebuild dependencies."
             )
 
+        if package_workers is not None and deployment_type != "direct_code_deploy":
+            _handle_error(
+                "Error: --package-workers is only supported for direct_code_deploy deployment type.\n"
+                "Container deployments are packaged by the container build."
+            )
+
+        if optimize_package and deployment_type != "direct_code_deploy":
+            _handle_error(
+                "Error: --optimize-package is only supported for direct_code_deploy deployment type.\n"
+                "Container deployments are packaged by the container build."
+            )
+
+        if precompile_bytecode and deployment_type != "direct_code_deploy":
+            _handle_error(
+                "Error: --precompile-bytecode is only supported for direct_code_deploy deployment type.\n"
+                "Container deployments are packaged by the container build."
+            )
+
     try:
         # Show launch mode with enhanced migration guidance
         if local:
@@ -984,14 +1200,7 @@ def launch(
         # Use the operations module
         with console.status("[bold]Launching Bedrock AgentCore...[/bold]"):
             # Parse environment variables for local mode
-            env_vars = None
-            if envs:
-                env_vars = {}
-                for env_var in envs:
-                    if "=" not in env_var:
-                        _handle_error(f"Invalid environment variable format: {env_var}. Use KEY=VALUE format.")
-                    key, value = env_var.split("=", 1)
-                    env_vars[key] = value
+            env_vars = _parse_env_vars(envs)
 
             # Call the operation - CodeBuild is now default, unless --local-build is specified
             result = launch_bedrock_agentcore(
@@ -1003,6 +1212,9 @@ def launch(
                 auto_update_on_conflict=auto_update_on_conflict,
                 console=console,
                 force_rebuild_deps=force_rebuild_deps,
+                package_workers=package_workers,
+                optimize_package=optimize_package,
+                precompile_bytecode=precompile_bytecode,
             )
 
         # Handle result based on mode
@@ -1134,8 +1346,8 @@ def launch(
                 f"[bold]Agent Details:[/bold]\n"
                 f"Agent Name: [cyan]{agent_name}[/cyan]\n"
                 f"Agent ARN: [cyan]{result.agent_arn}[/cyan]\n"
-                f"ECR URI: [cyan]{result.ecr_uri}:latest[/cyan]\n"
-                f"CodeBuild ID: [dim]{result.codebuild_id}[/dim]\n\n"
+                f"Image: [cyan]{result.image_uri or f'{result.ecr_uri}:latest'}[/cyan]\n"
+                f"CodeBuild ID: [dim]{result.codebuild_id or 'skipped (source unchanged)'}[/dim]\n\n"
                 f"🚀 ARM64 container deployed to Bedrock AgentCore\n\n"
                 f"[bold]Next Steps:[/bold]\n"
                 f"   [cyan]agentcore status[/cyan]\n"
@@ -1179,7 +1391,7 @@ def launch(
                 f"[bold]Agent Details:[/bold]\n"
                 f"Agent Name: [cyan]{agent_name}[/cyan]\n"
                 f"Agent ARN: [cyan]{result.agent_arn}[/cyan]\n"
-                f"ECR URI: [cyan]{result.ecr_uri}[/cyan]\n\n"
+                f"Image: [cyan]{result.image_uri or result.ecr_uri}[/cyan]\n\n"
                 f"{icon} Container deployed to Bedrock AgentCore\n\n"
                 f"[bold]Next Steps:[/bold]\n"
                 f"   [cyan]agentcore status[/cyan]\n"
@@ -1206,6 +1418,12 @@ def launch(
                 )
             )
 
+        if result.mode not in ("local", "local_direct_code_deploy") and result.profile:
+            console.print()
+            _print_launch_profile(result.profile)
+            if profile_out:
+                _write_launch_profile(profile_out, result.profile.model_dump())
+
     except FileNotFoundError:
         _handle_error(".bedrock_agentcore.yaml not found. Run 'agentcore configure --entrypoint <file>' first")
     except ValueError as e:
@@ -1793,6 +2011,116 @@ def stop_session(
         raise typer.Exit(1) from e
 
 
+def rollback(
+    agent: Optional[str] = typer.Option(
+        None, "--agent", "-a", help="Agent name (use 'agentcore configure list' to see available agents)"
+    ),
+    image: Optional[str] = typer.Option(
+        None,
+        "--image",
+        "-i",
+        help="Image to deploy: a tag or digest in the agent's ECR repository, or a full repository@sha256 URI. "
+        "Defaults to the image deployed before the current one.",
+    ),
+):
+    """Roll a container agent back to a previously built image.
+
+    Launches deploy images by digest, so any earlier build can be redeployed
+    without rebuilding: only the agent runtime is updated.
+
+    Examples:
+        # Go back to the image deployed before the last launch
+        agentcore rollback
+
+        # Deploy a specific build
+        agentcore rollback --image src-4f2a9c1e0b7d
+        agentcore rollback --image sha256:3b1f...
+    """
+    config_path = Path.cwd() / ".bedrock_agentcore.yaml"
+
+    try:
+        result = rollback_bedrock_agentcore(config_path=config_path, agent_name=agent, image=image)
+
+        console.print(
+            Panel(
+                f"[green]Agent Rolled Back[/green]\n\n"
+                f"Agent Name: {result.agent_name}\n"
+                f"Agent ARN: [cyan]{result.agent_arn}[/cyan]\n"
+                f"Image: [cyan]{result.image_uri}[/cyan]\n"
+                f"Previous Image: [dim]{result.previous_image_uri or 'none'}[/dim]\n\n"
+                f"[dim]Run 'agentcore rollback' again to switch back to the previous image.[/dim]",
+                title="Rollback Complete",
+                border_style="bright_blue",
+            )
+        )
+
+    except FileNotFoundError:
+        _show_configuration_not_found_panel()
+        raise typer.Exit(1) from None
+    except ValueError as e:
+        _handle_error(str(e), e)
+    except Exception as e:
+        _handle_error(f"Rollback failed: {e}", e)
+
+
+def wheelhouse(
+    agent: Optional[str] = typer.Option(
+        None, "--agent", "-a", help="Agent name (use 'agentcore configure list' to see available agents)"
+    ),
+    requirements_file: Optional[str] = typer.Option(
+        None, "--requirements-file", "-rf", help="Dependency file to resolve (defaults to the detected one)"
+    ),
+    force: bool = typer.Option(False, "--force", help="Rebuild the wheelhouse even if it is up to date"),
+):
+    """Prebuild Linux ARM64 wheels for a container agent's dependencies.
+
+    Resolves the agent's requirements with uv and collects their wheels into a
+    wheelhouse/ directory of the build context, keyed by a hash of the lock. The
+    generated Dockerfile installs from it offline, so container builds do not hit
+    PyPI and always install the same versions.
+
+    Examples:
+        # Build (or refresh) the wheelhouse, then regenerate the Dockerfile to use it
+        agentcore wheelhouse
+        agentcore configure --entrypoint agent.py
+    """
+    config_path = Path.cwd() / ".bedrock_agentcore.yaml"
+
+    try:
+        result = build_agent_wheelhouse(
+            config_path=config_path, agent_name=agent, requirements_file=requirements_file, force=force
+        )
+
+        status_line = "Wheelhouse built" if result.rebuilt else "Wheelhouse already up to date"
+        hint = (
+            "[dim]The Dockerfile installs from the wheelhouse: run 'agentcore launch' to build with it.[/dim]"
+            if result.dockerfile_uses_wheelhouse
+            else "[yellow]Re-run 'agentcore configure' so the Dockerfile installs from the wheelhouse.[/yellow]"
+        )
+        console.print(
+            Panel(
+                f"[green]{status_line}[/green]\n\n"
+                f"Agent Name: {result.agent_name}\n"
+                f"Wheelhouse: [cyan]{get_relative_path(result.wheelhouse_path)}[/cyan]\n"
+                f"Wheels: {result.wheel_count} (Python {result.python_version}, Linux ARM64)\n"
+                f"Lock: [dim]{result.lock_hash[:12]}[/dim]\n\n"
+                f"{hint}",
+                title="Wheelhouse",
+                border_style="bright_blue",
+            )
+        )
+
+    except FileNotFoundError as e:
+        if config_path.exists():
+            _handle_error(str(e), e)
+        _show_configuration_not_found_panel()
+        raise typer.Exit(1) from None
+    except ValueError as e:
+        _handle_error(str(e), e)
+    except Exception as e:
+        _handle_error(f"Wheelhouse build failed: {e}", e)
+
+
 def destroy(
     agent: Optional[str] = typer.Option(
         None, "--agent", "-a", help="Agent name (use 'agentcore configure list' to see available agents)"
@@ -2,18 +2,27 @@
 
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, Iterator, List, Literal, Optional
 
 from ...operations.runtime import (
     configure_bedrock_agentcore,
     destroy_bedrock_agentcore,
     get_status,
     invoke_bedrock_agentcore,
+    launch_all_bedrock_agentcore,
     launch_bedrock_agentcore,
     stop_runtime_session,
+    stream_bedrock_agentcore,
     validate_agent_name,
 )
-from ...operations.runtime.models import ConfigureResult, DestroyResult, LaunchResult, StatusResult
+from ...operations.runtime.launch_all import DEFAULT_LAUNCH_WORKERS
+from ...operations.runtime.models import (
+    ConfigureResult,
+    DestroyResult,
+    LaunchResult,
+    MultiLaunchResult,
+    StatusResult,
+)
 
 # Setup centralized logging for SDK usage (notebooks, scripts, imports)
 from ...utils.logging_config import setup_toolkit_logging
@@ -62,6 +71,7 @@ class Runtime:
         max_lifetime: Optional[int] = None,
         deployment_type: Literal["direct_code_deploy", "container"] = "container",
         runtime_type: Optional[str] = None,
+        dockerfile_template: Literal["standard", "multistage"] = "standard",
     ) -> ConfigureResult:
         """Configure Bedrock AgentCore from notebook using an entrypoint file.
 
@@ -97,6 +107,8 @@ class Runtime:
             deployment_type: Deployment type - "direct_code_deploy" (default) or "container"
             runtime_type: Python runtime version for direct_code_deploy (e.g., "PYTHON_3_10", "PYTHON_3_11")
                 If not specified, will use current Python version or default to PYTHON_3_11
+            dockerfile_template: Dockerfile template for container deployments - "standard" (default) or
+                "multistage" (uv cache mounts, venv builder stage, slim runtime image with precompiled bytecode)
 
         Returns:
             ConfigureResult with configuration details
@@ -248,6 +260,7 @@ class Runtime:
             max_lifetime=max_lifetime,
             deployment_type=deployment_type,
             runtime_type=runtime_type,
+            dockerfile_template=dockerfile_template,
         )
 
         self._config_path = result.config_path
@@ -260,6 +273,9 @@ class Runtime:
         local_build: bool = False,
         auto_update_on_conflict: bool = False,
         env_vars: Optional[Dict] = None,
+        package_workers: Optional[int] = None,
+        optimize_package: bool = False,
+        precompile_bytecode: bool = False,
     ) -> LaunchResult:
         """Launch Bedrock AgentCore from notebook.
 
@@ -268,6 +284,11 @@ class Runtime:
             local_build: Whether to build locally and deploy to cloud (requires Docker/Finch/Podman)
             auto_update_on_conflict: Whether to automatically update resources on conflict (default: False)
             env_vars: environment variables for agent container
+            package_workers: Threads used to compress the deployment package
+                (direct_code_deploy only, defaults to CPU count)
+            optimize_package: Strip tests, stubs, docs and debug symbols from dependencies
+                (direct_code_deploy only)
+            precompile_bytecode: Ship precompiled bytecode to cut cold start time (direct_code_deploy only)
 
         Returns:
             LaunchResult with deployment details
@@ -337,6 +358,9 @@ class Runtime:
                 use_codebuild=use_codebuild,
                 auto_update_on_conflict=auto_update_on_conflict,
                 env_vars=env_vars,
+                package_workers=package_workers,
+                optimize_package=optimize_package,
+                precompile_bytecode=precompile_bytecode,
             )
         except RuntimeError as e:
             # Enhance Docker-related error messages
@@ -367,9 +391,9 @@ class Runtime:
                 log.info("💡 Tail logs with: %s", follow_cmd)
                 log.info("💡 Or view recent logs: %s", since_cmd)
         elif result.mode == "codebuild":
-            log.info("Built with CodeBuild: %s", result.codebuild_id)
+            log.info("Built with CodeBuild: %s", result.codebuild_id or "skipped (source unchanged)")
             log.info("Deployed to cloud: %s", result.agent_arn)
-            log.info("ECR image: %s", result.ecr_uri)
+            log.info("ECR image: %s", result.image_uri or result.ecr_uri)
             # Show log information for CodeBuild deployments
             if result.agent_id:
                 from ...utils.runtime.logs import get_agent_log_paths, get_aws_tail_commands
@@ -391,6 +415,55 @@ class Runtime:
 
         return result
 
+    def launch_all(
+        self,
+        agents: Optional[List[str]] = None,
+        max_workers: int = DEFAULT_LAUNCH_WORKERS,
+        local_build: bool = False,
+        auto_update_on_conflict: bool = False,
+        env_vars: Optional[Dict] = None,
+    ) -> MultiLaunchResult:
+        """Launch every agent of the project to the cloud, several at a time.
+
+        Args:
+            agents: Agents to launch, defaults to every agent in the configuration
+            max_workers: Maximum number of agents launched at the same time
+            local_build: Whether to build container agents locally instead of with CodeBuild
+            auto_update_on_conflict: Whether to automatically update resources on conflict (default: False)
+            env_vars: environment variables for every agent
+
+        Returns:
+            MultiLaunchResult with one outcome per agent
+        """
+        if not self._config_path:
+            raise ValueError("Must configure before launching. Call .configure() first.")
+
+        def report(agent_name: str, event: str, outcome) -> None:
+            if outcome is None:
+                log.info("🚀 %s: launching...", agent_name)
+            elif outcome.succeeded:
+                log.info("✅ %s: deployed in %.0fs", agent_name, outcome.duration_seconds)
+            else:
+                log.error("❌ %s: failed after %.0fs: %s", agent_name, outcome.duration_seconds, outcome.error)
+
+        result = launch_all_bedrock_agentcore(
+            self._config_path,
+            agent_names=agents,
+            max_workers=max_workers,
+            use_codebuild=not local_build,
+            auto_update_on_conflict=auto_update_on_conflict,
+            env_vars=env_vars,
+            progress=report,
+        )
+
+        log.info(
+            "Launched %d of %d agents in %.0fs", len(result.succeeded), len(result.results), result.duration_seconds
+        )
+        for outcome in result.results:
+            if outcome.result is not None:
+                outcome.result.build_output = None
+        return result
+
     def invoke(
         self,
         payload: Dict[str, Any],
@@ -430,6 +503,48 @@ class Runtime:
         )
         return result.response
 
+    def invoke_stream(
+        self,
+        payload: Dict[str, Any],
+        session_id: Optional[str] = None,
+        bearer_token: Optional[str] = None,
+        local: Optional[bool] = False,
+        user_id: Optional[str] = None,
+    ) -> Iterator[Any]:
+        """Invoke deployed Bedrock AgentCore endpoint and iterate over its response as it streams.
+
+        Events are yielded as the agent produces them: streamed text chunks as strings,
+        structured events as decoded JSON. The connection is closed when iteration ends,
+        including when the loop is exited early.
+
+        Example:
+            for chunk in runtime.invoke_stream({"prompt": "Hello"}):
+                print(chunk, end="")
+
+        Args:
+            payload: Dictionary payload to send
+            session_id: Optional session ID for conversation continuity
+            bearer_token: Optional bearer token for HTTP authentication
+            local: Send request to a running local container
+            user_id: User id for authorization flows
+
+        Returns:
+            Iterator over the response events
+        """
+        if not self._config_path:
+            log.warning("Agent not configured and deployed")
+            log.info("Required workflow: .configure() → .launch() → .invoke_stream()")
+            raise ValueError("Must configure and launch first.")
+
+        return stream_bedrock_agentcore(
+            config_path=self._config_path,
+            payload=payload,
+            session_id=session_id,
+            bearer_token=bearer_token,
+            local_mode=local,
+            user_id=user_id,
+        )
+
     def stop_session(self, session_id: Optional[str] = None) -> Dict[str, Any]:
         """Stop an active runtime session.
 
@@ -1,5 +1,6 @@
 """Bedrock AgentCore operations - shared business logic for CLI and notebook interfaces."""
 
+from .bench import BenchStage, parse_bench_stage, run_invoke_benchmark
 from .configure import (
     configure_bedrock_agentcore,
     detect_entrypoint,
@@ -9,19 +10,30 @@ from .configure import (
     validate_agent_name,
 )
 from .destroy import destroy_bedrock_agentcore
-from .invoke import invoke_bedrock_agentcore
+from .invoke import invoke_bedrock_agentcore, stream_bedrock_agentcore
 from .launch import launch_bedrock_agentcore
+from .launch_all import launch_all_bedrock_agentcore
 from .models import (
+    AgentLaunchResult,
+    BenchmarkResult,
+    BenchStageResult,
     ConfigureResult,
     DestroyResult,
     InvokeResult,
+    LatencyStats,
+    LaunchProfile,
     LaunchResult,
+    MultiLaunchResult,
+    RollbackResult,
     StatusConfigInfo,
     StatusResult,
     StopSessionResult,
+    WheelhouseResult,
 )
+from .rollback import rollback_bedrock_agentcore
 from .status import get_status
 from .stop_session import stop_runtime_session
+from .wheelhouse import build_agent_wheelhouse
 
 __all__ = [
     "configure_bedrock_agentcore",
@@ -32,14 +44,29 @@ __all__ = [
     "get_relative_path",
     "infer_agent_name",
     "launch_bedrock_agentcore",
+    "launch_all_bedrock_agentcore",
     "invoke_bedrock_agentcore",
+    "stream_bedrock_agentcore",
+    "rollback_bedrock_agentcore",
     "stop_runtime_session",
     "get_status",
+    "build_agent_wheelhouse",
+    "run_invoke_benchmark",
+    "parse_bench_stage",
+    "BenchStage",
+    "AgentLaunchResult",
+    "BenchmarkResult",
+    "BenchStageResult",
     "ConfigureResult",
     "DestroyResult",
     "InvokeResult",
+    "LatencyStats",
+    "LaunchProfile",
     "LaunchResult",
+    "MultiLaunchResult",
+    "RollbackResult",
     "StatusResult",
     "StatusConfigInfo",
     "StopSessionResult",
+    "WheelhouseResult",
 ]
@@ -0,0 +1,413 @@
+"""Bench operation - load-tests the invocation path of an agent."""
+
+import asyncio
+import itertools
+import json
+import logging
+import time
+from contextlib import aclosing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import httpx
+
+from ...services.async_runtime import (
+    AsyncBedrockAgentCoreClient,
+    AsyncHttpBedrockAgentCoreClient,
+    AsyncLocalBedrockAgentCoreClient,
+)
+from ...services.runtime import generate_session_id
+from ...utils.runtime.config import load_config
+from .invoke import get_local_invocation_identity
+from .models import BenchmarkResult, BenchStageResult, LatencyStats
+
+log = logging.getLogger(__name__)
+
+# Port the local container is published on by launch --local
+LOCAL_AGENT_PORT = 8080
+
+# Sends one payload in one session and returns the response events as they arrive
+InvokeStream = Callable[[str, str], AsyncIterator[Any]]
+
+
+@dataclass
+class BenchStage:
+    """One phase of a benchmark schedule.
+
+    The stage keeps up to ``concurrency`` requests in flight, starting them no faster than
+    ``rate`` per second (as fast as possible if None), until ``requests`` have been sent or
+    ``duration`` seconds have passed, whichever comes first.
+    """
+
+    concurrency: int = 1
+    rate: Optional[float] = None
+    requests: Optional[int] = None
+    duration: Optional[float] = None
+
+
+def parse_bench_stage(spec: str) -> BenchStage:
+    """Parse a timed stage written as ``SECONDS:CONCURRENCY[:RATE]``, e.g. ``30:8`` or ``60:16:20``.
+
+    Raises:
+        ValueError: If the stage is malformed
+    """
+    parts = spec.split(":")
+    if len(parts) not in (2, 3):
+        raise ValueError(f"Invalid stage '{spec}': expected SECONDS:CONCURRENCY[:RATE]")
+    try:
+        stage = BenchStage(
+            duration=float(parts[0]),
+            concurrency=int(parts[1]),
+            rate=float(parts[2]) if len(parts) == 3 else None,
+        )
+    except ValueError:
+        raise ValueError(f"Invalid stage '{spec}': expected SECONDS:CONCURRENCY[:RATE]") from None
+    _validate_stage(stage)
+    return stage
+
+
+def load_bench_payloads(path: Path) -> List[Any]:
+    """Load benchmark payloads from a JSONL file, one JSON payload per line.
+
+    Raises:
+        ValueError: If a line is not valid JSON or the file holds no payloads
+    """
+    payloads = []
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                payloads.append(json.loads(line))
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON on line {line_number} of {path}: {e}") from e
+    if not payloads:
+        raise ValueError(f"No payloads found in {path}")
+    return payloads
+
+
+def run_invoke_benchmark(
+    payloads_file: Path,
+    config_path: Optional[Path] = None,
+    agent_name: Optional[str] = None,
+    stages: Optional[Sequence[BenchStage]] = None,
+    sessions: Optional[int] = None,
+    bearer_token: Optional[str] = None,
+    user_id: Optional[str] = None,
+    local_mode: bool = False,
+    local_port: int = LOCAL_AGENT_PORT,
+    endpoint: Optional[str] = None,
+    custom_headers: Optional[dict] = None,
+) -> BenchmarkResult:
+    """Benchmark the invocations of an agent.
+
+    Payloads are sent round-robin from the file, each request in whichever of ``sessions``
+    runtime sessions is idle. A session handles one request at a time, as a conversation
+    would, so the number of sessions caps the concurrency. Requests go through
+    the async runtime clients: SigV4 or bearer token for deployed agents, the local
+    container protocol for ``local_mode`` and ``endpoint``.
+
+    Args:
+        payloads_file: JSONL file of payloads
+        config_path: Path to BedrockAgentCore configuration file (not needed with ``endpoint``)
+        agent_name: Name of agent (for project configurations)
+        stages: Schedule to run, in order (defaults to one request per payload, one at a time)
+        sessions: Number of sessions to spread requests over (defaults to the highest stage concurrency)
+        bearer_token: Bearer token for agents with OAuth configured
+        user_id: User id for authorization flows
+        local_mode: Benchmark the agent running in a local container
+        local_port: Port the local container listens on
+        endpoint: Base URL of a stand-in agent speaking the local container protocol
+        custom_headers: Custom headers to send with every request
+
+    Returns:
+        BenchmarkResult with latency distributions, error counts and throughput
+
+    Raises:
+        ValueError: If the payloads, schedule or agent configuration are invalid
+    """
+    payloads = [
+        p if isinstance(p, str) else json.dumps(p, ensure_ascii=False) for p in load_bench_payloads(payloads_file)
+    ]
+    stages = list(stages) if stages else [BenchStage(requests=len(payloads))]
+    for stage in stages:
+        _validate_stage(stage)
+    session_count = sessions or max(stage.concurrency for stage in stages)
+    if session_count < 1:
+        raise ValueError("At least one session is required")
+
+    target, mode, client, invoke = _resolve_target(
+        config_path,
+        agent_name,
+        bearer_token,
+        user_id,
+        local_mode,
+        local_port,
+        endpoint,
+        custom_headers,
+        max_connections=max(stage.concurrency for stage in stages),
+    )
+    session_ids = [generate_session_id() for _ in range(session_count)]
+    log.info("Benchmarking %s (%s) over %d sessions in %d stage(s)", target, mode, session_count, len(stages))
+
+    async def benchmark() -> Tuple[List[List["_Sample"]], List[float]]:
+        try:
+            return await _run_schedule(stages, invoke, payloads, session_ids)
+        finally:
+            await client.aclose()
+
+    samples_by_stage, durations = asyncio.run(benchmark())
+    return _summarize(target, mode, session_count, stages, samples_by_stage, durations)
+
+
+def _validate_stage(stage: BenchStage) -> None:
+    if stage.concurrency < 1:
+        raise ValueError("Concurrency must be at least 1")
+    if stage.rate is not None and stage.rate <= 0:
+        raise ValueError("Rate must be positive")
+    if stage.requests is None and stage.duration is None:
+        raise ValueError("A stage needs a number of requests or a duration")
+    if (stage.requests is not None and stage.requests < 1) or (stage.duration is not None and stage.duration <= 0):
+        raise ValueError("A stage needs at least one request and a positive duration")
+
+
+def _resolve_target(
+    config_path: Optional[Path],
+    agent_name: Optional[str],
+    bearer_token: Optional[str],
+    user_id: Optional[str],
+    local_mode: bool,
+    local_port: int,
+    endpoint: Optional[str],
+    custom_headers: Optional[dict],
+    max_connections: int,
+) -> Tuple[str, str, Any, InvokeStream]:
+    """Pick the async client for the invocation path under test.
+
+    Returns:
+        Display name of the target, mode, client (to close) and its invoke function
+    """
+    limits = {"max_connections": max_connections, "max_keepalive_connections": max_connections}
+
+    if endpoint:
+        local_client = AsyncLocalBedrockAgentCoreClient(endpoint, **limits)
+
+        def invoke_endpoint(payload: str, session_id: str) -> AsyncIterator[Any]:
+            return local_client.invoke_stream(session_id, payload, custom_headers=custom_headers)
+
+        return endpoint, "endpoint", local_client, invoke_endpoint
+
+    if config_path is None:
+        raise ValueError("A configuration file is required unless an endpoint is given")
+    project_config = load_config(config_path)
+    agent_config = project_config.get_agent_config(agent_name)
+
+    if local_mode:
+        workload_access_token, oauth2_callback_url = get_local_invocation_identity(
+            project_config, config_path, agent_config.name, bearer_token, user_id
+        )
+        local_client = AsyncLocalBedrockAgentCoreClient(f"http://127.0.0.1:{local_port}", **limits)
+
+        def invoke_local(payload: str, session_id: str) -> AsyncIterator[Any]:
+            return local_client.invoke_stream(
+                session_id, payload, workload_access_token, oauth2_callback_url, custom_headers
+            )
+
+        return agent_config.name, "local", local_client, invoke_local
+
+    region = agent_config.aws.region
+    if not region:
+        raise ValueError("Region not configured.")
+    agent_arn = agent_config.bedrock_agentcore.agent_arn
+    if not agent_arn:
+        raise ValueError("Bedrock AgentCore not deployed. Run launch first.")
+
+    if bearer_token:
+        http_client = AsyncHttpBedrockAgentCoreClient(region, **limits)
+
+        def invoke_http(payload: str, session_id: str) -> AsyncIterator[Any]:
+            return http_client.invoke_stream(
+                agent_arn, payload, session_id, bearer_token, custom_headers=custom_headers
+            )
+
+        return agent_config.name, "cloud", http_client, invoke_http
+
+    client = AsyncBedrockAgentCoreClient(region, **limits)
+
+    def invoke(payload: str, session_id: str) -> AsyncIterator[Any]:
+        return client.invoke_stream(agent_arn, payload, session_id, user_id=user_id, custom_headers=custom_headers)
+
+    return agent_config.name, "cloud", client, invoke
+
+
+@dataclass
+class _Sample:
+    """Measurement of one request."""
+
+    ttfb: Optional[float] = None
+    latency: Optional[float] = None
+    events: int = 0
+    error: Optional[str] = None
+
+
+async def _run_schedule(
+    stages: Sequence[BenchStage], invoke: InvokeStream, payloads: List[str], session_ids: List[str]
+) -> Tuple[List[List[_Sample]], List[float]]:
+    """Run the stages one after another, returning the samples and wall-clock time of each."""
+    # A worker takes any idle session, so a slow response only holds up its own session
+    idle_sessions: asyncio.Queue = asyncio.Queue()
+    for session_id in session_ids:
+        idle_sessions.put_nowait(session_id)
+    request_index = itertools.count()
+    samples_by_stage, durations = [], []
+
+    for stage_number, stage in enumerate(stages, 1):
+        log.info(
+            "Stage %d: concurrency %d, rate %s, %s",
+            stage_number,
+            stage.concurrency,
+            f"{stage.rate:g}/s" if stage.rate else "unlimited",
+            f"{stage.requests} requests" if stage.requests else f"{stage.duration:g}s",
+        )
+        start = time.perf_counter()
+        samples = await _run_stage(stage, invoke, payloads, idle_sessions, request_index)
+        samples_by_stage.append(samples)
+        durations.append(time.perf_counter() - start)
+
+    return samples_by_stage, durations
+
+
+async def _run_stage(
+    stage: BenchStage,
+    invoke: InvokeStream,
+    payloads: List[str],
+    idle_sessions: asyncio.Queue,
+    request_index: Iterator[int],
+) -> List[_Sample]:
+    """Run one stage: ``concurrency`` workers taking slots of the schedule until it is exhausted."""
+    samples: List[_Sample] = []
+    start = time.perf_counter()
+    deadline = start + stage.duration if stage.duration else None
+    started = 0
+
+    async def worker():
+        nonlocal started
+        while stage.requests is None or started < stage.requests:
+            # Claimed before any await, so workers never share a slot of the schedule
+            slot = started
+            started += 1
+            if stage.rate:
+                delay = start + slot / stage.rate - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            if deadline is not None and time.perf_counter() >= deadline:
+                return
+
+            index = next(request_index)
+            sample = _Sample()
+            samples.append(sample)
+            session_id = await idle_sessions.get()
+            try:
+                await _measure(invoke, payloads[index % len(payloads)], session_id, sample)
+            finally:
+                idle_sessions.put_nowait(session_id)
+
+    await asyncio.gather(*(worker() for _ in range(stage.concurrency)))
+    return samples
+
+
+async def _measure(invoke: InvokeStream, payload: str, session_id: str, sample: _Sample) -> None:
+    """Send one request, recording when its first and last events arrive."""
+    start = time.perf_counter()
+    try:
+        async with aclosing(invoke(payload, session_id)) as events:
+            async for _ in events:
+                if sample.ttfb is None:
+                    sample.ttfb = time.perf_counter() - start
+                sample.events += 1
+        sample.latency = time.perf_counter() - start
+    except Exception as e:
+        sample.error = _describe_error(e)
+        log.debug("Request failed: %s", e)
+
+
+def _describe_error(error: Exception) -> str:
+    """Bucket an error for counting: by HTTP status where there is one, else by type."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return f"HTTP {error.response.status_code}"
+    return type(error).__name__
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    """Percentile of sorted values, interpolating linearly between the closest ranks."""
+    position = (len(sorted_values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def _latency_stats(values: List[float]) -> LatencyStats:
+    if not values:
+        return LatencyStats()
+    ordered = sorted(values)
+    return LatencyStats(
+        count=len(ordered),
+        min=ordered[0],
+        mean=sum(ordered) / len(ordered),
+        p50=_percentile(ordered, 0.50),
+        p90=_percentile(ordered, 0.90),
+        p95=_percentile(ordered, 0.95),
+        p99=_percentile(ordered, 0.99),
+        max=ordered[-1],
+    )
+
+
+def _summarize(
+    target: str,
+    mode: str,
+    session_count: int,
+    stages: Sequence[BenchStage],
+    samples_by_stage: List[List[_Sample]],
+    durations: List[float],
+) -> BenchmarkResult:
+    stage_results = []
+    for stage, samples, duration in zip(stages, samples_by_stage, durations, strict=True):
+        stage_results.append(
+            BenchStageResult(
+                concurrency=stage.concurrency,
+                rate=stage.rate,
+                requests=len(samples),
+                failed=sum(1 for s in samples if s.error),
+                duration_seconds=duration,
+                requests_per_second=len(samples) / duration if duration else 0.0,
+                latency=_latency_stats([s.latency for s in samples if s.latency is not None]),
+            )
+        )
+
+    samples = [sample for stage_samples in samples_by_stage for sample in stage_samples]
+    succeeded = [s for s in samples if not s.error]
+    errors: Dict[str, int] = {}
+    for sample in samples:
+        if sample.error:
+            errors[sample.error] = errors.get(sample.error, 0) + 1
+    duration = sum(durations)
+    events = sum(s.events for s in samples)
+
+    return BenchmarkResult(
+        target=target,
+        mode=mode,
+        sessions=session_count,
+        requests=len(samples),
+        succeeded=len(succeeded),
+        failed=len(samples) - len(succeeded),
+        error_rate=(len(samples) - len(succeeded)) / len(samples) if samples else 0.0,
+        errors=errors,
+        duration_seconds=duration,
+        requests_per_second=len(samples) / duration if duration else 0.0,
+        events=events,
+        events_per_second=events / duration if duration else 0.0,
+        ttfb=_latency_stats([s.ttfb for s in succeeded if s.ttfb is not None]),
+        latency=_latency_stats([s.latency for s in succeeded if s.latency is not None]),
+        stages=stage_results,
+    )
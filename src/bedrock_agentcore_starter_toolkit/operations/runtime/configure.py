@@ -159,6 +159,7 @@ def configure_bedrock_agentcore(
     max_lifetime: Optional[int] = None,
     deployment_type: str = "direct_code_deploy",
     runtime_type: Optional[str] = None,
+    dockerfile_template: str = "standard",
 ) -> ConfigureResult:
     """Configure Bedrock AgentCore application with deployment settings.
 
@@ -192,6 +193,8 @@ def configure_bedrock_agentcore(
         runtime_type: Python runtime version for direct_code_deploy (e.g., "PYTHON_3_10", "PYTHON_3_11")
         auto_create_s3: Whether to auto-create S3 bucket for direct_code_deploy deployment
         s3_path: S3 path for direct_code_deploy deployment
+        dockerfile_template: Dockerfile template for container deployments - "standard" (default) or
+            "multistage" (builder stage with a uv cache mount, slim runtime stage with precompiled bytecode)
 
     Returns:
         ConfigureResult model with configuration details
@@ -432,6 +435,7 @@ def configure_bedrock_agentcore(
             memory_name,
             source_path,
             protocol,
+            dockerfile_template=dockerfile_template,
         )
         # Log with relative path for better readability
         rel_dockerfile_path = get_relative_path(Path(dockerfile_path))
@@ -2,8 +2,9 @@
 
 import json
 import logging
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, Iterator, Optional, Tuple
 
 from bedrock_agentcore.services.identity import IdentityClient
 
@@ -16,6 +17,17 @@ from .models import InvokeResult
 log = logging.getLogger(__name__)
 
 
+@dataclass
+class _Invocation:
+    """A prepared invocation: the client to send it with and the arguments of its invoke methods."""
+
+    client: Any
+    session_id: str
+    agent_arn: Optional[str]
+    args: Tuple[Any, ...] = ()
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+
+
 def invoke_bedrock_agentcore(
     config_path: Path,
     payload: Any,
@@ -27,6 +39,52 @@ def invoke_bedrock_agentcore(
     custom_headers: Optional[dict] = None,
 ) -> InvokeResult:
     """Invoke deployed Bedrock AgentCore endpoint."""
+    invocation = _prepare_invocation(
+        config_path, payload, agent_name, session_id, bearer_token, user_id, local_mode, custom_headers
+    )
+    response = invocation.client.invoke_endpoint(*invocation.args, **invocation.kwargs)
+
+    return InvokeResult(
+        response=response,
+        session_id=invocation.session_id,
+        agent_arn=invocation.agent_arn,
+    )
+
+
+def stream_bedrock_agentcore(
+    config_path: Path,
+    payload: Any,
+    agent_name: Optional[str] = None,
+    session_id: Optional[str] = None,
+    bearer_token: Optional[str] = None,
+    user_id: Optional[str] = None,
+    local_mode: Optional[bool] = False,
+    custom_headers: Optional[dict] = None,
+) -> Iterator[Any]:
+    """Invoke deployed Bedrock AgentCore endpoint and stream its response events.
+
+    The invocation is prepared (and its session ID saved) eagerly; the request is sent
+    when iteration starts, and closing the iterator closes the connection.
+
+    Returns:
+        Iterator over the response events as the agent produces them
+    """
+    invocation = _prepare_invocation(
+        config_path, payload, agent_name, session_id, bearer_token, user_id, local_mode, custom_headers
+    )
+    return invocation.client.invoke_stream(*invocation.args, **invocation.kwargs)
+
+
+def _prepare_invocation(
+    config_path: Path,
+    payload: Any,
+    agent_name: Optional[str],
+    session_id: Optional[str],
+    bearer_token: Optional[str],
+    user_id: Optional[str],
+    local_mode: Optional[bool],
+    custom_headers: Optional[dict],
+) -> _Invocation:
     # Load project configuration
     project_config = load_config(config_path)
     agent_config = project_config.get_agent_config(agent_name)
@@ -63,62 +121,88 @@ def invoke_bedrock_agentcore(
     if local_mode:
         from ...services.runtime import LocalBedrockAgentCoreClient
 
-        identity_client = IdentityClient(region)
-        workload_name = _get_workload_name(project_config, config_path, agent_config.name, identity_client)
-        workload_access_token = identity_client.get_workload_access_token(
-            workload_name=workload_name, user_token=bearer_token, user_id=user_id
-        )["workloadAccessToken"]
-
-        agent_config.oauth_configuration[WORKLOAD_USER_ID] = user_id  # type: ignore : populated by _get_workload_name(...)
-        save_config(project_config, config_path)
-
-        oauth2_callback_url = BedrockAgentCoreIdentity3loCallback.get_oauth2_callback_endpoint()
-        _update_workload_identity_with_oauth2_callback_url(
-            identity_client, workload_name=workload_name, oauth2_callback_url=oauth2_callback_url
+        workload_access_token, oauth2_callback_url = get_local_invocation_identity(
+            project_config, config_path, agent_config.name, bearer_token, user_id
         )
 
         # TODO: store and read port config of local running container
         client = LocalBedrockAgentCoreClient("http://127.0.0.1:8080")
-        response = client.invoke_endpoint(
-            session_id, payload_str, workload_access_token, oauth2_callback_url, custom_headers
+        return _Invocation(
+            client,
+            session_id,
+            agent_arn,
+            args=(session_id, payload_str, workload_access_token, oauth2_callback_url, custom_headers),
         )
 
-    else:
-        if not agent_arn:
-            raise ValueError("Bedrock AgentCore not deployed. Run launch first.")
-
-        # Invoke endpoint using appropriate client
-        if bearer_token:
-            if user_id:
-                log.warning("Both bearer token and user id are specified, ignoring user id")
-
-            # Use HTTP client with bearer token
-            from ...services.runtime import HttpBedrockAgentCoreClient
-
-            client = HttpBedrockAgentCoreClient(region)
-            response = client.invoke_endpoint(
-                agent_arn=agent_arn,
-                payload=payload_str,
-                session_id=session_id,
-                bearer_token=bearer_token,
-                custom_headers=custom_headers,
-            )
-        else:
-            # Use existing boto3 client
-            bedrock_agentcore_client = BedrockAgentCoreClient(region)
-            response = bedrock_agentcore_client.invoke_endpoint(
-                agent_arn=agent_arn,
-                payload=payload_str,
-                session_id=session_id,
-                user_id=user_id,
-                custom_headers=custom_headers,
-            )
+    if not agent_arn:
+        raise ValueError("Bedrock AgentCore not deployed. Run launch first.")
+
+    # Invoke endpoint using appropriate client
+    if bearer_token:
+        if user_id:
+            log.warning("Both bearer token and user id are specified, ignoring user id")
+
+        # Use HTTP client with bearer token
+        from ...services.runtime import HttpBedrockAgentCoreClient
+
+        return _Invocation(
+            HttpBedrockAgentCoreClient(region),
+            session_id,
+            agent_arn,
+            kwargs={
+                "agent_arn": agent_arn,
+                "payload": payload_str,
+                "session_id": session_id,
+                "bearer_token": bearer_token,
+                "custom_headers": custom_headers,
+            },
+        )
 
-    return InvokeResult(
-        response=response,
-        session_id=session_id,
-        agent_arn=agent_arn,
+    # Use existing boto3 client
+    return _Invocation(
+        BedrockAgentCoreClient(region),
+        session_id,
+        agent_arn,
+        kwargs={
+            "agent_arn": agent_arn,
+            "payload": payload_str,
+            "session_id": session_id,
+            "user_id": user_id,
+            "custom_headers": custom_headers,
+        },
+    )
+
+
+def get_local_invocation_identity(
+    project_config: BedrockAgentCoreConfigSchema,
+    config_path: Path,
+    agent_name: str,
+    bearer_token: Optional[str] = None,
+    user_id: Optional[str] = None,
+) -> Tuple[str, str]:
+    """Get the workload identity a local agent container is invoked with.
+
+    Creates the agent's workload identity if needed and registers the local OAuth2
+    callback URL with it.
+
+    Returns:
+        Workload access token and OAuth2 callback URL to send with local invocations
+    """
+    agent_config = project_config.get_agent_config(agent_name)
+    identity_client = IdentityClient(agent_config.aws.region)
+    workload_name = _get_workload_name(project_config, config_path, agent_config.name, identity_client)
+    workload_access_token = identity_client.get_workload_access_token(
+        workload_name=workload_name, user_token=bearer_token, user_id=user_id
+    )["workloadAccessToken"]
+
+    agent_config.oauth_configuration[WORKLOAD_USER_ID] = user_id  # type: ignore : populated by _get_workload_name(...)
+    save_config(project_config, config_path)
+
+    oauth2_callback_url = BedrockAgentCoreIdentity3loCallback.get_oauth2_callback_endpoint()
+    _update_workload_identity_with_oauth2_callback_url(
+        identity_client, workload_name=workload_name, oauth2_callback_url=oauth2_callback_url
     )
+    return workload_access_token, oauth2_callback_url
 
 
 def _update_workload_identity_with_oauth2_callback_url(
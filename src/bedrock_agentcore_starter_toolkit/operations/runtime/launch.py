@@ -1,28 +1,39 @@
 """Launch operation - deploys Bedrock AgentCore locally or to cloud."""
 
+import hashlib
 import json
 import logging
 import time
 import urllib.parse
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 import boto3
 from botocore.exceptions import ClientError
 from rich.console import Console
 
 from ...services.codebuild import CodeBuildService
-from ...services.ecr import deploy_to_ecr, get_or_create_ecr_repository
+from ...services.ecr import (
+    deploy_to_ecr,
+    get_image_digest,
+    get_or_create_ecr_repository,
+    is_pinned_image_uri,
+    pin_image_uri,
+)
 from ...services.runtime import BedrockAgentCoreClient
+from ...services.s3 import DIGEST_METADATA_KEY, StreamingUploadError, get_object_digest
 from ...services.xray import enable_transaction_search_if_needed
-from ...utils.runtime.config import load_config, save_config
+from ...utils.runtime.archive import hash_file
+from ...utils.runtime.config import load_config, save_agent_config
 from ...utils.runtime.container import ContainerRuntime
 from ...utils.runtime.entrypoint import build_entrypoint_array
 from ...utils.runtime.logs import get_genai_observability_url
+from ...utils.runtime.profiling import LaunchProfiler, profile_launch, record_phases, timed_step
 from ...utils.runtime.schema import BedrockAgentCoreAgentSchema, BedrockAgentCoreConfigSchema
+from ...utils.runtime.step_graph import StepGraph
 from .create_role import get_or_create_runtime_execution_role
 from .exceptions import RuntimeToolkitException
-from .models import LaunchResult
+from .models import LaunchProfile, LaunchResult, LaunchStepTiming
 
 # console = Console()
 
@@ -161,7 +172,7 @@ def _ensure_ecr_repository(agent_config, project_config, config_path, agent_name
 
         # Update the project config and save
         project_config.agents[agent_config.name] = agent_config
-        save_config(project_config, config_path)
+        save_agent_config(agent_config, config_path)
 
         log.info("ECR repository available: %s", ecr_uri)
         return ecr_uri
@@ -237,7 +248,7 @@ def _ensure_execution_role(agent_config, project_config, config_path, agent_name
 
         # Update the project config and save
         project_config.agents[agent_config.name] = agent_config
-        save_config(project_config, config_path)
+        save_agent_config(agent_config, config_path)
 
         log.info("Execution role available: %s", execution_role_arn)
         return execution_role_arn
@@ -404,7 +415,7 @@ def _ensure_memory_for_agent(
         agent_config.memory.first_invoke_memory_check_done = True  # CHANGE: Set to True since memory is now ACTIVE
 
         project_config.agents[agent_config.name] = agent_config
-        save_config(project_config, config_path)
+        save_agent_config(agent_config, config_path)
 
         return memory.id
 
@@ -414,6 +425,19 @@ def _ensure_memory_for_agent(
         return None
 
 
+def _enable_observability(agent_config: BedrockAgentCoreAgentSchema, region: str, account_id: str) -> None:
+    """Enable Transaction Search if observability is enabled for the agent."""
+    if not agent_config.aws.observability.enabled:
+        return
+    log.info("Observability is enabled, configuring Transaction Search...")
+    enable_transaction_search_if_needed(region, account_id)
+
+    # Show GenAI Observability Dashboard URL whenever OTEL is enabled
+    console_url = get_genai_observability_url(region)
+    log.info("🔍 GenAI Observability Dashboard:")
+    log.info("   %s", console_url)
+
+
 def _deploy_to_bedrock_agentcore(
     agent_config: BedrockAgentCoreAgentSchema,
     project_config: BedrockAgentCoreConfigSchema,
@@ -424,9 +448,21 @@ def _deploy_to_bedrock_agentcore(
     account_id: str,
     env_vars: Optional[dict] = None,
     auto_update_on_conflict: bool = False,
+    image_uri: Optional[str] = None,
+    enable_observability: bool = True,
 ):
-    """Deploy agent to Bedrock AgentCore with retry logic for role validation."""
+    """Deploy agent to Bedrock AgentCore with retry logic for role validation.
+
+    image_uri should be digest-pinned (repository@sha256:...) so the runtime keeps running
+    exactly this image; it is recorded in the config as the current image, and the image it
+    replaces becomes the default rollback target. Falls back to the mutable latest tag, which
+    is not recorded: it does not say which image runs, so it cannot be rolled back to.
+
+    enable_observability=False leaves Transaction Search setup to the caller, which can run
+    it alongside other launch steps.
+    """
     log.info("Deploying to Bedrock AgentCore...")
+    image_uri = image_uri or f"{ecr_uri}:latest"
 
     # Prepare environment variables
     if env_vars is None:
@@ -467,20 +503,21 @@ def _deploy_to_bedrock_agentcore(
 
     for attempt in range(max_retries + 1):
         try:
-            agent_info = bedrock_agentcore_client.create_or_update_agent(
-                agent_id=agent_config.bedrock_agentcore.agent_id,
-                agent_name=agent_name,
-                execution_role_arn=agent_config.aws.execution_role,
-                deployment_type="container",
-                image_uri=f"{ecr_uri}:latest",
-                network_config=network_config,
-                authorizer_config=agent_config.get_authorizer_configuration(),
-                request_header_config=agent_config.request_header_configuration,
-                protocol_config=protocol_config,
-                env_vars=env_vars,
-                auto_update_on_conflict=auto_update_on_conflict,
-                lifecycle_config=lifecycle_config,
-            )
+            with timed_step("deploy"):
+                agent_info = bedrock_agentcore_client.create_or_update_agent(
+                    agent_id=agent_config.bedrock_agentcore.agent_id,
+                    agent_name=agent_name,
+                    execution_role_arn=agent_config.aws.execution_role,
+                    deployment_type="container",
+                    image_uri=image_uri,
+                    network_config=network_config,
+                    authorizer_config=agent_config.get_authorizer_configuration(),
+                    request_header_config=agent_config.request_header_configuration,
+                    protocol_config=protocol_config,
+                    env_vars=env_vars,
+                    auto_update_on_conflict=auto_update_on_conflict,
+                    lifecycle_config=lifecycle_config,
+                )
             break  # Success! Exit retry loop
 
         except ClientError as e:
@@ -522,6 +559,16 @@ def _deploy_to_bedrock_agentcore(
     # Update the config
     agent_config.bedrock_agentcore.agent_id = agent_id
     agent_config.bedrock_agentcore.agent_arn = agent_arn
+    deployment = agent_config.bedrock_agentcore
+    if deployment.image_uri != image_uri:
+        # The image deployed so far stays the rollback target until another pinned image replaces it
+        if deployment.image_uri:
+            deployment.previous_image_uri = deployment.image_uri
+        if is_pinned_image_uri(image_uri):
+            deployment.image_uri = image_uri
+        else:
+            log.warning("⚠️ Deployed %s without a digest; it will not be available as a rollback target", image_uri)
+            deployment.image_uri = None
 
     # Reset session id if present
     existing_session_id = agent_config.bedrock_agentcore.agent_session_id
@@ -535,23 +582,18 @@ def _deploy_to_bedrock_agentcore(
 
     # Update the project config and save
     project_config.agents[agent_config.name] = agent_config
-    save_config(project_config, config_path)
+    save_agent_config(agent_config, config_path)
 
     log.info("Agent created/updated: %s", agent_arn)
 
-    # Enable Transaction Search if observability is enabled
-    if agent_config.aws.observability.enabled:
-        log.info("Observability is enabled, configuring Transaction Search...")
-        enable_transaction_search_if_needed(region, account_id)
-
-        # Show GenAI Observability Dashboard URL whenever OTEL is enabled
-        console_url = get_genai_observability_url(region)
-        log.info("🔍 GenAI Observability Dashboard:")
-        log.info("   %s", console_url)
+    if enable_observability:
+        with timed_step("observability"):
+            _enable_observability(agent_config, region, account_id)
 
     # Wait for agent to be ready
     log.info("Polling for endpoint to be ready...")
-    result = bedrock_agentcore_client.wait_for_agent_endpoint_ready(agent_id)
+    with timed_step("endpoint_ready"):
+        result = bedrock_agentcore_client.wait_for_agent_endpoint_ready(agent_id)
     log.info("Agent endpoint: %s", result)
 
     if agent_config.aws.network_configuration.network_mode == "VPC":
@@ -658,6 +700,9 @@ def launch_bedrock_agentcore(
     auto_update_on_conflict: bool = False,
     console: Optional[Console] = None,
     force_rebuild_deps: bool = False,
+    package_workers: Optional[int] = None,
+    optimize_package: bool = False,
+    precompile_bytecode: bool = False,
 ) -> LaunchResult:
     """Launch Bedrock AgentCore locally or to cloud.
 
@@ -671,9 +716,15 @@ def launch_bedrock_agentcore(
         console: Optional Rich Console instance for progress output. Used to maintain
                 output hierarchy with CLI status contexts.
         force_rebuild_deps: Force rebuild of dependencies (direct_code_deploy deployments only)
+        package_workers: Number of threads used to compress the deployment package
+            (direct_code_deploy deployments only, defaults to the CPU count)
+        optimize_package: Apply the package size optimizer to dependencies even if it is not
+            enabled in the agent's package_optimization config (direct_code_deploy deployments only)
+        precompile_bytecode: Ship unchecked-hash bytecode compiled for the runtime's Python version
+            (direct_code_deploy deployments only)
 
     Returns:
-        LaunchResult model with launch details
+        LaunchResult model with launch details; its profile holds the duration of each launch step
     """
     if console is None:
         console = Console()
@@ -681,23 +732,74 @@ def launch_bedrock_agentcore(
     project_config = load_config(config_path)
     agent_config = project_config.get_agent_config(agent_name)
 
-    if env_vars is None:
-        env_vars = {}
+    with profile_launch() as profiler:
+        result = _launch_agent(
+            config_path,
+            project_config,
+            agent_config,
+            local=local,
+            use_codebuild=use_codebuild,
+            env_vars=env_vars if env_vars is not None else {},
+            auto_update_on_conflict=auto_update_on_conflict,
+            console=console,
+            force_rebuild_deps=force_rebuild_deps,
+            package_workers=package_workers,
+            optimize_package=optimize_package,
+            precompile_bytecode=precompile_bytecode,
+        )
+    result.profile = _build_launch_profile(profiler, agent_config.name, result.mode)
+    return result
+
 
+def _build_launch_profile(profiler: LaunchProfiler, agent_name: str, mode: str) -> LaunchProfile:
+    """Convert the steps collected during a launch into a LaunchProfile."""
+    return LaunchProfile(
+        agent_name=agent_name,
+        mode=mode,
+        total_seconds=round(profiler.total_seconds, 3),
+        steps=[
+            LaunchStepTiming(
+                name=step.name,
+                start_seconds=round(step.start, 3),
+                duration_seconds=round(step.duration, 3),
+                failed=step.failed,
+            )
+            for step in profiler.steps
+        ],
+    )
+
+
+def _launch_agent(
+    config_path: Path,
+    project_config: BedrockAgentCoreConfigSchema,
+    agent_config: BedrockAgentCoreAgentSchema,
+    local: bool,
+    use_codebuild: bool,
+    env_vars: dict,
+    auto_update_on_conflict: bool,
+    console: Console,
+    force_rebuild_deps: bool,
+    package_workers: Optional[int],
+    optimize_package: bool,
+    precompile_bytecode: bool,
+) -> LaunchResult:
+    """Route a launch to the deployment mode's workflow; see launch_bedrock_agentcore."""
     if agent_config.aws.network_configuration.network_mode == "VPC":
         if local:
             log.warning("⚠️  VPC configuration detected but running in local mode. VPC settings will be ignored.")
         else:
             log.info("Validating VPC resources...")
-            session = boto3.Session(region_name=agent_config.aws.region)
-            _validate_vpc_resources(session, agent_config, agent_config.aws.region)
+            with timed_step("vpc_validation"):
+                session = boto3.Session(region_name=agent_config.aws.region)
+                _validate_vpc_resources(session, agent_config, agent_config.aws.region)
 
-            # Ensure service-linked role exists for VPC networking
-            _ensure_network_service_linked_role(session, log)
+                # Ensure service-linked role exists for VPC networking
+                _ensure_network_service_linked_role(session, log)
 
     # Ensure memory exists for non-CodeBuild paths
     if not use_codebuild:
-        _ensure_memory_for_agent(agent_config, project_config, config_path, agent_config.name)
+        with timed_step("memory"):
+            _ensure_memory_for_agent(agent_config, project_config, config_path, agent_config.name)
     # Route based on deployment type for cloud deployments
     if not local and agent_config.deployment_type == "direct_code_deploy":
         return _launch_with_direct_code_deploy(
@@ -707,6 +809,9 @@ def launch_bedrock_agentcore(
             auto_update_on_conflict=auto_update_on_conflict,
             env_vars=env_vars,
             force_rebuild_deps=force_rebuild_deps,
+            package_workers=package_workers,
+            optimize_package=optimize_package,
+            precompile_bytecode=precompile_bytecode,
         )
 
     # Route for local direct_code_deploy deployment
@@ -783,7 +888,8 @@ def launch_bedrock_agentcore(
     if not dockerfile_path.exists():
         raise RuntimeError(f"Dockerfile not found at {dockerfile_path}. Please run 'agentcore configure' first.")
 
-    success, output = runtime.build(build_dir, tag, dockerfile_path=dockerfile_path)
+    with timed_step("docker_build"):
+        success, output = runtime.build(build_dir, tag, dockerfile_path=dockerfile_path)
     if not success:
         error_lines = output[-10:] if len(output) > 10 else output
         error_message = " ".join(error_lines)
@@ -817,19 +923,26 @@ def launch_bedrock_agentcore(
     account_id = agent_config.aws.account
 
     # Step 2: Ensure execution role exists (moved before ECR push)
-    _ensure_execution_role(agent_config, project_config, config_path, bedrock_agentcore_name, region, account_id)
+    with timed_step("execution_role"):
+        _ensure_execution_role(agent_config, project_config, config_path, bedrock_agentcore_name, region, account_id)
 
     # Step 3: Push to ECR
     log.info("Uploading to ECR...")
 
     # Handle ECR repository
-    ecr_uri = _ensure_ecr_repository(agent_config, project_config, config_path, bedrock_agentcore_name, region)
+    with timed_step("ecr"):
+        ecr_uri = _ensure_ecr_repository(agent_config, project_config, config_path, bedrock_agentcore_name, region)
 
-    # Deploy to ECR
+    # Deploy to ECR, tagged by the local image ID so the pushed image can be pinned by digest
     repo_name = "/".join(ecr_uri.split("/")[1:])
-    deploy_to_ecr(tag, repo_name, region, runtime)
+    image_id = runtime.get_image_id(tag)
+    image_tag = f"img-{image_id.split(':', 1)[1][:32]}" if image_id else None
+    with timed_step("ecr_push"):
+        deploy_to_ecr(tag, repo_name, region, runtime, image_tag=image_tag)
 
     log.info("Image uploaded to ECR: %s", ecr_uri)
+    image_digest = get_image_digest(ecr_uri, image_tag or "latest", region)
+    image_uri = pin_image_uri(ecr_uri, image_digest) if image_digest else None
 
     # Step 4: Deploy agent (with retry logic for role readiness)
     agent_id, agent_arn = _deploy_to_bedrock_agentcore(
@@ -842,6 +955,7 @@ def launch_bedrock_agentcore(
         account_id,
         env_vars,
         auto_update_on_conflict,
+        image_uri=image_uri,
     )
 
     return LaunchResult(
@@ -850,6 +964,7 @@ def launch_bedrock_agentcore(
         agent_arn=agent_arn,
         agent_id=agent_id,
         ecr_uri=ecr_uri,
+        image_uri=image_uri,
         build_output=output,
     )
 
@@ -863,7 +978,14 @@ def _execute_codebuild_workflow(
     auto_update_on_conflict: bool = False,
     env_vars: Optional[dict] = None,
 ) -> LaunchResult:
-    """Launch using CodeBuild for ARM64 builds."""
+    """Launch using CodeBuild for ARM64 builds.
+
+    The build is skipped when ECR already holds an image tagged with the digest of the
+    filtered build context; that image is tagged as latest and its build ID is None.
+
+    Returns:
+        Tuple of (build ID, ECR repository URI, region, account ID, digest-pinned image URI)
+    """
     log.info(
         "Starting CodeBuild ARM64 deployment for agent '%s' to account %s (%s)",
         agent_name,
@@ -886,35 +1008,8 @@ def _execute_codebuild_workflow(
 
         session = boto3.Session(region_name=region)
         account_id = agent_config.aws.account  # Use existing account from config
-
-        # Setup AWS resources
-        log.info("Setting up AWS resources (ECR repository%s)...", "" if ecr_only else ", execution roles")
-        ecr_uri = _ensure_ecr_repository(agent_config, project_config, config_path, agent_name, region)
-        if ecr_uri:
-            created_resources.append(f"ECR Repository: {ecr_uri}")
-        ecr_repository_arn = f"arn:aws:ecr:{region}:{account_id}:repository/{ecr_uri.split('/')[-1]}"
-
-        # Setup execution role only if not ECR-only mode
-        if not ecr_only:
-            _ensure_execution_role(agent_config, project_config, config_path, agent_name, region, account_id)
-            if agent_config.aws.execution_role:
-                created_resources.append(f"Runtime Execution Role: {agent_config.aws.execution_role}")
-
-        # Prepare CodeBuild
-        log.info("Preparing CodeBuild project and uploading source...")
         codebuild_service = CodeBuildService(session)
 
-        # Use cached CodeBuild role from config if available
-        if hasattr(agent_config, "codebuild") and agent_config.codebuild.execution_role:
-            log.info("Using CodeBuild role from config: %s", agent_config.codebuild.execution_role)
-            codebuild_execution_role = agent_config.codebuild.execution_role
-        else:
-            codebuild_execution_role = codebuild_service.create_codebuild_execution_role(
-                account_id=account_id, ecr_repository_arn=ecr_repository_arn, agent_name=agent_name
-            )
-            if codebuild_execution_role:
-                created_resources.append(f"CodeBuild Execution Role: {codebuild_execution_role}")
-
         # Get source directory - use source_path if configured, otherwise use current directory
         source_dir = str(Path(agent_config.source_path)) if agent_config.source_path else "."
 
@@ -922,24 +1017,89 @@ def _execute_codebuild_workflow(
         from ...utils.runtime.config import get_agentcore_directory
 
         dockerfile_dir = get_agentcore_directory(config_path.parent, agent_name, agent_config.source_path)
+        # Keep the source archive cache out of the project root even in the legacy layout, where
+        # a local build would copy it into the image and agents would share it
+        source_cache_dir = config_path.parent / ".bedrock_agentcore" / agent_name
 
-        source_location = codebuild_service.upload_source(
-            agent_name=agent_name, source_dir=source_dir, dockerfile_dir=str(dockerfile_dir)
-        )
+        # Setup AWS resources and prepare the build; independent steps run concurrently
+        log.info("Setting up AWS resources (ECR repository%s)...", "" if ecr_only else ", execution roles")
+        graph = StepGraph()
 
-        # Use cached project name from config if available
-        if hasattr(agent_config, "codebuild") and agent_config.codebuild.project_name:
-            log.info("Using CodeBuild project from config: %s", agent_config.codebuild.project_name)
-            project_name = agent_config.codebuild.project_name
-        else:
+        def ensure_ecr():
+            ecr_uri = _ensure_ecr_repository(agent_config, project_config, config_path, agent_name, region)
+            if ecr_uri:
+                created_resources.append(f"ECR Repository: {ecr_uri}")
+            return ecr_uri
+
+        def ensure_execution_role():
+            _ensure_execution_role(agent_config, project_config, config_path, agent_name, region, account_id)
+            if agent_config.aws.execution_role:
+                created_resources.append(f"Runtime Execution Role: {agent_config.aws.execution_role}")
+
+        def find_reusable_image():
+            # Skip the build when an image was already built from the same build context
+            return codebuild_service.reuse_image(graph.results["ecr"], graph.results["source_tag"])
+
+        def ensure_codebuild_role():
+            if graph.results["reuse"]:
+                return None
+            # Use cached CodeBuild role from config if available
+            if hasattr(agent_config, "codebuild") and agent_config.codebuild.execution_role:
+                log.info("Using CodeBuild role from config: %s", agent_config.codebuild.execution_role)
+                return agent_config.codebuild.execution_role
+            ecr_repository_arn = f"arn:aws:ecr:{region}:{account_id}:repository/{graph.results['ecr'].split('/')[-1]}"
+            role = codebuild_service.create_codebuild_execution_role(
+                account_id=account_id, ecr_repository_arn=ecr_repository_arn, agent_name=agent_name
+            )
+            if role:
+                created_resources.append(f"CodeBuild Execution Role: {role}")
+            return role
+
+        def upload_source():
+            if graph.results["reuse"]:
+                return None
+            log.info("Preparing CodeBuild project and uploading source...")
+            return codebuild_service.upload_source(
+                agent_name=agent_name,
+                source_dir=source_dir,
+                dockerfile_dir=str(dockerfile_dir),
+                cache_dir=str(source_cache_dir),
+            )
+
+        def ensure_project():
+            if graph.results["reuse"]:
+                return None
+            # Use cached project name from config if available
+            if hasattr(agent_config, "codebuild") and agent_config.codebuild.project_name:
+                log.info("Using CodeBuild project from config: %s", agent_config.codebuild.project_name)
+                return agent_config.codebuild.project_name
             project_name = codebuild_service.create_or_update_project(
                 agent_name=agent_name,
-                ecr_repository_uri=ecr_uri,
-                execution_role=codebuild_execution_role,
-                source_location=source_location,
+                ecr_repository_uri=graph.results["ecr"],
+                execution_role=graph.results["codebuild_role"],
+                source_location=graph.results["source"],
             )
             if project_name:
                 created_resources.append(f"CodeBuild Project: {project_name}")
+            return project_name
+
+        graph.add("ecr", ensure_ecr)
+        # Setup execution role only if not ECR-only mode
+        if not ecr_only:
+            graph.add("execution_role", ensure_execution_role)
+        graph.add(
+            "source_tag",
+            lambda: codebuild_service.source_image_tag(
+                codebuild_service.compute_source_digest(
+                    source_dir, str(dockerfile_dir), cache_dir=str(source_cache_dir)
+                )
+            ),
+        )
+        graph.add("reuse", find_reusable_image, depends_on=["ecr", "source_tag"])
+        graph.add("codebuild_role", ensure_codebuild_role, depends_on=["reuse"])
+        graph.add("source", upload_source, depends_on=["reuse"])
+        graph.add("project", ensure_project, depends_on=["codebuild_role", "source"])
+        results = graph.run()
 
     except Exception as e:
         if created_resources:
@@ -947,12 +1107,31 @@ def _execute_codebuild_workflow(
             raise RuntimeToolkitException("Launch failed", created_resources) from e
         raise
 
+    ecr_uri, source_tag = results["ecr"], results["source_tag"]
+    image = results["reuse"]
+    if image:
+        log.info("♻️  Source unchanged, reusing image %s:%s (skipping CodeBuild)", ecr_uri, source_tag)
+        return None, ecr_uri, region, account_id, pin_image_uri(ecr_uri, image["imageDigest"])
+
+    project_name, source_location = results["project"], results["source"]
+    codebuild_execution_role = results["codebuild_role"]
+
     # Execute CodeBuild
     log.info("Starting CodeBuild build (this may take several minutes)...")
-    build_id = codebuild_service.start_build(project_name, source_location)
-    codebuild_service.wait_for_completion(build_id)
+    with timed_step("codebuild"):
+        build_id = codebuild_service.start_build(
+            project_name, source_location, ecr_repository_uri=ecr_uri, image_tag=source_tag
+        )
+        metrics = codebuild_service.wait_for_completion(build_id)
+        if metrics:
+            record_phases(metrics.phases)
     log.info("CodeBuild completed successfully")
 
+    image = codebuild_service.find_image(ecr_uri, source_tag)
+    image_uri = pin_image_uri(ecr_uri, image["imageDigest"]) if image else None
+    if image_uri:
+        log.info("Built image: %s", image_uri)
+
     # Update CodeBuild config only for full deployments, not ECR-only
     if not ecr_only:
         agent_config.codebuild.project_name = project_name
@@ -961,12 +1140,12 @@ def _execute_codebuild_workflow(
 
         # Save config changes
         project_config.agents[agent_config.name] = agent_config
-        save_config(project_config, config_path)
+        save_agent_config(agent_config, config_path)
         log.info("CodeBuild project configuration saved")
     else:
         log.info("ECR-only build completed (project configuration not saved)")
 
-    return build_id, ecr_uri, region, account_id
+    return build_id, ecr_uri, region, account_id, image_uri
 
 
 def _launch_with_codebuild(
@@ -981,19 +1160,33 @@ def _launch_with_codebuild(
     """Launch using CodeBuild for ARM64 builds."""
     if console is None:
         console = Console()
-    # Create memory if configured
-    _ensure_memory_for_agent(agent_config, project_config, config_path, agent_name, console=console)
 
+    # Memory provisioning (up to several minutes) overlaps with the container build;
+    # the agent is deployed once both are done, as it needs the memory ID
+    graph = StepGraph()
+    graph.add(
+        "memory",
+        lambda: _ensure_memory_for_agent(agent_config, project_config, config_path, agent_name, console=console),
+    )
     # Execute shared CodeBuild workflow with full deployment mode
-    build_id, ecr_uri, region, account_id = _execute_codebuild_workflow(
-        config_path=config_path,
-        agent_name=agent_name,
-        agent_config=agent_config,
-        project_config=project_config,
-        ecr_only=False,
-        auto_update_on_conflict=auto_update_on_conflict,
-        env_vars=env_vars,
+    graph.add(
+        "build",
+        lambda: _execute_codebuild_workflow(
+            config_path=config_path,
+            agent_name=agent_name,
+            agent_config=agent_config,
+            project_config=project_config,
+            ecr_only=False,
+            auto_update_on_conflict=auto_update_on_conflict,
+            env_vars=env_vars,
+        ),
     )
+    # Transaction Search setup does not depend on the agent either
+    graph.add(
+        "observability",
+        lambda: _enable_observability(agent_config, agent_config.aws.region, agent_config.aws.account),
+    )
+    build_id, ecr_uri, region, account_id, image_uri = graph.run()["build"]
 
     # Deploy to Bedrock AgentCore
     agent_id, agent_arn = _deploy_to_bedrock_agentcore(
@@ -1006,6 +1199,8 @@ def _launch_with_codebuild(
         account_id,
         env_vars=env_vars,
         auto_update_on_conflict=auto_update_on_conflict,
+        image_uri=image_uri,
+        enable_observability=False,
     )
 
     log.info("Deployment completed successfully - Agent: %s", agent_arn)
@@ -1015,11 +1210,50 @@ def _launch_with_codebuild(
         tag=f"bedrock_agentcore-{agent_name}:latest",
         codebuild_id=build_id,
         ecr_uri=ecr_uri,
+        image_uri=image_uri,
         agent_arn=agent_arn,
         agent_id=agent_id,
     )
 
 
+def _deployment_fingerprint(package_digest: str, runtime_settings: Dict[str, Any]) -> str:
+    """Hash the code package digest together with the settings sent to the Runtime API.
+
+    Args:
+        package_digest: SHA256 of the deployment package
+        runtime_settings: Arguments passed to create_or_update_agent
+
+    Returns:
+        SHA256 hex digest identifying this deployment
+    """
+    payload = json.dumps({"package": package_digest, "settings": runtime_settings}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _is_deployment_current(
+    client: BedrockAgentCoreClient, agent_id: Optional[str], stored_fingerprint: Optional[str], fingerprint: str
+) -> bool:
+    """Check whether the deployed agent already runs this exact package and configuration.
+
+    Args:
+        client: Bedrock AgentCore client
+        agent_id: Agent ID from the config (None if never deployed)
+        stored_fingerprint: Fingerprint recorded by the last update
+        fingerprint: Fingerprint of the deployment about to be made
+
+    Returns:
+        True if the agent exists, is ready and was last updated with the same fingerprint
+    """
+    if not agent_id or stored_fingerprint != fingerprint:
+        return False
+    try:
+        status = client.get_agent_runtime(agent_id).get("status")
+    except Exception as e:
+        log.debug("Could not check agent %s, updating it: %s", agent_id, e)
+        return False
+    return status == "READY"
+
+
 def _launch_with_direct_code_deploy(
     config_path: Path,
     agent_config: BedrockAgentCoreAgentSchema,
@@ -1027,6 +1261,9 @@ def _launch_with_direct_code_deploy(
     auto_update_on_conflict: bool,
     env_vars: Optional[dict],
     force_rebuild_deps: bool = False,
+    package_workers: Optional[int] = None,
+    optimize_package: bool = False,
+    precompile_bytecode: bool = False,
 ) -> LaunchResult:
     """Deploy using code zip artifact (Lambda-style deployment).
 
@@ -1037,17 +1274,18 @@ def _launch_with_direct_code_deploy(
         auto_update_on_conflict: Whether to auto-update on conflict
         env_vars: Environment variables
         force_rebuild_deps: Force rebuild of dependencies
+        package_workers: Number of threads used to compress the deployment package
+        optimize_package: Apply the package size optimizer to dependencies
+        precompile_bytecode: Ship precompiled bytecode for the runtime's Python version
 
     Returns:
         LaunchResult with deployment details
     """
     import shutil
-    import time
 
     log.info("Launching with direct_code_deploy deployment for agent '%s'", agent_config.name)
 
     # Validate configuration
-    step_start = time.time()
     errors = agent_config.validate(for_local=False)
     if errors:
         raise ValueError(f"Invalid configuration: {', '.join(errors)}")
@@ -1071,17 +1309,7 @@ def _launch_with_direct_code_deploy(
     account_id = agent_config.aws.account
     session = boto3.Session(region_name=region)
 
-    # Step 1: Ensure execution role
-    step_start = time.time()
-    log.info("Ensuring execution role...")
-    _ensure_execution_role(agent_config, project_config, config_path, agent_config.name, region, account_id)
-
-    # Step 2: Ensure memory (if configured)
-    step_start = time.time()
-    _ensure_memory_for_agent(agent_config, project_config, config_path, agent_config.name)
-
-    # Step 3: Prepare entrypoint (compute relative path from source directory)
-    step_start = time.time()
+    # Step 1: Prepare entrypoint (compute relative path from source directory)
     source_dir = Path(agent_config.source_path) if agent_config.source_path else config_path.parent
     entrypoint_abs = Path(agent_config.entrypoint)
 
@@ -1094,55 +1322,54 @@ def _launch_with_direct_code_deploy(
 
     log.info("Using entrypoint: %s (relative to %s)", entrypoint_path, source_dir)
 
-    # Step 4: Create deployment package
-    step_start = time.time()
+    # Step 2: Prepare deployment packaging
     from ...utils.runtime.config import get_agentcore_directory
+    from ...utils.runtime.dependency_store import DependencyStore
     from ...utils.runtime.entrypoint import detect_dependencies
+    from ...utils.runtime.optimize import PackageOptimizer
     from ...utils.runtime.package import CodeZipPackager
 
     cache_dir = get_agentcore_directory(config_path.parent, agent_config.name, agent_config.source_path)
 
-    packager = CodeZipPackager()
+    optimization = agent_config.package_optimization
+    optimizer = None
+    if optimize_package or optimization.enabled:
+        optimizer = PackageOptimizer(rules=optimization.rules, extra_patterns=optimization.exclude_patterns)
+
+    # Installed distributions are shared by every agent in the project
+    packager = CodeZipPackager(
+        workers=package_workers,
+        dependency_store=DependencyStore.for_project(config_path.parent),
+        optimizer=optimizer,
+        precompile=precompile_bytecode,
+    )
 
     # Detect dependencies
     dep_info = detect_dependencies(source_dir)
+    requirements_file = Path(dep_info.resolved_path) if dep_info.found else None
+    temp_dirs: List[Path] = []
 
-    log.info("Creating deployment package...")
-    deployment_zip, has_otel_distro = packager.create_deployment_package(
-        source_dir=source_dir,
-        agent_name=agent_config.name,
-        cache_dir=cache_dir,
-        runtime_version=agent_config.runtime_type,
-        requirements_file=Path(dep_info.resolved_path) if dep_info.found else None,
-        force_rebuild_deps=force_rebuild_deps,
-    )
-
-    try:
-        # Initialize variables for direct_code_deploy deployment
-        bucket_name = None
-        s3_key = None
+    def ensure_s3_bucket() -> None:
+        # Create S3 bucket if needed (idempotent)
+        if not agent_config.aws.s3_auto_create:
+            return
+        from ...services.s3 import get_or_create_s3_bucket
 
-        # Step 5a: Create S3 bucket if needed (idempotent)
-        if agent_config.aws.s3_auto_create:
-            from ...services.s3 import get_or_create_s3_bucket
+        log.info("Getting or creating S3 bucket for agent: %s", agent_config.name)
 
-            log.info("Getting or creating S3 bucket for agent: %s", agent_config.name)
+        bucket_name = get_or_create_s3_bucket(agent_config.name, account_id, region)
 
-            bucket_name = get_or_create_s3_bucket(agent_config.name, account_id, region)
+        # Update the config with S3 URI
+        agent_config.aws.s3_path = f"s3://{bucket_name}"
+        agent_config.aws.s3_auto_create = False
 
-            # Update the config with S3 URI
-            agent_config.aws.s3_path = f"s3://{bucket_name}"
-            agent_config.aws.s3_auto_create = False
-
-            # Update the project config and save
-            project_config.agents[agent_config.name] = agent_config
-            save_config(project_config, config_path)
+        # Update the project config and save
+        project_config.agents[agent_config.name] = agent_config
+        save_agent_config(agent_config, config_path)
 
-            log.info("S3 bucket available: %s", agent_config.aws.s3_path)
+        log.info("S3 bucket available: %s", agent_config.aws.s3_path)
 
-        # Step 5b: Upload to S3
-        log.info("Uploading deployment package to S3...")
-        step_start = time.time()
+    def resolve_upload_location():
         if agent_config.aws.s3_path:
             # Parse S3 URI or path to get bucket and prefix
             s3_input = agent_config.aws.s3_path
@@ -1155,36 +1382,79 @@ def _launch_with_direct_code_deploy(
 
             if "/" in s3_path:
                 bucket_name, prefix = s3_path.split("/", 1)
-                s3_key = f"{prefix}/{agent_config.name}/deployment.zip"
-            else:
-                bucket_name = s3_path
-                s3_key = f"{agent_config.name}/deployment.zip"
-
-            # Use configured bucket
-            s3 = session.client("s3")
-            log.info("Uploading to s3://%s/%s...", bucket_name, s3_key)
-            s3.upload_file(str(deployment_zip), bucket_name, s3_key, ExtraArgs={"ExpectedBucketOwner": account_id})
-            s3_location = f"s3://{bucket_name}/{s3_key}"
-        else:
-            # Fallback to existing logic
-            s3_location = packager.upload_to_s3(
-                deployment_zip=deployment_zip,
+                return bucket_name, f"{prefix}/{agent_config.name}/deployment.zip"
+            return s3_path, f"{agent_config.name}/deployment.zip"
+        # Fallback to the CodeBuild source bucket
+        return packager.resolve_upload_location(agent_config.name, session, account_id)
+
+    def package_and_upload():
+        # Package and upload, streaming the archive straight into S3
+        bucket_name, s3_key = graph.results["upload_location"]
+        log.info("Creating deployment package...")
+        try:
+            package = packager.stream_deployment_package(
+                source_dir=source_dir,
                 agent_name=agent_config.name,
+                cache_dir=cache_dir,
+                runtime_version=agent_config.runtime_type,
                 session=session,
+                bucket=bucket_name,
+                s3_key=s3_key,
                 account_id=account_id,
+                requirements_file=requirements_file,
+                force_rebuild_deps=force_rebuild_deps,
             )
-            # Extract bucket_name and s3_key from s3_location for later use
-            if s3_location.startswith("s3://"):
-                s3_path = s3_location[5:]  # Remove 's3://'
-                if "/" in s3_path:
-                    bucket_name, s3_key = s3_path.split("/", 1)
-                else:
-                    bucket_name = s3_path
-                    s3_key = f"{agent_config.name}/deployment.zip"
+            s3_location, has_otel_distro, package_digest = package.s3_location, package.has_otel_distro, package.digest
+        except StreamingUploadError as e:
+            log.warning("⚠️  Streaming upload failed, retrying from a temporary file: %s", e)
+            deployment_zip, has_otel_distro = packager.create_deployment_package(
+                source_dir=source_dir,
+                agent_name=agent_config.name,
+                cache_dir=cache_dir,
+                runtime_version=agent_config.runtime_type,
+                requirements_file=requirements_file,
+                force_rebuild_deps=force_rebuild_deps,
+            )
+            temp_dirs.append(deployment_zip.parent)
+            package_digest = hash_file(deployment_zip)
+
+            s3 = session.client("s3")
+            if get_object_digest(s3, bucket_name, s3_key, account_id) == package_digest:
+                log.info("✓ Deployment package unchanged (sha256 %s), skipping upload", package_digest[:12])
+            else:
+                log.info("Uploading to s3://%s/%s...", bucket_name, s3_key)
+                s3.upload_file(
+                    str(deployment_zip),
+                    bucket_name,
+                    s3_key,
+                    ExtraArgs={"ExpectedBucketOwner": account_id, "Metadata": {DIGEST_METADATA_KEY: package_digest}},
+                )
+            s3_location = f"s3://{bucket_name}/{s3_key}"
         log.info("✓ Deployment package uploaded: %s", s3_location)
+        return s3_location, has_otel_distro, package_digest
+
+    # Steps 3-5: AWS resources, packaging and observability setup are independent of each
+    # other; only the runtime deployment below needs all of them
+    graph = StepGraph()
+    graph.add(
+        "execution_role",
+        lambda: _ensure_execution_role(
+            agent_config, project_config, config_path, agent_config.name, region, account_id
+        ),
+    )
+    graph.add("memory", lambda: _ensure_memory_for_agent(agent_config, project_config, config_path, agent_config.name))
+    graph.add("s3_bucket", ensure_s3_bucket)
+    graph.add("upload_location", resolve_upload_location, depends_on=["s3_bucket"])
+    graph.add("package", package_and_upload, depends_on=["upload_location"])
+    graph.add("observability", lambda: _enable_observability(agent_config, region, account_id))
+
+    try:
+        log.info("Ensuring execution role and memory while packaging...")
+        results = graph.run()
+        bucket_name, s3_key = results["upload_location"]
+        s3_location, has_otel_distro, package_digest = results["package"]
 
         # Step 6: Deploy to Runtime
-        step_start = time.time()
         log.info("Deploying to Bedrock AgentCore Runtime...")
 
         bedrock_agentcore_client = BedrockAgentCoreClient(region)
@@ -1203,56 +1473,78 @@ def _launch_with_direct_code_deploy(
         if len(entrypoint_array) > 1:
             log.info("OpenTelemetry instrumentation enabled (aws-opentelemetry-distro detected)")
 
-        # Create/update agent with code configuration
-        agent_info = bedrock_agentcore_client.create_or_update_agent(
-            agent_id=agent_config.bedrock_agentcore.agent_id,
-            agent_name=agent_config.name,
-            execution_role_arn=agent_config.aws.execution_role,
-            deployment_type="direct_code_deploy",
-            code_s3_bucket=bucket_name,
-            code_s3_key=s3_key,
-            runtime_type=agent_config.runtime_type,  # Optional
-            entrypoint_array=entrypoint_array,  # Array format for Runtime API
-            entrypoint_handler=None,  # Not used
-            network_config=agent_config.aws.network_configuration.to_aws_dict(),
-            authorizer_config=agent_config.get_authorizer_configuration(),
-            request_header_config=agent_config.request_header_configuration,
-            protocol_config=agent_config.aws.protocol_configuration.to_aws_dict(),
-            env_vars=env_vars,
-            auto_update_on_conflict=auto_update_on_conflict,
-        )
+        network_config = agent_config.aws.network_configuration.to_aws_dict()
+        authorizer_config = agent_config.get_authorizer_configuration()
+        request_header_config = agent_config.request_header_configuration
+        protocol_config = agent_config.aws.protocol_configuration.to_aws_dict()
+        runtime_settings: Dict[str, Any] = {
+            "agent_name": agent_config.name,
+            "execution_role_arn": agent_config.aws.execution_role,
+            "deployment_type": "direct_code_deploy",
+            "code_s3_bucket": bucket_name,
+            "code_s3_key": s3_key,
+            "runtime_type": agent_config.runtime_type,
+            "entrypoint_array": entrypoint_array,
+            "network_config": network_config,
+            "authorizer_config": authorizer_config,
+            "request_header_config": request_header_config,
+            "protocol_config": protocol_config,
+            "env_vars": env_vars,
+        }
+        fingerprint = _deployment_fingerprint(package_digest, runtime_settings)
+
+        deployment = agent_config.bedrock_agentcore
+        if _is_deployment_current(
+            bedrock_agentcore_client, deployment.agent_id, deployment.deployment_fingerprint, fingerprint
+        ):
+            log.info("✓ Code and runtime settings unchanged, skipping agent update")
+            agent_info = {"id": str(deployment.agent_id), "arn": str(deployment.agent_arn)}
+        else:
+            # Create/update agent with code configuration
+            with timed_step("deploy"):
+                agent_info = bedrock_agentcore_client.create_or_update_agent(
+                    agent_id=deployment.agent_id,
+                    agent_name=agent_config.name,
+                    execution_role_arn=agent_config.aws.execution_role,
+                    deployment_type="direct_code_deploy",
+                    code_s3_bucket=bucket_name,
+                    code_s3_key=s3_key,
+                    runtime_type=agent_config.runtime_type,  # Optional
+                    entrypoint_array=entrypoint_array,  # Array format for Runtime API
+                    entrypoint_handler=None,  # Not used
+                    network_config=network_config,
+                    authorizer_config=authorizer_config,
+                    request_header_config=request_header_config,
+                    protocol_config=protocol_config,
+                    env_vars=env_vars,
+                    auto_update_on_conflict=auto_update_on_conflict,
+                )
 
-        # Save deployment info
-        agent_config.bedrock_agentcore.agent_id = agent_info["id"]
-        agent_config.bedrock_agentcore.agent_arn = agent_info["arn"]
-
-        # Reset session id if present
-        existing_session_id = agent_config.bedrock_agentcore.agent_session_id
-        if existing_session_id is not None:
-            log.warning(
-                "⚠️ Session ID will be reset to connect to the updated agent. "
-                "The previous agent remains accessible via the original session ID: %s",
-                existing_session_id,
-            )
-            agent_config.bedrock_agentcore.agent_session_id = None
+            # Save deployment info
+            deployment.agent_id = agent_info["id"]
+            deployment.agent_arn = agent_info["arn"]
+            deployment.package_digest = package_digest
+            deployment.deployment_fingerprint = fingerprint
+
+            # Reset session id if present
+            existing_session_id = deployment.agent_session_id
+            if existing_session_id is not None:
+                log.warning(
+                    "⚠️ Session ID will be reset to connect to the updated agent. "
+                    "The previous agent remains accessible via the original session ID: %s",
+                    existing_session_id,
+                )
+                deployment.agent_session_id = None
 
-        project_config.agents[agent_config.name] = agent_config
-        save_config(project_config, config_path)
+            project_config.agents[agent_config.name] = agent_config
+            save_agent_config(agent_config, config_path)
 
-        log.info("✅ Agent created/updated: %s", agent_info["arn"])
+            log.info("✅ Agent created/updated: %s", agent_info["arn"])
 
         # Step 7: Wait for ready
-        step_start = time.time()
         log.info("Waiting for agent endpoint to be ready...")
-        bedrock_agentcore_client.wait_for_agent_endpoint_ready(agent_info["id"])
-
-        # Step 8: Enable observability
-        step_start = time.time()
-        if agent_config.aws.observability.enabled:
-            log.info("Enabling observability...")
-            enable_transaction_search_if_needed(region, account_id)
-            console_url = get_genai_observability_url(region)
-            log.info("🔍 GenAI Observability Dashboard: %s", console_url)
+        with timed_step("endpoint_ready"):
+            bedrock_agentcore_client.wait_for_agent_endpoint_ready(agent_info["id"])
 
         log.info("✅ Deployment completed successfully - Agent: %s", agent_info["arn"])
 
@@ -1265,7 +1557,5 @@ def _launch_with_direct_code_deploy(
 
     finally:
         # Cleanup temp deployment.zip (only if it was created)
-        import shutil
-
-        if "deployment_zip" in locals():
-            shutil.rmtree(deployment_zip.parent, ignore_errors=True)
+        for temp_dir in temp_dirs:
+            shutil.rmtree(temp_dir, ignore_errors=True)
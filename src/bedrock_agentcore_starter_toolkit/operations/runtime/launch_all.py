@@ -0,0 +1,140 @@
+"""Launch every agent of a project configuration concurrently."""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, List, Optional
+
+import boto3
+from rich.console import Console
+
+from ...utils.runtime.config import get_agentcore_directory, load_config
+from .launch import launch_bedrock_agentcore
+from .models import AgentLaunchResult, MultiLaunchResult
+
+log = logging.getLogger(__name__)
+
+# Builds and runtime updates are mostly waiting on AWS; a few at a time stays well
+# inside the default CodeBuild concurrent build quota
+DEFAULT_LAUNCH_WORKERS = 4
+
+# Progress events passed to the progress callback
+LAUNCH_STARTED = "started"
+LAUNCH_SUCCEEDED = "succeeded"
+LAUNCH_FAILED = "failed"
+
+ProgressCallback = Callable[[str, str, Optional[AgentLaunchResult]], None]
+
+
+def launch_all_bedrock_agentcore(
+    config_path: Path,
+    agent_names: Optional[List[str]] = None,
+    max_workers: int = DEFAULT_LAUNCH_WORKERS,
+    use_codebuild: bool = True,
+    env_vars: Optional[dict] = None,
+    auto_update_on_conflict: bool = False,
+    force_rebuild_deps: bool = False,
+    package_workers: Optional[int] = None,
+    optimize_package: bool = False,
+    precompile_bytecode: bool = False,
+    progress: Optional[ProgressCallback] = None,
+    console: Optional[Console] = None,
+) -> MultiLaunchResult:
+    """Launch several agents of a project to the cloud with a bounded worker pool.
+
+    Each agent goes through the same packaging, build and deployment steps as
+    launch_bedrock_agentcore; a failing agent does not stop the others. Agents update
+    their own entry in the configuration file only, so concurrent launches do not
+    overwrite each other's deployment state. Agents without a source_path all keep their
+    build artifacts and caches in the project root, so they are launched one after another.
+
+    Args:
+        config_path: Path to BedrockAgentCore configuration file
+        agent_names: Agents to launch, defaults to every agent in the configuration
+        max_workers: Maximum number of agents launched at the same time
+        use_codebuild: Whether to build container agents with CodeBuild (False builds locally)
+        env_vars: Environment variables passed to every agent
+        auto_update_on_conflict: Whether to update agents that already exist
+        force_rebuild_deps: Force rebuild of dependencies (direct_code_deploy agents only)
+        package_workers: Threads used to compress each deployment package (direct_code_deploy agents only)
+        optimize_package: Apply the package size optimizer (direct_code_deploy agents only)
+        precompile_bytecode: Ship precompiled bytecode (direct_code_deploy agents only)
+        progress: Called with (agent_name, event, outcome) when an agent's launch starts,
+            succeeds or fails; outcome is None for the start event
+        console: Optional Rich Console passed to each launch
+
+    Returns:
+        MultiLaunchResult with one outcome per agent, in configuration order
+
+    Raises:
+        ValueError: If an agent is not in the configuration or max_workers is not positive
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    project_config = load_config(config_path)
+    names = list(agent_names) if agent_names else list(project_config.agents)
+    missing = [name for name in names if name not in project_config.agents]
+    if missing:
+        raise ValueError(f"Agents not found in configuration: {', '.join(missing)}")
+    if not names:
+        raise ValueError("No agents configured. Run 'agentcore configure' first.")
+
+    # Agents sharing an artifact directory would write the same package and source caches
+    groups = {}
+    for name in names:
+        artifact_dir = get_agentcore_directory(config_path.parent, name, project_config.agents[name].source_path)
+        groups.setdefault(artifact_dir, []).append(name)
+
+    workers = min(max_workers, len(groups))
+    log.info("Launching %d agents with %d workers", len(names), workers)
+
+    # boto3 creates its default session lazily and not thread-safely; create it up front
+    if boto3.DEFAULT_SESSION is None:
+        boto3.setup_default_session()
+
+    def launch_one(name: str) -> AgentLaunchResult:
+        if progress:
+            progress(name, LAUNCH_STARTED, None)
+        start = time.perf_counter()
+        try:
+            result = launch_bedrock_agentcore(
+                config_path,
+                agent_name=name,
+                local=False,
+                use_codebuild=use_codebuild,
+                env_vars=dict(env_vars) if env_vars else None,
+                auto_update_on_conflict=auto_update_on_conflict,
+                console=console,
+                force_rebuild_deps=force_rebuild_deps,
+                package_workers=package_workers,
+                optimize_package=optimize_package,
+                precompile_bytecode=precompile_bytecode,
+            )
+            outcome = AgentLaunchResult(agent_name=name, result=result, duration_seconds=time.perf_counter() - start)
+        except Exception as e:
+            log.error("❌ Launch of agent '%s' failed: %s", name, e)
+            outcome = AgentLaunchResult(agent_name=name, error=str(e), duration_seconds=time.perf_counter() - start)
+        if progress:
+            progress(name, LAUNCH_SUCCEEDED if outcome.succeeded else LAUNCH_FAILED, outcome)
+        return outcome
+
+    def launch_group(group: List[str]) -> List[AgentLaunchResult]:
+        return [launch_one(name) for name in group]
+
+    start = time.perf_counter()
+    outcomes = {}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="agentcore-launch") as executor:
+        futures = [executor.submit(launch_group, group) for group in groups.values()]
+        for future in as_completed(futures):
+            for outcome in future.result():
+                outcomes[outcome.agent_name] = outcome
+
+    result = MultiLaunchResult(
+        results=[outcomes[name] for name in names],
+        max_workers=workers,
+        duration_seconds=time.perf_counter() - start,
+    )
+    log.info("Launched %d of %d agents in %.1fs", len(result.succeeded), len(result.results), result.duration_seconds)
+    return result
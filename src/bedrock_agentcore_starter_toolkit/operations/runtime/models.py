@@ -32,6 +32,24 @@ class ConfigureResult(BaseModel):
 
 
 # Launch operation models
+class LaunchStepTiming(BaseModel):
+    """Timing of one step of a launch."""
+
+    name: str = Field(..., description="Step name; nested steps are named 'outer/inner'")
+    start_seconds: float = Field(..., description="When the step started, in seconds from the start of the launch")
+    duration_seconds: float = Field(..., description="Wall-clock time of the step")
+    failed: bool = Field(default=False, description="Whether the step raised an error")
+
+
+class LaunchProfile(BaseModel):
+    """Where the time of a launch went."""
+
+    agent_name: str = Field(..., description="Name of the launched agent")
+    mode: str = Field(..., description="Launch mode")
+    total_seconds: float = Field(..., description="Wall-clock time of the whole launch")
+    steps: List[LaunchStepTiming] = Field(default_factory=list, description="Timed steps, ordered by start time")
+
+
 class LaunchResult(BaseModel):
     """Result of launch operation."""
 
@@ -45,6 +63,7 @@ class LaunchResult(BaseModel):
 
     # Cloud mode fields
     ecr_uri: Optional[str] = Field(default=None, description="ECR repository URI")
+    image_uri: Optional[str] = Field(default=None, description="Digest-pinned image the agent was deployed with")
     agent_id: Optional[str] = Field(default=None, description="BedrockAgentCore agent ID")
     agent_arn: Optional[str] = Field(default=None, description="BedrockAgentCore agent ARN")
 
@@ -54,9 +73,66 @@ class LaunchResult(BaseModel):
     # Build output (optional)
     build_output: Optional[List[str]] = Field(default=None, description="Docker build output")
 
+    profile: Optional[LaunchProfile] = Field(default=None, description="Per-step timing of the launch")
+
     model_config = ConfigDict(arbitrary_types_allowed=True)  # For runtime field
 
 
+class AgentLaunchResult(BaseModel):
+    """Outcome of launching one agent as part of a multi-agent launch."""
+
+    agent_name: str = Field(..., description="Name of the agent")
+    result: Optional[LaunchResult] = Field(default=None, description="Launch result, if the launch succeeded")
+    error: Optional[str] = Field(default=None, description="Error message, if the launch failed")
+    duration_seconds: float = Field(default=0.0, description="Wall-clock time of the agent's launch")
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the agent was launched."""
+        return self.error is None
+
+
+class MultiLaunchResult(BaseModel):
+    """Result of launching several agents of a project."""
+
+    results: List[AgentLaunchResult] = Field(default_factory=list, description="Per-agent outcomes, in config order")
+    max_workers: int = Field(..., description="Number of agents launched concurrently")
+    duration_seconds: float = Field(default=0.0, description="Wall-clock time of the whole launch")
+
+    @property
+    def succeeded(self) -> List[AgentLaunchResult]:
+        """Agents that were launched."""
+        return [result for result in self.results if result.succeeded]
+
+    @property
+    def failed(self) -> List[AgentLaunchResult]:
+        """Agents whose launch failed."""
+        return [result for result in self.results if not result.succeeded]
+
+
+class RollbackResult(BaseModel):
+    """Result of rollback operation."""
+
+    agent_name: str = Field(..., description="Name of the agent that was rolled back")
+    agent_arn: Optional[str] = Field(default=None, description="BedrockAgentCore agent ARN")
+    image_uri: str = Field(..., description="Digest-pinned image the agent now runs")
+    previous_image_uri: Optional[str] = Field(default=None, description="Image the agent ran before the rollback")
+
+
+class WheelhouseResult(BaseModel):
+    """Result of wheelhouse operation."""
+
+    agent_name: str = Field(..., description="Name of the agent the wheelhouse was built for")
+    wheelhouse_path: Path = Field(..., description="Path to the wheelhouse directory")
+    lock_hash: str = Field(..., description="Hash of the resolved requirements the wheelhouse holds")
+    python_version: str = Field(..., description="Python version the wheels were collected for")
+    wheel_count: int = Field(..., description="Number of wheels in the wheelhouse")
+    rebuilt: bool = Field(..., description="Whether the wheelhouse was (re)built rather than already up to date")
+    dockerfile_uses_wheelhouse: bool = Field(
+        False, description="Whether the agent's Dockerfile installs from the wheelhouse"
+    )
+
+
 class InvokeResult(BaseModel):
     """Result of invoke operation."""
 
@@ -65,6 +141,52 @@ class InvokeResult(BaseModel):
     agent_arn: Optional[str] = Field(default=None, description="BedrockAgentCore agent ARN")
 
 
+# Bench operation models
+class LatencyStats(BaseModel):
+    """Distribution of a per-request latency, in seconds."""
+
+    count: int = Field(0, description="Number of measured requests")
+    min: float = Field(0.0, description="Fastest request")
+    mean: float = Field(0.0, description="Mean over all requests")
+    p50: float = Field(0.0, description="Median")
+    p90: float = Field(0.0, description="90th percentile")
+    p95: float = Field(0.0, description="95th percentile")
+    p99: float = Field(0.0, description="99th percentile")
+    max: float = Field(0.0, description="Slowest request")
+
+
+class BenchStageResult(BaseModel):
+    """Outcome of one stage of a benchmark schedule."""
+
+    concurrency: int = Field(..., description="Maximum requests in flight")
+    rate: Optional[float] = Field(None, description="Target request rate per second (None: as fast as possible)")
+    requests: int = Field(..., description="Requests sent in the stage")
+    failed: int = Field(..., description="Requests that failed")
+    duration_seconds: float = Field(..., description="Wall-clock time of the stage")
+    requests_per_second: float = Field(..., description="Achieved request rate")
+    latency: LatencyStats = Field(..., description="Total latency of successful requests")
+
+
+class BenchmarkResult(BaseModel):
+    """Result of an invocation benchmark."""
+
+    target: str = Field(..., description="Agent name or endpoint that was benchmarked")
+    mode: str = Field(..., description="Invocation path: cloud, local or endpoint")
+    sessions: int = Field(..., description="Number of runtime sessions the requests were spread over")
+    requests: int = Field(..., description="Requests sent")
+    succeeded: int = Field(..., description="Requests that completed")
+    failed: int = Field(..., description="Requests that failed")
+    error_rate: float = Field(..., description="Fraction of requests that failed")
+    errors: Dict[str, int] = Field(default_factory=dict, description="Failed requests by error")
+    duration_seconds: float = Field(..., description="Wall-clock time of the benchmark")
+    requests_per_second: float = Field(..., description="Achieved request rate")
+    events: int = Field(0, description="Response events received (streamed chunks, typically one token each)")
+    events_per_second: float = Field(0.0, description="Response events received per second of benchmark")
+    ttfb: LatencyStats = Field(..., description="Time to the first response event of successful requests")
+    latency: LatencyStats = Field(..., description="Total latency of successful requests")
+    stages: List[BenchStageResult] = Field(default_factory=list, description="Per-stage breakdown")
+
+
 # Status operation models
 class StatusConfigInfo(BaseModel):
     """Configuration information for status."""
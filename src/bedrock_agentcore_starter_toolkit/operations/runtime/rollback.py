@@ -0,0 +1,126 @@
+"""Rollback operation - redeploys a previously built container image without rebuilding."""
+
+import logging
+from pathlib import Path
+from typing import Optional
+
+from ...services.ecr import get_image_digest, is_pinned_image_uri, pin_image_uri
+from ...services.runtime import BedrockAgentCoreClient
+from ...utils.runtime.config import load_config
+from .launch import _deploy_to_bedrock_agentcore
+from .models import RollbackResult
+
+log = logging.getLogger(__name__)
+
+
+def resolve_image_uri(repository_uri: str, image: str, region: str) -> str:
+    """Resolve an image reference to a digest-pinned image URI.
+
+    Args:
+        repository_uri: ECR repository URI of the agent
+        image: Full image URI pinned by digest, a digest (sha256:...) or a tag in the repository
+        region: AWS region
+
+    Returns:
+        Digest-pinned image URI (repository@sha256:...)
+
+    Raises:
+        ValueError: If the tag does not exist in the repository
+    """
+    if is_pinned_image_uri(image):
+        return image
+    if image.startswith("sha256:"):
+        return pin_image_uri(repository_uri, image)
+
+    image_digest = get_image_digest(repository_uri, image, region)
+    if not image_digest:
+        raise ValueError(f"No image tagged '{image}' in {repository_uri}")
+    return pin_image_uri(repository_uri, image_digest)
+
+
+def rollback_bedrock_agentcore(
+    config_path: Path,
+    agent_name: Optional[str] = None,
+    image: Optional[str] = None,
+) -> RollbackResult:
+    """Point a deployed container agent at an image that was built before.
+
+    Only the agent runtime is updated: nothing is built or pushed.
+
+    Args:
+        config_path: Path to BedrockAgentCore configuration file
+        agent_name: Name of agent (for project configurations)
+        image: Image to deploy - a digest-pinned URI, a digest or a tag in the agent's ECR
+            repository (defaults to the image deployed before the current one)
+
+    Returns:
+        RollbackResult with the image now deployed
+
+    Raises:
+        ValueError: If the agent is not a deployed container agent or there is no image to roll back to
+    """
+    project_config = load_config(config_path)
+    agent_config = project_config.get_agent_config(agent_name)
+    deployment = agent_config.bedrock_agentcore
+
+    if agent_config.deployment_type != "container":
+        raise ValueError("Rollback is only supported for container deployments")
+    if not deployment.agent_id:
+        raise ValueError(
+            f"Agent '{agent_config.name}' is not deployed. Run 'agentcore launch' to deploy the agent first."
+        )
+
+    region = agent_config.aws.region
+    ecr_uri = agent_config.aws.ecr_repository
+    if image:
+        if not ecr_uri and not is_pinned_image_uri(image):
+            raise ValueError("No ECR repository configured to resolve the image in")
+        target = resolve_image_uri(ecr_uri or "", image, region)
+    else:
+        target = deployment.previous_image_uri
+        if not target:
+            raise ValueError(
+                f"No previous image recorded for agent '{agent_config.name}'. Pass --image with a tag or digest."
+            )
+        if not is_pinned_image_uri(target):
+            # A mutable tag may name the image running now, so "rolling back" to it could change nothing
+            raise ValueError(
+                f"Previous image {target} of agent '{agent_config.name}' is not pinned by digest. "
+                "Pass --image with a tag or digest."
+            )
+
+    if target == deployment.image_uri:
+        log.info("Agent '%s' already runs %s", agent_config.name, target)
+        return RollbackResult(
+            agent_name=agent_config.name,
+            agent_arn=deployment.agent_arn,
+            image_uri=target,
+            previous_image_uri=deployment.previous_image_uri,
+        )
+
+    log.info("Rolling back agent '%s' to %s", agent_config.name, target)
+
+    # Keep the environment the agent runs with; launch-time --env values are not in the config
+    current = BedrockAgentCoreClient(region).get_agent_runtime(deployment.agent_id)
+    env_vars = dict(current.get("environmentVariables") or {})
+
+    _, agent_arn = _deploy_to_bedrock_agentcore(
+        agent_config,
+        project_config,
+        config_path,
+        agent_config.name,
+        target.split("@", 1)[0],
+        region,
+        agent_config.aws.account,
+        env_vars=env_vars,
+        auto_update_on_conflict=True,
+        image_uri=target,
+        enable_observability=False,
+    )
+
+    return RollbackResult(
+        agent_name=agent_config.name,
+        agent_arn=agent_arn,
+        image_uri=target,
+        previous_image_uri=agent_config.bedrock_agentcore.previous_image_uri,
+    )
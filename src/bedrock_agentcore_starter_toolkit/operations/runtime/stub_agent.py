@@ -0,0 +1,65 @@
+"""Provides a Starlette-based stand-in agent for benchmarking invocation paths offline."""
+
+import asyncio
+import json
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+STUB_AGENT_PORT = 8080
+
+
+class StubAgent(Starlette):
+    """Stand-in for an agent container: serves /invocations and /ping with synthetic, paced output.
+
+    Each invocation streams ``chunks`` Server-Sent Events, echoing the words of the payload's
+    ``prompt``, after ``first_chunk_delay`` seconds and ``chunk_delay`` seconds apart, the
+    way a model streams tokens.
+    """
+
+    def __init__(self, chunks: int = 20, first_chunk_delay: float = 0.1, chunk_delay: float = 0.02):
+        """Initialize the stand-in agent."""
+        self.chunks = chunks
+        self.first_chunk_delay = first_chunk_delay
+        self.chunk_delay = chunk_delay
+        routes = [
+            Route("/invocations", self._handle_invocation, methods=["POST"]),
+            Route("/ping", self._handle_ping, methods=["GET"]),
+        ]
+        super().__init__(routes=routes)
+
+    def run(self, **kwargs):
+        """Start the stand-in agent server."""
+        uvicorn_params = {
+            "host": "127.0.0.1",
+            "port": STUB_AGENT_PORT,
+            "access_log": False,
+            "log_level": "warning",
+        }
+        uvicorn_params.update(kwargs)
+
+        uvicorn.run(self, **uvicorn_params)
+
+    async def _handle_invocation(self, request: Request) -> Response:
+        try:
+            payload = await request.json()
+        except json.JSONDecodeError:
+            return JSONResponse(status_code=400, content={"message": "payload must be JSON"})
+
+        prompt = payload.get("prompt", "") if isinstance(payload, dict) else payload
+        words = str(prompt).split() or ["ok"]
+
+        async def stream():
+            await asyncio.sleep(self.first_chunk_delay)
+            for i in range(self.chunks):
+                if i:
+                    await asyncio.sleep(self.chunk_delay)
+                yield f"data: {json.dumps(words[i % len(words)] + ' ')}\n\n"
+
+        return StreamingResponse(stream(), media_type="text/event-stream")
+
+    async def _handle_ping(self, request: Request) -> JSONResponse:
+        return JSONResponse({"status": "Healthy"})
@@ -0,0 +1,74 @@
+"""Wheelhouse operation - prebuilds the wheels of a container agent's dependencies."""
+
+import logging
+from pathlib import Path
+from typing import Optional
+
+from ...utils.runtime.config import get_agentcore_directory, load_config
+from ...utils.runtime.container import OTEL_DISTRO
+from ...utils.runtime.entrypoint import detect_dependencies, get_python_version
+from ...utils.runtime.wheelhouse import WHEELHOUSE_DIR, build_wheelhouse
+from .models import WheelhouseResult
+
+log = logging.getLogger(__name__)
+
+
+def build_agent_wheelhouse(
+    config_path: Path,
+    agent_name: Optional[str] = None,
+    requirements_file: Optional[str] = None,
+    force: bool = False,
+) -> WheelhouseResult:
+    """Build the wheelhouse of a container agent in its Docker build context.
+
+    The Dockerfile generated by configure installs the locked dependencies offline from
+    the wheelhouse, so container builds (local or CodeBuild) do not reach PyPI.
+
+    Args:
+        config_path: Path to BedrockAgentCore configuration file
+        agent_name: Name of agent (for project configurations)
+        requirements_file: Dependency file to resolve (defaults to the one configure detects)
+        force: Rebuild even if the wheelhouse matches the current lock
+
+    Returns:
+        WheelhouseResult describing the wheelhouse
+
+    Raises:
+        ValueError: If the agent is not a container agent or has no dependency file
+    """
+    project_config = load_config(config_path)
+    agent_config = project_config.get_agent_config(agent_name)
+
+    if agent_config.deployment_type != "container":
+        raise ValueError("A wheelhouse is only used by container deployments")
+
+    build_dir = Path(agent_config.source_path) if agent_config.source_path else config_path.parent
+    deps = detect_dependencies(build_dir, explicit_file=requirements_file)
+    if not deps.found:
+        raise ValueError(f"No requirements.txt or pyproject.toml found for agent '{agent_config.name}'")
+
+    python_version = get_python_version()
+    extra = [f"{OTEL_DISTRO}>=0.10.1"] if agent_config.aws.observability.enabled else []
+
+    log.info("Building wheelhouse for agent '%s' from %s", agent_config.name, deps.file)
+    wheelhouse = build_wheelhouse(
+        Path(deps.resolved_path),
+        build_dir / WHEELHOUSE_DIR,
+        python_version,
+        extra_requirements=extra,
+        force=force,
+    )
+
+    # The Dockerfile only installs from the wheelhouse if it existed when configure generated it
+    dockerfile = get_agentcore_directory(config_path.parent, agent_config.name, agent_config.source_path) / "Dockerfile"
+    dockerfile_uses_wheelhouse = dockerfile.exists() and f"--find-links {WHEELHOUSE_DIR}" in dockerfile.read_text()
+
+    return WheelhouseResult(
+        agent_name=agent_config.name,
+        wheelhouse_path=wheelhouse.path,
+        lock_hash=wheelhouse.lock_hash,
+        python_version=python_version,
+        wheel_count=len(wheelhouse.wheels),
+        rebuilt=wheelhouse.rebuilt,
+        dockerfile_uses_wheelhouse=dockerfile_uses_wheelhouse,
+    )
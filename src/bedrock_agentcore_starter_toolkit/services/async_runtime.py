@@ -0,0 +1,463 @@
+"""Asyncio-native Bedrock AgentCore clients for agent invocation.
+
+Counterparts of the invocation methods of ``BedrockAgentCoreClient`` (SigV4, IAM
+credentials) and ``HttpBedrockAgentCoreClient`` (bearer token) built on httpx. Requests
+run on the event loop over a shared keep-alive connection pool, so a single process can
+drive thousands of concurrent agent sessions without a thread per call.
+"""
+
+import asyncio
+import json
+import logging
+import urllib.parse
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import boto3
+import httpx
+from botocore.auth import SigV4Auth
+from botocore.awsrequest import AWSRequest
+from botocore.credentials import ReadOnlyCredentials
+from botocore.exceptions import NoCredentialsError
+
+from ..utils.endpoints import get_data_plane_endpoint
+from ..utils.runtime.sse import aiter_sse_events
+from .runtime import _decode_event_data, _get_user_agent
+
+# Connection pool of the async clients: concurrent connections, and idle ones kept alive
+DEFAULT_ASYNC_MAX_CONNECTIONS = 1000
+DEFAULT_ASYNC_MAX_KEEPALIVE_CONNECTIONS = 100
+
+# Same limits as the botocore config of the synchronous clients
+INVOKE_TIMEOUT = httpx.Timeout(900, connect=60)
+
+SIGNING_SERVICE = "bedrock-agentcore"
+
+
+def _invocation_url(dp_endpoint: str, agent_arn: str) -> str:
+    escaped_arn = urllib.parse.quote(agent_arn, safe="")
+    return f"{dp_endpoint}/runtimes/{escaped_arn}/invocations"
+
+
+class _AsyncInvocationClient:
+    """Shared connection handling of the async clients."""
+
+    def __init__(
+        self,
+        logger_name: str,
+        client: Optional[httpx.AsyncClient],
+        max_connections: int,
+        max_keepalive_connections: int,
+    ):
+        self.logger = logging.getLogger(logger_name)
+        self._owns_client = client is None
+        self.client = client or httpx.AsyncClient(
+            timeout=INVOKE_TIMEOUT,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive_connections),
+        )
+
+    async def __aenter__(self):
+        """Enter the client context."""
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Close the client on leaving its context."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the connection pool, unless it was provided by the caller."""
+        if self._owns_client:
+            await self.client.aclose()
+
+    async def _send(self, request: httpx.Request) -> httpx.Response:
+        """Send a request, returning the response with its body still unread."""
+        try:
+            response = await self.client.send(request, stream=True)
+        except httpx.HTTPError as e:
+            self.logger.error("Failed to invoke agent endpoint: %s", str(e))
+            raise
+
+        if response.is_error:
+            # Read the error body so it is part of the raised exception's response
+            await response.aread()
+            await response.aclose()
+            self.logger.error("Failed to invoke agent endpoint: %s %s", response.status_code, response.text)
+            response.raise_for_status()
+        return response
+
+    async def _stream(self, request: httpx.Request) -> AsyncIterator[Any]:
+        """Yield the events of an invocation as they arrive, closing the response when done or abandoned."""
+        response = await self._send(request)
+        try:
+            if "text/event-stream" in response.headers.get("content-type", ""):
+                async for event in aiter_sse_events(response.aiter_bytes()):
+                    yield _decode_event_data(event.data)
+            else:
+                content = await response.aread()
+                if not content:
+                    raise ValueError("Empty response from agent endpoint")
+                yield _decode_event_data(response.text)
+        finally:
+            await response.aclose()
+
+    async def _invoke(self, request: httpx.Request) -> Dict:
+        """Send an invocation and collect its response.
+
+        Returns:
+            ``{"response": [events]}`` for a streaming response, ``{"response": text}`` otherwise
+        """
+        response = await self._send(request)
+        try:
+            if "text/event-stream" in response.headers.get("content-type", ""):
+                events: List[Any] = []
+                async for event in aiter_sse_events(response.aiter_bytes()):
+                    events.append(_decode_event_data(event.data))
+                return {"response": events}
+
+            content = await response.aread()
+            if not content:
+                raise ValueError("Empty response from agent endpoint")
+            return {"response": response.text}
+        finally:
+            await response.aclose()
+
+
+class AsyncBedrockAgentCoreClient(_AsyncInvocationClient):
+    """Async Bedrock AgentCore invocation client authenticating with SigV4-signed IAM credentials."""
+
+    def __init__(
+        self,
+        region: str,
+        client: Optional[httpx.AsyncClient] = None,
+        boto_session: Optional[boto3.Session] = None,
+        max_connections: int = DEFAULT_ASYNC_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_ASYNC_MAX_KEEPALIVE_CONNECTIONS,
+    ):
+        """Initialize AsyncBedrockAgentCoreClient.
+
+        Args:
+            region: AWS region for the client
+            client: httpx client to send requests with (closed by the caller)
+            boto_session: Session to take credentials from (defaults to the default credential chain)
+            max_connections: Maximum number of concurrent connections (without a client)
+            max_keepalive_connections: Maximum number of idle connections kept alive (without a client)
+        """
+        self.region = region
+        self.dp_endpoint = get_data_plane_endpoint(region)
+        super().__init__(
+            f"bedrock_agentcore.async_runtime.{region}",
+            client,
+            max_connections,
+            max_keepalive_connections,
+        )
+        self._boto_session = boto_session or boto3.Session()
+        # Resolved on first use, off the event loop: the credential chain may call out to IMDS, ECS or SSO
+        self._credentials = None
+        self._credentials_lock = asyncio.Lock()
+
+    async def invoke_endpoint(
+        self,
+        agent_arn: str,
+        payload: str,
+        session_id: str,
+        endpoint_name: str = "DEFAULT",
+        user_id: Optional[str] = None,
+        custom_headers: Optional[dict] = None,
+    ) -> Dict:
+        """Invoke agent endpoint.
+
+        Args:
+            agent_arn: Agent ARN to invoke
+            payload: Payload to send as string
+            session_id: Session ID for the request
+            endpoint_name: Endpoint name, defaults to "DEFAULT"
+            user_id: Optional user ID for authorization
+            custom_headers: Optional custom headers to include in the request
+
+        Returns:
+            Response from the agent endpoint: the decoded events of a streaming response, or the body text
+        """
+        request = await self._build_request(agent_arn, payload, session_id, endpoint_name, user_id, custom_headers)
+        return await self._invoke(request)
+
+    def invoke_stream(
+        self,
+        agent_arn: str,
+        payload: str,
+        session_id: str,
+        endpoint_name: str = "DEFAULT",
+        user_id: Optional[str] = None,
+        custom_headers: Optional[dict] = None,
+    ) -> AsyncIterator[Any]:
+        """Invoke agent endpoint and yield its response events as they arrive.
+
+        The request is sent when iteration starts and the response is read only as events
+        are consumed. Closing the iterator (``aclose()``, or ``contextlib.aclosing`` around
+        an ``async for`` that may exit early) closes the connection.
+
+        Args:
+            agent_arn: Agent ARN to invoke
+            payload: Payload to send as string
+            session_id: Session ID for the request
+            endpoint_name: Endpoint name, defaults to "DEFAULT"
+            user_id: Optional user ID for authorization
+            custom_headers: Optional custom headers to include in the request
+
+        Returns:
+            Async iterator over the event data of a streaming response (JSON-decoded where
+            possible), or over the decoded body of a non-streaming one
+        """
+        return self._signed_stream(agent_arn, payload, session_id, endpoint_name, user_id, custom_headers)
+
+    async def _signed_stream(self, *request_args) -> AsyncIterator[Any]:
+        request = await self._build_request(*request_args)
+        async with aclosing(self._stream(request)) as events:
+            async for event in events:
+                yield event
+
+    async def _get_frozen_credentials(self) -> ReadOnlyCredentials:
+        """Resolve the credentials to sign with in a worker thread.
+
+        Refreshable credentials (assume role, SSO, container or instance metadata) refresh with
+        a blocking network call when close to expiry, which must not stall the other
+        invocations on the event loop. They are read per request, so long-running processes
+        pick up rotated keys.
+        """
+        async with self._credentials_lock:
+            if self._credentials is None:
+                self._credentials = await asyncio.to_thread(self._boto_session.get_credentials)
+        if self._credentials is None:
+            raise NoCredentialsError()
+        return await asyncio.to_thread(self._credentials.get_frozen_credentials)
+
+    async def _build_request(
+        self,
+        agent_arn: str,
+        payload: str,
+        session_id: str,
+        endpoint_name: str,
+        user_id: Optional[str],
+        custom_headers: Optional[dict],
+    ) -> httpx.Request:
+        """Build a SigV4-signed InvokeAgentRuntime request."""
+        credentials = await self._get_frozen_credentials()
+
+        url = f"{_invocation_url(self.dp_endpoint, agent_arn)}?{urllib.parse.urlencode({'qualifier': endpoint_name})}"
+        headers = {
+            "Content-Type": "application/json",
+            "X-Amzn-Bedrock-AgentCore-Runtime-Session-Id": session_id,
+            "User-Agent": _get_user_agent(),
+        }
+        if user_id:
+            headers["X-Amzn-Bedrock-AgentCore-Runtime-User-Id"] = user_id
+        # Custom headers are signed along with the rest, as with the boto3 client
+        if custom_headers:
+            headers.update(custom_headers)
+
+        body = payload.encode("utf-8") if isinstance(payload, str) else payload
+        aws_request = AWSRequest(method="POST", url=url, data=body, headers=headers)
+        SigV4Auth(credentials, SIGNING_SERVICE, self.region).add_auth(aws_request)
+
+        return self.client.build_request("POST", url, content=body, headers=dict(aws_request.headers.items()))
+
+
+class AsyncHttpBedrockAgentCoreClient(_AsyncInvocationClient):
+    """Async Bedrock AgentCore invocation client authenticating with a bearer token."""
+
+    def __init__(
+        self,
+        region: str,
+        client: Optional[httpx.AsyncClient] = None,
+        max_connections: int = DEFAULT_ASYNC_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_ASYNC_MAX_KEEPALIVE_CONNECTIONS,
+    ):
+        """Initialize AsyncHttpBedrockAgentCoreClient.
+
+        Args:
+            region: AWS region for the client
+            client: httpx client to send requests with (closed by the caller)
+            max_connections: Maximum number of concurrent connections (without a client)
+            max_keepalive_connections: Maximum number of idle connections kept alive (without a client)
+        """
+        self.region = region
+        self.dp_endpoint = get_data_plane_endpoint(region)
+        super().__init__(
+            f"bedrock_agentcore.async_http_runtime.{region}",
+            client,
+            max_connections,
+            max_keepalive_connections,
+        )
+
+    async def invoke_endpoint(
+        self,
+        agent_arn: str,
+        payload,
+        session_id: str,
+        bearer_token: Optional[str],
+        endpoint_name: str = "DEFAULT",
+        custom_headers: Optional[dict] = None,
+    ) -> Dict:
+        """Invoke agent endpoint using HTTP request with bearer token.
+
+        Args:
+            agent_arn: Agent ARN to invoke
+            payload: Payload to send (dict or string)
+            session_id: Session ID for the request
+            bearer_token: Bearer token for authentication
+            endpoint_name: Endpoint name, defaults to "DEFAULT"
+            custom_headers: Optional custom headers to include in the request
+
+        Returns:
+            Response from the agent endpoint: the decoded events of a streaming response, or the body text
+        """
+        request = self._build_request(agent_arn, payload, session_id, bearer_token, endpoint_name, custom_headers)
+        return await self._invoke(request)
+
+    def invoke_stream(
+        self,
+        agent_arn: str,
+        payload,
+        session_id: str,
+        bearer_token: Optional[str],
+        endpoint_name: str = "DEFAULT",
+        custom_headers: Optional[dict] = None,
+    ) -> AsyncIterator[Any]:
+        """Invoke agent endpoint with bearer token and yield its response events as they arrive.
+
+        The request is sent when iteration starts and the response is read only as events
+        are consumed. Closing the iterator (``aclose()``, or ``contextlib.aclosing`` around
+        an ``async for`` that may exit early) closes the connection.
+
+        Args:
+            agent_arn: Agent ARN to invoke
+            payload: Payload to send (dict or string)
+            session_id: Session ID for the request
+            bearer_token: Bearer token for authentication
+            endpoint_name: Endpoint name, defaults to "DEFAULT"
+            custom_headers: Optional custom headers to include in the request
+
+        Returns:
+            Async iterator over the event data of a streaming response (JSON-decoded where
+            possible), or over the decoded body of a non-streaming one
+        """
+        request = self._build_request(agent_arn, payload, session_id, bearer_token, endpoint_name, custom_headers)
+        return self._stream(request)
+
+    def _build_request(
+        self,
+        agent_arn: str,
+        payload,
+        session_id: str,
+        bearer_token: Optional[str],
+        endpoint_name: str,
+        custom_headers: Optional[dict],
+    ) -> httpx.Request:
+        headers = {
+            "Authorization": f"Bearer {bearer_token}",
+            "Content-Type": "application/json",
+            "X-Amzn-Bedrock-AgentCore-Runtime-Session-Id": session_id,
+            "User-Agent": _get_user_agent(),
+        }
+        if custom_headers:
+            headers.update(custom_headers)
+
+        # Send the payload as a JSON object, as the synchronous HTTP client does
+        try:
+            body = json.loads(payload) if isinstance(payload, str) else payload
+        except json.JSONDecodeError:
+            self.logger.warning("Failed to parse payload as JSON, wrapping in payload object")
+            body = {"payload": payload}
+
+        return self.client.build_request(
+            "POST",
+            _invocation_url(self.dp_endpoint, agent_arn),
+            params={"qualifier": endpoint_name},
+            headers=headers,
+            content=json.dumps(body).encode("utf-8"),
+        )
+
+
+class AsyncLocalBedrockAgentCoreClient(_AsyncInvocationClient):
+    """Async client for invoking an agent container (or a stand-in for one) over HTTP."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        client: Optional[httpx.AsyncClient] = None,
+        max_connections: int = DEFAULT_ASYNC_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_ASYNC_MAX_KEEPALIVE_CONNECTIONS,
+    ):
+        """Initialize AsyncLocalBedrockAgentCoreClient.
+
+        Args:
+            endpoint: Base URL of the agent container
+            client: httpx client to send requests with (closed by the caller)
+            max_connections: Maximum number of concurrent connections (without a client)
+            max_keepalive_connections: Maximum number of idle connections kept alive (without a client)
+        """
+        self.endpoint = endpoint.rstrip("/")
+        super().__init__("bedrock_agentcore.async_http_local", client, max_connections, max_keepalive_connections)
+
+    async def invoke_endpoint(
+        self,
+        session_id: str,
+        payload: str,
+        workload_access_token: Optional[str] = None,
+        oauth2_callback_url: Optional[str] = None,
+        custom_headers: Optional[dict] = None,
+    ) -> Dict:
+        """Invoke the endpoint with the given parameters.
+
+        Returns:
+            Response from the agent: the decoded events of a streaming response, or the body text
+        """
+        request = self._build_request(session_id, payload, workload_access_token, oauth2_callback_url, custom_headers)
+        return await self._invoke(request)
+
+    def invoke_stream(
+        self,
+        session_id: str,
+        payload: str,
+        workload_access_token: Optional[str] = None,
+        oauth2_callback_url: Optional[str] = None,
+        custom_headers: Optional[dict] = None,
+    ) -> AsyncIterator[Any]:
+        """Invoke the endpoint and iterate over its response events as they arrive.
+
+        The request is sent when iteration starts; closing the iterator closes the connection.
+        """
+        request = self._build_request(session_id, payload, workload_access_token, oauth2_callback_url, custom_headers)
+        return self._stream(request)
+
+    def _build_request(
+        self,
+        session_id: str,
+        payload: str,
+        workload_access_token: Optional[str],
+        oauth2_callback_url: Optional[str],
+        custom_headers: Optional[dict],
+    ) -> httpx.Request:
+        from bedrock_agentcore.runtime.models import ACCESS_TOKEN_HEADER, OAUTH2_CALLBACK_URL_HEADER, SESSION_HEADER
+
+        headers = {
+            "Content-Type": "application/json",
+            SESSION_HEADER: session_id,
+            "User-Agent": _get_user_agent(),
+        }
+        # A stand-in endpoint needs no workload identity
+        if workload_access_token:
+            headers[ACCESS_TOKEN_HEADER] = workload_access_token
+        if oauth2_callback_url:
+            headers[OAUTH2_CALLBACK_URL_HEADER] = oauth2_callback_url
+        if custom_headers:
+            headers.update(custom_headers)
+
+        try:
+            body = json.loads(payload) if isinstance(payload, str) else payload
+        except json.JSONDecodeError:
+            self.logger.warning("Failed to parse payload as JSON, wrapping in payload object")
+            body = {"payload": payload}
+
+        return self.client.build_request(
+            "POST", f"{self.endpoint}/invocations", headers=headers, content=json.dumps(body).encode("utf-8")
+        )
@@ -1,20 +1,225 @@
 """CodeBuild service for ARM64 container builds."""
 
-import fnmatch
+import hashlib
+import json
 import logging
 import os
 import tempfile
 import time
-import zipfile
+from dataclasses import dataclass, field
 from importlib.resources import files
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
 import boto3
 from botocore.exceptions import ClientError
 
 from ..operations.runtime.create_role import get_or_create_codebuild_execution_role
+from ..utils.runtime.archive import hash_file, write_incremental_zip
+from ..utils.runtime.ignore import compile_ignore_patterns
 from .ecr import sanitize_ecr_repo_name
+from .s3 import DIGEST_METADATA_KEY, get_object_digest
+
+# Prefix of the ECR tag holding the image built from a given build context digest
+SOURCE_TAG_PREFIX = "src-"
+
+SOURCE_CACHE_VERSION = 1
+
+# BuildKit layer cache kept next to the images in the agent's ECR repository
+CACHE_TAG = "buildcache"
+# mode=max also caches intermediate stages; ECR needs the cache stored as an OCI image manifest.
+# A failed cache export must not fail an otherwise good build.
+CACHE_EXPORT_OPTIONS = "mode=max,image-manifest=true,oci-mediatypes=true,ignore-error=true"
+BUILDER_NAME = "agentcore-builder"
+# CodeBuild keeps the Docker daemon's layers (e.g. the BuildKit image) between builds on the same host
+PROJECT_CACHE = {"type": "LOCAL", "modes": ["LOCAL_DOCKER_LAYER_CACHE"]}
+
+# Seconds between status polls when a phase starts; the interval grows while the phase
+# lasts (up to MAX_POLL_INTERVAL) and resets on every phase change
+PHASE_POLL_INTERVALS = {
+    "SUBMITTED": 2.0,
+    "QUEUED": 5.0,
+    "PROVISIONING": 5.0,
+    "DOWNLOAD_SOURCE": 2.0,
+    "INSTALL": 2.0,
+    "PRE_BUILD": 2.0,
+    "BUILD": 3.0,
+    "POST_BUILD": 2.0,
+    "UPLOAD_ARTIFACTS": 1.0,
+    "FINALIZING": 1.0,
+}
+DEFAULT_POLL_INTERVAL = 2.0
+MAX_POLL_INTERVAL = 10.0
+POLL_BACKOFF = 1.5
+TERMINAL_BUILD_STATUSES = ("SUCCEEDED", "FAILED", "FAULT", "STOPPED", "TIMED_OUT")
+
+
+@dataclass
+class BuildMetrics:
+    """Timing and API usage of a monitored CodeBuild build."""
+
+    build_id: str
+    status: str = "IN_PROGRESS"
+    total_seconds: float = 0.0
+    # Phase name -> duration in seconds, in execution order
+    phases: Dict[str, float] = field(default_factory=dict)
+    status_polls: int = 0
+    log_requests: int = 0
+    log_events: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Metrics as a JSON-serializable dict."""
+        return {
+            "build_id": self.build_id,
+            "status": self.status,
+            "total_seconds": round(self.total_seconds, 1),
+            "phases": {phase: round(seconds, 1) for phase, seconds in self.phases.items()},
+            "status_polls": self.status_polls,
+            "log_requests": self.log_requests,
+            "log_events": self.log_events,
+        }
+
+
+class BuildLogTail:
+    """Incrementally fetches a build's CloudWatch log events.
+
+    Each poll pages through ``filter_log_events`` with its ``nextToken`` and resumes the
+    next poll from the timestamp of the last event seen, skipping events already emitted
+    at that timestamp.
+    """
+
+    def __init__(self, logs_client, logger: logging.Logger):
+        """Create a tail that emits log lines through logger."""
+        self.logs_client = logs_client
+        self.logger = logger
+        self.disabled = False
+        self.requests = 0
+        self.events = 0
+        self._last_timestamp: Optional[int] = None
+        self._seen_at_last_timestamp: set = set()
+
+    def poll(self, build: Dict[str, Any]) -> int:
+        """Emit log events written since the previous poll.
+
+        Args:
+            build: Build description from batch_get_builds
+
+        Returns:
+            Number of new events emitted
+        """
+        logs = build.get("logs") or {}
+        group, stream = logs.get("groupName"), logs.get("streamName")
+        if self.disabled or not group or not stream:
+            return 0
+
+        kwargs: Dict[str, Any] = {"logGroupName": group, "logStreamNames": [stream]}
+        if self._last_timestamp is not None:
+            kwargs["startTime"] = self._last_timestamp
+
+        emitted = 0
+        while True:
+            try:
+                response = self.logs_client.filter_log_events(**kwargs)
+            except ClientError as e:
+                if e.response["Error"]["Code"] != "ResourceNotFoundException":
+                    # Streaming is best effort: keep monitoring the build without it
+                    self.logger.warning("⚠️ Build logs unavailable, showing phases only: %s", e)
+                    self.disabled = True
+                return emitted
+            self.requests += 1
+
+            for event in response.get("events", []):
+                timestamp, event_id = event["timestamp"], event.get("eventId")
+                if timestamp == self._last_timestamp and event_id in self._seen_at_last_timestamp:
+                    continue
+                if timestamp != self._last_timestamp:
+                    self._last_timestamp = timestamp
+                    self._seen_at_last_timestamp = set()
+                self._seen_at_last_timestamp.add(event_id)
+
+                line = event.get("message", "").rstrip()
+                if line:
+                    self.logger.info("   │ %s", line)
+                emitted += 1
+
+            token = response.get("nextToken")
+            if not token:
+                break
+            kwargs["nextToken"] = token
+
+        self.events += emitted
+        return emitted
+
+
+def _matches_manifest_entry(file_path: Path, entry: Optional[dict]) -> bool:
+    """Whether a file has the size, mode and mtime recorded for it in a source manifest."""
+    if not entry:
+        return False
+    st = file_path.stat()
+    return (entry.get("size"), entry.get("mtime_ns"), entry.get("mode")) == (st.st_size, st.st_mtime_ns, st.st_mode)
+
+
+class SourceArchiveCache:
+    """The last source.zip built for an agent and the manifest of the files in it.
+
+    Lets upload_source reuse the archive when the build context is unchanged, rebuild it
+    from the cached compressed entries when only some files changed, and lets the source
+    digest skip hashing files whose size, mode and mtime are unchanged.
+    """
+
+    def __init__(self, cache_dir: Path):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the cache (the agent's .bedrock_agentcore directory)
+        """
+        self.cache_dir = cache_dir
+
+    @property
+    def source_zip(self) -> Path:
+        """Path to the cached source.zip."""
+        return self.cache_dir / "codebuild_source.zip"
+
+    @property
+    def manifest_path(self) -> Path:
+        """Path to the manifest describing the cached source.zip."""
+        return self.cache_dir / "codebuild_source.json"
+
+    @property
+    def artifacts(self) -> Set[Path]:
+        """Resolved paths of the cache files (never part of the build context)."""
+        return {self.source_zip.resolve(), self.manifest_path.resolve()}
+
+    def load(self) -> Tuple[Optional[str], Dict[str, dict]]:
+        """Load the manifest of the cached source.zip.
+
+        Returns:
+            Tuple of the archive's SHA256 digest and its files (archive name -> {size,
+            mtime_ns, mode, sha256}); (None, {}) if there is no usable cache
+        """
+        if not self.manifest_path.exists() or not self.source_zip.exists():
+            return None, {}
+        try:
+            data = json.loads(self.manifest_path.read_text())
+        except (OSError, ValueError) as e:
+            logging.getLogger(__name__).debug("Ignoring unreadable source manifest: %s", e)
+            return None, {}
+        if data.get("version") != SOURCE_CACHE_VERSION:
+            return None, {}
+        return data.get("digest"), data.get("files", {})
+
+    def save(self, source_zip: Path, digest: str, manifest: Dict[str, dict]) -> None:
+        """Replace the cache with a freshly built source.zip.
+
+        Args:
+            source_zip: Archive to cache, moved into place (must be on the cache's filesystem)
+            digest: SHA256 hex digest of the archive
+            manifest: Files of the archive as returned by write_incremental_zip
+        """
+        os.replace(source_zip, self.source_zip)
+        tmp_manifest = self.manifest_path.with_suffix(".json.tmp")
+        tmp_manifest.write_text(json.dumps({"version": SOURCE_CACHE_VERSION, "digest": digest, "files": manifest}))
+        os.replace(tmp_manifest, self.manifest_path)
 
 
 class CodeBuildService:
@@ -26,6 +231,8 @@ class CodeBuildService:
         self.client = session.client("codebuild")
         self.s3_client = session.client("s3")
         self.iam_client = session.client("iam")
+        self.ecr_client = session.client("ecr")
+        self.logs_client = session.client("logs")
         self.logger = logging.getLogger(__name__)
         self.source_bucket = None
         self.account_id = session.client("sts").get_caller_identity()["Account"]
@@ -72,74 +279,208 @@ class CodeBuildService:
 
         return bucket_name
 
-    def upload_source(self, agent_name: str, source_dir: str = ".", dockerfile_dir: Optional[str] = None) -> str:
+    def upload_source(
+        self,
+        agent_name: str,
+        source_dir: str = ".",
+        dockerfile_dir: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+    ) -> str:
         """Upload source directory to S3, respecting .dockerignore patterns.
 
+        With a cache_dir, the archive and a manifest of its files are kept between launches:
+        an unchanged build context reuses the archive as-is, and a changed one is rebuilt
+        from the cached compressed entries, deflating only new or modified files. The upload
+        itself is skipped when the object in S3 already has the archive's digest.
+
         Args:
             agent_name: Name of the agent
             source_dir: Directory to upload (defaults to current directory)
             dockerfile_dir: Directory containing Dockerfile (may be different from source_dir)
+            cache_dir: Directory to keep the source archive cache in (no caching if None)
+
+        Returns:
+            S3 location of the uploaded source (s3://bucket/agentname/source.zip)
         """
         account_id = self.account_id
         bucket_name = self.ensure_source_bucket(account_id)
         self.source_bucket = bucket_name
+        # Agent-organized S3 key: agentname/source.zip (fixed naming for cache consistency)
+        s3_key = f"{agent_name}/source.zip"
 
-        # Parse .dockerignore patterns from template for consistent filtering
-        ignore_patterns = self._parse_dockerignore()
+        cache = SourceArchiveCache(Path(cache_dir)) if cache_dir else None
+        sources = list(self._iter_build_context(source_dir, dockerfile_dir, cache))
+
+        if cache:
+            cache.cache_dir.mkdir(parents=True, exist_ok=True)
+            digest, previous = cache.load()
+            if digest and self._context_unchanged(sources, previous):
+                self.logger.info("Source unchanged since the last launch, reusing cached source.zip")
+            else:
+                tmp_zip = cache.source_zip.with_suffix(".zip.tmp")
+                manifest, reused = write_incremental_zip(sources, tmp_zip, previous, cached_zip=cache.source_zip)
+                digest = hash_file(tmp_zip)
+                cache.save(tmp_zip, digest, manifest)
+                self.logger.info("Rebuilt source.zip, reusing %d of %d compressed files", reused, len(manifest))
+            self._upload_source_zip(cache.source_zip, digest, bucket_name, s3_key)
+            return f"s3://{bucket_name}/{s3_key}"
 
         with tempfile.NamedTemporaryFile(suffix=".zip", delete=False) as temp_zip:
             try:
-                with zipfile.ZipFile(temp_zip.name, "w", zipfile.ZIP_DEFLATED) as zipf:
-                    # First, add all files from source_dir
-                    for root, dirs, files in os.walk(source_dir):
-                        # Convert to relative path from source_dir
-                        rel_root = os.path.relpath(root, source_dir)
-                        if rel_root == ".":
-                            rel_root = ""
-
-                        # Filter directories
-                        dirs[:] = [
-                            d
-                            for d in dirs
-                            if not self._should_ignore(
-                                os.path.join(rel_root, d) if rel_root else d, ignore_patterns, is_dir=True
-                            )
-                        ]
-
-                        for file in files:
-                            file_rel_path = os.path.join(rel_root, file) if rel_root else file
-
-                            # Skip if matches ignore pattern
-                            if self._should_ignore(file_rel_path, ignore_patterns, is_dir=False):
-                                continue
-
-                            file_path = Path(root) / file
-                            zipf.write(file_path, file_rel_path)
-
-                    # If Dockerfile is in a different directory, include it in the zip
-                    if dockerfile_dir and source_dir != dockerfile_dir:
-                        dockerfile_path = Path(dockerfile_dir) / "Dockerfile"
-                        source_dockerfile = Path(source_dir) / "Dockerfile"
-
-                        if dockerfile_path.exists() and not source_dockerfile.exists():
-                            # Include the Dockerfile from dockerfile_dir
-                            zipf.write(dockerfile_path, "Dockerfile")
-                            self.logger.info("Including Dockerfile from %s in source.zip", dockerfile_dir)
-
-                # Create agent-organized S3 key: agentname/source.zip (fixed naming for cache consistency)
-                s3_key = f"{agent_name}/source.zip"
-
-                self.s3_client.upload_file(
-                    temp_zip.name, bucket_name, s3_key, ExtraArgs={"ExpectedBucketOwner": account_id}
-                )
-
-                self.logger.info("Uploaded source to S3: %s", s3_key)
+                write_incremental_zip(sources, Path(temp_zip.name), {})
+                self._upload_source_zip(Path(temp_zip.name), hash_file(Path(temp_zip.name)), bucket_name, s3_key)
                 return f"s3://{bucket_name}/{s3_key}"
 
             finally:
                 temp_zip.close()
                 os.unlink(temp_zip.name)
 
+    def _upload_source_zip(self, source_zip: Path, digest: str, bucket_name: str, s3_key: str) -> None:
+        """Upload source.zip unless the S3 object already holds an archive with the same digest."""
+        if get_object_digest(self.s3_client, bucket_name, s3_key, self.account_id) == digest:
+            self.logger.info("Source in S3 is up to date (sha256 %s), skipping upload: %s", digest[:12], s3_key)
+            return
+
+        self.s3_client.upload_file(
+            str(source_zip),
+            bucket_name,
+            s3_key,
+            ExtraArgs={"ExpectedBucketOwner": self.account_id, "Metadata": {DIGEST_METADATA_KEY: digest}},
+        )
+        self.logger.info("Uploaded source to S3: %s", s3_key)
+
+    @staticmethod
+    def _context_unchanged(sources: List[Tuple[Path, str]], previous: Dict[str, dict]) -> bool:
+        """Whether the build context has exactly the files of the manifest, with the same size, mode and mtime."""
+        if len(sources) != len(previous):
+            return False
+        return all(_matches_manifest_entry(file_path, previous.get(file_rel)) for file_path, file_rel in sources)
+
+    def _iter_build_context(
+        self, source_dir: str, dockerfile_dir: Optional[str], cache: Optional[SourceArchiveCache] = None
+    ) -> Iterator[Tuple[Path, str]]:
+        """Yield (path, archive name) for every file of the Docker build context."""
+        # Parse .dockerignore patterns from template for consistent filtering
+        matcher = compile_ignore_patterns(self._parse_dockerignore())
+
+        # First, all files from source_dir that the ignore patterns keep (except the
+        # source archive cache, which lives in the source tree for legacy projects)
+        excluded = cache.artifacts if cache else set()
+        for file_path, file_rel in matcher.walk(Path(source_dir)):
+            if not (excluded and file_path.resolve() in excluded):
+                yield file_path, file_rel
+
+        # If Dockerfile is in a different directory, include it in the context
+        if dockerfile_dir and source_dir != dockerfile_dir:
+            dockerfile_path = Path(dockerfile_dir) / "Dockerfile"
+            source_dockerfile = Path(source_dir) / "Dockerfile"
+
+            if dockerfile_path.exists() and not source_dockerfile.exists():
+                self.logger.info("Including Dockerfile from %s in source.zip", dockerfile_dir)
+                yield dockerfile_path, "Dockerfile"
+
+    def compute_source_digest(
+        self, source_dir: str = ".", dockerfile_dir: Optional[str] = None, cache_dir: Optional[str] = None
+    ) -> str:
+        """Compute a deterministic digest of the filtered Docker build context.
+
+        The digest covers the name and content of every file upload_source would send
+        (including the Dockerfile) and the buildspec, so it changes whenever CodeBuild
+        could produce a different image.
+
+        Args:
+            source_dir: Directory to upload (defaults to current directory)
+            dockerfile_dir: Directory containing Dockerfile (may be different from source_dir)
+            cache_dir: Source archive cache of upload_source; files whose size, mode and mtime
+                match its manifest are not hashed again
+
+        Returns:
+            SHA256 hex digest of the build context
+        """
+        cache = SourceArchiveCache(Path(cache_dir)) if cache_dir else None
+        previous = cache.load()[1] if cache else {}
+
+        digest = hashlib.sha256()
+        digest.update(self._get_arm64_buildspec("").encode())
+        for file_path, file_rel_path in sorted(
+            self._iter_build_context(source_dir, dockerfile_dir, cache), key=lambda e: e[1]
+        ):
+            cached = previous.get(file_rel_path)
+            if _matches_manifest_entry(file_path, cached):
+                file_digest = cached["sha256"]
+            else:
+                file_digest = hash_file(file_path)
+            digest.update(f"{file_rel_path}\0{file_digest}\n".encode())
+        return digest.hexdigest()
+
+    def source_image_tag(self, source_digest: str) -> str:
+        """ECR tag of the image built from a build context digest."""
+        return f"{SOURCE_TAG_PREFIX}{source_digest}"
+
+    def find_image(self, ecr_repository_uri: str, image_tag: str) -> Optional[Dict[str, Any]]:
+        """Look up an image by tag in an ECR repository.
+
+        Args:
+            ecr_repository_uri: ECR repository URI
+            image_tag: Tag to look up
+
+        Returns:
+            The image details from describe_images, or None if no image has the tag (or the
+            lookup failed)
+        """
+        repository_name = ecr_repository_uri.split("/", 1)[-1]
+        try:
+            response = self.ecr_client.describe_images(
+                repositoryName=repository_name, imageIds=[{"imageTag": image_tag}]
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] not in ("ImageNotFoundException", "RepositoryNotFoundException"):
+                # e.g. missing ecr:DescribeImages permission; building is always safe
+                self.logger.warning("Could not look up image %s:%s, building it: %s", ecr_repository_uri, image_tag, e)
+            return None
+        return next(iter(response.get("imageDetails") or []), None)
+
+    def reuse_image(
+        self, ecr_repository_uri: str, image_tag: str, target_tag: str = "latest"
+    ) -> Optional[Dict[str, Any]]:
+        """Point target_tag at an existing image instead of rebuilding it.
+
+        Deployments use the image digest; target_tag only keeps the repository's moving
+        tag in step with what is deployed.
+
+        Args:
+            ecr_repository_uri: ECR repository URI
+            image_tag: Tag of the image to reuse
+            target_tag: Moving tag to update
+
+        Returns:
+            The image details (including imageDigest) if the image exists, otherwise None
+        """
+        image = self.find_image(ecr_repository_uri, image_tag)
+        if image is None:
+            return None
+        if target_tag in image.get("imageTags", []):
+            return image
+
+        repository_name = ecr_repository_uri.split("/", 1)[-1]
+        images = self.ecr_client.batch_get_image(
+            repositoryName=repository_name, imageIds=[{"imageTag": image_tag}]
+        ).get("images", [])
+        if not images:
+            return None
+        try:
+            self.ecr_client.put_image(
+                repositoryName=repository_name,
+                imageManifest=images[0]["imageManifest"],
+                imageManifestMediaType=images[0].get("imageManifestMediaType", image.get("imageManifestMediaType")),
+                imageTag=target_tag,
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "ImageAlreadyExistsException":
+                raise
+        self.logger.info("Tagged existing image %s as %s", image_tag, target_tag)
+        return image
+
     def _normalize_s3_location(self, source_location: str) -> str:
         """Convert s3:// URL to bucket/key format for CodeBuild."""
         return source_location.replace("s3://", "") if source_location.startswith("s3://") else source_location
@@ -177,6 +518,7 @@ class CodeBuildService:
             "artifacts": {
                 "type": "NO_ARTIFACTS",
             },
+            "cache": PROJECT_CACHE,
             "environment": {
                 "type": "ARM_CONTAINER",  # ARM64 images require ARM_CONTAINER environment type
                 "image": "aws/codebuild/amazonlinux2-aarch64-standard:3.0",
@@ -198,103 +540,197 @@ class CodeBuildService:
 
         return project_name
 
-    def start_build(self, project_name: str, source_location: str) -> str:
-        """Start a CodeBuild build."""
+    def start_build(
+        self,
+        project_name: str,
+        source_location: str,
+        ecr_repository_uri: Optional[str] = None,
+        image_tag: Optional[str] = None,
+    ) -> str:
+        """Start a CodeBuild build.
+
+        Args:
+            project_name: CodeBuild project name
+            source_location: S3 location of source.zip
+            ecr_repository_uri: ECR repository URI; when set, the current buildspec and cache
+                settings override the project's, so projects created by older toolkit versions
+                build the same way
+            image_tag: Additional tag to push the image under (e.g. its source tag)
+        """
         # CodeBuild expects S3 location without s3:// prefix (bucket/key format)
         codebuild_source_location = self._normalize_s3_location(source_location)
 
+        kwargs: Dict[str, Any] = {}
+        if ecr_repository_uri:
+            kwargs["buildspecOverride"] = self._get_arm64_buildspec(ecr_repository_uri)
+            kwargs["cacheOverride"] = PROJECT_CACHE
+        if image_tag:
+            kwargs["environmentVariablesOverride"] = [
+                {"name": "SOURCE_IMAGE_TAG", "value": image_tag, "type": "PLAINTEXT"}
+            ]
+
         response = self.client.start_build(
             projectName=project_name,
             sourceLocationOverride=codebuild_source_location,
+            **kwargs,
         )
 
         return response["build"]["id"]
 
-    def wait_for_completion(self, build_id: str, timeout: int = 900):
-        """Wait for CodeBuild to complete with detailed phase tracking."""
+    def wait_for_completion(self, build_id: str, timeout: int = 900, stream_logs: bool = True) -> BuildMetrics:
+        """Wait for CodeBuild to complete, streaming its logs and tracking phase durations.
+
+        The build status is polled at an interval chosen per phase that backs off while the
+        phase lasts, and the build's CloudWatch log events are streamed as they arrive.
+
+        Args:
+            build_id: ID of the build to monitor
+            timeout: Seconds to wait before giving up
+            stream_logs: Whether to stream the build's log output
+
+        Returns:
+            BuildMetrics with per-phase durations
+
+        Raises:
+            RuntimeError: If the build does not succeed
+            TimeoutError: If the build does not finish within timeout
+        """
         self.logger.info("Starting CodeBuild monitoring...")
 
+        metrics = BuildMetrics(build_id=build_id)
+        log_tail = BuildLogTail(self.logs_client, self.logger) if stream_logs else None
+
         # Phase tracking variables
         current_phase = None
         phase_start_time = None
+        interval = DEFAULT_POLL_INTERVAL
         build_start_time = time.time()
+        build: Dict[str, Any] = {}
 
         while time.time() - build_start_time < timeout:
             response = self.client.batch_get_builds(ids=[build_id])
+            metrics.status_polls += 1
             build = response["builds"][0]
             status = build["buildStatus"]
             build_phase = build.get("currentPhase", "UNKNOWN")
 
+            if log_tail:
+                log_tail.poll(build)
+
             # Track phase changes
             if build_phase != current_phase:
                 # Log previous phase completion (if any)
                 if current_phase and phase_start_time:
                     phase_duration = time.time() - phase_start_time
+                    metrics.phases[current_phase] = phase_duration
                     self.logger.info("✅ %s completed in %.1fs", current_phase, phase_duration)
 
                 # Log new phase start
                 current_phase = build_phase
                 phase_start_time = time.time()
                 total_duration = phase_start_time - build_start_time
-                self.logger.info("🔄 %s started (total: %.0fs)", current_phase, total_duration)
-
-            # Check for completion
-            if status == "SUCCEEDED":
-                # Log final phase completion
-                if current_phase and phase_start_time:
-                    phase_duration = time.time() - phase_start_time
-                    self.logger.info("✅ %s completed in %.1fs", current_phase, phase_duration)
-
-                total_duration = time.time() - build_start_time
-                minutes, seconds = divmod(int(total_duration), 60)
-                self.logger.info("🎉 CodeBuild completed successfully in %dm %ds", minutes, seconds)
-                return
+                interval = PHASE_POLL_INTERVALS.get(build_phase, DEFAULT_POLL_INTERVAL)
+                if status not in TERMINAL_BUILD_STATUSES:
+                    self.logger.info("🔄 %s started (total: %.0fs)", current_phase, total_duration)
+            else:
+                interval = min(interval * POLL_BACKOFF, MAX_POLL_INTERVAL)
 
-            elif status in ["FAILED", "FAULT", "STOPPED", "TIMED_OUT"]:
-                # Log failure with phase info
-                if current_phase:
-                    self.logger.error("❌ Build failed during %s phase", current_phase)
-                raise RuntimeError(f"CodeBuild failed with status: {status}")
+            if status in TERMINAL_BUILD_STATUSES:
+                return self._finish_build(build, status, current_phase, build_start_time, metrics, log_tail)
 
-            time.sleep(1)
+            time.sleep(interval)
 
-        total_duration = time.time() - build_start_time
-        minutes, seconds = divmod(int(total_duration), 60)
+        metrics.total_seconds = time.time() - build_start_time
+        metrics.status = "TIMED_OUT"
+        self._log_build_metrics(metrics, log_tail)
+        minutes, seconds = divmod(int(metrics.total_seconds), 60)
         raise TimeoutError(f"CodeBuild timed out after {minutes}m {seconds}s (current phase: {current_phase})")
 
+    def _finish_build(
+        self,
+        build: Dict[str, Any],
+        status: str,
+        current_phase: Optional[str],
+        build_start_time: float,
+        metrics: BuildMetrics,
+        log_tail: Optional[BuildLogTail],
+    ) -> BuildMetrics:
+        """Record the final metrics of a finished build and raise if it did not succeed."""
+        # Logs can lag behind the build status: pick up the tail, which holds any error
+        if log_tail:
+            log_tail.poll(build)
+
+        metrics.status = status
+        metrics.total_seconds = time.time() - build_start_time
+        # CodeBuild reports exact durations once a build finishes; fall back to what was observed
+        reported = {
+            phase["phaseType"]: float(phase["durationInSeconds"])
+            for phase in build.get("phases", [])
+            if "durationInSeconds" in phase and phase.get("phaseType") != "COMPLETED"
+        }
+        if reported:
+            metrics.phases = reported
+        self._log_build_metrics(metrics, log_tail)
+
+        if status == "SUCCEEDED":
+            minutes, seconds = divmod(int(metrics.total_seconds), 60)
+            self.logger.info("🎉 CodeBuild completed successfully in %dm %ds", minutes, seconds)
+            return metrics
+
+        # Log failure with phase info
+        failed_phase = next(
+            (
+                phase["phaseType"]
+                for phase in build.get("phases", [])
+                if phase.get("phaseStatus") in ("FAILED", "FAULT", "TIMED_OUT", "STOPPED")
+            ),
+            current_phase,
+        )
+        if failed_phase:
+            self.logger.error("❌ Build failed during %s phase", failed_phase)
+        raise RuntimeError(f"CodeBuild failed with status: {status}")
+
+    def _log_build_metrics(self, metrics: BuildMetrics, log_tail: Optional[BuildLogTail]) -> None:
+        """Emit build metrics: a readable phase summary and the structured record at debug level."""
+        if log_tail:
+            metrics.log_requests = log_tail.requests
+            metrics.log_events = log_tail.events
+        if metrics.phases:
+            summary = ", ".join(f"{phase} {seconds:.1f}s" for phase, seconds in metrics.phases.items())
+            self.logger.info("📊 Build phases: %s", summary)
+        self.logger.debug("CodeBuild metrics: %s", json.dumps(metrics.to_dict()))
+
     def _get_arm64_buildspec(self, ecr_repository_uri: str) -> str:
-        """Get optimized buildspec with parallel ECR authentication."""
+        """Get buildspec that builds with BuildKit, reusing layers cached in ECR.
+
+        Layers from previous builds (including those of intermediate stages) are imported
+        from and exported to the ``buildcache`` tag of the agent's repository, so the
+        dependency install layer is rebuilt only when the requirements change.
+        """
         return f"""
 version: 0.2
 phases:
-  build:
+  pre_build:
     commands:
-      - echo "Starting parallel Docker build and ECR authentication..."
+      - echo "Authenticating with ECR and starting BuildKit builder..."
       - |
-        docker build -t bedrock-agentcore-arm64 . &
-        BUILD_PID=$!
         aws ecr get-login-password --region $AWS_DEFAULT_REGION | \\
-        docker login --username AWS --password-stdin {ecr_repository_uri} &
-        AUTH_PID=$!
-        echo "Waiting for Docker build to complete..."
-        wait $BUILD_PID
-        if [ $? -ne 0 ]; then
-          echo "Docker build failed"
-          exit 1
-        fi
-        echo "Waiting for ECR authentication to complete..."
-        wait $AUTH_PID
-        if [ $? -ne 0 ]; then
-          echo "ECR authentication failed"
-          exit 1
+        docker login --username AWS --password-stdin {ecr_repository_uri}
+      - docker buildx create --name {BUILDER_NAME} --driver docker-container --use
+  build:
+    commands:
+      - echo "Building ARM64 image with layer cache from ECR..."
+      - |
+        TAGS="--tag {ecr_repository_uri}:latest"
+        if [ -n "$SOURCE_IMAGE_TAG" ]; then
+          TAGS="$TAGS --tag {ecr_repository_uri}:$SOURCE_IMAGE_TAG"
         fi
-        echo "Both build and auth completed successfully"
-      - echo "Tagging image..."
-      - docker tag bedrock-agentcore-arm64:latest {ecr_repository_uri}:latest
+        docker buildx build --platform linux/arm64 $TAGS \\
+          --cache-from type=registry,ref={ecr_repository_uri}:{CACHE_TAG} \\
+          --cache-to type=registry,ref={ecr_repository_uri}:{CACHE_TAG},{CACHE_EXPORT_OPTIONS} \\
+          --provenance=false --push .
   post_build:
     commands:
-      - echo "Pushing ARM64 image to ECR..."
-      - docker push {ecr_repository_uri}:latest
       - echo "Build completed at $(date)"
 """
 
@@ -338,46 +774,8 @@ phases:
 
     def _should_ignore(self, path: str, patterns: List[str], is_dir: bool = False) -> bool:
         """Check if path should be ignored based on dockerignore patterns."""
-        # Normalize path
-        if path.startswith("./"):
-            path = path[2:]
-
-        should_ignore = False  # Default state: don't ignore
-
-        for pattern in patterns:
-            # Handle negation patterns
-            if pattern.startswith("!"):
-                if self._matches_pattern(path, pattern[1:], is_dir):
-                    should_ignore = False  # Negation pattern: don't ignore
-            else:
-                # Regular ignore patterns
-                if self._matches_pattern(path, pattern, is_dir):
-                    should_ignore = True  # Regular pattern: ignore
-
-        return should_ignore
+        return compile_ignore_patterns(patterns).is_ignored(path, is_dir)
 
     def _matches_pattern(self, path: str, pattern: str, is_dir: bool) -> bool:
         """Check if path matches a dockerignore pattern."""
-        # Directory-specific patterns
-        if pattern.endswith("/"):
-            if not is_dir:
-                return False
-            pattern = pattern[:-1]
-
-        # Exact match
-        if path == pattern:
-            return True
-
-        # Glob pattern match
-        if fnmatch.fnmatch(path, pattern):
-            return True
-
-        # Directory prefix match
-        if is_dir and pattern in path.split("/"):
-            return True
-
-        # File in ignored directory
-        if not is_dir and any(fnmatch.fnmatch(part, pattern) for part in path.split("/")):
-            return True
-
-        return False
+        return compile_ignore_patterns([pattern]).is_ignored(path, is_dir)
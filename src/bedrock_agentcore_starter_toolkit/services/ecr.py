@@ -2,8 +2,10 @@
 
 import base64
 import re
+from typing import Optional
 
 import boto3
+from botocore.exceptions import ClientError
 
 from ..utils.runtime.container import ContainerRuntime
 
@@ -99,8 +101,59 @@ def get_or_create_ecr_repository(agent_name: str, region: str) -> str:
         return create_ecr_repository(repo_name, region)
 
 
-def deploy_to_ecr(local_tag: str, repo_name: str, region: str, container_runtime: ContainerRuntime) -> str:
-    """Build and push image to ECR."""
+def pin_image_uri(repository_uri: str, image_digest: str) -> str:
+    """Immutable image reference (repository@sha256:...) for a repository and manifest digest."""
+    return f"{repository_uri}@{image_digest}"
+
+
+def is_pinned_image_uri(image_uri: str) -> bool:
+    """Whether an image reference is pinned by digest, and so always names the same image."""
+    return "@sha256:" in image_uri
+
+
+def get_image_digest(repository_uri: str, image_tag: str, region: str) -> Optional[str]:
+    """Get the manifest digest of a tagged image.
+
+    Args:
+        repository_uri: ECR repository URI
+        image_tag: Image tag
+        region: AWS region
+
+    Returns:
+        The image digest (sha256:...), or None if no image has the tag
+    """
+    ecr = boto3.client("ecr", region_name=region)
+    try:
+        response = ecr.describe_images(
+            repositoryName=repository_uri.split("/", 1)[-1], imageIds=[{"imageTag": image_tag}]
+        )
+    except ClientError as e:
+        if e.response["Error"]["Code"] in ("ImageNotFoundException", "RepositoryNotFoundException"):
+            return None
+        raise
+    images = response.get("imageDetails") or []
+    return images[0]["imageDigest"] if images else None
+
+
+def deploy_to_ecr(
+    local_tag: str,
+    repo_name: str,
+    region: str,
+    container_runtime: ContainerRuntime,
+    image_tag: Optional[str] = None,
+) -> str:
+    """Build and push image to ECR.
+
+    Args:
+        local_tag: Tag of the local image
+        repo_name: ECR repository name
+        region: AWS region
+        container_runtime: Container runtime used to tag and push
+        image_tag: Additional immutable tag to push the image under (e.g. derived from its image ID)
+
+    Returns:
+        The pushed image reference (image_tag if given, otherwise latest)
+    """
     ecr = boto3.client("ecr", region_name=region)
 
     # Get or create repository
@@ -123,4 +176,12 @@ def deploy_to_ecr(local_tag: str, repo_name: str, region: str, container_runtime
     if not container_runtime.push(ecr_tag):
         raise RuntimeError("Failed to push image to ECR")
 
+    if image_tag:
+        ecr_tag = f"{ecr_uri}:{image_tag}"
+        if not container_runtime.tag(local_tag, ecr_tag):
+            raise RuntimeError("Failed to tag image")
+        # Only the tag is new: the registry already has every layer from the push above
+        if not container_runtime.push(ecr_tag):
+            raise RuntimeError("Failed to push image to ECR")
+
     return ecr_tag
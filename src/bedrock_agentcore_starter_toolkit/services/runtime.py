@@ -2,23 +2,67 @@
 
 import json
 import logging
+import threading
 import time
 import urllib.parse
 import uuid
+from http.cookiejar import DefaultCookiePolicy
 from importlib.metadata import version
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional, Tuple
 
 import boto3
 import requests
 from botocore.config import Config
 from botocore.exceptions import ClientError
+from requests.adapters import HTTPAdapter
 from rich.console import Console
 
 from ..utils.endpoints import get_control_plane_endpoint, get_data_plane_endpoint
+from ..utils.runtime.sse import iter_sse_events
 
 logger = logging.getLogger(__name__)
 console = Console()
 
+# Keep-alive connection pool of the HTTP clients: hosts kept pooled, and connections kept per host
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+
+_http_adapters: Dict[Tuple[int, int], HTTPAdapter] = {}
+_http_adapters_lock = threading.Lock()
+
+
+def get_http_session(
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS, pool_maxsize: int = DEFAULT_POOL_MAXSIZE
+) -> requests.Session:
+    """Create a session over the process-wide keep-alive connection pool for a pool configuration.
+
+    Clients are cheap and often created per invocation (e.g. by Runtime.invoke), so
+    connections live in a shared adapter: repeated invocations reuse the TCP and TLS
+    connection to the data plane instead of opening a new one per request. Only the
+    connections are shared; each session is separate and keeps no cookies, so no state
+    leaks between invocations made with other tokens, for other agents or sessions.
+
+    Args:
+        pool_connections: Number of hosts to keep connection pools for
+        pool_maxsize: Maximum number of connections kept per host
+
+    Returns:
+        A requests session mounted on the adapter shared by every caller with the same pool configuration
+    """
+    key = (pool_connections, pool_maxsize)
+    with _http_adapters_lock:
+        adapter = _http_adapters.get(key)
+        if adapter is None:
+            adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+            _http_adapters[key] = adapter
+
+    session = requests.Session()
+    # Reject every cookie, as a one-off requests.post would not carry one into the next invocation
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
 
 def _get_user_agent() -> str:
     """Get user-agent string for agentcore-st.
@@ -102,28 +146,61 @@ def _handle_aws_response(response) -> dict:
 
 
 def _handle_streaming_response(response) -> Dict[str, Any]:
-    complete_text = ""
-    for line in response.iter_lines(chunk_size=1):
-        if line:
-            line = line.decode("utf-8")
-            if line.startswith("data: "):
-                json_chunk = line[6:]
-                try:
-                    parsed_chunk = json.loads(json_chunk)
-                    if isinstance(parsed_chunk, str):
-                        text_chunk = parsed_chunk
-                    else:
-                        text_chunk = json.dumps(parsed_chunk, ensure_ascii=False)
-                        text_chunk += "\n\n"
-                    console.print(text_chunk, end="")
-                    complete_text += text_chunk
-                except json.JSONDecodeError:
-                    console.print(json_chunk)
-                    continue
+    for event in iter_sse_events(response):
+        try:
+            parsed_chunk = json.loads(event.data)
+        except json.JSONDecodeError:
+            console.print(event.data)
+            continue
+        if isinstance(parsed_chunk, str):
+            text_chunk = parsed_chunk
+        else:
+            text_chunk = json.dumps(parsed_chunk, ensure_ascii=False)
+            text_chunk += "\n\n"
+        console.print(text_chunk, end="")
     console.print()
     return {}
 
 
+def _decode_event_data(data: str) -> Any:
+    """Decode the data of a streamed event: JSON values are parsed, anything else is kept as text."""
+    try:
+        return json.loads(data)
+    except json.JSONDecodeError:
+        return data
+
+
+def _iter_http_response_events(response) -> Iterator[Any]:
+    """Yield the events of an HTTP invocation response as they arrive, closing it when done or abandoned."""
+    try:
+        response.raise_for_status()
+        if "text/event-stream" in response.headers.get("content-type", ""):
+            for event in iter_sse_events(response):
+                yield _decode_event_data(event.data)
+        elif response.content:
+            yield _decode_event_data(response.text)
+        else:
+            raise ValueError("Empty response from agent endpoint")
+    finally:
+        # Hand the connection back to the pool (read fully) or drop it (read partially)
+        response.close()
+
+
+def _iter_aws_response_events(response) -> Iterator[Any]:
+    """Yield the events of an InvokeAgentRuntime response as they arrive, closing it when done or abandoned."""
+    body = response["response"]
+    try:
+        if "text/event-stream" in response.get("contentType", ""):
+            for event in iter_sse_events(body):
+                yield _decode_event_data(event.data)
+        else:
+            content = body.read()
+            if content:
+                yield _decode_event_data(content.decode("utf-8"))
+    finally:
+        body.close()
+
+
 class BedrockAgentCoreClient:
     """Bedrock AgentCore client for agent management."""
 
@@ -631,6 +708,48 @@ class BedrockAgentCoreClient:
         Returns:
             Response from the agent endpoint
         """
+        response = self._invoke_agent_runtime(agent_arn, payload, session_id, endpoint_name, user_id, custom_headers)
+        return _handle_aws_response(response)
+
+    def invoke_stream(
+        self,
+        agent_arn: str,
+        payload: str,
+        session_id: str,
+        endpoint_name: str = "DEFAULT",
+        user_id: Optional[str] = None,
+        custom_headers: Optional[dict] = None,
+    ) -> Iterator[Any]:
+        """Invoke agent endpoint and yield its response events as they arrive.
+
+        The request is sent when iteration starts. The response stream is read only as
+        events are consumed, so a slow consumer applies backpressure to the agent, and
+        closing the generator (or breaking out of the loop) closes the connection.
+
+        Args:
+            agent_arn: Agent ARN to invoke
+            payload: Payload to send as string
+            session_id: Session ID for the request
+            endpoint_name: Endpoint name, defaults to "DEFAULT"
+            user_id: Optional user ID for authorization
+            custom_headers: Optional custom headers to include in the request
+
+        Yields:
+            Event data of a streaming response (JSON-decoded where possible), or the
+            decoded body of a non-streaming one
+        """
+        response = self._invoke_agent_runtime(agent_arn, payload, session_id, endpoint_name, user_id, custom_headers)
+        yield from _iter_aws_response_events(response)
+
+    def _invoke_agent_runtime(
+        self,
+        agent_arn: str,
+        payload: str,
+        session_id: str,
+        endpoint_name: str,
+        user_id: Optional[str],
+        custom_headers: Optional[dict],
+    ) -> Dict:
         req = {
             "agentRuntimeArn": agent_arn,
             "qualifier": endpoint_name,
@@ -654,8 +773,7 @@ class BedrockAgentCoreClient:
             )
 
         try:
-            response = self.dataplane_client.invoke_agent_runtime(**req)
-            return _handle_aws_response(response)
+            return self.dataplane_client.invoke_agent_runtime(**req)
         finally:
             # Always clean up event handler
             if handler_id is not None:
@@ -698,14 +816,24 @@ class BedrockAgentCoreClient:
 class HttpBedrockAgentCoreClient:
     """Bedrock AgentCore client for agent management using HTTP requests with bearer token."""
 
-    def __init__(self, region: str):
+    def __init__(
+        self,
+        region: str,
+        session: Optional[requests.Session] = None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    ):
         """Initialize HttpBedrockAgentCoreClient.
 
         Args:
             region: AWS region for the client
+            session: Session to send requests with (defaults to one over the shared keep-alive connection pool)
+            pool_connections: Number of hosts to keep connection pools for (without a session)
+            pool_maxsize: Maximum number of connections kept per host (without a session)
         """
         self.region = region
         self.dp_endpoint = get_data_plane_endpoint(region)
+        self.session = session or get_http_session(pool_connections, pool_maxsize)
         self.logger = logging.getLogger(f"bedrock_agentcore.http_runtime.{region}")
 
         self.logger.debug("Initializing HTTP Bedrock AgentCore client for region: %s", region)
@@ -733,6 +861,52 @@ class HttpBedrockAgentCoreClient:
         Returns:
             Response from the agent endpoint
         """
+        response = self._post(agent_arn, payload, session_id, bearer_token, endpoint_name, custom_headers)
+        try:
+            return _handle_http_response(response)
+        finally:
+            # Hand the connection back to the pool (read fully) or drop it (read partially)
+            response.close()
+
+    def invoke_stream(
+        self,
+        agent_arn: str,
+        payload,
+        session_id: str,
+        bearer_token: Optional[str],
+        endpoint_name: str = "DEFAULT",
+        custom_headers: Optional[dict] = None,
+    ) -> Iterator[Any]:
+        """Invoke agent endpoint with bearer token and yield its response events as they arrive.
+
+        The request is sent when iteration starts. The response stream is read only as
+        events are consumed, so a slow consumer applies backpressure to the agent, and
+        closing the generator (or breaking out of the loop) closes the connection.
+
+        Args:
+            agent_arn: Agent ARN to invoke
+            payload: Payload to send (dict or string)
+            session_id: Session ID for the request
+            bearer_token: Bearer token for authentication
+            endpoint_name: Endpoint name, defaults to "DEFAULT"
+            custom_headers: Optional custom headers to include in the request
+
+        Yields:
+            Event data of a streaming response (JSON-decoded where possible), or the
+            decoded body of a non-streaming one
+        """
+        response = self._post(agent_arn, payload, session_id, bearer_token, endpoint_name, custom_headers)
+        yield from _iter_http_response_events(response)
+
+    def _post(
+        self,
+        agent_arn: str,
+        payload,
+        session_id: str,
+        bearer_token: Optional[str],
+        endpoint_name: str,
+        custom_headers: Optional[dict],
+    ) -> requests.Response:
         # Escape agent ARN for URL
         escaped_arn = urllib.parse.quote(agent_arn, safe="")
 
@@ -760,8 +934,8 @@ class HttpBedrockAgentCoreClient:
             body = {"payload": payload}
 
         try:
-            # Make request with timeout
-            response = requests.post(
+            # Make request with timeout over a pooled keep-alive connection
+            return self.session.post(
                 url,
                 params={"qualifier": endpoint_name},
                 headers=headers,
@@ -769,7 +943,6 @@ class HttpBedrockAgentCoreClient:
                 timeout=900,
                 stream=True,
             )
-            return _handle_http_response(response)
         except requests.exceptions.RequestException as e:
             self.logger.error("Failed to invoke agent endpoint: %s", str(e))
             raise
@@ -778,9 +951,23 @@ class HttpBedrockAgentCoreClient:
 class LocalBedrockAgentCoreClient:
     """Local Bedrock AgentCore client for invoking endpoints."""
 
-    def __init__(self, endpoint: str):
-        """Initialize the local client with the given endpoint."""
+    def __init__(
+        self,
+        endpoint: str,
+        session: Optional[requests.Session] = None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    ):
+        """Initialize the local client with the given endpoint.
+
+        Args:
+            endpoint: Base URL of the local agent container
+            session: Session to send requests with (defaults to one over the shared keep-alive connection pool)
+            pool_connections: Number of hosts to keep connection pools for (without a session)
+            pool_maxsize: Maximum number of connections kept per host (without a session)
+        """
         self.endpoint = endpoint
+        self.session = session or get_http_session(pool_connections, pool_maxsize)
         self.logger = logging.getLogger("bedrock_agentcore.http_local")
 
     def invoke_endpoint(
@@ -792,6 +979,35 @@ class LocalBedrockAgentCoreClient:
         custom_headers: Optional[dict] = None,
     ):
         """Invoke the endpoint with the given parameters."""
+        response = self._post(session_id, payload, workload_access_token, oauth2_callback_url, custom_headers)
+        try:
+            return _handle_http_response(response)
+        finally:
+            response.close()
+
+    def invoke_stream(
+        self,
+        session_id: str,
+        payload: str,
+        workload_access_token: str,
+        oauth2_callback_url: str,
+        custom_headers: Optional[dict] = None,
+    ) -> Iterator[Any]:
+        """Invoke the endpoint and yield its response events as they arrive.
+
+        The request is sent when iteration starts; closing the generator closes the connection.
+        """
+        response = self._post(session_id, payload, workload_access_token, oauth2_callback_url, custom_headers)
+        yield from _iter_http_response_events(response)
+
+    def _post(
+        self,
+        session_id: str,
+        payload: str,
+        workload_access_token: str,
+        oauth2_callback_url: str,
+        custom_headers: Optional[dict],
+    ) -> requests.Response:
         from bedrock_agentcore.runtime.models import ACCESS_TOKEN_HEADER, OAUTH2_CALLBACK_URL_HEADER, SESSION_HEADER
 
         url = f"{self.endpoint}/invocations"
@@ -816,9 +1032,8 @@ class LocalBedrockAgentCoreClient:
             body = {"payload": payload}
 
         try:
-            # Make request with timeout
-            response = requests.post(url, headers=headers, json=body, timeout=900, stream=True)
-            return _handle_http_response(response)
+            # Make request with timeout over a pooled keep-alive connection
+            return self.session.post(url, headers=headers, json=body, timeout=900, stream=True)
         except requests.exceptions.RequestException as e:
             self.logger.error("Failed to invoke agent endpoint: %s", str(e))
             raise
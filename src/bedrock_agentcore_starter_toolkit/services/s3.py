@@ -1,13 +1,29 @@
 """S3 service integration."""
 
+import io
 import logging
+import math
 import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
 
 import boto3
-from botocore.exceptions import ClientError
+from botocore.exceptions import BotoCoreError, ClientError
 
 log = logging.getLogger(__name__)
 
+MULTIPART_PART_SIZE = 8 * 1024 * 1024
+MULTIPART_MAX_PARTS = 10000
+MULTIPART_CONCURRENCY = 4
+
+# User metadata key holding the SHA256 of an uploaded deployment package
+DIGEST_METADATA_KEY = "agentcore-sha256"
+
+
+class StreamingUploadError(Exception):
+    """Raised when a streaming upload fails; the caller can retry from a file on disk."""
+
 
 def sanitize_s3_bucket_name(name: str, account_id: str, region: str) -> str:
     """Sanitize agent name for S3 bucket naming requirements."""
@@ -88,3 +104,223 @@ def create_s3_bucket(bucket_name: str, region: str, account_id: str) -> str:
             return bucket_name
         else:
             raise RuntimeError(f"Failed to create S3 bucket: {e}") from e
+
+
+def get_object_digest(s3_client: Any, bucket: str, key: str, account_id: str) -> Optional[str]:
+    """Return the package digest recorded in an object's metadata.
+
+    Args:
+        s3_client: Boto3 S3 client
+        bucket: Bucket name
+        key: Object key
+        account_id: Expected bucket owner
+
+    Returns:
+        The SHA256 hex digest, or None if the object is missing or has no recorded digest
+    """
+    try:
+        response = s3_client.head_object(Bucket=bucket, Key=key, ExpectedBucketOwner=account_id)
+    except (BotoCoreError, ClientError) as e:
+        log.debug("No existing object at s3://%s/%s: %s", bucket, key, e)
+        return None
+    digest = response.get("Metadata", {}).get(DIGEST_METADATA_KEY)
+    return digest if isinstance(digest, str) else None
+
+
+def multipart_part_size(expected_size: int) -> int:
+    """Smallest part size that fits ``expected_size`` bytes within S3's part count limit.
+
+    Args:
+        expected_size: Expected object size in bytes
+
+    Returns:
+        Part size in bytes, never below MULTIPART_PART_SIZE
+    """
+    return max(MULTIPART_PART_SIZE, math.ceil(expected_size / MULTIPART_MAX_PARTS))
+
+
+class MultipartUploadStream(io.RawIOBase):
+    """Write-only stream that uploads its contents to S3 as they are produced.
+
+    Written bytes are buffered until a full part is available, which is then sent with
+    ``upload_part`` on a small thread pool. At most ``max_concurrency`` parts are in
+    flight; further writes block until one finishes, so memory use is bounded by roughly
+    ``(max_concurrency + 1) * part_size``. Objects smaller than one part are sent with a
+    single ``put_object`` call instead.
+
+    Call :meth:`complete` once all data is written, or :meth:`abort` to discard the
+    upload. Any S3 failure is raised as :class:`StreamingUploadError`.
+    """
+
+    def __init__(
+        self,
+        s3_client: Any,
+        bucket: str,
+        key: str,
+        account_id: str,
+        part_size: int = MULTIPART_PART_SIZE,
+        max_concurrency: int = MULTIPART_CONCURRENCY,
+        metadata: Optional[Dict[str, str]] = None,
+    ):
+        """Create the stream. No request is made until the first part is full.
+
+        Args:
+            s3_client: Boto3 S3 client
+            bucket: Destination bucket
+            key: Destination object key
+            account_id: Expected bucket owner
+            part_size: Size of each uploaded part (at least 5 MiB, S3's minimum)
+            max_concurrency: Maximum number of parts uploaded at once
+            metadata: User metadata to store on the object
+        """
+        super().__init__()
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.key = key
+        self.account_id = account_id
+        self.part_size = part_size
+        self.metadata = metadata or {}
+        self.bytes_written = 0
+        self._buffer = bytearray()
+        self._upload_id: Optional[str] = None
+        self._parts: Dict[int, str] = {}
+        self._futures: List[Future] = []
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="agentcore-s3")
+        self._error: Optional[BaseException] = None
+        self._finished = False
+
+    def writable(self) -> bool:
+        """The stream only supports writing."""
+        return True
+
+    def write(self, data: Any) -> int:
+        """Buffer ``data`` and upload every complete part.
+
+        Args:
+            data: Bytes-like object to append
+
+        Returns:
+            Number of bytes accepted
+        """
+        if self._finished:
+            raise ValueError("Write to a finished MultipartUploadStream")
+        self._raise_if_failed()
+
+        self._buffer += data
+        self.bytes_written += len(data)
+        while len(self._buffer) >= self.part_size:
+            part = bytes(self._buffer[: self.part_size])
+            del self._buffer[: self.part_size]
+            self._submit_part(part)
+        return len(data)
+
+    def complete(self) -> str:
+        """Upload the remaining data and finish the object.
+
+        Returns:
+            S3 location (s3://bucket/key)
+
+        Raises:
+            StreamingUploadError: If any part or the final request fails
+        """
+        self._finished = True
+        try:
+            if self._upload_id is None:
+                self._call(
+                    "put_object",
+                    Bucket=self.bucket,
+                    Key=self.key,
+                    Body=bytes(self._buffer),
+                    Metadata=self.metadata,
+                    ExpectedBucketOwner=self.account_id,
+                )
+            else:
+                if self._buffer:
+                    self._submit_part(bytes(self._buffer))
+                for future in self._futures:
+                    future.result()
+                self._raise_if_failed()
+                self._call(
+                    "complete_multipart_upload",
+                    Bucket=self.bucket,
+                    Key=self.key,
+                    UploadId=self._upload_id,
+                    MultipartUpload={
+                        "Parts": [{"PartNumber": n, "ETag": etag} for n, etag in sorted(self._parts.items())]
+                    },
+                    ExpectedBucketOwner=self.account_id,
+                )
+        except BaseException:
+            self.abort()
+            raise
+        finally:
+            self._buffer = bytearray()
+            self._executor.shutdown(wait=True)
+
+        log.debug(
+            "Streamed %d bytes to s3://%s/%s in %d parts", self.bytes_written, self.bucket, self.key, len(self._parts)
+        )
+        return f"s3://{self.bucket}/{self.key}"
+
+    def abort(self) -> None:
+        """Cancel outstanding parts and discard the multipart upload, if one was started."""
+        self._finished = True
+        for future in self._futures:
+            future.cancel()
+        self._executor.shutdown(wait=True)
+        if self._upload_id is not None:
+            try:
+                self.s3_client.abort_multipart_upload(
+                    Bucket=self.bucket, Key=self.key, UploadId=self._upload_id, ExpectedBucketOwner=self.account_id
+                )
+            except (BotoCoreError, ClientError) as e:
+                log.debug("Failed to abort multipart upload %s: %s", self._upload_id, e)
+            self._upload_id = None
+
+    def _submit_part(self, data: bytes) -> None:
+        if self._upload_id is None:
+            response = self._call(
+                "create_multipart_upload",
+                Bucket=self.bucket,
+                Key=self.key,
+                Metadata=self.metadata,
+                ExpectedBucketOwner=self.account_id,
+            )
+            self._upload_id = response["UploadId"]
+
+        part_number = len(self._futures) + 1
+        # Block the writer while max_concurrency parts are already in flight
+        self._slots.acquire()
+        self._raise_if_failed()
+        future = self._executor.submit(self._upload_part, part_number, data)
+        future.add_done_callback(lambda _: self._slots.release())
+        self._futures.append(future)
+
+    def _upload_part(self, part_number: int, data: bytes) -> None:
+        try:
+            response = self._call(
+                "upload_part",
+                Bucket=self.bucket,
+                Key=self.key,
+                UploadId=self._upload_id,
+                PartNumber=part_number,
+                Body=data,
+                ExpectedBucketOwner=self.account_id,
+            )
+            self._parts[part_number] = response["ETag"]
+        except BaseException as e:
+            self._error = self._error or e
+            raise
+
+    def _call(self, operation: str, **kwargs: Any) -> Any:
+        try:
+            return getattr(self.s3_client, operation)(**kwargs)
+        except (BotoCoreError, ClientError) as e:
+            raise StreamingUploadError(f"{operation} failed for s3://{self.bucket}/{self.key}: {e}") from e
+
+    def _raise_if_failed(self) -> None:
+        if self._error is not None:
+            if isinstance(self._error, StreamingUploadError):
+                raise self._error
+            raise StreamingUploadError(f"Part upload failed for s3://{self.bucket}/{self.key}: {self._error}")
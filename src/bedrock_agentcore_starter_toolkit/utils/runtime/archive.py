@@ -0,0 +1,620 @@
+"""Low-level zip helpers for splicing already-compressed entries between archives.
+
+``zipfile.ZipFile`` always decompresses on read and recompresses on write. The packaging
+pipeline reuses compressed entries from cached archives, so this module provides a small
+writer that accepts raw (already deflated) payloads and a reader that exposes them.
+"""
+
+import contextlib
+import hashlib
+import io
+import logging
+import os
+import stat
+import struct
+import tempfile
+import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    IO,
+    BinaryIO,
+    Callable,
+    Collection,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+log = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1024 * 1024
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+_LOCAL_HEADER_STRUCT = "<4s2B4HL2L2H"
+_LOCAL_HEADER_SIZE = struct.calcsize(_LOCAL_HEADER_STRUCT)
+_LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+_CENTRAL_DIR_STRUCT = "<4s4B4HL2L5H2L"
+_CENTRAL_DIR_SIGNATURE = b"PK\x01\x02"
+_END_RECORD_STRUCT = "<4s4H2LH"
+_END_RECORD_SIGNATURE = b"PK\x05\x06"
+_ZIP64_END_RECORD_STRUCT = "<4sQ2H2L4Q"
+_ZIP64_END_RECORD_SIGNATURE = b"PK\x06\x06"
+_ZIP64_LOCATOR_STRUCT = "<4sLQL"
+_ZIP64_LOCATOR_SIGNATURE = b"PK\x06\x07"
+_ZIP64_EXTRA_ID = 0x0001
+_ZIP64_VERSION = 45
+_DATA_DESCRIPTOR_FLAG = 0x08
+_UTF8_FLAG = 0x800
+
+# Fixed entry timestamp (earliest DOS date) so identical inputs produce identical archives
+FIXED_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def default_workers() -> int:
+    """Number of compression workers to use when none is configured."""
+    return os.cpu_count() or 1
+
+
+def ordered_map(func: Callable[[T], R], items: Iterable[T], workers: int) -> Iterator[R]:
+    """Apply ``func`` to ``items`` on a thread pool, yielding results in input order.
+
+    zlib and hashlib release the GIL on large buffers, so threads compress on multiple
+    cores without the pickling overhead of a process pool. At most ``workers * 2`` items
+    are in flight, which bounds the spooled buffers held while the caller writes results
+    out sequentially.
+
+    Args:
+        func: Function to apply
+        items: Inputs, consumed lazily
+        workers: Number of worker threads; 1 runs everything on the calling thread
+
+    Yields:
+        ``func(item)`` for each item, in the order the items were given
+    """
+    if workers <= 1:
+        for item in items:
+            yield func(item)
+        return
+
+    pending: Deque["Future[R]"] = deque()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="agentcore-zip") as executor:
+        try:
+            for item in items:
+                pending.append(executor.submit(func, item))
+                if len(pending) >= workers * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+@dataclass
+class CompressedFile:
+    """A file deflated into a spooled buffer, ready to be written as a raw zip entry."""
+
+    crc: int
+    file_size: int
+    compress_size: int
+    sha256: str
+    payload: IO[bytes]
+
+    def iter_chunks(self) -> Iterator[bytes]:
+        """Yield the compressed payload in chunks."""
+        self.payload.seek(0)
+        while True:
+            chunk = self.payload.read(CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+    def close(self) -> None:
+        """Release the spooled payload buffer."""
+        self.payload.close()
+
+
+def deterministic_info(arcname: str, mode: int) -> zipfile.ZipInfo:
+    """Create entry metadata that depends only on the name and the executable bit.
+
+    Timestamps are pinned to FIXED_DATE_TIME and permissions are normalized to 0644 or
+    0755, so archives built from the same content on different machines are identical.
+
+    Args:
+        arcname: Name inside the archive (directories end with "/")
+        mode: File mode as returned by ``os.stat`` (only the executable bits are kept)
+
+    Returns:
+        ZipInfo for a deflated entry
+    """
+    info = zipfile.ZipInfo(arcname, FIXED_DATE_TIME)
+    info.create_system = 3  # Unix, so external_attr carries the permission bits on every platform
+    info.compress_type = zipfile.ZIP_DEFLATED
+    if arcname.endswith("/"):
+        info.external_attr = (stat.S_IFDIR | 0o755) << 16 | 0x10
+    else:
+        info.external_attr = (stat.S_IFREG | (0o755 if mode & 0o111 else 0o644)) << 16
+    return info
+
+
+def hash_file(path: Path) -> str:
+    """Compute the SHA256 hex digest of a file without loading it into memory.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        SHA256 hash as hex string
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def deflate_file(path: Path, compresslevel: int = zlib.Z_DEFAULT_COMPRESSION) -> CompressedFile:
+    """Deflate a file into a spooled buffer, computing CRC32 and SHA256 in the same pass.
+
+    Args:
+        path: File to compress
+        compresslevel: zlib compression level
+
+    Returns:
+        CompressedFile holding the raw deflate stream and its checksums
+    """
+    compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -15)
+    payload = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+    crc = 0
+    file_size = 0
+    digest = hashlib.sha256()
+
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            crc = zlib.crc32(chunk, crc)
+            file_size += len(chunk)
+            digest.update(chunk)
+            payload.write(compressor.compress(chunk))
+    payload.write(compressor.flush())
+
+    return CompressedFile(
+        crc=crc,
+        file_size=file_size,
+        compress_size=payload.tell(),
+        sha256=digest.hexdigest(),
+        payload=payload,
+    )
+
+
+def _strip_zip64_extra(extra: bytes) -> bytes:
+    """Remove ZIP64 extra fields; the writer re-adds them when sizes or offsets require it."""
+    result = bytearray()
+    i = 0
+    while i + 4 <= len(extra):
+        header_id, length = struct.unpack("<HH", extra[i : i + 4])
+        if header_id != _ZIP64_EXTRA_ID:
+            result += extra[i : i + 4 + length]
+        i += 4 + length
+    return bytes(result)
+
+
+class RawZipReader:
+    """Read-only view of a zip archive that exposes compressed entry payloads."""
+
+    def __init__(self, path: Path):
+        """Open a zip archive for raw reads.
+
+        Args:
+            path: Path to the zip archive
+        """
+        self.path = path
+        self._zip = zipfile.ZipFile(path, "r")
+        self._fp = open(path, "rb")
+
+    def __enter__(self) -> "RawZipReader":
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Exit context manager."""
+        self.close()
+
+    def infolist(self) -> List[zipfile.ZipInfo]:
+        """Return entries in archive order."""
+        return self._zip.infolist()
+
+    def getinfo(self, name: str) -> Optional[zipfile.ZipInfo]:
+        """Return the entry for ``name`` or None if the archive does not contain it."""
+        try:
+            return self._zip.getinfo(name)
+        except KeyError:
+            return None
+
+    def iter_raw(self, info: zipfile.ZipInfo) -> Iterator[bytes]:
+        """Yield the still-compressed payload of an entry.
+
+        Args:
+            info: Entry from this archive's central directory
+
+        Raises:
+            zipfile.BadZipFile: If the local file header is corrupt or truncated
+        """
+        self._fp.seek(info.header_offset)
+        header = self._fp.read(_LOCAL_HEADER_SIZE)
+        if len(header) != _LOCAL_HEADER_SIZE or header[:4] != _LOCAL_HEADER_SIGNATURE:
+            raise zipfile.BadZipFile(f"Bad local file header for {info.filename} in {self.path}")
+        fields = struct.unpack(_LOCAL_HEADER_STRUCT, header)
+        self._fp.seek(fields[-2] + fields[-1], os.SEEK_CUR)
+
+        remaining = info.compress_size
+        while remaining > 0:
+            chunk = self._fp.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                raise zipfile.BadZipFile(f"Truncated entry {info.filename} in {self.path}")
+            remaining -= len(chunk)
+            yield chunk
+
+    def close(self) -> None:
+        """Close the underlying file handles."""
+        self._zip.close()
+        self._fp.close()
+
+
+class ZipWriter:
+    """Append-only zip writer that stores already-compressed payloads byte for byte.
+
+    Every entry is written with its sizes and CRC in the local header, so the output
+    never needs to be seeked and can be any writable binary stream.
+    """
+
+    def __init__(self, target: Union[Path, BinaryIO, io.RawIOBase], compresslevel: int = zlib.Z_DEFAULT_COMPRESSION):
+        """Create a writer.
+
+        Args:
+            target: Output path, or a writable binary stream (not closed by the writer)
+            compresslevel: zlib compression level for entries compressed by this writer
+        """
+        self._fp: Union[BinaryIO, io.RawIOBase]
+        if isinstance(target, (str, Path)):
+            self._fp = open(target, "wb")
+            self._owns_fp = True
+        else:
+            self._fp = target
+            self._owns_fp = False
+        self.compresslevel = compresslevel
+        self._offset = 0
+        self._entries: List[zipfile.ZipInfo] = []
+        self._names: Set[str] = set()
+        self._closed = False
+
+    def __enter__(self) -> "ZipWriter":
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, exc_type: object, *exc_info: object) -> None:
+        """Finish the archive, or just release the handle if the body raised."""
+        if exc_type is None:
+            self.close()
+        elif self._owns_fp:
+            self._fp.close()
+
+    def __contains__(self, name: str) -> bool:
+        """Whether an entry with ``name`` has already been written."""
+        return name in self._names
+
+    @property
+    def entries(self) -> List[zipfile.ZipInfo]:
+        """Entries written so far."""
+        return list(self._entries)
+
+    def _write(self, data: bytes) -> None:
+        self._fp.write(data)
+        self._offset += len(data)
+
+    def write_raw(self, info: zipfile.ZipInfo, chunks: Iterator[bytes]) -> zipfile.ZipInfo:
+        """Write an entry whose payload is already compressed.
+
+        Args:
+            info: Entry metadata; CRC, file_size, compress_size and compress_type must describe ``chunks``
+            chunks: Compressed payload
+
+        Returns:
+            The ZipInfo recorded for the central directory
+        """
+        if self._closed:
+            raise ValueError("Attempt to write to a closed ZipWriter")
+        if info.filename in self._names:
+            raise ValueError(f"Duplicate zip entry: {info.filename}")
+
+        zinfo = zipfile.ZipInfo(info.filename, info.date_time)
+        zinfo.compress_type = info.compress_type
+        zinfo.CRC = info.CRC
+        zinfo.file_size = info.file_size
+        zinfo.compress_size = info.compress_size
+        zinfo.external_attr = info.external_attr
+        zinfo.internal_attr = info.internal_attr
+        zinfo.create_system = info.create_system
+        zinfo.comment = info.comment
+        zinfo.extra = _strip_zip64_extra(info.extra)
+        zinfo.flag_bits = info.flag_bits & ~(_DATA_DESCRIPTOR_FLAG | _UTF8_FLAG)
+        zinfo.header_offset = self._offset
+
+        self._write(zinfo.FileHeader())
+        written = 0
+        for chunk in chunks:
+            self._write(chunk)
+            written += len(chunk)
+        if written != zinfo.compress_size:
+            raise zipfile.BadZipFile(
+                f"Payload size mismatch for {zinfo.filename}: expected {zinfo.compress_size}, got {written}"
+            )
+
+        self._entries.append(zinfo)
+        self._names.add(zinfo.filename)
+        return zinfo
+
+    def copy_entry(self, reader: RawZipReader, info: zipfile.ZipInfo) -> zipfile.ZipInfo:
+        """Copy an entry from another archive without recompressing it."""
+        return self.write_raw(info, reader.iter_raw(info))
+
+    def write_compressed(self, info: zipfile.ZipInfo, compressed: CompressedFile) -> zipfile.ZipInfo:
+        """Write a file produced by :func:`deflate_file` under the metadata in ``info``."""
+        info.compress_type = zipfile.ZIP_DEFLATED
+        info.CRC = compressed.crc
+        info.file_size = compressed.file_size
+        info.compress_size = compressed.compress_size
+        return self.write_raw(info, compressed.iter_chunks())
+
+    def add_file(self, path: Path, arcname: str) -> str:
+        """Compress a file from disk and append it.
+
+        Args:
+            path: File to add
+            arcname: Name inside the archive
+
+        Returns:
+            SHA256 hex digest of the file contents
+        """
+        info = deterministic_info(arcname, path.stat().st_mode)
+        compressed = deflate_file(path, self.compresslevel)
+        try:
+            self.write_compressed(info, compressed)
+        finally:
+            compressed.close()
+        return compressed.sha256
+
+    def close(self) -> None:
+        """Write the central directory and end-of-archive records."""
+        if self._closed:
+            return
+        self._closed = True
+
+        start_dir = self._offset
+        for zinfo in self._entries:
+            self._write_central_dir_entry(zinfo)
+        end_dir = self._offset
+
+        count = len(self._entries)
+        size = end_dir - start_dir
+        offset = start_dir
+        if count > 0xFFFF or size > zipfile.ZIP64_LIMIT or offset > zipfile.ZIP64_LIMIT:
+            self._write(
+                struct.pack(
+                    _ZIP64_END_RECORD_STRUCT,
+                    _ZIP64_END_RECORD_SIGNATURE,
+                    44,
+                    _ZIP64_VERSION,
+                    _ZIP64_VERSION,
+                    0,
+                    0,
+                    count,
+                    count,
+                    size,
+                    offset,
+                )
+            )
+            self._write(struct.pack(_ZIP64_LOCATOR_STRUCT, _ZIP64_LOCATOR_SIGNATURE, 0, end_dir, 1))
+            count = min(count, 0xFFFF)
+            size = min(size, 0xFFFFFFFF)
+            offset = min(offset, 0xFFFFFFFF)
+
+        self._write(struct.pack(_END_RECORD_STRUCT, _END_RECORD_SIGNATURE, 0, 0, count, count, size, offset, 0))
+        self._fp.flush()
+        if self._owns_fp:
+            self._fp.close()
+
+    def _write_central_dir_entry(self, zinfo: zipfile.ZipInfo) -> None:
+        dt = zinfo.date_time
+        dosdate = (dt[0] - 1980) << 9 | dt[1] << 5 | dt[2]
+        dostime = dt[3] << 11 | dt[4] << 5 | (dt[5] // 2)
+
+        zip64_fields = []
+        file_size = zinfo.file_size
+        compress_size = zinfo.compress_size
+        header_offset = zinfo.header_offset
+        if file_size > zipfile.ZIP64_LIMIT or compress_size > zipfile.ZIP64_LIMIT:
+            zip64_fields.extend([file_size, compress_size])
+            file_size = compress_size = 0xFFFFFFFF
+        if header_offset > zipfile.ZIP64_LIMIT:
+            zip64_fields.append(header_offset)
+            header_offset = 0xFFFFFFFF
+
+        extra = zinfo.extra
+        min_version = 0
+        if zip64_fields:
+            extra = (
+                struct.pack("<HH" + "Q" * len(zip64_fields), _ZIP64_EXTRA_ID, 8 * len(zip64_fields), *zip64_fields)
+                + extra
+            )
+            min_version = _ZIP64_VERSION
+
+        try:
+            filename = zinfo.filename.encode("ascii")
+            flag_bits = zinfo.flag_bits
+        except UnicodeEncodeError:
+            filename = zinfo.filename.encode("utf-8")
+            flag_bits = zinfo.flag_bits | _UTF8_FLAG
+
+        self._write(
+            struct.pack(
+                _CENTRAL_DIR_STRUCT,
+                _CENTRAL_DIR_SIGNATURE,
+                max(min_version, zinfo.create_version),
+                zinfo.create_system,
+                max(min_version, zinfo.extract_version),
+                zinfo.reserved,
+                flag_bits,
+                zinfo.compress_type,
+                dostime,
+                dosdate,
+                zinfo.CRC,
+                compress_size,
+                file_size,
+                len(filename),
+                len(extra),
+                len(zinfo.comment),
+                0,
+                zinfo.internal_attr,
+                zinfo.external_attr,
+                header_offset,
+            )
+        )
+        self._write(filename)
+        self._write(extra)
+        self._write(zinfo.comment)
+
+
+def splice_zips(sources: Iterable[Tuple[Path, Optional[Collection[str]]]], output_zip: Path) -> Dict[Path, List[str]]:
+    """Write a zip from entries of other zips without recompressing them.
+
+    Entries are written in sorted name order. When several sources contain the same
+    name, the later source wins.
+
+    Args:
+        sources: (archive, names) pairs; names limits which entries are taken (None takes all)
+        output_zip: Path to the output zip (must not be one of the sources)
+
+    Returns:
+        Mapping of each source archive to the names taken from it
+
+    Raises:
+        KeyError: If a requested name is missing from its source archive
+    """
+    taken: Dict[Path, List[str]] = {}
+    with contextlib.ExitStack() as stack:
+        entries: Dict[str, Tuple[RawZipReader, zipfile.ZipInfo]] = {}
+        for path, names in sources:
+            reader = stack.enter_context(RawZipReader(path))
+            if names is None:
+                infos = reader.infolist()
+            else:
+                infos = []
+                for name in names:
+                    info = reader.getinfo(name)
+                    if info is None:
+                        raise KeyError(f"{name} not found in {path}")
+                    infos.append(info)
+            taken[path] = [info.filename for info in infos]
+            for info in infos:
+                entries[info.filename] = (reader, info)
+
+        with ZipWriter(output_zip) as writer:
+            for name in sorted(entries):
+                reader, info = entries[name]
+                writer.copy_entry(reader, info)
+    return taken
+
+
+def write_incremental_zip(
+    sources: Iterable[Tuple[Path, str]],
+    output_zip: Path,
+    previous: Dict[str, dict],
+    cached_zip: Optional[Path] = None,
+    workers: Optional[int] = None,
+) -> Tuple[Dict[str, dict], int]:
+    """Write a deterministic zip of files, reusing compressed entries of an earlier archive.
+
+    Files whose size, mode and mtime (or, failing that, content hash) match an entry of
+    ``previous`` are copied from ``cached_zip`` without being recompressed; a file with the
+    same content under another name is reused too. Only new or changed files are deflated,
+    in parallel and written in source order.
+
+    Args:
+        sources: (path, archive name) pairs, in archive order
+        output_zip: Path to the output zip (must not be cached_zip)
+        previous: Manifest of cached_zip as returned by an earlier call, or empty
+        cached_zip: Archive written by the call that produced previous
+        workers: Threads used to hash and compress files (defaults to the CPU count)
+
+    Returns:
+        Tuple of the manifest of the new archive (archive name -> {size, mtime_ns, mode,
+        sha256}) and the number of entries reused from cached_zip
+    """
+    manifest: Dict[str, dict] = {}
+    reused = 0
+
+    # Content index so renamed or copied files can also be served from the cache
+    by_hash = {entry["sha256"]: name for name, entry in previous.items()}
+
+    reader = RawZipReader(cached_zip) if cached_zip is not None and previous else None
+
+    def prepare(
+        item: Tuple[Path, str],
+    ) -> Tuple[zipfile.ZipInfo, Dict[str, object], Optional[zipfile.ZipInfo], Optional[CompressedFile]]:
+        # Runs on a worker thread: stat, hash and deflate, but never touch the output or cached archive
+        file_path, file_rel = item
+        st = file_path.stat()
+        entry: Dict[str, object] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "mode": st.st_mode}
+        info = deterministic_info(file_rel, st.st_mode)
+
+        if reader is not None:
+            cached = previous.get(file_rel)
+            if cached and all(cached.get(key) == entry[key] for key in ("size", "mtime_ns", "mode")):
+                entry["sha256"] = cached["sha256"]
+            else:
+                entry["sha256"] = hash_file(file_path)
+            source_name = by_hash.get(str(entry["sha256"]))
+            cached_info = reader.getinfo(source_name) if source_name else None
+            if cached_info is not None and cached_info.file_size == st.st_size:
+                return info, entry, cached_info, None
+
+        compressed = deflate_file(file_path)
+        entry["sha256"] = compressed.sha256
+        return info, entry, None, compressed
+
+    try:
+        with ZipWriter(output_zip) as writer:
+            for info, entry, cached_info, compressed in ordered_map(prepare, sources, workers or default_workers()):
+                if reader is not None and cached_info is not None:
+                    info.compress_type = cached_info.compress_type
+                    info.CRC = cached_info.CRC
+                    info.file_size = cached_info.file_size
+                    info.compress_size = cached_info.compress_size
+                    writer.write_raw(info, reader.iter_raw(cached_info))
+                    reused += 1
+                elif compressed is not None:
+                    try:
+                        writer.write_compressed(info, compressed)
+                    finally:
+                        compressed.close()
+
+                manifest[info.filename] = entry
+    finally:
+        if reader is not None:
+            reader.close()
+
+    return manifest, reused
@@ -1,6 +1,9 @@
 """Configuration utilities for Bedrock AgentCore SDK."""
 
 import logging
+import os
+import tempfile
+import threading
 from pathlib import Path
 from typing import Optional
 
@@ -12,6 +15,9 @@ from .schema import BedrockAgentCoreAgentSchema, BedrockAgentCoreConfigSchema
 
 log = logging.getLogger(__name__)
 
+# Serializes config writes from concurrent launches in this process
+_config_write_lock = threading.RLock()
+
 # def _clean_authorizer_config(config_dict: Dict[str, Any]) -> Dict[str, Any]:
 #     """Remove unwanted snake_case authorizer configurations."""
 #     if "authorizer_configuration" in config_dict:
@@ -120,12 +126,44 @@ def load_config(config_path: Path) -> BedrockAgentCoreConfigSchema:
 def save_config(config: BedrockAgentCoreConfigSchema, config_path: Path):
     """Save configuration to YAML file.
 
+    The file is replaced atomically, so readers never see a partially written config.
+
     Args:
         config: BedrockAgentCoreConfigSchema instance to save
         config_path: Path to save configuration file
     """
-    with open(config_path, "w") as f:
-        yaml.dump(config.model_dump(), f, default_flow_style=False, sort_keys=False)
+    config_path = Path(config_path)
+    with _config_write_lock:
+        fd, tmp_path = tempfile.mkstemp(dir=config_path.parent, prefix=f".{config_path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                yaml.dump(config.model_dump(), f, default_flow_style=False, sort_keys=False)
+            # mkstemp creates the file owner-only; keep the permissions a plain write would give
+            os.chmod(tmp_path, config_path.stat().st_mode & 0o777 if config_path.exists() else 0o644)
+            os.replace(tmp_path, config_path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+
+def save_agent_config(agent_config: BedrockAgentCoreAgentSchema, config_path: Path) -> BedrockAgentCoreConfigSchema:
+    """Save one agent's configuration, keeping every other agent as it is on disk.
+
+    Used where several agents are launched concurrently: each launch holds its own copy of
+    the project config, so saving that copy whole would undo the other launches' updates.
+
+    Args:
+        agent_config: Agent configuration to save
+        config_path: Path to configuration file
+
+    Returns:
+        The project configuration that was written
+    """
+    with _config_write_lock:
+        config = load_config_if_exists(config_path) or BedrockAgentCoreConfigSchema(default_agent=agent_config.name)
+        config.agents[agent_config.name] = agent_config
+        save_config(config, config_path)
+        return config
 
 
 def load_config_if_exists(config_path: Path) -> Optional[BedrockAgentCoreConfigSchema]:
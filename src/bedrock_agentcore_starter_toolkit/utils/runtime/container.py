@@ -12,6 +12,10 @@ from rich.console import Console
 
 from ...cli.common import _handle_warn, _print_success
 from .entrypoint import detect_dependencies, get_python_version
+from .wheelhouse import WHEELHOUSE_DIR, WHEELHOUSE_LOCK
+
+# Distribution installed in the image when observability is enabled
+OTEL_DISTRO = "aws-opentelemetry-distro"
 
 console = Console()
 
@@ -23,6 +27,10 @@ class ContainerRuntime:
 
     DEFAULT_RUNTIME = "auto"
     DEFAULT_PLATFORM = "linux/arm64"
+    # Dockerfile template modes: "standard" installs dependencies in the runtime image, "multistage"
+    # installs them into a venv in a builder stage (with a uv cache mount) and ships a slim image
+    # with the venv and precompiled application only
+    DOCKERFILE_TEMPLATES = {"standard": "Dockerfile.j2", "multistage": "Dockerfile.multistage.j2"}
 
     def __init__(self, runtime_type: Optional[str] = None):
         """Initialize container runtime.
@@ -113,6 +121,7 @@ class ContainerRuntime:
         memory_name: Optional[str] = None,
         source_path: Optional[str] = None,
         protocol: Optional[str] = None,
+        dockerfile_template: str = "standard",
     ) -> Path:
         """Generate Dockerfile from template.
 
@@ -127,7 +136,14 @@ class ContainerRuntime:
             memory_name: Optional memory name
             source_path: Optional source code directory (for dependency detection)
             protocol: Optional protocol configuration (HTTP or HTTPS)
+            dockerfile_template: Template mode, "standard" or "multistage"
         """
+        if dockerfile_template not in self.DOCKERFILE_TEMPLATES:
+            raise ValueError(
+                f"Unknown Dockerfile template: {dockerfile_template}. "
+                f"Choose one of: {', '.join(self.DOCKERFILE_TEMPLATES)}"
+            )
+
         current_platform = self._get_current_platform()
         required_platform = self.DEFAULT_PLATFORM
 
@@ -140,7 +156,7 @@ class ContainerRuntime:
                 "https://docs.aws.amazon.com/bedrock-agentcore/latest/devguide/getting-started-custom.html\n"
             )
 
-        template_path = Path(__file__).parent / "templates" / "Dockerfile.j2"
+        template_path = Path(__file__).parent / "templates" / self.DOCKERFILE_TEMPLATES[dockerfile_template]
 
         if not template_path.exists():
             log.error("Dockerfile template not found: %s", template_path)
@@ -162,7 +178,10 @@ class ContainerRuntime:
         # Calculate module path relative to Docker build context
         agent_module_path = self._get_module_path(agent_path, build_context_root)
 
-        wheelhouse_dir = output_dir / "wheelhouse"
+        # A wheelhouse built by 'agentcore wheelhouse' must be in the build context to be copied in
+        wheelhouse_lock = build_context_root / WHEELHOUSE_DIR / WHEELHOUSE_LOCK
+        has_wheelhouse = wheelhouse_lock.exists()
+        wheelhouse_has_otel = has_wheelhouse and OTEL_DISTRO in wheelhouse_lock.read_text()
 
         # Detect dependencies:
         # - If source_path provided: check source_path only
@@ -192,7 +211,10 @@ class ContainerRuntime:
             "agent_module": agent_path.stem,
             "agent_module_path": agent_module_path,
             "agent_var": agent_name,
-            "has_wheelhouse": wheelhouse_dir.exists() and wheelhouse_dir.is_dir(),
+            "has_wheelhouse": has_wheelhouse,
+            "wheelhouse_dir": WHEELHOUSE_DIR,
+            "wheelhouse_lock": f"{WHEELHOUSE_DIR}/{WHEELHOUSE_LOCK}",
+            "wheelhouse_has_otel": wheelhouse_has_otel,
             "has_current_package": has_current_package,
             "dependencies_file": deps.file,
             "dependencies_install_path": deps.install_path,
@@ -387,6 +409,20 @@ class ContainerRuntime:
             log.error("Failed to tag image")
             return False
 
+    def get_image_id(self, tag: str) -> Optional[str]:
+        """Get the content-addressed ID (sha256:...) of a local image."""
+        try:
+            result = subprocess.run(  # nosec B603
+                [self.runtime, "image", "inspect", "--format", "{{.Id}}", tag],
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+        except (subprocess.SubprocessError, OSError):
+            return None
+        image_id = result.stdout.strip()
+        return image_id if result.returncode == 0 and image_id.startswith("sha256:") else None
+
     def push(self, tag: str) -> bool:
         """Push image to registry."""
         log.info("Pushing image to registry...")
@@ -0,0 +1,240 @@
+"""Content-addressed store of installed distributions shared by every agent in a project.
+
+Each distribution is installed once per (name, version, platform, python) and kept as a
+zip fragment of its installed files (as listed in its RECORD). An agent's
+dependencies.zip is assembled by copying the compressed entries of the fragments it
+needs, so agents with overlapping requirements never reinstall or recompress the same
+distribution.
+"""
+
+import csv
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import uuid
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from .archive import CompressedFile, ZipWriter, deflate_file, deterministic_info, ordered_map
+
+log = logging.getLogger(__name__)
+
+STORE_ENV_VAR = "BEDROCK_AGENTCORE_DEPENDENCY_STORE"
+STORE_VERSION = 1
+
+_FRAGMENT_NAME = "files.zip"
+_RECORD_NAME = "record.json"
+_PIN_RE = re.compile(r"^(?P<name>[A-Za-z0-9][A-Za-z0-9._-]*)(?:\[[^\]]*\])?\s*==\s*(?P<version>[^\s;]+)")
+_DIRECT_RE = re.compile(r"^(?P<name>[A-Za-z0-9][A-Za-z0-9._-]*)(?:\[[^\]]*\])?\s*@\s*(?P<url>[^\s;]+)")
+
+
+def canonicalize_name(name: str) -> str:
+    """Normalize a distribution name as described in PEP 503."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+@dataclass(frozen=True)
+class Distribution:
+    """A pinned distribution from a resolved requirements file."""
+
+    name: str
+    version: str
+    requirement: str
+
+    @property
+    def key(self) -> str:
+        """Directory name of this distribution inside a store partition."""
+        return f"{self.name}-{self.version}"
+
+
+def parse_resolved_requirements(text: str) -> List[Distribution]:
+    """Parse the output of ``uv pip compile`` into pinned distributions.
+
+    Pinned requirements (``name==version``) are keyed by version. Direct references
+    (``name @ url``) are keyed by a hash of the URL, since they carry no version.
+
+    Args:
+        text: Contents of a resolved requirements file
+
+    Returns:
+        Distributions sorted by name
+
+    Raises:
+        ValueError: If a requirement is neither pinned nor a direct reference
+    """
+    dists: Dict[str, Distribution] = {}
+    for raw_line in text.splitlines():
+        line = raw_line.split(" #", 1)[0].strip().rstrip("\\").strip()
+        if not line or line.startswith("#") or line.startswith("-"):
+            continue
+
+        pinned = _PIN_RE.match(line)
+        if pinned:
+            name = canonicalize_name(pinned.group("name"))
+            dists[name] = Distribution(name, pinned.group("version"), line)
+            continue
+
+        direct = _DIRECT_RE.match(line)
+        if direct:
+            name = canonicalize_name(direct.group("name"))
+            url_hash = hashlib.sha256(direct.group("url").encode()).hexdigest()[:16]
+            dists[name] = Distribution(name, f"url-{url_hash}", line)
+            continue
+
+        raise ValueError(f"Unsupported requirement in resolved dependencies: {line}")
+
+    return [dists[name] for name in sorted(dists)]
+
+
+class DependencyStore:
+    """Directory of installed distributions, partitioned by target platform and Python version."""
+
+    def __init__(self, root: Path):
+        """Initialize the store.
+
+        Args:
+            root: Store directory (created on first write)
+        """
+        self.root = root
+
+    @classmethod
+    def for_project(cls, project_root: Path) -> "DependencyStore":
+        """Store shared by all agents of a project.
+
+        Set BEDROCK_AGENTCORE_DEPENDENCY_STORE to share one store between projects
+        (for example a directory under the user's cache).
+
+        Args:
+            project_root: Directory containing .bedrock_agentcore.yaml
+
+        Returns:
+            DependencyStore rooted at the override or at .bedrock_agentcore/dependency-store
+        """
+        override = os.environ.get(STORE_ENV_VAR)
+        if override:
+            return cls(Path(override).expanduser())
+        return cls(project_root / ".bedrock_agentcore" / "dependency-store")
+
+    def entry_dir(self, dist: Distribution, platform: str, python_version: str) -> Path:
+        """Directory holding one installed distribution."""
+        return self.root / f"v{STORE_VERSION}" / platform / f"py{python_version}" / dist.key
+
+    def fragment(self, dist: Distribution, platform: str, python_version: str) -> Path:
+        """Zip fragment holding the compressed files of one stored distribution."""
+        return self.entry_dir(dist, platform, python_version) / _FRAGMENT_NAME
+
+    def contains(self, dist: Distribution, platform: str, python_version: str) -> bool:
+        """Whether the distribution is already stored for this platform and Python version."""
+        return self.fragment(dist, platform, python_version).exists()
+
+    def missing(self, dists: Iterable[Distribution], platform: str, python_version: str) -> List[Distribution]:
+        """Distributions that still need to be installed."""
+        return [dist for dist in dists if not self.contains(dist, platform, python_version)]
+
+    def add_from_target(
+        self,
+        target_dir: Path,
+        dists: Iterable[Distribution],
+        platform: str,
+        python_version: str,
+        workers: int = 1,
+    ) -> None:
+        """Split an ``--target`` installation into one stored fragment per distribution.
+
+        Files are attributed to distributions through their ``*.dist-info/RECORD`` files.
+        Entries are published with an atomic rename, so concurrent launches that install
+        the same distribution never observe a partial entry.
+
+        Args:
+            target_dir: Directory the distributions were installed into
+            dists: Distributions that were installed
+            platform: Target platform tag (e.g. aarch64-manylinux2014)
+            python_version: Target Python version (e.g. 3.11)
+            workers: Number of threads used to compress files
+
+        Raises:
+            RuntimeError: If an installed distribution has no RECORD file
+        """
+        records = _find_records(target_dir)
+        for dist in dists:
+            record_file = records.get(dist.name)
+            if record_file is None:
+                raise RuntimeError(f"Installed distribution {dist.name} has no RECORD file in {target_dir}")
+
+            files = sorted(_record_files(record_file, target_dir))
+            self._publish(dist, platform, python_version, target_dir, files, workers)
+
+    def _publish(
+        self,
+        dist: Distribution,
+        platform: str,
+        python_version: str,
+        target_dir: Path,
+        files: List[str],
+        workers: int,
+    ) -> None:
+        entry_dir = self.entry_dir(dist, platform, python_version)
+        entry_dir.parent.mkdir(parents=True, exist_ok=True)
+        staging = entry_dir.with_name(f".{entry_dir.name}.{uuid.uuid4().hex}")
+        staging.mkdir()
+
+        def compress(arcname: str) -> Tuple[zipfile.ZipInfo, CompressedFile]:
+            path = target_dir / arcname
+            return deterministic_info(arcname, path.stat().st_mode), deflate_file(path)
+
+        try:
+            with ZipWriter(staging / _FRAGMENT_NAME) as writer:
+                for info, compressed in ordered_map(compress, files, workers):
+                    try:
+                        writer.write_compressed(info, compressed)
+                    finally:
+                        compressed.close()
+            (staging / _RECORD_NAME).write_text(json.dumps({"requirement": dist.requirement, "files": files}))
+
+            try:
+                os.replace(staging, entry_dir)
+            except OSError:
+                # Another launch published the same distribution first; its entry is equivalent
+                if not (entry_dir / _FRAGMENT_NAME).exists():
+                    raise
+                log.debug("Dependency store entry %s already published", dist.key)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+
+def _find_records(target_dir: Path) -> Dict[str, Path]:
+    """Map canonical distribution names to RECORD files in an install target."""
+    records = {}
+    for dist_info in target_dir.glob("*.dist-info"):
+        record = dist_info / "RECORD"
+        if not record.is_file():
+            continue
+        name = dist_info.name[: -len(".dist-info")].rsplit("-", 1)[0]
+        records[canonicalize_name(name)] = record
+    return records
+
+
+def _record_files(record_file: Path, target_dir: Path) -> Iterator[str]:
+    """Yield archive names of the installed files listed in a RECORD file.
+
+    Bytecode caches are skipped, as are paths that resolve outside the install target.
+    """
+    root = target_dir.resolve()
+    with open(record_file, newline="", encoding="utf-8") as f:
+        for row in csv.reader(f):
+            if not row or not row[0]:
+                continue
+            path = (target_dir / row[0]).resolve()
+            try:
+                arcname = path.relative_to(root).as_posix()
+            except ValueError:
+                log.debug("Skipping %s from %s: outside the install target", row[0], record_file)
+                continue
+            if "__pycache__" in arcname.split("/") or not path.is_file():
+                continue
+            yield arcname
@@ -0,0 +1,300 @@
+"""Compiled .dockerignore matching shared by code.zip packaging and CodeBuild source uploads.
+
+Semantics:
+
+- Patterns are evaluated in order and the last matching pattern wins; ``!pattern`` re-includes.
+- A pattern matches a path or any of its parent directories, so files inside an ignored
+  directory are ignored unless a later negation matches them (or a directory above them).
+- A pattern without a slash (other than a trailing one) matches a single path component at
+  any depth, e.g. ``*.pyc`` or ``node_modules``. A pattern with a slash (or a leading ``/``)
+  is anchored at the root of the build context; ``*`` and ``?`` never cross a slash and ``**`` matches any
+  number of directories.
+- A trailing slash restricts the pattern to directories.
+
+Patterns are compiled into a handful of combined regexes, so matching a path costs a
+fixed number of regex searches regardless of the number of patterns. Directories are
+pruned from the walk when they are ignored and no later negation can match below them;
+anchored negations are indexed in a prefix trie of their path segments for that check.
+"""
+
+import functools
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Pattern, Sequence, Tuple
+
+# Highest index of a pattern matching a path or one of its parents; NO_MATCH if none does
+NO_MATCH = -1
+
+
+@dataclass(frozen=True)
+class IgnoreRule:
+    """A parsed dockerignore pattern."""
+
+    index: int
+    pattern: str
+    negated: bool
+    dir_only: bool
+    anchored: bool
+    segments: Tuple[str, ...]
+
+
+def parse_pattern(index: int, raw: str) -> Optional[IgnoreRule]:
+    """Parse one dockerignore line into a rule, or None for blank lines and comments."""
+    line = raw.strip()
+    if not line or line.startswith("#"):
+        return None
+
+    negated = line.startswith("!")
+    if negated:
+        line = line[1:].strip()
+    dir_only = line.endswith("/")
+    rooted = line.startswith(("/", "./"))
+    segments = tuple(segment for segment in line.split("/") if segment and segment != ".")
+    if not segments:
+        return None
+
+    return IgnoreRule(index, raw, negated, dir_only, anchored=rooted or len(segments) > 1, segments=segments)
+
+
+def _translate_segment(segment: str) -> str:
+    """Translate one glob path segment to a regex that never crosses a slash."""
+    out = []
+    i, n = 0, len(segment)
+    while i < n:
+        c = segment[i]
+        i += 1
+        if c == "*":
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            j = i
+            if j < n and segment[j] in "!^":
+                j += 1
+            if j < n and segment[j] == "]":
+                j += 1
+            while j < n and segment[j] != "]":
+                j += 1
+            if j >= n:
+                out.append("\\[")
+            else:
+                body = segment[i:j].replace("\\", "\\\\")
+                if body[:1] in ("!", "^"):
+                    body = "^" + body[1:]
+                out.append(f"[{body}]")
+                i = j + 1
+        else:
+            out.append(re.escape(c))
+    return "".join(out)
+
+
+def _translate(segments: Sequence[str]) -> str:
+    """Translate anchored pattern segments to a regex over a full relative path."""
+    out = []
+    last = len(segments) - 1
+    for i, segment in enumerate(segments):
+        if segment == "**":
+            out.append(".*" if i == last else "(?:[^/]+/)*")
+        else:
+            out.append(_translate_segment(segment) + ("" if i == last else "/"))
+    return "".join(out)
+
+
+@functools.lru_cache(maxsize=256)
+def _segment_regex(segment: str) -> Pattern[str]:
+    return re.compile(_translate_segment(segment))
+
+
+def _segment_matches(segment: str, part: str) -> bool:
+    return _segment_regex(segment).fullmatch(part) is not None
+
+
+def _combine(rules: Iterable[Tuple[int, str]]) -> Optional[Pattern[str]]:
+    """Combine (index, regex) pairs so a match reports the highest matching index.
+
+    Alternatives are tried left to right, so they are ordered by descending index.
+    """
+    ordered = sorted(rules, reverse=True)
+    if not ordered:
+        return None
+    return re.compile("|".join(f"(?P<r{index}>{regex})" for index, regex in ordered))
+
+
+def _highest(regex: Optional[Pattern[str]], text: str) -> int:
+    if regex is None:
+        return NO_MATCH
+    match = regex.fullmatch(text)
+    if match is None or match.lastgroup is None:
+        return NO_MATCH
+    return int(match.lastgroup[1:])
+
+
+@dataclass
+class _TrieNode:
+    children: Dict[str, "_TrieNode"] = field(default_factory=dict)
+    # Rules whose next segment is a glob, with the segments from that point on
+    globs: List[Tuple[int, Tuple[str, ...]]] = field(default_factory=list)
+    # Highest rule index stored anywhere in this subtree
+    max_index: int = NO_MATCH
+
+
+class _NegationTrie:
+    """Prefix trie of anchored negation patterns, keyed by their literal leading segments."""
+
+    def __init__(self, rules: Iterable[IgnoreRule]):
+        self.root = _TrieNode()
+        for rule in rules:
+            self._insert(rule)
+
+    def _insert(self, rule: IgnoreRule) -> None:
+        node = self.root
+        node.max_index = max(node.max_index, rule.index)
+        for i, segment in enumerate(rule.segments):
+            if any(c in segment for c in "*?["):
+                node.globs.append((rule.index, rule.segments[i:]))
+                return
+            node = node.children.setdefault(segment, _TrieNode())
+            node.max_index = max(node.max_index, rule.index)
+
+    def may_match_below(self, parts: Sequence[str], after: int) -> bool:
+        """Whether a negation with index > after could match a path strictly below parts."""
+        node = self.root
+        for i, part in enumerate(parts):
+            if node.max_index <= after:
+                return False
+            for index, rest in node.globs:
+                if index > after and self._rest_may_match_below(rest, parts[i:]):
+                    return True
+            child = node.children.get(part)
+            if child is None:
+                return False
+            node = child
+        # Every remaining rule in this subtree continues below the directory
+        return node.max_index > after and (bool(node.children) or bool(node.globs))
+
+    @staticmethod
+    def _rest_may_match_below(segments: Sequence[str], parts: Sequence[str]) -> bool:
+        for i, segment in enumerate(segments):
+            if segment == "**":
+                return True
+            if i >= len(parts):
+                return True
+            if not _segment_matches(segment, parts[i]):
+                return False
+        return False
+
+
+class IgnoreMatcher:
+    """Dockerignore patterns compiled for fast, repeated matching."""
+
+    def __init__(self, patterns: Sequence[str]):
+        """Compile patterns.
+
+        Args:
+            patterns: Dockerignore lines in file order (comments and blank lines are skipped)
+        """
+        self.rules = [rule for rule in (parse_pattern(i, p) for i, p in enumerate(patterns)) if rule]
+
+        # is_dir -> [(index, regex)]
+        component: Dict[bool, List[Tuple[int, str]]] = {True: [], False: []}
+        anchored: Dict[bool, List[Tuple[int, str]]] = {True: [], False: []}
+        for rule in self.rules:
+            target = anchored if rule.anchored else component
+            regex = _translate(rule.segments) if rule.anchored else _translate_segment(rule.segments[0])
+            target[True].append((rule.index, regex))
+            if not rule.dir_only:
+                target[False].append((rule.index, regex))
+
+        self._component = {is_dir: _combine(rules) for is_dir, rules in component.items()}
+        self._anchored = {is_dir: _combine(rules) for is_dir, rules in anchored.items()}
+        self._negated = {rule.index for rule in self.rules if rule.negated}
+        self._unanchored_negation = max(
+            (rule.index for rule in self.rules if rule.negated and not rule.anchored), default=NO_MATCH
+        )
+        self._negation_trie = _NegationTrie(rule for rule in self.rules if rule.negated and rule.anchored)
+
+    def state(self, path: str, is_dir: bool, parent_state: int = NO_MATCH) -> int:
+        """Highest index of a pattern matching path, given the state of its parent directory."""
+        name = path.rsplit("/", 1)[-1]
+        return max(
+            parent_state,
+            _highest(self._component[is_dir], name),
+            _highest(self._anchored[is_dir], path),
+        )
+
+    def is_ignored_state(self, state: int) -> bool:
+        """Whether a path with this state is ignored."""
+        return state != NO_MATCH and state not in self._negated
+
+    def is_ignored(self, path: str, is_dir: bool = False) -> bool:
+        """Whether a relative path is ignored.
+
+        Args:
+            path: POSIX-style path relative to the build context
+            is_dir: Whether the path is a directory
+
+        Returns:
+            True if the path is ignored
+        """
+        parts = [part for part in path.replace(os.sep, "/").split("/") if part and part != "."]
+        state = NO_MATCH
+        for i in range(len(parts)):
+            state = self.state("/".join(parts[: i + 1]), is_dir or i < len(parts) - 1, state)
+        return self.is_ignored_state(state)
+
+    def can_prune(self, parts: Sequence[str], state: int) -> bool:
+        """Whether an ignored directory can be skipped entirely.
+
+        Args:
+            parts: Path segments of the directory
+            state: State of the directory
+
+        Returns:
+            True if nothing below the directory can be re-included by a negation
+        """
+        if not self.is_ignored_state(state):
+            return False
+        if self._unanchored_negation > state:
+            return False
+        return not self._negation_trie.may_match_below(parts, state)
+
+    def walk(self, root: Path) -> Iterator[Tuple[Path, str]]:
+        """Yield (path, relative POSIX path) for every file under root that is not ignored.
+
+        Directories and files are visited in sorted order so archives are stable across
+        filesystems; ignored directories are pruned when nothing below them can be
+        re-included.
+        """
+        states = {"": NO_MATCH}
+        for current, dirs, files in os.walk(root):
+            rel_root = os.path.relpath(current, root).replace(os.sep, "/")
+            if rel_root == ".":
+                rel_root = ""
+            parent_state = states.pop(rel_root, NO_MATCH)
+            prefix = f"{rel_root}/" if rel_root else ""
+
+            kept = []
+            for d in sorted(dirs):
+                rel = prefix + d
+                state = self.state(rel, True, parent_state)
+                if not self.can_prune(rel.split("/"), state):
+                    states[rel] = state
+                    kept.append(d)
+            dirs[:] = kept
+
+            for f in sorted(files):
+                rel = prefix + f
+                if not self.is_ignored_state(self.state(rel, False, parent_state)):
+                    yield Path(current) / f, rel
+
+
+@functools.lru_cache(maxsize=16)
+def _compile(patterns: Tuple[str, ...]) -> IgnoreMatcher:
+    return IgnoreMatcher(patterns)
+
+
+def compile_ignore_patterns(patterns: Sequence[str]) -> IgnoreMatcher:
+    """Compiled matcher for a pattern list, reused across calls with the same patterns."""
+    return _compile(tuple(patterns))
@@ -0,0 +1,250 @@
+"""Opt-in size optimization for installed dependencies.
+
+Runs between ``uv pip install`` and zipping. Each rule removes (or shrinks) files that
+are not needed to import and run packages on AgentCore Runtime, and the optimizer
+reports how many bytes every rule saved.
+"""
+
+import fnmatch
+import hashlib
+import json
+import logging
+import os
+import shutil
+import subprocess  # nosec B404 - strip is invoked without a shell
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+log = logging.getLogger(__name__)
+
+_TEST_DIRS = {"tests", "test"}
+_DOC_DIRS = {"docs", "doc", "examples"}
+_KEEP_LOCALES = ("en", "en_US", "en_GB")
+_ELF_MAGIC = b"\x7fELF"
+# ELF e_machine values for the platforms AgentCore Runtime and local builds target
+_ELF_MACHINES = {"aarch64": 183, "x86_64": 62}
+
+# A rule sees the path relative to the install target and whether it is a directory
+PathPredicate = Callable[[str, bool, Path], bool]
+
+
+@dataclass(frozen=True)
+class OptimizationRule:
+    """A named set of paths to remove from installed dependencies."""
+
+    name: str
+    description: str
+    matches: PathPredicate
+
+
+def _is_test_dir(relpath: str, is_dir: bool, path: Path) -> bool:
+    # Only test directories inside a package; a top-level "tests" may be a real package
+    return is_dir and "/" in relpath and os.path.basename(relpath) in _TEST_DIRS
+
+
+def _is_type_stub(relpath: str, is_dir: bool, path: Path) -> bool:
+    return not is_dir and relpath.endswith(".pyi")
+
+
+def _is_doc_dir(relpath: str, is_dir: bool, path: Path) -> bool:
+    # Keep importable packages that happen to be called "doc" (e.g. numpy.doc in older releases)
+    return is_dir and "/" in relpath and os.path.basename(relpath) in _DOC_DIRS and not (path / "__init__.py").exists()
+
+
+def _is_bytecode(relpath: str, is_dir: bool, path: Path) -> bool:
+    if is_dir:
+        return os.path.basename(relpath) == "__pycache__"
+    return relpath.endswith((".pyc", ".pyo"))
+
+
+def _is_unused_locale(relpath: str, is_dir: bool, path: Path) -> bool:
+    # <pkg>/.../locale/<lang>/LC_MESSAGES/*.mo|*.po, keeping English catalogs
+    if is_dir or not relpath.endswith((".mo", ".po")):
+        return False
+    parts = relpath.split("/")
+    if len(parts) < 4 or parts[-2] != "LC_MESSAGES" or parts[-4] != "locale":
+        return False
+    return parts[-3] not in _KEEP_LOCALES
+
+
+BUILTIN_RULES: Dict[str, OptimizationRule] = {
+    rule.name: rule
+    for rule in (
+        OptimizationRule("tests", "test suites shipped inside packages", _is_test_dir),
+        OptimizationRule("type_stubs", "*.pyi type stubs", _is_type_stub),
+        OptimizationRule("docs", "documentation and example directories", _is_doc_dir),
+        OptimizationRule("bytecode", "__pycache__ and stale *.pyc files", _is_bytecode),
+        OptimizationRule("locale", "non-English gettext catalogs", _is_unused_locale),
+    )
+}
+STRIP_DEBUG_RULE = "strip_debug"
+DEFAULT_RULES = [*BUILTIN_RULES, STRIP_DEBUG_RULE]
+CUSTOM_RULE = "custom"
+
+
+@dataclass
+class OptimizationReport:
+    """Bytes and files removed by each rule."""
+
+    bytes_saved: Dict[str, int] = field(default_factory=dict)
+    files_removed: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def total_bytes_saved(self) -> int:
+        """Bytes saved across all rules."""
+        return sum(self.bytes_saved.values())
+
+    def add(self, rule: str, size: int, files: int = 1) -> None:
+        """Credit a removal to a rule."""
+        self.bytes_saved[rule] = self.bytes_saved.get(rule, 0) + size
+        self.files_removed[rule] = self.files_removed.get(rule, 0) + files
+
+    def log_summary(self) -> None:
+        """Log the savings per rule."""
+        if not self.bytes_saved:
+            log.info("✂️  Package optimization found nothing to remove")
+            return
+        log.info("✂️  Package optimization saved %.2f MB", self.total_bytes_saved / (1024 * 1024))
+        for rule, size in sorted(self.bytes_saved.items(), key=lambda item: -item[1]):
+            log.info("  %-12s %9.2f MB  (%d files)", rule, size / (1024 * 1024), self.files_removed[rule])
+
+
+class PackageOptimizer:
+    """Applies a configurable ruleset to an install target directory."""
+
+    def __init__(
+        self,
+        rules: Optional[Sequence[str]] = None,
+        extra_patterns: Optional[Sequence[str]] = None,
+    ):
+        """Initialize the optimizer.
+
+        Args:
+            rules: Names of built-in rules to apply (defaults to all of DEFAULT_RULES)
+            extra_patterns: Additional glob patterns (relative to the install target) to remove
+
+        Raises:
+            ValueError: If a rule name is unknown
+        """
+        self.rules = list(DEFAULT_RULES if rules is None else rules)
+        unknown = sorted(set(self.rules) - set(DEFAULT_RULES))
+        if unknown:
+            raise ValueError(f"Unknown package optimization rules: {', '.join(unknown)}")
+        self.extra_patterns = list(extra_patterns or [])
+
+    @property
+    def fingerprint(self) -> str:
+        """Short hash of the ruleset; dependencies built with different rulesets are cached apart."""
+        payload = json.dumps([sorted(self.rules), self.extra_patterns])
+        return hashlib.sha256(payload.encode()).hexdigest()[:12]
+
+    def optimize(self, target_dir: Path, target_machine: str = "aarch64") -> OptimizationReport:
+        """Remove matching paths from an install target and strip shared libraries.
+
+        Args:
+            target_dir: Directory dependencies were installed into
+            target_machine: CPU architecture of the target runtime, used to guard .so stripping
+
+        Returns:
+            Bytes and files removed per rule
+        """
+        report = OptimizationReport()
+        path_rules = [BUILTIN_RULES[name] for name in self.rules if name in BUILTIN_RULES]
+        if self.extra_patterns:
+            path_rules.append(OptimizationRule(CUSTOM_RULE, "user-configured patterns", self._matches_extra))
+
+        shared_libraries = []
+        for dirpath, dirnames, filenames in os.walk(target_dir):
+            current = Path(dirpath)
+            rel_dir = current.relative_to(target_dir).as_posix()
+            prefix = "" if rel_dir == "." else f"{rel_dir}/"
+
+            for dirname in sorted(dirnames):
+                path = current / dirname
+                rule = self._first_match(path_rules, prefix + dirname, True, path)
+                if rule and not path.is_symlink():
+                    size, count = _tree_size(path)
+                    shutil.rmtree(path)
+                    report.add(rule.name, size, count)
+                    dirnames.remove(dirname)
+
+            for filename in filenames:
+                path = current / filename
+                rule = self._first_match(path_rules, prefix + filename, False, path)
+                if rule:
+                    report.add(rule.name, path.lstat().st_size)
+                    path.unlink()
+                elif (filename.endswith(".so") or ".so." in filename) and not path.is_symlink():
+                    shared_libraries.append(path)
+
+        if STRIP_DEBUG_RULE in self.rules:
+            self._strip_debug_symbols(shared_libraries, target_machine, report)
+        return report
+
+    def _matches_extra(self, relpath: str, is_dir: bool, path: Path) -> bool:
+        return any(fnmatch.fnmatchcase(relpath, pattern.rstrip("/")) for pattern in self.extra_patterns)
+
+    @staticmethod
+    def _first_match(
+        rules: Iterable[OptimizationRule], relpath: str, is_dir: bool, path: Path
+    ) -> Optional[OptimizationRule]:
+        return next((rule for rule in rules if rule.matches(relpath, is_dir, path)), None)
+
+    @staticmethod
+    def _strip_debug_symbols(libraries: List[Path], target_machine: str, report: OptimizationReport) -> None:
+        """Strip debug sections from ELF shared libraries built for the target machine.
+
+        Only ``--strip-debug`` is used, so symbol tables needed for dynamic linking stay
+        intact. Libraries for another architecture, and any library strip fails on, are
+        left untouched.
+        """
+        strip = shutil.which("strip")
+        if not strip:
+            if libraries:
+                log.info("strip not found, skipping debug symbol removal for %d shared libraries", len(libraries))
+            return
+
+        machine = _ELF_MACHINES.get(target_machine)
+        for library in libraries:
+            if not _is_elf_for(library, machine):
+                continue
+            with tempfile.TemporaryDirectory(dir=library.parent) as temp_dir:
+                stripped = Path(temp_dir) / library.name
+                result = subprocess.run(  # nosec B603 - strip resolved from PATH, no shell
+                    [strip, "--strip-debug", "-o", str(stripped), str(library)],
+                    capture_output=True,
+                    text=True,
+                    check=False,
+                )
+                if result.returncode != 0 or not stripped.exists():
+                    log.debug("Could not strip %s: %s", library, result.stderr.strip())
+                    continue
+                saved = library.stat().st_size - stripped.stat().st_size
+                if saved > 0:
+                    shutil.copymode(library, stripped)
+                    os.replace(stripped, library)
+                    report.add(STRIP_DEBUG_RULE, saved)
+
+
+def _tree_size(path: Path) -> Tuple[int, int]:
+    """Total size in bytes and number of files below a directory."""
+    size = count = 0
+    for dirpath, _, filenames in os.walk(path):
+        for filename in filenames:
+            size += os.lstat(os.path.join(dirpath, filename)).st_size
+            count += 1
+    return size, count
+
+
+def _is_elf_for(path: Path, machine: Optional[int]) -> bool:
+    """Whether a file is a little-endian ELF object for the given e_machine."""
+    try:
+        with open(path, "rb") as f:
+            header = f.read(20)
+    except OSError:
+        return False
+    if len(header) < 20 or not header.startswith(_ELF_MAGIC):
+        return False
+    return machine is None or int.from_bytes(header[18:20], "little") == machine
@@ -1,23 +1,47 @@
 """Code zip packaging with smart dependency caching for Lambda-style deployments."""
 
-import fnmatch
+import contextlib
 import hashlib
+import io
+import json
 import logging
 import os
 import shutil
 import subprocess  # nosec B404 - subprocess is required for pip/uv package installation
 import tempfile
-import zipfile
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 import boto3
 
+from .archive import (
+    RawZipReader,
+    ZipWriter,
+    default_workers,
+    deterministic_info,
+    hash_file,
+    splice_zips,
+    write_incremental_zip,
+)
+from .bytecode import build_bytecode_layer, find_interpreter, source_for_bytecode
+from .dependency_store import DependencyStore, parse_resolved_requirements
+from .ignore import compile_ignore_patterns
+from .optimize import PackageOptimizer
+
 log = logging.getLogger(__name__)
 
+SOURCE_CACHE_VERSION = 1
+DEPENDENCY_MANIFEST_VERSION = 1
+# Bump when the merge changes, so packages keyed by the old merge are uploaded again
+PACKAGE_KEY_VERSION = 1
+
+# uv platform tag for AgentCore Runtime (Linux ARM64)
+DEPENDENCY_PLATFORM = "aarch64-manylinux2014"
+
 
 class PackageCache:
-    """Minimal cache for dependencies only."""
+    """Persistent cache for dependencies and compressed source entries."""
 
     def __init__(self, cache_dir: Path):
         """Initialize package cache.
@@ -30,7 +54,7 @@ class PackageCache:
 
     @property
     def dependencies_zip(self) -> Path:
-        """Path to cached dependencies.zip (only persistent artifact)."""
+        """Path to cached dependencies.zip."""
         return self.cache_dir / "dependencies.zip"
 
     @property
@@ -38,12 +62,147 @@ class PackageCache:
         """Path to hash file for dependencies."""
         return self.cache_dir / "dependencies.hash"
 
+    @property
+    def dependencies_manifest(self) -> Path:
+        """Path to the manifest listing the distributions in dependencies.zip."""
+        return self.cache_dir / "dependencies.json"
+
+    @property
+    def dependencies_bytecode_zip(self) -> Path:
+        """Path to the precompiled bytecode for dependencies.zip."""
+        return self.cache_dir / "dependencies_bytecode.zip"
+
+    @property
+    def dependencies_bytecode_stamp(self) -> Path:
+        """Path to the record of what dependencies_bytecode.zip was compiled from."""
+        return self.cache_dir / "dependencies_bytecode.json"
+
+    @property
+    def source_cache_zip(self) -> Path:
+        """Path to the archive holding compressed source entries from the last build."""
+        return self.cache_dir / "source_cache.zip"
+
+    @property
+    def source_manifest(self) -> Path:
+        """Path to the manifest describing entries in source_cache.zip."""
+        return self.cache_dir / "source_cache.json"
+
+    @property
+    def artifacts(self) -> Set[Path]:
+        """Resolved paths of every file owned by the cache (never packaged as source)."""
+        paths = [
+            self.dependencies_zip,
+            self.dependencies_hash,
+            self.dependencies_manifest,
+            self.dependencies_bytecode_zip,
+            self.dependencies_bytecode_stamp,
+            self.source_cache_zip,
+            self.source_manifest,
+        ]
+        return {path.resolve() for path in paths}
+
+    def load_source_manifest(self) -> Dict[str, dict]:
+        """Load the per-file manifest for cached source entries.
+
+        Returns:
+            Mapping of archive name to {size, mtime_ns, mode, sha256}, empty if unusable
+        """
+        if not self.source_manifest.exists() or not self.source_cache_zip.exists():
+            return {}
+        try:
+            data = json.loads(self.source_manifest.read_text())
+        except (OSError, ValueError) as e:
+            log.debug("Ignoring unreadable source cache manifest: %s", e)
+            return {}
+        if data.get("version") != SOURCE_CACHE_VERSION:
+            return {}
+        files: Dict[str, dict] = data.get("files", {})
+        return files
+
+    def save_source_cache(self, code_zip: Path, manifest: Dict[str, dict]) -> None:
+        """Persist a freshly built code.zip and its manifest for the next build.
+
+        Args:
+            code_zip: code.zip produced by the current build
+            manifest: Mapping of archive name to {size, mtime_ns, mode, sha256}
+        """
+        tmp_zip = self.source_cache_zip.with_suffix(".zip.tmp")
+        shutil.copyfile(code_zip, tmp_zip)
+        os.replace(tmp_zip, self.source_cache_zip)
+
+        tmp_manifest = self.source_manifest.with_suffix(".json.tmp")
+        tmp_manifest.write_text(json.dumps({"version": SOURCE_CACHE_VERSION, "files": manifest}))
+        os.replace(tmp_manifest, self.source_manifest)
+
+    def load_dependencies_manifest(self, platform: str, python_version: str) -> Dict[str, List[str]]:
+        """Load the distributions in the cached dependencies.zip.
+
+        Args:
+            platform: Target platform the dependencies must have been built for
+            python_version: Python version the dependencies must have been built for
+
+        Returns:
+            Mapping of distribution key to its archive names, empty if unusable
+        """
+        if not self.dependencies_manifest.exists() or not self.dependencies_zip.exists():
+            return {}
+        try:
+            data = json.loads(self.dependencies_manifest.read_text())
+        except (OSError, ValueError) as e:
+            log.debug("Ignoring unreadable dependencies manifest: %s", e)
+            return {}
+        if (data.get("version"), data.get("platform"), data.get("python_version")) != (
+            DEPENDENCY_MANIFEST_VERSION,
+            platform,
+            python_version,
+        ):
+            return {}
+        dists: Dict[str, List[str]] = data.get("distributions", {})
+        return dists
+
+    def save_dependencies_manifest(self, platform: str, python_version: str, dists: Dict[str, List[str]]) -> None:
+        """Record the distributions written to dependencies.zip.
+
+        Args:
+            platform: Target platform the dependencies were built for
+            python_version: Python version the dependencies were built for
+            dists: Mapping of distribution key to its archive names
+        """
+        tmp_manifest = self.dependencies_manifest.with_suffix(".json.tmp")
+        tmp_manifest.write_text(
+            json.dumps(
+                {
+                    "version": DEPENDENCY_MANIFEST_VERSION,
+                    "platform": platform,
+                    "python_version": python_version,
+                    "distributions": dists,
+                }
+            )
+        )
+        os.replace(tmp_manifest, self.dependencies_manifest)
+
+    def load_bytecode_stamp(self) -> Dict[str, Any]:
+        """Load the record of what dependencies_bytecode.zip was compiled from, empty if unusable."""
+        if not self.dependencies_bytecode_stamp.exists() or not self.dependencies_bytecode_zip.exists():
+            return {}
+        try:
+            stamp: Dict[str, Any] = json.loads(self.dependencies_bytecode_stamp.read_text())
+        except (OSError, ValueError) as e:
+            log.debug("Ignoring unreadable bytecode stamp: %s", e)
+            return {}
+        return stamp
+
+    def save_bytecode_stamp(self, stamp: Dict[str, Any]) -> None:
+        """Record what dependencies_bytecode.zip was compiled from."""
+        self.dependencies_bytecode_stamp.write_text(json.dumps(stamp))
+
     def should_rebuild_dependencies(
         self,
         requirements_file: Path,
         user_lock_file: Optional[Path],
         force: bool,
         runtime_version: Optional[str] = None,
+        variant: Optional[str] = None,
     ) -> bool:
         """Determine if dependencies need rebuilding using multi-signal detection.
 
@@ -52,6 +211,7 @@ class PackageCache:
             user_lock_file: User's uv.lock file (if exists)
             force: Force rebuild flag
             runtime_version: Python runtime version (e.g., "PYTHON_3_11")
+            variant: Build variant, such as the package optimizer ruleset fingerprint
 
         Returns:
             True if dependencies should be rebuilt
@@ -71,7 +231,7 @@ class PackageCache:
             log.info("📦 No hash file found, will rebuild")
             return True
 
-        current_hash = self._compute_combined_hash(requirements_file, user_lock_file, runtime_version)
+        current_hash = self._compute_combined_hash(requirements_file, user_lock_file, runtime_version, variant)
         stored_hash = self.dependencies_hash.read_text().strip()
 
         if current_hash != stored_hash:
@@ -84,7 +244,11 @@ class PackageCache:
         return False
 
     def save_dependencies_hash(
-        self, requirements_file: Path, user_lock_file: Optional[Path], runtime_version: Optional[str] = None
+        self,
+        requirements_file: Path,
+        user_lock_file: Optional[Path],
+        runtime_version: Optional[str] = None,
+        variant: Optional[str] = None,
     ) -> None:
         """Save combined hash of requirements file, uv.lock, and runtime version for future comparisons.
 
@@ -92,8 +256,9 @@ class PackageCache:
             requirements_file: Source requirements file to hash
             user_lock_file: User's uv.lock file (if exists)
             runtime_version: Python runtime version (e.g., "PYTHON_3_11")
+            variant: Build variant, such as the package optimizer ruleset fingerprint
         """
-        combined_hash = self._compute_combined_hash(requirements_file, user_lock_file, runtime_version)
+        combined_hash = self._compute_combined_hash(requirements_file, user_lock_file, runtime_version, variant)
         self.dependencies_hash.write_text(combined_hash)
 
     @staticmethod
@@ -109,7 +274,11 @@ class PackageCache:
         return hashlib.sha256(file_path.read_bytes()).hexdigest()
 
     def _compute_combined_hash(
-        self, requirements_file: Path, user_lock_file: Optional[Path], runtime_version: Optional[str] = None
+        self,
+        requirements_file: Path,
+        user_lock_file: Optional[Path],
+        runtime_version: Optional[str] = None,
+        variant: Optional[str] = None,
     ) -> str:
         """Compute combined hash of requirements file, uv.lock, and runtime version.
 
@@ -117,6 +286,7 @@ class PackageCache:
             requirements_file: Source requirements file
             user_lock_file: User's uv.lock file (if exists)
             runtime_version: Python runtime version (e.g., "PYTHON_3_11")
+            variant: Build variant, such as the package optimizer ruleset fingerprint
 
         Returns:
             Combined SHA256 hash as hex string
@@ -133,6 +303,9 @@ class PackageCache:
         if runtime_version:
             hash_components.append(runtime_version)
 
+        if variant:
+            hash_components.append(variant)
+
         # Combine all components deterministically
         combined_input = ":".join(hash_components)
         combined_hash = hashlib.sha256(combined_input.encode()).hexdigest()
@@ -146,9 +319,50 @@ class PackageCache:
         return combined_hash
 
 
+@dataclass
+class BytecodeLayers:
+    """Precompiled bytecode for the dependency and source layers of a package."""
+
+    dependencies: Optional[Path]
+    source: Path
+
+
+@dataclass
+class UploadedPackage:
+    """A deployment package stored in S3."""
+
+    s3_location: str
+    has_otel_distro: bool
+    digest: str
+    uploaded: bool
+
+
 class CodeZipPackager:
     """Creates Lambda-style deployment packages with smart caching."""
 
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        dependency_store: Optional[DependencyStore] = None,
+        optimizer: Optional[PackageOptimizer] = None,
+        precompile: bool = False,
+    ):
+        """Initialize the packager.
+
+        Args:
+            workers: Number of threads used to compress files (defaults to the CPU count)
+            dependency_store: Store of installed distributions shared between agents. Without
+                one, every dependency build installs into a throwaway store.
+            optimizer: Size optimizer applied to newly installed dependencies (opt-in)
+            precompile: Ship unchecked-hash bytecode for the runtime's Python version
+        """
+        if workers is not None and workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+        self.workers = workers or default_workers()
+        self.dependency_store = dependency_store
+        self.optimizer = optimizer
+        self.precompile = precompile
+
     def create_deployment_package(
         self,
         source_dir: Path,
@@ -182,22 +396,9 @@ class CodeZipPackager:
         cache = PackageCache(cache_dir)
 
         # Step 1: Ensure dependencies.zip exists in cache
-        has_dependencies = requirements_file is not None and requirements_file.exists()
-
-        if has_dependencies and requirements_file is not None:  # Type guard for mypy
-            user_lock = source_dir / "uv.lock"
-
-            needs_rebuild = cache.should_rebuild_dependencies(
-                requirements_file, user_lock if user_lock.exists() else None, force_rebuild_deps, runtime_version
-            )
-
-            if needs_rebuild:
-                log.info("Building dependencies (this may take a minute)...")
-                self._build_dependencies_zip(requirements_file, cache.dependencies_zip, runtime_version)
-                cache.save_dependencies_hash(
-                    requirements_file, user_lock if user_lock.exists() else None, runtime_version
-                )
-                log.info("✓ Dependencies cached")
+        dependencies_zip = self._ensure_dependencies(
+            cache, source_dir, runtime_version, requirements_file, force_rebuild_deps
+        )
 
         # Step 2: Create ephemeral code.zip and deployment.zip in temp
         temp_dir = Path(tempfile.mkdtemp(prefix=f"agentcore_{agent_name}_"))
@@ -207,17 +408,16 @@ class CodeZipPackager:
             deployment_zip = temp_dir / "deployment.zip"
 
             log.info("Packaging source code...")
-            self._build_direct_code_deploy(source_dir, direct_code_deploy)
+            self._build_direct_code_deploy(source_dir, direct_code_deploy, cache=cache)
+            bytecode = self._build_bytecode_layers(
+                cache, dependencies_zip, direct_code_deploy, runtime_version, temp_dir
+            )
 
             log.info("Creating deployment package...")
-            self._merge_zips(cache.dependencies_zip if has_dependencies else None, direct_code_deploy, deployment_zip)
+            self._merge_zips(dependencies_zip, direct_code_deploy, deployment_zip, bytecode=bytecode)
 
             # Validate size
-            size_mb = deployment_zip.stat().st_size / (1024 * 1024)
-            log.info("✓ Deployment package ready: %.2f MB", size_mb)
-
-            if size_mb > 250:
-                log.warning("⚠️  Package size (%.2f MB) exceeds 250MB limit. Consider reducing dependencies.", size_mb)
+            self._check_package_size(deployment_zip.stat().st_size)
 
             # Check if aws-opentelemetry-distro is present for instrumentation
             has_otel_distro = self._check_otel_distro(requirements_file)
@@ -229,40 +429,298 @@ class CodeZipPackager:
             shutil.rmtree(temp_dir, ignore_errors=True)
             raise
 
-    def _build_dependencies_zip(self, requirements_file: Path, output_zip: Path, runtime_version: str) -> None:
-        """Build dependencies.zip to cache (expensive operation).
+    def stream_deployment_package(
+        self,
+        source_dir: Path,
+        agent_name: str,
+        cache_dir: Path,
+        runtime_version: str,
+        session: boto3.Session,
+        bucket: str,
+        s3_key: str,
+        account_id: str,
+        requirements_file: Optional[Path] = None,
+        force_rebuild_deps: bool = False,
+    ) -> UploadedPackage:
+        """Create deployment.zip and upload it to S3 as it is written.
+
+        Same packaging as :meth:`create_deployment_package`, but the merged archive is
+        never written to disk: its bytes are sent as S3 multipart upload parts while the
+        layers are being merged.
 
         Args:
-            requirements_file: Source requirements file
-            output_zip: Path to output dependencies.zip
+            source_dir: Directory containing source code
+            agent_name: Name of the agent
+            cache_dir: Cache directory for dependencies
+            runtime_version: Python runtime version (e.g., "python3.10")
+            session: Boto3 session
+            bucket: Destination S3 bucket
+            s3_key: Destination S3 key
+            account_id: AWS account ID (expected bucket owner)
+            requirements_file: Path to requirements.txt or pyproject.toml
+            force_rebuild_deps: Force rebuild of dependencies even if cached
+
+        A key for the merged archive is computed from its layers first (see
+        :meth:`_package_key`) and compared with the one recorded in the existing object's
+        metadata; if they match the upload is skipped.
+
+        Returns:
+            UploadedPackage describing the object in S3
+
+        Raises:
+            StreamingUploadError: If the upload fails; the multipart upload is aborted and the
+                caller can fall back to :meth:`create_deployment_package`
+        """
+        from ...services.s3 import DIGEST_METADATA_KEY, MultipartUploadStream, get_object_digest, multipart_part_size
+
+        cache = PackageCache(cache_dir)
+        dependencies_zip = self._ensure_dependencies(
+            cache, source_dir, runtime_version, requirements_file, force_rebuild_deps
+        )
+
+        with tempfile.TemporaryDirectory(prefix=f"agentcore_{agent_name}_") as temp_dir:
+            direct_code_deploy = Path(temp_dir) / "code.zip"
+
+            log.info("Packaging source code...")
+            self._build_direct_code_deploy(source_dir, direct_code_deploy, cache=cache)
+            bytecode = self._build_bytecode_layers(
+                cache, dependencies_zip, direct_code_deploy, runtime_version, Path(temp_dir)
+            )
+
+            s3 = session.client("s3")
+            has_otel_distro = self._check_otel_distro(requirements_file)
+            digest = self._package_key(cache, dependencies_zip, direct_code_deploy, bytecode=bytecode)
+            if get_object_digest(s3, bucket, s3_key, account_id) == digest:
+                log.info("✓ Deployment package unchanged (key %s), skipping upload", digest[:12])
+                return UploadedPackage(f"s3://{bucket}/{s3_key}", has_otel_distro, digest, uploaded=False)
+
+            # The merged archive is roughly the size of its layers
+            layers = [direct_code_deploy, dependencies_zip]
+            if bytecode:
+                layers.extend([bytecode.source, bytecode.dependencies])
+            expected_size = sum(layer.stat().st_size for layer in layers if layer)
+
+            upload = MultipartUploadStream(
+                s3,
+                bucket,
+                s3_key,
+                account_id,
+                part_size=multipart_part_size(expected_size),
+                metadata={DIGEST_METADATA_KEY: digest},
+            )
+            log.info("Streaming deployment package to s3://%s/%s...", bucket, s3_key)
+            try:
+                self._merge_zips(dependencies_zip, direct_code_deploy, upload, bytecode=bytecode)
+                s3_location = upload.complete()
+            except BaseException:
+                upload.abort()
+                raise
+
+        self._check_package_size(upload.bytes_written)
+        return UploadedPackage(s3_location, has_otel_distro, digest, uploaded=True)
+
+    def _ensure_dependencies(
+        self,
+        cache: PackageCache,
+        source_dir: Path,
+        runtime_version: str,
+        requirements_file: Optional[Path],
+        force_rebuild_deps: bool,
+    ) -> Optional[Path]:
+        """Build dependencies.zip into the cache if it is missing or stale.
+
+        Args:
+            cache: Package cache
+            source_dir: Directory containing source code (checked for uv.lock)
             runtime_version: Python runtime version
+            requirements_file: Path to requirements.txt or pyproject.toml
+            force_rebuild_deps: Force rebuild of dependencies even if cached
+
+        Returns:
+            Path to the cached dependencies.zip, or None if the agent has no dependencies
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
-            package_dir = Path(temp_dir) / "package"
-            package_dir.mkdir()
+        if requirements_file is None or not requirements_file.exists():
+            return None
 
-            # Handle pyproject.toml → requirements.txt conversion
-            # (necessary because uv pip install --target requires -r flag)
-            if requirements_file.name == "pyproject.toml":
-                resolved_reqs = self._resolve_pyproject_to_requirements(requirements_file, Path(temp_dir))
-            else:
-                resolved_reqs = requirements_file
+        user_lock = source_dir / "uv.lock"
+        variant = self.optimizer.fingerprint if self.optimizer else None
+
+        needs_rebuild = cache.should_rebuild_dependencies(
+            requirements_file, user_lock if user_lock.exists() else None, force_rebuild_deps, runtime_version, variant
+        )
+
+        if needs_rebuild:
+            log.info("Building dependencies (this may take a minute)...")
+            self._build_dependencies_zip(requirements_file, cache, runtime_version, incremental=not force_rebuild_deps)
+            cache.save_dependencies_hash(
+                requirements_file, user_lock if user_lock.exists() else None, runtime_version, variant
+            )
+            log.info("✓ Dependencies cached")
 
-            # Install dependencies (uv only)
+        return cache.dependencies_zip
+
+    def _build_bytecode_layers(
+        self,
+        cache: PackageCache,
+        dependencies_zip: Optional[Path],
+        direct_code_deploy: Path,
+        runtime_version: str,
+        temp_dir: Path,
+    ) -> Optional[BytecodeLayers]:
+        """Precompile the dependency and source layers when precompilation is enabled.
+
+        Dependency bytecode is cached next to dependencies.zip and only recompiled when
+        dependencies.zip or the runtime version changes; source bytecode is compiled on
+        every build.
+
+        Args:
+            cache: Package cache
+            dependencies_zip: Cached dependencies.zip (optional)
+            direct_code_deploy: code.zip for this build
+            runtime_version: Python runtime version
+            temp_dir: Build directory for the source bytecode layer
+
+        Returns:
+            BytecodeLayers, or None if precompilation is disabled or no interpreter is available
+        """
+        if not self.precompile:
+            return None
+
+        python_version = self._normalize_python_version(runtime_version)
+        interpreter = find_interpreter(python_version)
+        if not interpreter:
+            log.warning(
+                "⚠️  No Python %s interpreter found, skipping bytecode precompilation "
+                "(install one with 'uv python install %s')",
+                python_version,
+                python_version,
+            )
+            return None
+
+        modules = 0
+        compile_seconds = 0.0
+        dependencies_bytecode = None
+        if dependencies_zip:
+            expected = {"dependencies_sha256": hash_file(dependencies_zip), "python_version": python_version}
+            stamp = cache.load_bytecode_stamp()
+            if {key: stamp.get(key) for key in expected} != expected:
+                log.info("Precompiling dependencies for Python %s...", python_version)
+                tmp_zip = cache.dependencies_bytecode_zip.with_suffix(".zip.tmp")
+                layer = build_bytecode_layer(dependencies_zip, tmp_zip, interpreter, self.workers)
+                os.replace(tmp_zip, cache.dependencies_bytecode_zip)
+                stamp = {**expected, "modules": layer.modules, "compile_seconds": layer.compile_seconds}
+                cache.save_bytecode_stamp(stamp)
+            dependencies_bytecode = cache.dependencies_bytecode_zip
+            modules += stamp["modules"]
+            compile_seconds += stamp["compile_seconds"]
+
+        source = build_bytecode_layer(direct_code_deploy, temp_dir / "code_bytecode.zip", interpreter, self.workers)
+        modules += source.modules
+        compile_seconds += source.compile_seconds
+
+        log.info(
+            "⚡ Precompiled %d modules for Python %s, moving up to %.2fs of import-time compilation off cold start",
+            modules,
+            python_version,
+            compile_seconds,
+        )
+        return BytecodeLayers(dependencies_bytecode, source.path)
+
+    @staticmethod
+    def _check_package_size(size_bytes: int) -> None:
+        """Log the package size and warn when it exceeds the runtime limit."""
+        size_mb = size_bytes / (1024 * 1024)
+        log.info("✓ Deployment package ready: %.2f MB", size_mb)
+
+        if size_mb > 250:
+            log.warning("⚠️  Package size (%.2f MB) exceeds 250MB limit. Consider reducing dependencies.", size_mb)
+
+    def _build_dependencies_zip(
+        self, requirements_file: Path, cache: PackageCache, runtime_version: str, incremental: bool = True
+    ) -> None:
+        """Update the cached dependencies.zip to match the resolved requirements.
+
+        The requirements are resolved to a pinned set for the target platform and diffed
+        against the distributions in the previous dependencies.zip. Unchanged distributions
+        keep their compressed entries, removed ones are dropped (their files are known from
+        RECORD), and only added or upgraded distributions are installed (in one ``--no-deps``
+        batch) unless the dependency store already has them.
+
+        Args:
+            requirements_file: Source requirements file
+            cache: Package cache holding dependencies.zip and its manifest
+            runtime_version: Python runtime version
+            incremental: Reuse entries from the previous dependencies.zip
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            python_version = self._normalize_python_version(runtime_version)
             cross_compile = self._should_cross_compile()
-            self._install_dependencies(resolved_reqs, package_dir, runtime_version, cross_compile)
+            platform = DEPENDENCY_PLATFORM if cross_compile else "host"
+            if self.optimizer:
+                # Optimized installs differ from plain ones, so they are stored and cached apart
+                platform = f"{platform}-opt-{self.optimizer.fingerprint}"
+
+            # Resolve to an exact set of distributions for the target platform
+            resolved_reqs = self._resolve_requirements(
+                requirements_file, Path(temp_dir), python_version=python_version, cross=cross_compile
+            )
+            dists = parse_resolved_requirements(resolved_reqs.read_text())
+
+            previous = cache.load_dependencies_manifest(platform, python_version) if incremental else {}
+            reused = [dist for dist in dists if dist.key in previous]
+            changed = [dist for dist in dists if dist.key not in previous]
+            removed = sorted(set(previous) - {dist.key for dist in dists})
+            if previous:
+                log.info(
+                    "📦 Dependencies: %d unchanged, %d added or upgraded, %d removed",
+                    len(reused),
+                    len(changed),
+                    len(removed),
+                )
+                if not changed and not removed:
+                    log.info("✓ Resolved dependencies unchanged, keeping dependencies.zip")
+                    return
+
+            store = self.dependency_store or DependencyStore(Path(temp_dir) / "store")
+            missing = store.missing(changed, platform, python_version)
+            log.info("📦 %d of %d distributions already in dependency store", len(changed) - len(missing), len(changed))
+
+            if missing:
+                package_dir = Path(temp_dir) / "package"
+                package_dir.mkdir()
+                missing_reqs = Path(temp_dir) / "missing.txt"
+                missing_reqs.write_text("".join(f"{dist.requirement}\n" for dist in missing))
+
+                # Install dependencies (uv only); the set is already resolved, so skip dependency resolution
+                self._install_dependencies(missing_reqs, package_dir, runtime_version, cross_compile, no_deps=True)
+                if self.optimizer:
+                    # AgentCore Runtime is Linux ARM64, so only aarch64 libraries are stripped
+                    self.optimizer.optimize(package_dir, target_machine="aarch64").log_summary()
+                store.add_from_target(package_dir, missing, platform, python_version, workers=self.workers)
 
             # Create zip (keep metadata for proper package resolution)
             log.info("Creating dependencies.zip...")
-            with zipfile.ZipFile(output_zip, "w", zipfile.ZIP_DEFLATED) as zipf:
-                for root, dirs, files in os.walk(package_dir):
-                    # Filter out __pycache__ directories
-                    dirs[:] = [d for d in dirs if d != "__pycache__"]
-
-                    for file in files:
-                        file_path = Path(root) / file
-                        arcname = file_path.relative_to(package_dir)
-                        zipf.write(file_path, arcname)
+            sources: List[Tuple[Path, Optional[List[str]]]] = []
+            if reused:
+                reused_names = [name for dist in reused for name in previous[dist.key]]
+                sources.append((cache.dependencies_zip, reused_names))
+            fragments = [store.fragment(dist, platform, python_version) for dist in changed]
+            sources.extend((fragment, None) for fragment in fragments)
+
+            output_zip = cache.dependencies_zip.with_suffix(".zip.tmp")
+            try:
+                taken = splice_zips(sources, output_zip)
+            except KeyError as e:
+                # The cached zip no longer matches its manifest; fall back to a full build
+                output_zip.unlink(missing_ok=True)
+                log.warning("⚠️  Cached dependencies.zip is inconsistent (%s), rebuilding", e)
+                self._build_dependencies_zip(requirements_file, cache, runtime_version, incremental=False)
+                return
+            os.replace(output_zip, cache.dependencies_zip)
+
+            contents = {dist.key: previous[dist.key] for dist in reused}
+            contents.update({dist.key: taken[fragment] for dist, fragment in zip(changed, fragments, strict=True)})
+            cache.save_dependencies_manifest(platform, python_version, contents)
 
     def _check_otel_distro(self, requirements_file: Optional[Path]) -> bool:
         """Check if aws-opentelemetry-distro is in requirements.
@@ -284,12 +742,20 @@ class CodeZipPackager:
             log.debug("Could not check requirements for OpenTelemetry: %s", e)
             return False
 
-    def _resolve_pyproject_to_requirements(self, pyproject_file: Path, output_dir: Path) -> Path:
-        """Convert pyproject.toml to requirements.txt using uv.
+    def _resolve_requirements(
+        self,
+        requirements_file: Path,
+        output_dir: Path,
+        python_version: Optional[str] = None,
+        cross: bool = False,
+    ) -> Path:
+        """Resolve requirements.txt or pyproject.toml to a pinned requirements file using uv.
 
         Args:
-            pyproject_file: Path to pyproject.toml
+            requirements_file: Path to requirements.txt or pyproject.toml
             output_dir: Directory for output requirements.txt
+            python_version: Target Python version (e.g., "3.10"); defaults to uv's interpreter
+            cross: Whether to resolve for Linux ARM64 wheels
 
         Returns:
             Path to resolved requirements.txt
@@ -299,24 +765,29 @@ class CodeZipPackager:
         """
         if not shutil.which("uv"):
             raise RuntimeError(
-                "uv is required for resolving pyproject.toml but was not found.\n"
+                f"uv is required for resolving {requirements_file.name} but was not found.\n"
                 "Install uv: https://docs.astral.sh/uv/getting-started/installation/"
             )
 
         output_file = output_dir / "requirements.txt"
+        cmd = [
+            "uv",
+            "pip",
+            "compile",
+            str(requirements_file),
+            "--output-file",
+            str(output_file),
+            "--quiet",
+        ]
+        if python_version:
+            cmd.extend(["--python-version", python_version])
+        if cross:
+            cmd.extend(["--python-platform", DEPENDENCY_PLATFORM, "--only-binary", ":all:"])
 
-        log.info("Resolving pyproject.toml with uv...")
+        log.info("Resolving %s with uv...", requirements_file.name)
         try:
             subprocess.run(  # nosec B603 B607 - using hardcoded command "uv" without shell=True
-                [
-                    "uv",
-                    "pip",
-                    "compile",
-                    str(pyproject_file),
-                    "--output-file",
-                    str(output_file),
-                    "--quiet",
-                ],
+                cmd,
                 check=True,
                 capture_output=True,
                 text=True,
@@ -324,10 +795,15 @@ class CodeZipPackager:
             log.info("✓ Dependencies resolved with uv")
             return output_file
         except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"Failed to resolve pyproject.toml with uv: {e.stderr}") from e
+            raise RuntimeError(f"Failed to resolve {requirements_file.name} with uv: {e.stderr}") from e
 
     def _install_dependencies(
-        self, requirements_file: Path, target_dir: Path, runtime_version: str, cross_compile: bool
+        self,
+        requirements_file: Path,
+        target_dir: Path,
+        runtime_version: str,
+        cross_compile: bool,
+        no_deps: bool = False,
     ) -> None:
         """Install dependencies using uv only.
 
@@ -336,6 +812,7 @@ class CodeZipPackager:
             target_dir: Target directory for installation
             runtime_version: Python runtime version (e.g., "PYTHON_3_10" or "python3.10")
             cross_compile: Whether to cross-compile for ARM64
+            no_deps: Install exactly the listed requirements (they are already resolved)
 
         Raises:
             RuntimeError: If uv is not available or installation fails
@@ -346,11 +823,9 @@ class CodeZipPackager:
                 "Install uv: https://docs.astral.sh/uv/getting-started/installation/"
             )
 
-        # Normalize python version to X.Y format (e.g., "3.10")
-        # Input: "PYTHON_3_10" or "python3.10" → Output: "3.10"
-        python_version = runtime_version.upper().replace("PYTHON", "").replace("_", ".").strip("_. ")
+        python_version = self._normalize_python_version(runtime_version)
 
-        cmd = self._build_uv_command(requirements_file, target_dir, python_version, cross_compile)
+        cmd = self._build_uv_command(requirements_file, target_dir, python_version, cross_compile, no_deps=no_deps)
         log.info("Installing dependencies with uv%s...", " (cross-compiling for Linux ARM64)" if cross_compile else "")
 
         try:
@@ -359,7 +834,17 @@ class CodeZipPackager:
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"Failed to install dependencies with uv: {e.stderr}") from e
 
-    def _build_uv_command(self, requirements: Path, target: Path, py_version: str, cross: bool) -> List[str]:
+    @staticmethod
+    def _normalize_python_version(runtime_version: str) -> str:
+        """Normalize a runtime version to X.Y format.
+
+        Input: "PYTHON_3_10" or "python3.10" → Output: "3.10"
+        """
+        return runtime_version.upper().replace("PYTHON", "").replace("_", ".").strip("_. ")
+
+    def _build_uv_command(
+        self, requirements: Path, target: Path, py_version: str, cross: bool, no_deps: bool = False
+    ) -> List[str]:
         """Build uv pip install command.
 
         Args:
@@ -367,6 +852,7 @@ class CodeZipPackager:
             target: Target directory
             py_version: Python version (e.g., "3.10")
             cross: Whether to cross-compile
+            no_deps: Whether to skip dependency resolution
 
         Returns:
             Command as list of strings
@@ -387,12 +873,15 @@ class CodeZipPackager:
             cmd.extend(
                 [
                     "--python-platform",
-                    "aarch64-manylinux2014",
+                    DEPENDENCY_PLATFORM,
                     "--only-binary",
                     ":all:",
                 ]
             )
 
+        if no_deps:
+            cmd.append("--no-deps")
+
         cmd.extend(["--upgrade", "-r", str(requirements)])
         return cmd
 
@@ -408,56 +897,153 @@ class CodeZipPackager:
         log.info("Building dependencies for Linux ARM64 Runtime (manylinux2014_aarch64)")
         return True
 
-    def _build_direct_code_deploy(self, source_dir: Path, output_zip: Path) -> None:
+    def _build_direct_code_deploy(
+        self, source_dir: Path, output_zip: Path, cache: Optional[PackageCache] = None
+    ) -> None:
         """Build code.zip with source files (respects ignore patterns).
 
+        When a cache is given, files whose path, size, mode and mtime (or, failing that,
+        content hash) match the previous build are spliced in from the cached archive
+        without being recompressed. Only new or changed files are deflated.
+
         Args:
             source_dir: Source directory
             output_zip: Path to output code.zip
+            cache: Optional package cache holding compressed entries from the last build
         """
-        ignore_patterns = self._get_ignore_patterns()
-
-        with zipfile.ZipFile(output_zip, "w", zipfile.ZIP_DEFLATED) as zipf:
-            for root, dirs, files in os.walk(source_dir):
-                rel_root = os.path.relpath(root, source_dir)
-                if rel_root == ".":
-                    rel_root = ""
-
-                # Filter directories
-                dirs[:] = [
-                    d
-                    for d in dirs
-                    if not self._should_ignore(os.path.join(rel_root, d) if rel_root else d, ignore_patterns, True)
-                ]
+        previous = cache.load_source_manifest() if cache else {}
+        excluded = cache.artifacts if cache else set()
 
-                # Add files
-                for file in files:
-                    file_rel = os.path.join(rel_root, file) if rel_root else file
+        sources = (
+            (file_path, file_rel)
+            for file_path, file_rel in self._iter_source_files(source_dir)
+            if not (excluded and file_path.resolve() in excluded)
+        )
+        manifest, reused = write_incremental_zip(
+            sources,
+            output_zip,
+            previous,
+            cached_zip=cache.source_cache_zip if cache else None,
+            workers=self.workers,
+        )
 
-                    if self._should_ignore(file_rel, ignore_patterns, False):
-                        continue
+        if cache:
+            cache.save_source_cache(output_zip, manifest)
+            log.info("✓ Reused %d of %d source files from cache", reused, len(manifest))
+
+    def _iter_source_files(self, source_dir: Path) -> Iterator[Tuple[Path, str]]:
+        """Yield (path, archive name) for every source file not excluded by ignore patterns.
+
+        Args:
+            source_dir: Source directory
 
-                    zipf.write(Path(root) / file, file_rel)
+        Yields:
+            Tuple of absolute file path and its POSIX-style path relative to source_dir
+        """
+        # Sorted walk, so the archive order is stable across filesystems
+        yield from compile_ignore_patterns(self._get_ignore_patterns()).walk(source_dir)
 
-    def _merge_zips(self, dependencies_zip: Optional[Path], direct_code_deploy: Path, output_zip: Path) -> None:
+    def _merge_zips(
+        self,
+        dependencies_zip: Optional[Path],
+        direct_code_deploy: Path,
+        output_zip: Union[Path, io.RawIOBase],
+        bytecode: Optional[BytecodeLayers] = None,
+    ) -> None:
         """Merge dependencies and code layers into deployment.zip.
 
+        Entries are copied as already-compressed records, so the cost of a merge is a
+        sequential copy of both archives rather than a decompress/recompress of every file.
+        The output is deterministic: sorted entries, fixed timestamps and normalized permissions.
+
         Args:
             dependencies_zip: Path to dependencies.zip (optional)
             direct_code_deploy: Path to code.zip
-            output_zip: Path to output deployment.zip
+            output_zip: Path to output deployment.zip, or a writable stream
+            bytecode: Precompiled bytecode for the dependency and source layers (optional)
         """
-        with zipfile.ZipFile(output_zip, "w", zipfile.ZIP_DEFLATED) as out:
-            # Layer 1: Dependencies
+        with contextlib.ExitStack() as stack:
+            code = stack.enter_context(RawZipReader(direct_code_deploy))
+            # Last occurrence wins for duplicate names, matching zipfile's read semantics
+            entries = {info.filename: (code, info) for info in code.infolist()}
+
+            # Layer 1: Dependencies (skipping anything user code overrides)
+            overridden = 0
+            dep = None
             if dependencies_zip and dependencies_zip.exists():
-                with zipfile.ZipFile(dependencies_zip, "r") as dep:
-                    for item in dep.namelist():
-                        out.writestr(item, dep.read(item))
+                dep = stack.enter_context(RawZipReader(dependencies_zip))
+                for info in dep.infolist():
+                    if info.filename in entries and entries[info.filename][0] is code:
+                        overridden += 1
+                        continue
+                    entries[info.filename] = (dep, info)
+
+            # Bytecode is only shipped next to the module it was compiled from. Unchecked-hash
+            # pycs are never revalidated, so a dependency pyc for a module that user code
+            # overrides must not survive the merge.
+            if bytecode:
+                layers = [(bytecode.source, code)]
+                if bytecode.dependencies and dep is not None:
+                    layers.append((bytecode.dependencies, dep))
+                for layer_zip, owner in layers:
+                    layer = stack.enter_context(RawZipReader(layer_zip))
+                    for info in layer.infolist():
+                        source = source_for_bytecode(info.filename)
+                        if source in entries and entries[source][0] is owner and info.filename not in entries:
+                            entries[info.filename] = (layer, info)
+
+            # Layer 2: Code (user code takes precedence on conflicts). Entries are written in
+            # name order with normalized metadata, so identical content gives identical bytes.
+            with ZipWriter(output_zip) as out:
+                for name in sorted(entries):
+                    reader, info = entries[name]
+                    zinfo = deterministic_info(name, info.external_attr >> 16)
+                    zinfo.compress_type = info.compress_type
+                    zinfo.CRC = info.CRC
+                    zinfo.file_size = info.file_size
+                    zinfo.compress_size = info.compress_size
+                    out.write_raw(zinfo, reader.iter_raw(info))
+
+        if overridden:
+            log.debug("User code overrides %d dependency files", overridden)
+
+    def _package_key(
+        self,
+        cache: PackageCache,
+        dependencies_zip: Optional[Path],
+        direct_code_deploy: Path,
+        bytecode: Optional[BytecodeLayers] = None,
+    ) -> str:
+        """Key identifying the deployment.zip that merging these layers produces, without merging them.
 
-            # Layer 2: Code (overwrites conflicts - user code takes precedence)
-            with zipfile.ZipFile(direct_code_deploy, "r") as code:
-                for item in code.namelist():
-                    out.writestr(item, code.read(item))
+        The merge is deterministic in its inputs, so the key hashes what determines each
+        layer rather than the merged bytes: code.zip, the manifest of distributions in
+        dependencies.zip and the bytecode layers. An unchanged deploy reads code.zip and the
+        small bytecode layer of the source, never the dependency layers.
+
+        Args:
+            cache: Package cache holding dependencies.zip and its manifest
+            dependencies_zip: Path to dependencies.zip (optional)
+            direct_code_deploy: Path to code.zip
+            bytecode: Precompiled bytecode layers (optional)
+
+        Returns:
+            SHA256 hex digest over the layer digests
+        """
+        parts = [f"version {PACKAGE_KEY_VERSION}", f"code {hash_file(direct_code_deploy)}"]
+        if dependencies_zip and dependencies_zip.exists():
+            if dependencies_zip == cache.dependencies_zip and cache.dependencies_manifest.exists():
+                manifest = hash_file(cache.dependencies_manifest)
+                parts.append(f"dependencies {manifest} {dependencies_zip.stat().st_size}")
+            else:
+                # No manifest to go by (a cache from before manifests were kept)
+                parts.append(f"dependencies-zip {hash_file(dependencies_zip)}")
+        if bytecode:
+            parts.append(f"source-bytecode {hash_file(bytecode.source)}")
+            if bytecode.dependencies:
+                stamp = cache.load_bytecode_stamp()
+                parts.append(f"dependencies-bytecode {stamp.get('dependencies_sha256')} {stamp.get('python_version')}")
+        return hashlib.sha256("\n".join(parts).encode()).hexdigest()
 
     def _get_ignore_patterns(self) -> List[str]:
         """Get ignore patterns from dockerignore.template (matches CodeBuild logic).
@@ -509,22 +1095,7 @@ class CodeZipPackager:
         Returns:
             True if path should be ignored
         """
-        # Normalize path
-        if path.startswith("./"):
-            path = path[2:]
-
-        should_ignore = False
-
-        for pattern in patterns:
-            # Handle negation patterns
-            if pattern.startswith("!"):
-                if self._matches_pattern(path, pattern[1:], is_dir):
-                    should_ignore = False
-            else:
-                if self._matches_pattern(path, pattern, is_dir):
-                    should_ignore = True
-
-        return should_ignore
+        return compile_ignore_patterns(patterns).is_ignored(path, is_dir)
 
     def _matches_pattern(self, path: str, pattern: str, is_dir: bool) -> bool:
         """Check if path matches a dockerignore pattern.
@@ -537,25 +1108,7 @@ class CodeZipPackager:
         Returns:
             True if path matches pattern
         """
-        # Directory-specific patterns
-        if pattern.endswith("/"):
-            if not is_dir:
-                return False
-            pattern = pattern[:-1]
-
-        # Exact match
-        if path == pattern:
-            return True
-
-        # Wildcard matching
-        if fnmatch.fnmatch(path, pattern):
-            return True
-
-        # Match directory prefix
-        if is_dir and pattern in path.split("/"):
-            return True
-
-        return False
+        return compile_ignore_patterns([pattern]).is_ignored(path, is_dir)
 
     def upload_to_s3(self, deployment_zip: Path, agent_name: str, session: boto3.Session, account_id: str) -> str:
         """Upload deployment.zip to S3 (reuses CodeBuild bucket infrastructure).
@@ -569,16 +1122,28 @@ class CodeZipPackager:
         Returns:
             S3 location (s3://bucket/key)
         """
-        from ...services.codebuild import CodeBuildService
-
-        codebuild = CodeBuildService(session)
-
-        bucket = codebuild.ensure_source_bucket(account_id)
-
-        s3_key = f"{agent_name}/deployment.zip"
+        bucket, s3_key = self.resolve_upload_location(agent_name, session, account_id)
         s3 = session.client("s3")
 
         log.info("Uploading to s3://%s/%s...", bucket, s3_key)
         s3.upload_file(str(deployment_zip), bucket, s3_key, ExtraArgs={"ExpectedBucketOwner": account_id})
 
         return f"s3://{bucket}/{s3_key}"
+
+    def resolve_upload_location(self, agent_name: str, session: boto3.Session, account_id: str) -> Tuple[str, str]:
+        """Ensure the default deployment bucket exists (reuses CodeBuild bucket infrastructure).
+
+        Args:
+            agent_name: Name of the agent
+            session: Boto3 session
+            account_id: AWS account ID (from config)
+
+        Returns:
+            Tuple of (bucket, key) for the agent's deployment.zip
+        """
+        from ...services.codebuild import CodeBuildService
+
+        codebuild = CodeBuildService(session)
+
+        bucket = codebuild.ensure_source_bucket(account_id)
+        return bucket, f"{agent_name}/deployment.zip"
@@ -0,0 +1,135 @@
+"""Wall-clock timing of the steps of a launch.
+
+A launch runs inside ``profile_launch()``; code anywhere below it wraps its work in
+``timed_step(name)``. Steps started inside another step are recorded under the outer
+step's name ("build/codebuild"), and the timing context follows work into StepGraph
+worker threads, so concurrent steps are attributed correctly. Outside of a profiled
+launch ``timed_step`` does nothing.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Separates the names of nested steps
+STEP_SEPARATOR = "/"
+
+
+@dataclass
+class ProfiledStep:
+    """A finished step of a profiled launch, timed in seconds from the start of the launch."""
+
+    name: str
+    start: float
+    end: float
+    failed: bool = False
+
+    @property
+    def duration(self) -> float:
+        """Seconds the step took."""
+        return self.end - self.start
+
+    @property
+    def depth(self) -> int:
+        """How many steps this step is nested in."""
+        return self.name.count(STEP_SEPARATOR)
+
+
+class LaunchProfiler:
+    """Collects the steps of one launch, timed relative to the start of the launch."""
+
+    def __init__(self):
+        """Start the launch clock."""
+        self.origin = time.perf_counter()
+        self.end: Optional[float] = None
+        self._steps: List[ProfiledStep] = []
+        self._lock = threading.Lock()
+
+    @property
+    def total_seconds(self) -> float:
+        """Seconds since the launch started, or the launch duration once it has finished."""
+        end = self.end if self.end is not None else time.perf_counter()
+        return end - self.origin
+
+    @property
+    def steps(self) -> List[ProfiledStep]:
+        """Recorded steps ordered by start time, outer steps before the steps nested in them."""
+        with self._lock:
+            return sorted(self._steps, key=lambda step: (step.start, step.depth))
+
+    def record(self, name: str, start: float, end: float, failed: bool = False) -> None:
+        """Record a step from perf_counter() start and end times."""
+        step = ProfiledStep(name, start - self.origin, end - self.origin, failed)
+        with self._lock:
+            self._steps.append(step)
+
+
+_profiler: ContextVar[Optional[LaunchProfiler]] = ContextVar("launch_profiler", default=None)
+_step_path: ContextVar[Tuple[str, ...]] = ContextVar("launch_step_path", default=())
+
+
+@contextmanager
+def profile_launch() -> Iterator[LaunchProfiler]:
+    """Time every step run in this context.
+
+    Yields:
+        The profiler collecting the steps; its clock stops when the context exits
+    """
+    profiler = LaunchProfiler()
+    profiler_token = _profiler.set(profiler)
+    path_token = _step_path.set(())
+    try:
+        yield profiler
+    finally:
+        profiler.end = time.perf_counter()
+        _step_path.reset(path_token)
+        _profiler.reset(profiler_token)
+
+
+@contextmanager
+def timed_step(name: str) -> Iterator[None]:
+    """Record the enclosed block as a step of the current launch, if one is being profiled.
+
+    Args:
+        name: Step name, nested under the name of the step this block runs in
+    """
+    profiler = _profiler.get()
+    if profiler is None:
+        yield
+        return
+
+    path = _step_path.get() + (name,)
+    token = _step_path.set(path)
+    start = time.perf_counter()
+    failed = False
+    try:
+        yield
+    except BaseException:
+        failed = True
+        raise
+    finally:
+        _step_path.reset(token)
+        profiler.record(STEP_SEPARATOR.join(path), start, time.perf_counter(), failed)
+
+
+def record_phases(phases: Dict[str, float]) -> None:
+    """Record externally timed phases that ran back to back and just finished.
+
+    Used for phases timed by a remote service, such as the phases of a CodeBuild build;
+    they are nested under the current step and laid out so the last one ends now.
+
+    Args:
+        phases: Phase name -> duration in seconds, in execution order
+    """
+    profiler = _profiler.get()
+    if profiler is None or not phases:
+        return
+
+    path = _step_path.get()
+    start = time.perf_counter() - sum(phases.values())
+    for phase, seconds in phases.items():
+        profiler.record(STEP_SEPARATOR.join(path + (phase,)), start, start + seconds)
+        start += seconds
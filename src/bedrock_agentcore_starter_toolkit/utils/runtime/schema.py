@@ -181,12 +181,44 @@ class CodeBuildConfig(BaseModel):
     source_bucket: Optional[str] = Field(default=None, description="S3 source bucket name")
 
 
+class PackageOptimizationConfig(BaseModel):
+    """Dependency size optimization for direct_code_deploy packages."""
+
+    enabled: bool = Field(default=False, description="Whether to optimize installed dependencies")
+    rules: Optional[List[str]] = Field(default=None, description="Built-in rules to apply (all rules when unset)")
+    exclude_patterns: List[str] = Field(
+        default_factory=list, description="Extra glob patterns to remove, relative to the dependency root"
+    )
+
+    @field_validator("rules")
+    @classmethod
+    def validate_rules(cls, v: Optional[List[str]]) -> Optional[List[str]]:
+        """Validate rule names against the built-in ruleset."""
+        from .optimize import DEFAULT_RULES
+
+        if v is not None:
+            unknown = sorted(set(v) - set(DEFAULT_RULES))
+            if unknown:
+                raise ValueError(f"Unknown rules {unknown}. Available rules: {', '.join(DEFAULT_RULES)}")
+        return v
+
+
 class BedrockAgentCoreDeploymentInfo(BaseModel):
     """BedrockAgentCore deployment information."""
 
     agent_id: Optional[str] = Field(default=None, description="BedrockAgentCore agent ID")
     agent_arn: Optional[str] = Field(default=None, description="BedrockAgentCore agent ARN")
     agent_session_id: Optional[str] = Field(default=None, description="Session ID for invocations")
+    package_digest: Optional[str] = Field(default=None, description="SHA256 of the last deployed code package")
+    deployment_fingerprint: Optional[str] = Field(
+        default=None, description="Hash of the code package and runtime settings of the last update"
+    )
+    image_uri: Optional[str] = Field(
+        default=None, description="Digest-pinned image (repository@sha256:...) of the last container deployment"
+    )
+    previous_image_uri: Optional[str] = Field(
+        default=None, description="Digest-pinned image deployed before image_uri, the default rollback target"
+    )
 
 
 class BedrockAgentCoreAgentSchema(BaseModel):
@@ -208,6 +240,7 @@ class BedrockAgentCoreAgentSchema(BaseModel):
     aws: AWSConfig = Field(default_factory=AWSConfig)
     bedrock_agentcore: BedrockAgentCoreDeploymentInfo = Field(default_factory=BedrockAgentCoreDeploymentInfo)
     codebuild: CodeBuildConfig = Field(default_factory=CodeBuildConfig)
+    package_optimization: PackageOptimizationConfig = Field(default_factory=PackageOptimizationConfig)
     memory: MemoryConfig = Field(default_factory=MemoryConfig)
     authorizer_configuration: Optional[dict] = Field(default=None, description="JWT authorizer configuration")
     request_header_configuration: Optional[dict] = Field(default=None, description="Request header configuration")
@@ -0,0 +1,195 @@
+"""Incremental parser for the Server-Sent Events streamed by agent invocations.
+
+Agents stream their output as ``text/event-stream``. The stream is read in whatever
+chunks the transport delivers and split into events as soon as their terminating blank
+line arrives, so long token streams are parsed in linear time without reading the
+socket byte by byte.
+"""
+
+import codecs
+import re
+from dataclasses import dataclass
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator, List, Optional
+
+# Largest read from a streaming body whose transport does not deliver its own chunks
+STREAM_CHUNK_SIZE = 64 * 1024
+
+_LINE_END = re.compile(r"\r\n|\r|\n")
+
+
+@dataclass
+class SSEEvent:
+    """A dispatched Server-Sent Event."""
+
+    data: str
+    event: str = "message"
+    id: Optional[str] = None
+    retry: Optional[int] = None
+
+
+class SSEParser:
+    """Incremental Server-Sent Events parser.
+
+    Feed it the raw bytes of a stream in chunks of any size; it returns the events
+    completed by each chunk. Lines may end in CRLF, LF or CR and may be split across
+    chunks, ``data`` fields spanning several lines are joined with newlines and
+    comments are ignored, as the EventSource specification describes.
+    """
+
+    def __init__(self):
+        """Initialize the parser."""
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._pending: List[str] = []
+        self._pending_cr = False
+        self._at_start = True
+        self._data: List[str] = []
+        self._event = ""
+        self._retry: Optional[int] = None
+        self.last_event_id: Optional[str] = None
+
+    def feed(self, chunk: bytes) -> List[SSEEvent]:
+        """Parse the next chunk of the stream.
+
+        Args:
+            chunk: Raw bytes, possibly ending in the middle of a line or a UTF-8 sequence
+
+        Returns:
+            Events completed by this chunk, in stream order
+        """
+        return self._parse(self._decoder.decode(chunk))
+
+    def close(self) -> List[SSEEvent]:
+        """Finish the stream.
+
+        An event left without its terminating blank line is still dispatched: agents may
+        end the stream right after their last ``data`` line.
+
+        Returns:
+            Events completed by the end of the stream
+        """
+        events = self._parse(self._decoder.decode(b"", final=True))
+        if self._pending:
+            self._process_line("".join(self._pending))
+            self._pending = []
+        event = self._dispatch()
+        if event is not None:
+            events.append(event)
+        return events
+
+    def _parse(self, text: str) -> List[SSEEvent]:
+        events: List[SSEEvent] = []
+        if not text:
+            return events
+        if self._at_start:
+            self._at_start = False
+            text = text.lstrip("\ufeff")
+
+        # A CR ending the previous chunk may be the first half of a CRLF
+        if self._pending_cr:
+            self._pending_cr = False
+            if text.startswith("\n"):
+                text = text[1:]
+
+        pieces = _LINE_END.split(text)
+        if len(pieces) == 1:
+            self._pending.append(text)
+            return events
+
+        if text.endswith("\r"):
+            self._pending_cr = True
+
+        # The last piece is the start of a line whose end has not arrived yet
+        first, *complete, rest = pieces
+        self._pending.append(first)
+        lines = ["".join(self._pending), *complete]
+        self._pending = [rest] if rest else []
+
+        for line in lines:
+            if line:
+                self._process_line(line)
+            else:
+                event = self._dispatch()
+                if event is not None:
+                    events.append(event)
+        return events
+
+    def _process_line(self, line: str) -> None:
+        if line.startswith(":"):
+            return
+        field, sep, value = line.partition(":")
+        if sep and value.startswith(" "):
+            value = value[1:]
+
+        if field == "data":
+            self._data.append(value)
+        elif field == "event":
+            self._event = value
+        elif field == "id":
+            if "\0" not in value:
+                self.last_event_id = value
+        elif field == "retry":
+            if value.isdigit():
+                self._retry = int(value)
+
+    def _dispatch(self) -> Optional[SSEEvent]:
+        data, event_type, retry = self._data, self._event, self._retry
+        self._data, self._event, self._retry = [], "", None
+        if not data:
+            return None
+        return SSEEvent(data="\n".join(data), event=event_type or "message", id=self.last_event_id, retry=retry)
+
+
+def iter_stream_chunks(body: Any, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterable[bytes]:
+    """Read a streaming HTTP body in the chunks it arrives in.
+
+    Args:
+        body: A requests response or a botocore StreamingBody
+        chunk_size: Largest chunk to read when the transport does not delimit chunks
+
+    Returns:
+        Iterable of raw byte chunks
+    """
+    if hasattr(body, "iter_content"):
+        # requests: chunk_size=None yields data as it arrives, in the sizes it is received
+        return body.iter_content(chunk_size=None)
+    raw = getattr(body, "_raw_stream", None)
+    if raw is not None and hasattr(raw, "stream"):
+        # botocore StreamingBody over urllib3: stream() yields each transfer chunk as it arrives,
+        # where StreamingBody.read(n) would block until n bytes are buffered
+        return raw.stream(chunk_size)
+    return body.iter_chunks(chunk_size)
+
+
+def iter_sse_events(body: Any, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[SSEEvent]:
+    """Parse the Server-Sent Events of a streaming HTTP body lazily.
+
+    Args:
+        body: A requests response or a botocore StreamingBody
+        chunk_size: Largest chunk to read when the transport does not delimit chunks
+
+    Yields:
+        Events in stream order, each as soon as it is complete
+    """
+    parser = SSEParser()
+    for chunk in iter_stream_chunks(body, chunk_size):
+        if chunk:
+            yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+async def aiter_sse_events(chunks: AsyncIterable[bytes]) -> AsyncIterator[SSEEvent]:
+    """Parse the Server-Sent Events of an asynchronous byte stream lazily.
+
+    Args:
+        chunks: Raw byte chunks, e.g. ``httpx.Response.aiter_bytes()``
+
+    Yields:
+        Events in stream order, each as soon as it is complete
+    """
+    parser = SSEParser()
+    async for chunk in chunks:
+        if chunk:
+            for event in parser.feed(chunk):
+                yield event
+    for event in parser.close():
+        yield event
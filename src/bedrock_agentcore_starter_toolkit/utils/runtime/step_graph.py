@@ -0,0 +1,115 @@
+"""Run launch steps concurrently as a graph of declared dependencies.
+
+Steps are added with the names of the steps they depend on; a step starts as soon as
+all of its dependencies have finished, so independent steps (creating an ECR
+repository, an IAM role and a memory resource, say) overlap and the whole graph takes
+about as long as its longest dependency chain.
+"""
+
+import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .profiling import timed_step
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class Step:
+    """A named unit of work and the steps it waits for."""
+
+    name: str
+    func: Callable[[], Any]
+    depends_on: Tuple[str, ...] = ()
+
+
+class StepGraph:
+    """A set of steps run on a thread pool in dependency order.
+
+    Steps read the values returned by their dependencies from ``results``. Dependencies
+    must be added before the steps that use them, which also rules out cycles. Each step
+    is timed by the launch profiler as a nested step of the caller's.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """Create an empty graph.
+
+        Args:
+            max_workers: Maximum number of steps running at once (defaults to one thread per step)
+        """
+        self.max_workers = max_workers
+        self.steps: Dict[str, Step] = {}
+        self.results: Dict[str, Any] = {}
+
+    def add(self, name: str, func: Callable[[], Any], depends_on: Sequence[str] = ()) -> None:
+        """Add a step.
+
+        Args:
+            name: Unique step name; the step's return value is stored under it in results
+            func: Callable run without arguments
+            depends_on: Names of steps that must finish before this one starts
+
+        Raises:
+            ValueError: If the name is taken or a dependency has not been added
+        """
+        if name in self.steps:
+            raise ValueError(f"Duplicate step: {name}")
+        unknown = [dep for dep in depends_on if dep not in self.steps]
+        if unknown:
+            raise ValueError(f"Step '{name}' depends on unknown steps: {', '.join(unknown)}")
+        self.steps[name] = Step(name, func, tuple(depends_on))
+
+    def run(self) -> Dict[str, Any]:
+        """Run every step, each as soon as its dependencies are done.
+
+        When a step fails no further steps are started; steps already running are
+        allowed to finish and the first failure is re-raised unchanged.
+
+        Returns:
+            Step results by name
+        """
+        if not self.steps:
+            return self.results
+
+        pending: Dict[str, Step] = dict(self.steps)
+        done: set = set()
+        running: Dict[Future, str] = {}
+        failure: Optional[BaseException] = None
+
+        def timed(step: Step) -> Any:
+            with timed_step(step.name):
+                return step.func()
+
+        workers = self.max_workers or len(self.steps)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="agentcore-step") as executor:
+            while pending or running:
+                if failure is None:
+                    for step in self._ready(pending, done):
+                        del pending[step.name]
+                        # Each step runs in a copy of the caller's context so it is profiled
+                        # as part of the launch and nested under the caller's step
+                        running[executor.submit(copy_context().run, timed, step)] = step.name
+                if not running:
+                    break
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    error = future.exception()
+                    if error is not None:
+                        log.debug("Step '%s' failed: %s", name, error)
+                        failure = failure or error
+                        continue
+                    self.results[name] = future.result()
+                    done.add(name)
+
+        if failure is not None:
+            raise failure
+        return self.results
+
+    @staticmethod
+    def _ready(pending: Dict[str, Step], done: set) -> List[Step]:
+        return [step for step in pending.values() if all(dep in done for dep in step.depends_on)]
@@ -0,0 +1,295 @@
+"""Prebuilt wheelhouse for offline container dependency installs.
+
+The agent's requirements are resolved with uv for Linux ARM64 and the wheels of the
+resolved set are downloaded (or, for pure-Python sdists, built) into a ``wheelhouse``
+directory of the Docker build context. The generated Dockerfile then installs the
+lock offline from it, so builds never hit PyPI and always install the same set.
+"""
+
+import hashlib
+import importlib.util
+import json
+import logging
+import platform
+import shutil
+import subprocess  # nosec B404 - subprocess is required for uv/pip
+import sys
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+from .dependency_store import canonicalize_name, parse_resolved_requirements
+
+log = logging.getLogger(__name__)
+
+WHEELHOUSE_DIR = "wheelhouse"
+WHEELHOUSE_LOCK = "requirements.lock"
+WHEELHOUSE_MANIFEST = "wheelhouse.json"
+WHEELHOUSE_VERSION = 1
+
+# Target of the container images (bookworm-based, glibc 2.36, on ARM64): uv and pip spell it differently
+WHEELHOUSE_UV_PLATFORM = "aarch64-manylinux_2_28"
+WHEELHOUSE_PIP_PLATFORM = "manylinux_2_28_aarch64"
+
+_SDIST_SUFFIXES = (".tar.gz", ".zip", ".tar.bz2")
+
+
+@dataclass
+class Wheelhouse:
+    """A wheelhouse built for a resolved set of requirements."""
+
+    path: Path
+    lock_hash: str
+    wheels: List[str]
+    rebuilt: bool
+
+    @property
+    def lock_file(self) -> Path:
+        """Path to the pinned requirements the wheelhouse was built for."""
+        return self.path / WHEELHOUSE_LOCK
+
+
+def wheelhouse_lock_hash(lock_text: str, python_version: str, target_platform: str = WHEELHOUSE_UV_PLATFORM) -> str:
+    """Key of a wheelhouse: the resolved requirements and the interpreter and platform they target."""
+    digest = hashlib.sha256()
+    digest.update(f"{WHEELHOUSE_VERSION}\0{python_version}\0{target_platform}\n".encode())
+    digest.update(lock_text.encode())
+    return digest.hexdigest()
+
+
+def load_wheelhouse(path: Path) -> Optional[Wheelhouse]:
+    """Load the wheelhouse in a directory.
+
+    Returns:
+        The wheelhouse, or None if the directory holds no complete wheelhouse
+    """
+    manifest_path = path / WHEELHOUSE_MANIFEST
+    if not manifest_path.exists() or not (path / WHEELHOUSE_LOCK).exists():
+        return None
+    try:
+        data = json.loads(manifest_path.read_text())
+    except (OSError, ValueError) as e:
+        log.debug("Ignoring unreadable wheelhouse manifest: %s", e)
+        return None
+    if data.get("version") != WHEELHOUSE_VERSION:
+        return None
+    wheels = data.get("wheels", [])
+    if not all((path / wheel).exists() for wheel in wheels):
+        return None
+    return Wheelhouse(path=path, lock_hash=data.get("lock_hash", ""), wheels=wheels, rebuilt=False)
+
+
+def build_wheelhouse(
+    requirements_file: Path,
+    wheelhouse_dir: Path,
+    python_version: str,
+    extra_requirements: Sequence[str] = (),
+    force: bool = False,
+) -> Wheelhouse:
+    """Resolve requirements for Linux ARM64 and collect their wheels into a wheelhouse.
+
+    The requirements are resolved with uv into ``requirements.lock``. If the wheelhouse
+    already holds every wheel of the same lock for the same Python version, nothing is
+    downloaded. Otherwise the wheels are downloaded for the target platform; distributions
+    published as sdists only are built on the host, which must produce a pure-Python wheel
+    unless the host itself is Linux ARM64 with the target Python version.
+
+    Args:
+        requirements_file: requirements.txt or pyproject.toml of the agent
+        wheelhouse_dir: Directory to build the wheelhouse in
+        python_version: Python version of the container image (e.g., "3.11")
+        extra_requirements: Additional requirements to include (e.g., the OpenTelemetry distro)
+        force: Rebuild even if the wheelhouse is up to date
+
+    Returns:
+        The wheelhouse
+
+    Raises:
+        RuntimeError: If uv is missing, resolution fails or a wheel cannot be obtained
+    """
+    if not shutil.which("uv"):
+        raise RuntimeError(
+            "uv is required for building a wheelhouse but was not found.\n"
+            "Install uv: https://docs.astral.sh/uv/getting-started/installation/"
+        )
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        lock_text = _resolve_lock(requirements_file, Path(temp_dir), python_version, extra_requirements)
+    lock_hash = wheelhouse_lock_hash(lock_text, python_version)
+
+    existing = load_wheelhouse(wheelhouse_dir)
+    if existing and existing.lock_hash == lock_hash and not force:
+        log.info("Wheelhouse is up to date (%d wheels, lock %s)", len(existing.wheels), lock_hash[:12])
+        return existing
+
+    wheelhouse_dir.mkdir(parents=True, exist_ok=True)
+    (wheelhouse_dir / WHEELHOUSE_MANIFEST).unlink(missing_ok=True)
+    lock_file = wheelhouse_dir / WHEELHOUSE_LOCK
+    lock_file.write_text(lock_text)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        download_dir = Path(temp_dir)
+        # pip skips files already in the destination, so wheels the locks share are not downloaded again
+        pinned = {(dist.name, dist.version) for dist in parse_resolved_requirements(lock_text)}
+        for wheel in wheelhouse_dir.glob("*.whl"):
+            if _wheel_key(wheel.name) in pinned:
+                shutil.copy2(wheel, download_dir / wheel.name)
+        _download(lock_file, download_dir, python_version)
+        _build_sdists(download_dir, python_version)
+
+        # Replace the wheels of the previous lock with the new set
+        wheels = sorted(p.name for p in download_dir.glob("*.whl"))
+        for stale in wheelhouse_dir.glob("*.whl"):
+            if stale.name not in wheels:
+                stale.unlink()
+        for wheel in wheels:
+            if not (wheelhouse_dir / wheel).exists():
+                shutil.move(str(download_dir / wheel), wheelhouse_dir / wheel)
+
+    (wheelhouse_dir / WHEELHOUSE_MANIFEST).write_text(
+        json.dumps(
+            {
+                "version": WHEELHOUSE_VERSION,
+                "lock_hash": lock_hash,
+                "python_version": python_version,
+                "platform": WHEELHOUSE_UV_PLATFORM,
+                "wheels": wheels,
+            },
+            indent=2,
+        )
+    )
+    log.info("Built wheelhouse with %d wheels (lock %s)", len(wheels), lock_hash[:12])
+    return Wheelhouse(path=wheelhouse_dir, lock_hash=lock_hash, wheels=wheels, rebuilt=True)
+
+
+def _wheel_key(filename: str) -> Tuple[str, str]:
+    """(canonical name, version) of a wheel filename."""
+    name, version = filename.split("-")[:2]
+    return canonicalize_name(name), version
+
+
+def _resolve_lock(
+    requirements_file: Path, work_dir: Path, python_version: str, extra_requirements: Sequence[str]
+) -> str:
+    """Resolve requirements to pinned versions for the container platform with uv."""
+    sources = [str(requirements_file)]
+    if extra_requirements:
+        extra_file = work_dir / "extra-requirements.txt"
+        extra_file.write_text("\n".join(extra_requirements) + "\n")
+        sources.append(str(extra_file))
+
+    output_file = work_dir / WHEELHOUSE_LOCK
+    cmd = [
+        "uv",
+        "pip",
+        "compile",
+        *sources,
+        "--output-file",
+        str(output_file),
+        "--python-version",
+        python_version,
+        "--python-platform",
+        WHEELHOUSE_UV_PLATFORM,
+        "--no-header",
+        "--no-annotate",
+        "--quiet",
+    ]
+
+    log.info("Resolving %s with uv...", requirements_file.name)
+    try:
+        subprocess.run(cmd, check=True, capture_output=True, text=True)  # nosec B603 B607 - hardcoded uv command
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"Failed to resolve {requirements_file.name} with uv: {e.stderr}") from e
+    return output_file.read_text()
+
+
+def _pip_command() -> List[str]:
+    """Command running pip: the current interpreter's, or an ephemeral one run by uv if it has none."""
+    if importlib.util.find_spec("pip") is not None:
+        return [sys.executable, "-m", "pip"]
+    return ["uv", "tool", "run", "pip"]
+
+
+def _download(lock_file: Path, dest: Path, python_version: str) -> None:
+    """Download the wheels (or sdists where no wheel fits) of a lock for the container platform."""
+    cmd = [
+        *_pip_command(),
+        "download",
+        "--dest",
+        str(dest),
+        "--requirement",
+        str(lock_file),
+        # The lock is complete; --no-deps also lets pip fall back to sdists for a foreign platform
+        "--no-deps",
+        "--prefer-binary",
+        "--platform",
+        WHEELHOUSE_PIP_PLATFORM,
+        "--python-version",
+        python_version,
+        "--implementation",
+        "cp",
+        "--quiet",
+        "--disable-pip-version-check",
+    ]
+
+    log.info("Downloading wheels for Linux ARM64 (Python %s)...", python_version)
+    try:
+        subprocess.run(cmd, check=True, capture_output=True, text=True)  # nosec B603 - pip with fixed arguments
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"Failed to download wheels: {e.stderr}") from e
+
+
+def _host_matches_target(python_version: str) -> bool:
+    """Whether wheels built on this host run in the container (Linux ARM64, same Python)."""
+    return (
+        sys.platform == "linux"
+        and platform.machine().lower() in ("aarch64", "arm64")
+        and f"{sys.version_info.major}.{sys.version_info.minor}" == python_version
+    )
+
+
+def _build_sdists(download_dir: Path, python_version: str) -> None:
+    """Build wheels for the sdists in a directory, replacing them.
+
+    Raises:
+        RuntimeError: If an sdist builds a platform-specific wheel that the container cannot use
+    """
+    sdists = [p for p in sorted(download_dir.iterdir()) if p.name.endswith(_SDIST_SUFFIXES)]
+    if not sdists:
+        return
+
+    native_ok = _host_matches_target(python_version)
+    unusable = []
+    for sdist in sdists:
+        with tempfile.TemporaryDirectory() as build_dir:
+            cmd = [
+                *_pip_command(),
+                "wheel",
+                "--no-deps",
+                "--wheel-dir",
+                build_dir,
+                "--quiet",
+                "--disable-pip-version-check",
+                str(sdist),
+            ]
+            log.info("Building wheel for %s...", sdist.name)
+            try:
+                subprocess.run(cmd, check=True, capture_output=True, text=True)  # nosec B603 - pip with fixed arguments
+            except subprocess.CalledProcessError as e:
+                raise RuntimeError(f"Failed to build a wheel for {sdist.name}: {e.stderr}") from e
+
+            for wheel in Path(build_dir).glob("*.whl"):
+                if wheel.name.endswith("-none-any.whl") or native_ok:
+                    shutil.move(str(wheel), download_dir / wheel.name)
+                else:
+                    unusable.append(sdist.name)
+        sdist.unlink()
+
+    if unusable:
+        raise RuntimeError(
+            "No Linux ARM64 wheel is published for: "
+            + ", ".join(unusable)
+            + "\nThese packages compile native code, so their wheels must be built on Linux ARM64 "
+            f"with Python {python_version} (run this command there, or add the wheels to the wheelhouse)."
+        )
@@ -0,0 +1,187 @@
+"""Tests for Bedrock AgentCore Bench CLI functionality."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from bedrock_agentcore_starter_toolkit.cli.bench.commands import bench_app
+from bedrock_agentcore_starter_toolkit.operations.runtime import (
+    BenchmarkResult,
+    BenchStage,
+    BenchStageResult,
+    LatencyStats,
+)
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def payloads_file(tmp_path, monkeypatch):
+    """A JSONL file of two payloads, in a directory without a configuration."""
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / "payloads.jsonl"
+    path.write_text('{"prompt": "one"}\n{"prompt": "two"}\n', encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def mock_benchmark():
+    """Patch run_invoke_benchmark to return a canned result."""
+    latency = LatencyStats(count=9, min=0.1, mean=0.2, p50=0.2, p90=0.3, p95=0.3, p99=0.4, max=0.4)
+    result = BenchmarkResult(
+        target="http://127.0.0.1:8090",
+        mode="endpoint",
+        sessions=2,
+        requests=10,
+        succeeded=9,
+        failed=1,
+        error_rate=0.1,
+        errors={"HTTP 500": 1},
+        duration_seconds=2.0,
+        requests_per_second=5.0,
+        events=90,
+        events_per_second=45.0,
+        ttfb=latency,
+        latency=latency,
+        stages=[
+            BenchStageResult(
+                concurrency=1, requests=4, failed=0, duration_seconds=1.0, requests_per_second=4.0, latency=latency
+            ),
+            BenchStageResult(
+                concurrency=2,
+                rate=10.0,
+                requests=6,
+                failed=1,
+                duration_seconds=1.0,
+                requests_per_second=6.0,
+                latency=latency,
+            ),
+        ],
+    )
+    with patch(
+        "bedrock_agentcore_starter_toolkit.cli.bench.commands.run_invoke_benchmark", return_value=result
+    ) as mock:
+        yield mock
+
+
+def test_invoke_endpoint(payloads_file, mock_benchmark):
+    """Test a request count benchmark against an endpoint needs no configuration."""
+    result = runner.invoke(
+        bench_app,
+        [
+            "invoke",
+            str(payloads_file),
+            "-c",
+            "2",
+            "-r",
+            "5",
+            "--endpoint",
+            "http://127.0.0.1:8090",
+            "--headers",
+            "Trace:1",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    kwargs = mock_benchmark.call_args.kwargs
+    # The request count defaults to one per payload
+    assert kwargs["stages"] == [BenchStage(concurrency=2, rate=5.0, requests=2)]
+    assert kwargs["config_path"] is None
+    assert kwargs["local_port"] == 8080
+    assert kwargs["endpoint"] == "http://127.0.0.1:8090"
+    assert kwargs["custom_headers"] == {"X-Amzn-Bedrock-AgentCore-Runtime-Custom-Trace": "1"}
+    assert "Latency" in result.output
+    assert "Stages" in result.output
+    assert "HTTP 500" in result.output
+    assert "45.0 events/s" in result.output
+
+
+def test_invoke_stages_and_output(payloads_file, mock_benchmark, tmp_path):
+    """Test --stage builds the schedule and --output writes the results."""
+    output = tmp_path / "out" / "results.json"
+
+    result = runner.invoke(
+        bench_app,
+        [
+            "invoke",
+            str(payloads_file),
+            "--stage",
+            "1:1",
+            "--stage",
+            "1:2:10",
+            "-s",
+            "4",
+            "--endpoint",
+            "http://127.0.0.1:8090",
+            "-o",
+            str(output),
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    kwargs = mock_benchmark.call_args.kwargs
+    assert kwargs["stages"] == [
+        BenchStage(concurrency=1, duration=1.0),
+        BenchStage(concurrency=2, rate=10.0, duration=1.0),
+    ]
+    assert kwargs["sessions"] == 4
+    data = json.loads(output.read_text(encoding="utf-8"))
+    assert data["requests"] == 10
+    assert data["errors"] == {"HTTP 500": 1}
+    assert len(data["stages"]) == 2
+
+
+def test_invoke_local_port(payloads_file, mock_benchmark):
+    """Test --port selects the port of the local container."""
+    (payloads_file.parent / ".bedrock_agentcore.yaml").touch()
+
+    with patch("bedrock_agentcore_starter_toolkit.cli.bench.commands.load_config") as mock_load_config:
+        mock_load_config.return_value.get_agent_config.return_value.authorizer_configuration = None
+        result = runner.invoke(bench_app, ["invoke", str(payloads_file), "--local", "--port", "9090"])
+
+    assert result.exit_code == 0, result.output
+    kwargs = mock_benchmark.call_args.kwargs
+    assert kwargs["local_mode"] is True
+    assert kwargs["local_port"] == 9090
+    assert kwargs["bearer_token"] is None
+
+
+def test_invoke_invalid_stage(payloads_file, mock_benchmark):
+    """Test a malformed stage is reported without running anything."""
+    result = runner.invoke(
+        bench_app, ["invoke", str(payloads_file), "--stage", "fast", "--endpoint", "http://127.0.0.1:8090"]
+    )
+
+    assert result.exit_code == 1
+    assert "Invalid stage" in result.output
+    mock_benchmark.assert_not_called()
+
+
+def test_invoke_missing_payloads(payloads_file, mock_benchmark):
+    """Test a missing payloads file is reported."""
+    result = runner.invoke(bench_app, ["invoke", "missing.jsonl", "--endpoint", "http://127.0.0.1:8090"])
+
+    assert result.exit_code == 1
+    assert "Payloads file not found" in result.output
+    mock_benchmark.assert_not_called()
+
+
+def test_invoke_without_configuration(payloads_file, mock_benchmark):
+    """Test benchmarking a deployed agent needs a configuration."""
+    result = runner.invoke(bench_app, ["invoke", str(payloads_file)])
+
+    assert result.exit_code == 1
+    assert "Configuration Not Found" in result.output
+    mock_benchmark.assert_not_called()
+
+
+def test_stub():
+    """Test the stand-in agent is served with the requested pacing."""
+    with patch("bedrock_agentcore_starter_toolkit.cli.bench.commands.StubAgent") as mock_stub:
+        result = runner.invoke(bench_app, ["stub", "--port", "8090", "--chunks", "5", "--chunk-delay", "0"])
+
+    assert result.exit_code == 0, result.output
+    mock_stub.assert_called_once_with(chunks=5, first_chunk_delay=0.1, chunk_delay=0.0)
+    mock_stub.return_value.run.assert_called_once_with(port=8090)
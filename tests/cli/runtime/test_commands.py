@@ -1571,6 +1571,7 @@ agents:
             mock_result.agent_arn = "arn:aws:bedrock:us-west-2:123456789012:agent-runtime/AGENT123"
             mock_result.ecr_uri = "123456789012.dkr.ecr.us-west-2.amazonaws.com/test-agent"
             mock_result.agent_id = "AGENT123"
+            mock_result.profile = None
             mock_launch.return_value = mock_result
 
             original_cwd = Path.cwd()
@@ -1592,6 +1593,9 @@ agents:
                     auto_update_on_conflict=False,
                     console=ANY,
                     force_rebuild_deps=False,
+                    package_workers=None,
+                    optimize_package=False,
+                    precompile_bytecode=False,
                 )
             finally:
                 os.chdir(original_cwd)
@@ -1616,6 +1620,7 @@ agents:
             mock_result.ecr_uri = "123456789012.dkr.ecr.us-west-2.amazonaws.com/test-agent"
             mock_result.codebuild_id = "codebuild-project:12345"
             mock_result.agent_id = "AGENT123"
+            mock_result.profile = None
             mock_launch.return_value = mock_result
 
             original_cwd = Path.cwd()
@@ -1640,10 +1645,124 @@ agents:
                     auto_update_on_conflict=False,
                     console=ANY,
                     force_rebuild_deps=False,
+                    package_workers=None,
+                    optimize_package=False,
+                    precompile_bytecode=False,
                 )
             finally:
                 os.chdir(original_cwd)
 
+    def test_launch_all_agents(self, tmp_path):
+        """Test launch --all launches the project and exits non-zero when an agent fails."""
+        from bedrock_agentcore_starter_toolkit.operations.runtime.models import (
+            AgentLaunchResult,
+            LaunchResult,
+            MultiLaunchResult,
+        )
+
+        config_file = tmp_path / ".bedrock_agentcore.yaml"
+        config_file.write_text(
+            """
+default_agent: agent-a
+agents:
+  agent-a:
+    name: agent-a
+    entrypoint: a.py
+  agent-b:
+    name: agent-b
+    entrypoint: b.py
+""".strip()
+        )
+        multi_result = MultiLaunchResult(
+            results=[
+                AgentLaunchResult(
+                    agent_name="agent-a",
+                    result=LaunchResult(mode="codebuild", agent_arn="arn:agent-a"),
+                    duration_seconds=61,
+                ),
+                AgentLaunchResult(agent_name="agent-b", error="Build failed", duration_seconds=12),
+            ],
+            max_workers=2,
+            duration_seconds=62,
+        )
+
+        with patch(
+            "bedrock_agentcore_starter_toolkit.cli.runtime.commands.launch_all_bedrock_agentcore",
+            return_value=multi_result,
+        ) as mock_launch_all:
+            original_cwd = Path.cwd()
+            os.chdir(tmp_path)
+            try:
+                result = self.runner.invoke(app, ["launch", "--all", "--max-workers", "2"])
+            finally:
+                os.chdir(original_cwd)
+
+        assert result.exit_code == 1
+        assert "Launch Results (1/2 succeeded)" in result.stdout
+        assert "arn:agent-a" in result.stdout
+        assert "Build failed" in result.stdout
+        assert mock_launch_all.call_args.kwargs["max_workers"] == 2
+        assert mock_launch_all.call_args.kwargs["use_codebuild"] is True
+
+        result = self.runner.invoke(app, ["launch", "--all", "--agent", "agent-a"])
+        assert result.exit_code == 1
+        assert "--all cannot be used with --agent or --local" in result.stdout
+
+    def test_launch_prints_and_writes_profile(self, tmp_path):
+        """Test launch shows the step timing table and writes it to --profile-out."""
+        from bedrock_agentcore_starter_toolkit.operations.runtime.models import (
+            LaunchProfile,
+            LaunchResult,
+            LaunchStepTiming,
+        )
+
+        config_file = tmp_path / ".bedrock_agentcore.yaml"
+        config_file.write_text(
+            """
+default_agent: test-agent
+agents:
+  test-agent:
+    name: test-agent
+    entrypoint: test.py
+""".strip()
+        )
+        profile = LaunchProfile(
+            agent_name="test-agent",
+            mode="codebuild",
+            total_seconds=100.0,
+            steps=[
+                LaunchStepTiming(name="build", start_seconds=0.0, duration_seconds=80.0),
+                LaunchStepTiming(name="build/codebuild", start_seconds=10.0, duration_seconds=70.0),
+                LaunchStepTiming(name="endpoint_ready", start_seconds=85.0, duration_seconds=15.0),
+            ],
+        )
+        launch_result = LaunchResult(
+            mode="codebuild",
+            tag="bedrock_agentcore-test-agent:latest",
+            agent_arn="arn:agent",
+            profile=profile,
+        )
+
+        with patch(
+            "bedrock_agentcore_starter_toolkit.cli.runtime.commands.launch_bedrock_agentcore",
+            return_value=launch_result,
+        ):
+            original_cwd = Path.cwd()
+            os.chdir(tmp_path)
+            try:
+                result = self.runner.invoke(app, ["launch", "--profile-out", "ci/profile.json"])
+            finally:
+                os.chdir(original_cwd)
+
+        assert result.exit_code == 0
+        assert "Launch Timing (100.0s total)" in result.stdout
+        assert "codebuild" in result.stdout
+        assert "70.0s" in result.stdout
+        assert "70%" in result.stdout
+        written = json.loads((tmp_path / "ci" / "profile.json").read_text())
+        assert written["total_seconds"] == 100.0
+        assert [step["name"] for step in written["steps"]] == ["build", "build/codebuild", "endpoint_ready"]
+
     def test_launch_help_text_updated(self):
         """Test that help text reflects the three simplified launch modes."""
         result = self.runner.invoke(app, ["launch", "--help"])
@@ -2248,6 +2367,7 @@ agents:
             mock_result.ecr_uri = "123456789012.dkr.ecr.us-west-2.amazonaws.com/test-agent"
             mock_result.agent_id = "AGENT123"
             mock_result.memory_id = "mem_123456"
+            mock_result.profile = None
             mock_launch.return_value = mock_result
 
             original_cwd = Path.cwd()
@@ -2269,6 +2389,9 @@ agents:
                     auto_update_on_conflict=False,
                     console=ANY,
                     force_rebuild_deps=False,
+                    package_workers=None,
+                    optimize_package=False,
+                    precompile_bytecode=False,
                 )
             finally:
                 os.chdir(original_cwd)
@@ -4153,6 +4276,7 @@ agents:
             mock_result.ecr_uri = "123456789012.dkr.ecr.us-west-2.amazonaws.com/test-agent"
             mock_result.codebuild_id = "codebuild-project:12345"
             mock_result.agent_id = "AGENT123"
+            mock_result.profile = None
             mock_launch.return_value = mock_result
 
             original_cwd = Path.cwd()
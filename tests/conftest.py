@@ -30,6 +30,7 @@ def mock_boto3_clients(monkeypatch):
     mock_ecr.describe_repositories.return_value = {
         "repositories": [{"repositoryUri": "123456789012.dkr.ecr.us-west-2.amazonaws.com/existing-repo"}]
     }
+    mock_ecr.describe_images.return_value = {"imageDetails": [{"imageDigest": "sha256:abc"}]}
 
     # Mock exceptions - create proper exception classes
     class RepositoryAlreadyExistsException(Exception):
@@ -133,6 +134,7 @@ def mock_container_runtime(monkeypatch):
     mock_runtime.login.return_value = True
     mock_runtime.tag.return_value = True
     mock_runtime.push.return_value = True
+    mock_runtime.get_image_id.return_value = "sha256:" + "0" * 64
     mock_runtime.generate_dockerfile.return_value = Path("/tmp/Dockerfile")
 
     # Set class attributes for compatibility
@@ -164,6 +164,9 @@ aws:
                 use_codebuild=False,  # Local mode doesn't use CodeBuild
                 auto_update_on_conflict=False,
                 env_vars=None,
+                package_workers=None,
+                optimize_package=False,
+                precompile_bytecode=False,
             )
             assert result.mode == "local"
 
@@ -205,6 +208,9 @@ aws:
                 use_codebuild=False,  # Local build mode doesn't use CodeBuild
                 auto_update_on_conflict=False,
                 env_vars=None,
+                package_workers=None,
+                optimize_package=False,
+                precompile_bytecode=False,
             )
             assert result.mode == "cloud"
 
@@ -267,6 +273,9 @@ aws:
                 use_codebuild=True,  # Default mode uses CodeBuild
                 auto_update_on_conflict=False,
                 env_vars=None,
+                package_workers=None,
+                optimize_package=False,
+                precompile_bytecode=False,
             )
             assert result.mode == "codebuild"
 
@@ -308,6 +317,9 @@ aws:
                 use_codebuild=True,  # Default mode uses CodeBuild
                 auto_update_on_conflict=True,
                 env_vars=None,
+                package_workers=None,
+                optimize_package=False,
+                precompile_bytecode=False,
             )
             assert result.mode == "codebuild"
 
@@ -416,6 +428,33 @@ bedrock_agentcore:
             )
             assert response == {"result": "success"}
 
+    def test_invoke_stream_without_config(self):
+        """Test streaming invoke fails when not configured."""
+        with pytest.raises(ValueError, match="Must configure and launch first"):
+            Runtime().invoke_stream({"test": "payload"})
+
+    def test_invoke_stream(self, tmp_path):
+        """Test streaming invocation returns the event iterator."""
+        bedrock_agentcore = Runtime()
+        config_path = tmp_path / ".bedrock_agentcore.yaml"
+        bedrock_agentcore._config_path = config_path
+
+        with patch(
+            "bedrock_agentcore_starter_toolkit.notebook.runtime.bedrock_agentcore.stream_bedrock_agentcore",
+            return_value=iter(["Hello", " world"]),
+        ) as mock_stream:
+            events = bedrock_agentcore.invoke_stream({"message": "hello"}, session_id="test-session", local=True)
+
+            assert list(events) == ["Hello", " world"]
+            mock_stream.assert_called_once_with(
+                config_path=config_path,
+                payload={"message": "hello"},
+                session_id="test-session",
+                bearer_token=None,
+                local_mode=True,
+                user_id=None,
+            )
+
     def test_invoke_with_bearer_token(self, tmp_path):
         """Test invocation with bearer token."""
         bedrock_agentcore = Runtime()
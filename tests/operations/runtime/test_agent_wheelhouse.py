@@ -0,0 +1,89 @@
+"""Tests for Bedrock AgentCore wheelhouse operation."""
+
+from unittest.mock import patch
+
+import pytest
+
+from bedrock_agentcore_starter_toolkit.operations.runtime.wheelhouse import build_agent_wheelhouse
+from bedrock_agentcore_starter_toolkit.utils.runtime.config import save_config
+from bedrock_agentcore_starter_toolkit.utils.runtime.schema import (
+    AWSConfig,
+    BedrockAgentCoreAgentSchema,
+    BedrockAgentCoreConfigSchema,
+    NetworkConfiguration,
+    ObservabilityConfig,
+)
+from bedrock_agentcore_starter_toolkit.utils.runtime.wheelhouse import Wheelhouse
+
+MODULE = "bedrock_agentcore_starter_toolkit.operations.runtime.wheelhouse"
+
+
+def create_config(tmp_path, deployment_type="container", observability=True):
+    """Create a configuration for a container agent in tmp_path."""
+    config_path = tmp_path / ".bedrock_agentcore.yaml"
+    agent_config = BedrockAgentCoreAgentSchema(
+        name="test-agent",
+        entrypoint="test_agent.py",
+        deployment_type=deployment_type,
+        aws=AWSConfig(
+            region="us-west-2",
+            account="123456789012",
+            network_configuration=NetworkConfiguration(),
+            observability=ObservabilityConfig(enabled=observability),
+        ),
+    )
+    project_config = BedrockAgentCoreConfigSchema(default_agent="test-agent", agents={"test-agent": agent_config})
+    save_config(project_config, config_path)
+    return config_path
+
+
+class TestBuildAgentWheelhouse:
+    """Test building the wheelhouse of a configured agent."""
+
+    def test_builds_in_build_context(self, tmp_path, monkeypatch):
+        """Test the wheelhouse is built next to the agent's dependencies with the OpenTelemetry distro."""
+        monkeypatch.chdir(tmp_path)
+        config_path = create_config(tmp_path)
+        (tmp_path / "requirements.txt").write_text("requests\n")
+        (tmp_path / "Dockerfile").write_text("RUN uv pip install --no-index --find-links wheelhouse -r x")
+
+        wheelhouse = Wheelhouse(path=tmp_path / "wheelhouse", lock_hash="abc", wheels=["a.whl"], rebuilt=True)
+        with (
+            patch(f"{MODULE}.build_wheelhouse", return_value=wheelhouse) as mock_build,
+            patch(f"{MODULE}.get_python_version", return_value="3.11"),
+        ):
+            result = build_agent_wheelhouse(config_path)
+
+        args, kwargs = mock_build.call_args
+        assert args == ((tmp_path / "requirements.txt").resolve(), tmp_path / "wheelhouse", "3.11")
+        assert kwargs["extra_requirements"] == ["aws-opentelemetry-distro>=0.10.1"]
+        assert result.wheel_count == 1
+        assert result.rebuilt
+        assert result.dockerfile_uses_wheelhouse
+
+    def test_reports_stale_dockerfile(self, tmp_path, monkeypatch):
+        """Test a Dockerfile generated without the wheelhouse is reported."""
+        monkeypatch.chdir(tmp_path)
+        config_path = create_config(tmp_path, observability=False)
+        (tmp_path / "requirements.txt").write_text("requests\n")
+        (tmp_path / "Dockerfile").write_text("RUN uv pip install -r requirements.txt")
+
+        wheelhouse = Wheelhouse(path=tmp_path / "wheelhouse", lock_hash="abc", wheels=[], rebuilt=False)
+        with patch(f"{MODULE}.build_wheelhouse", return_value=wheelhouse) as mock_build:
+            result = build_agent_wheelhouse(config_path)
+
+        assert mock_build.call_args.kwargs["extra_requirements"] == []
+        assert not result.dockerfile_uses_wheelhouse
+
+    def test_rejects_direct_code_deploy(self, tmp_path):
+        """Test agents without a container are rejected."""
+        config_path = create_config(tmp_path, deployment_type="direct_code_deploy")
+        with pytest.raises(ValueError, match="container"):
+            build_agent_wheelhouse(config_path)
+
+    def test_requires_dependency_file(self, tmp_path, monkeypatch):
+        """Test an agent without a dependency file is rejected."""
+        monkeypatch.chdir(tmp_path)
+        config_path = create_config(tmp_path)
+        with pytest.raises(ValueError, match="No requirements.txt"):
+            build_agent_wheelhouse(config_path)
@@ -0,0 +1,313 @@
+"""Tests for Bedrock AgentCore bench operation."""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from bedrock_agentcore_starter_toolkit.operations.runtime import bench
+from bedrock_agentcore_starter_toolkit.operations.runtime.bench import (
+    BenchStage,
+    _latency_stats,
+    _percentile,
+    load_bench_payloads,
+    parse_bench_stage,
+    run_invoke_benchmark,
+)
+from bedrock_agentcore_starter_toolkit.operations.runtime.stub_agent import StubAgent
+from bedrock_agentcore_starter_toolkit.services.async_runtime import AsyncLocalBedrockAgentCoreClient
+from bedrock_agentcore_starter_toolkit.utils.runtime.config import save_config
+from bedrock_agentcore_starter_toolkit.utils.runtime.schema import (
+    AWSConfig,
+    BedrockAgentCoreAgentSchema,
+    BedrockAgentCoreConfigSchema,
+    BedrockAgentCoreDeploymentInfo,
+    NetworkConfiguration,
+    ObservabilityConfig,
+)
+
+ENDPOINT = "http://127.0.0.1:8090"
+
+
+@pytest.fixture
+def payloads_file(tmp_path):
+    """A JSONL file of three payloads."""
+    path = tmp_path / "payloads.jsonl"
+    path.write_text('{"prompt": "one"}\n\n{"prompt": "two three"}\n"raw"\n', encoding="utf-8")
+    return path
+
+
+def save_agent_config(tmp_path):
+    """Save the configuration of an agent that is not deployed."""
+    config_path = tmp_path / ".bedrock_agentcore.yaml"
+    agent_config = BedrockAgentCoreAgentSchema(
+        name="test-agent",
+        entrypoint="test.py",
+        aws=AWSConfig(
+            region="us-west-2", network_configuration=NetworkConfiguration(), observability=ObservabilityConfig()
+        ),
+        bedrock_agentcore=BedrockAgentCoreDeploymentInfo(),
+    )
+    save_config(
+        BedrockAgentCoreConfigSchema(default_agent="test-agent", agents={"test-agent": agent_config}), config_path
+    )
+    return config_path
+
+
+def local_client_with(transport):
+    """Patch the bench local client to send requests through transport."""
+
+    def create(endpoint, **kwargs):
+        return AsyncLocalBedrockAgentCoreClient(endpoint, client=httpx.AsyncClient(transport=transport))
+
+    return patch.object(bench, "AsyncLocalBedrockAgentCoreClient", side_effect=create)
+
+
+class TestParseBenchStage:
+    """Test parse_bench_stage functionality."""
+
+    def test_parse_stage(self):
+        """Test stages with and without a rate."""
+        assert parse_bench_stage("30:8") == BenchStage(concurrency=8, duration=30.0)
+        assert parse_bench_stage("1.5:2:10") == BenchStage(concurrency=2, rate=10.0, duration=1.5)
+
+    @pytest.mark.parametrize("spec", ["30", "30:8:1:2", "a:8", "30:x", "0:4", "30:0", "30:4:-1"])
+    def test_invalid_stage(self, spec):
+        """Test malformed and out of range stages are rejected."""
+        with pytest.raises(ValueError):
+            parse_bench_stage(spec)
+
+
+class TestLoadBenchPayloads:
+    """Test load_bench_payloads functionality."""
+
+    def test_load_payloads(self, payloads_file):
+        """Test blank lines are skipped and any JSON value is a payload."""
+        assert load_bench_payloads(payloads_file) == [{"prompt": "one"}, {"prompt": "two three"}, "raw"]
+
+    def test_invalid_line(self, tmp_path):
+        """Test the failing line is reported."""
+        path = tmp_path / "payloads.jsonl"
+        path.write_text('{"prompt": "one"}\n{not json}\n', encoding="utf-8")
+
+        with pytest.raises(ValueError, match="line 2"):
+            load_bench_payloads(path)
+
+    def test_empty_file(self, tmp_path):
+        """Test a file without payloads is rejected."""
+        path = tmp_path / "payloads.jsonl"
+        path.write_text("\n", encoding="utf-8")
+
+        with pytest.raises(ValueError, match="No payloads"):
+            load_bench_payloads(path)
+
+
+class TestLatencyStats:
+    """Test the latency summaries."""
+
+    def test_percentile_interpolates(self):
+        """Test percentiles interpolate between the closest ranks."""
+        values = [1.0, 2.0, 3.0, 4.0, 5.0]
+        assert _percentile(values, 0.5) == 3.0
+        assert _percentile(values, 0.9) == pytest.approx(4.6)
+        assert _percentile([2.0], 0.99) == 2.0
+
+    def test_latency_stats(self):
+        """Test a distribution is summarized whatever the order of its values."""
+        stats = _latency_stats([float(v) for v in range(100, 0, -1)])
+
+        assert stats.count == 100
+        assert stats.min == 1.0
+        assert stats.max == 100.0
+        assert stats.mean == 50.5
+        assert stats.p50 == 50.5
+        assert stats.p99 == pytest.approx(99.01)
+
+    def test_no_values(self):
+        """Test an empty distribution is all zeros."""
+        assert _latency_stats([]).count == 0
+
+
+class TestRunInvokeBenchmark:
+    """Test run_invoke_benchmark functionality."""
+
+    def test_benchmark_stub_agent(self, payloads_file):
+        """Test a benchmark against the stand-in agent measures every request."""
+        app = StubAgent(chunks=5, first_chunk_delay=0, chunk_delay=0)
+
+        with local_client_with(httpx.ASGITransport(app=app)):
+            result = run_invoke_benchmark(
+                payloads_file, stages=[BenchStage(concurrency=3, requests=12)], endpoint=ENDPOINT
+            )
+
+        assert result.target == ENDPOINT
+        assert result.mode == "endpoint"
+        assert result.sessions == 3
+        assert result.requests == result.succeeded == 12
+        assert result.failed == 0
+        assert result.error_rate == 0.0
+        assert result.events == 60
+        assert result.latency.count == result.ttfb.count == 12
+        assert 0 < result.ttfb.p50 <= result.latency.p50
+        assert result.requests_per_second > 0
+        assert result.events_per_second == pytest.approx(5 * result.requests_per_second)
+        assert len(result.stages) == 1
+        assert result.stages[0].requests == 12
+
+    def test_requests_default_to_payloads(self, payloads_file):
+        """Test each payload is sent once, in order, when no schedule is given."""
+        sent = []
+
+        def handler(request):
+            sent.append(request.content.decode())
+            assert request.headers["X-Custom"] == "1"
+            return httpx.Response(200, text="ok")
+
+        with local_client_with(httpx.MockTransport(handler)):
+            result = run_invoke_benchmark(payloads_file, endpoint=ENDPOINT, custom_headers={"X-Custom": "1"})
+
+        assert result.requests == result.succeeded == 3
+        assert result.sessions == 1
+        # A string payload is sent as is, so like invoke it is wrapped unless it holds JSON
+        assert sent == ['{"prompt": "one"}', '{"prompt": "two three"}', '{"payload": "raw"}']
+
+    def test_errors_counted(self, payloads_file):
+        """Test failed requests are counted by status and left out of the latency distribution."""
+        count = 0
+
+        def handler(request):
+            nonlocal count
+            count += 1
+            if count % 2:
+                return httpx.Response(500, json={"message": "boom"})
+            return httpx.Response(200, text="ok")
+
+        with local_client_with(httpx.MockTransport(handler)):
+            result = run_invoke_benchmark(payloads_file, stages=[BenchStage(requests=10)], endpoint=ENDPOINT)
+
+        assert result.requests == 10
+        assert result.failed == 5
+        assert result.error_rate == 0.5
+        assert result.errors == {"HTTP 500": 5}
+        assert result.latency.count == 5
+        assert result.stages[0].failed == 5
+
+    def test_sessions_cap_concurrency(self, payloads_file):
+        """Test a session never has two requests in flight."""
+        in_flight = {}
+        peak = 0
+
+        async def handler(request):
+            nonlocal peak
+            session = request.headers["X-Amzn-Bedrock-AgentCore-Runtime-Session-Id"]
+            in_flight[session] = in_flight.get(session, 0) + 1
+            peak = max(peak, in_flight[session])
+            await asyncio.sleep(0.005)
+            in_flight[session] -= 1
+            return httpx.Response(200, text="ok")
+
+        with local_client_with(httpx.MockTransport(handler)):
+            result = run_invoke_benchmark(
+                payloads_file, stages=[BenchStage(concurrency=4, requests=16)], sessions=2, endpoint=ENDPOINT
+            )
+
+        assert result.requests == 16
+        assert result.sessions == 2
+        assert len(in_flight) == 2
+        assert peak == 1
+
+    def test_slow_request_holds_only_its_session(self, tmp_path):
+        """Test workers keep taking idle sessions while one session waits on a slow response."""
+        path = tmp_path / "payloads.jsonl"
+        path.write_text('{"delay": 0.2}\n{"delay": 0.01}\n{"delay": 0.01}\n{"delay": 0.01}\n', encoding="utf-8")
+        in_flight = 0
+        peak = 0
+        finished = []
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            delay = json.loads(request.content)["delay"]
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(delay)
+            in_flight -= 1
+            finished.append(delay)
+            return httpx.Response(200, text="ok")
+
+        with local_client_with(httpx.MockTransport(handler)):
+            result = run_invoke_benchmark(
+                path, stages=[BenchStage(concurrency=2, requests=4)], sessions=2, endpoint=ENDPOINT
+            )
+
+        assert result.succeeded == 4
+        assert peak == 2
+        # The fast requests share the other session instead of queueing behind the slow one
+        assert finished == [0.01, 0.01, 0.01, 0.2]
+
+    def test_rate_limited_timed_stages(self, payloads_file):
+        """Test timed stages stop at their deadline and starts are paced by the rate."""
+        with local_client_with(httpx.MockTransport(lambda request: httpx.Response(200, text="ok"))):
+            result = run_invoke_benchmark(
+                payloads_file,
+                stages=[parse_bench_stage("0.3:2:20"), parse_bench_stage("0.2:1")],
+                endpoint=ENDPOINT,
+            )
+
+        first, second = result.stages
+        assert first.rate == 20.0
+        assert 2 <= first.requests <= 7
+        assert first.duration_seconds >= 0.25
+        assert second.requests > first.requests
+        assert result.requests == first.requests + second.requests
+
+    def test_configuration_required(self, payloads_file):
+        """Test a deployed agent cannot be benchmarked without its configuration."""
+        with pytest.raises(ValueError, match="configuration file is required"):
+            run_invoke_benchmark(payloads_file)
+
+    def test_agent_not_deployed(self, payloads_file, tmp_path):
+        """Test an agent without an ARN is rejected before any request."""
+        config_path = save_agent_config(tmp_path)
+
+        with pytest.raises(ValueError, match="not deployed"):
+            run_invoke_benchmark(payloads_file, config_path=config_path)
+
+    def test_local_port(self, payloads_file, tmp_path):
+        """Test the local container is invoked on the given port with the workload identity."""
+        config_path = save_agent_config(tmp_path)
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, text="ok")
+
+        with (
+            local_client_with(httpx.MockTransport(handler)) as mock_client,
+            patch.object(
+                bench, "get_local_invocation_identity", return_value=("workload-token", "http://callback")
+            ) as mock_identity,
+        ):
+            result = run_invoke_benchmark(payloads_file, config_path=config_path, local_mode=True, local_port=9090)
+
+        assert result.mode == "local"
+        assert result.succeeded == 3
+        assert mock_client.call_args.args == ("http://127.0.0.1:9090",)
+        assert mock_identity.call_args.args[2] == "test-agent"
+        assert str(requests[0].url) == "http://127.0.0.1:9090/invocations"
+        assert requests[0].headers["WorkloadAccessToken"] == "workload-token"
+
+    def test_invalid_sessions(self, payloads_file):
+        """Test a benchmark needs at least one session."""
+        with pytest.raises(ValueError, match="At least one session"):
+            run_invoke_benchmark(payloads_file, sessions=-1, endpoint=ENDPOINT)
+
+    def test_results_serialize(self, payloads_file):
+        """Test results round-trip through JSON for --output."""
+        with local_client_with(httpx.MockTransport(lambda request: httpx.Response(200, text="ok"))):
+            result = run_invoke_benchmark(payloads_file, endpoint=ENDPOINT)
+
+        data = json.loads(json.dumps(result.model_dump()))
+        assert data["requests"] == 3
+        assert data["latency"]["count"] == 3
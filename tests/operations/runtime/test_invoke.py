@@ -4,7 +4,11 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from bedrock_agentcore_starter_toolkit.operations.runtime.invoke import invoke_bedrock_agentcore
+from bedrock_agentcore_starter_toolkit.operations.runtime.invoke import (
+    invoke_bedrock_agentcore,
+    stream_bedrock_agentcore,
+)
+from bedrock_agentcore_starter_toolkit.services.runtime import BedrockAgentCoreClient
 from bedrock_agentcore_starter_toolkit.utils.runtime.config import save_config
 from bedrock_agentcore_starter_toolkit.utils.runtime.schema import (
     AWSConfig,
@@ -889,6 +893,74 @@ class TestGetWorkloadName:
             assert result is not None
 
 
+class TestStreamBedrockAgentCore:
+    """Test stream_bedrock_agentcore functionality."""
+
+    @pytest.fixture
+    def config_path(self, tmp_path):
+        """A project with a deployed agent."""
+        config_path = tmp_path / ".bedrock_agentcore.yaml"
+        agent_config = BedrockAgentCoreAgentSchema(
+            name="test-agent",
+            entrypoint="test.py",
+            aws=AWSConfig(
+                region="us-west-2", network_configuration=NetworkConfiguration(), observability=ObservabilityConfig()
+            ),
+            bedrock_agentcore=BedrockAgentCoreDeploymentInfo(
+                agent_arn="arn:aws:bedrock_agentcore:us-west-2:123456789012:agent-runtime/test-agent-id"
+            ),
+        )
+        project_config = BedrockAgentCoreConfigSchema(default_agent="test-agent", agents={"test-agent": agent_config})
+        save_config(project_config, config_path)
+        return config_path
+
+    def test_stream_uses_boto3_client(self, mock_boto3_clients, config_path):
+        """Test events of the boto3 client are streamed through."""
+        with patch.object(
+            BedrockAgentCoreClient, "invoke_stream", return_value=iter(["Hello", "!"])
+        ) as mock_invoke_stream:
+            events = stream_bedrock_agentcore(config_path, {"prompt": "hi"}, session_id="session-123")
+
+            assert list(events) == ["Hello", "!"]
+            mock_invoke_stream.assert_called_once_with(
+                agent_arn="arn:aws:bedrock_agentcore:us-west-2:123456789012:agent-runtime/test-agent-id",
+                payload='{"prompt": "hi"}',
+                session_id="session-123",
+                user_id=None,
+                custom_headers=None,
+            )
+
+    def test_stream_with_bearer_token(self, config_path):
+        """Test a bearer token streams through the HTTP client."""
+        with patch(
+            "bedrock_agentcore_starter_toolkit.services.runtime.HttpBedrockAgentCoreClient"
+        ) as mock_http_client_class:
+            mock_http_client_class.return_value.invoke_stream.return_value = iter([{"delta": "x"}])
+
+            events = stream_bedrock_agentcore(config_path, {"prompt": "hi"}, bearer_token="token-123")
+
+            assert list(events) == [{"delta": "x"}]
+            mock_http_client_class.return_value.invoke_stream.assert_called_once()
+            mock_http_client_class.return_value.invoke_endpoint.assert_not_called()
+
+    def test_stream_requires_deployed_agent(self, tmp_path):
+        """Test streaming an undeployed agent fails before any request."""
+        config_path = tmp_path / ".bedrock_agentcore.yaml"
+        agent_config = BedrockAgentCoreAgentSchema(
+            name="test-agent",
+            entrypoint="test.py",
+            aws=AWSConfig(
+                region="us-west-2", network_configuration=NetworkConfiguration(), observability=ObservabilityConfig()
+            ),
+        )
+        save_config(
+            BedrockAgentCoreConfigSchema(default_agent="test-agent", agents={"test-agent": agent_config}), config_path
+        )
+
+        with pytest.raises(ValueError, match="not deployed"):
+            stream_bedrock_agentcore(config_path, {"prompt": "hi"})
+
+
 class TestUpdateWorkloadIdentityWithCallbackUrl:
     def test_update_workload_identity_callback_url_already_exists(self):
         from bedrock_agentcore_starter_toolkit.operations.runtime.invoke import (
@@ -1,15 +1,20 @@
 """Tests for Bedrock AgentCore launch operation."""
 
+import hashlib
+import threading
 from types import SimpleNamespace
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
+from botocore.exceptions import ClientError
 
 from bedrock_agentcore_starter_toolkit.operations.runtime.launch import (
     _ensure_execution_role,
     launch_bedrock_agentcore,
 )
-from bedrock_agentcore_starter_toolkit.utils.runtime.config import save_config
+from bedrock_agentcore_starter_toolkit.operations.runtime.models import LaunchResult
+from bedrock_agentcore_starter_toolkit.utils.runtime.config import load_config, save_config
+from bedrock_agentcore_starter_toolkit.utils.runtime.package import UploadedPackage
 from bedrock_agentcore_starter_toolkit.utils.runtime.schema import (
     AWSConfig,
     BedrockAgentCoreAgentSchema,
@@ -132,6 +137,12 @@ class MockAWSClientFactory:
         self.sts_client = MagicMock()
         self.sts_client.get_caller_identity.return_value = {"Account": self.account}
 
+        # ECR Client Mock (no image built from the current source yet)
+        self.ecr_client = MagicMock()
+        self.ecr_client.describe_images.side_effect = ClientError(
+            {"Error": {"Code": "ImageNotFoundException", "Message": "not found"}}, "DescribeImages"
+        )
+
     def get_client(self, service_name):
         """Get a mock client for the specified service."""
         clients = {
@@ -139,6 +150,7 @@ class MockAWSClientFactory:
             "codebuild": self.codebuild_client,
             "s3": self.s3_client,
             "sts": self.sts_client,
+            "ecr": self.ecr_client,
         }
         return clients.get(service_name, MagicMock())
 
@@ -162,7 +174,6 @@ def assert_codebuild_workflow_called(mock_factory):
 
 def assert_config_updated_with_role(config_path, expected_role_arn):
     """Assert that config was updated with the expected execution role."""
-    from bedrock_agentcore_starter_toolkit.utils.runtime.config import load_config
 
     updated_config = load_config(config_path)
     updated_agent = list(updated_config.agents.values())[0]
@@ -236,6 +247,94 @@ class TestLaunchBedrockAgentCore:
             # Verify CodeBuild workflow was executed
             assert_codebuild_workflow_called(mock_factory)
 
+    def test_launch_codebuild_reuses_image_for_unchanged_source(
+        self, mock_boto3_clients, mock_container_runtime, tmp_path
+    ):
+        """Test the build is skipped when ECR has an image tagged with the source digest."""
+        config_path = create_test_config(
+            tmp_path,
+            execution_role="arn:aws:iam::123456789012:role/TestRole",
+            ecr_repository="123456789012.dkr.ecr.us-west-2.amazonaws.com/test-repo",
+        )
+        create_test_agent_file(tmp_path)
+        create_test_dockerfile(tmp_path)
+
+        mock_factory = MockAWSClientFactory()
+        mock_factory.setup_session_mock(mock_boto3_clients)
+        mock_factory.ecr_client.describe_images.side_effect = None
+        mock_factory.ecr_client.describe_images.return_value = {
+            "imageDetails": [{"imageTags": ["src-abc", "latest"], "imageDigest": "sha256:abc"}]
+        }
+
+        # Keep the digest from walking the working directory
+        with patch("os.walk", return_value=[(str(tmp_path), [], [])]):
+            result = launch_bedrock_agentcore(config_path, local=False)
+
+        assert result.mode == "codebuild"
+        assert result.codebuild_id is None
+        assert result.image_uri == "123456789012.dkr.ecr.us-west-2.amazonaws.com/test-repo@sha256:abc"
+        create_call = mock_boto3_clients["bedrock_agentcore"].create_agent_runtime.call_args.kwargs
+        assert create_call["agentRuntimeArtifact"]["containerConfiguration"]["containerUri"] == result.image_uri
+        image_tag = mock_factory.ecr_client.describe_images.call_args.kwargs["imageIds"][0]["imageTag"]
+        assert image_tag.startswith("src-")
+        mock_factory.s3_client.upload_file.assert_not_called()
+        mock_factory.codebuild_client.start_build.assert_not_called()
+        mock_factory.ecr_client.put_image.assert_not_called()
+
+        deployment = load_config(config_path).get_agent_config("test-agent").bedrock_agentcore
+        assert deployment.image_uri == result.image_uri
+        assert deployment.previous_image_uri is None
+
+    def test_launch_codebuild_keeps_source_cache_out_of_project_root(
+        self, mock_boto3_clients, mock_container_runtime, tmp_path
+    ):
+        """Test the source archive cache of a legacy layout agent is kept in its .bedrock_agentcore directory."""
+        config_path = create_test_config(
+            tmp_path,
+            execution_role="arn:aws:iam::123456789012:role/TestRole",
+            ecr_repository="123456789012.dkr.ecr.us-west-2.amazonaws.com/test-repo",
+        )
+        create_test_agent_file(tmp_path)
+        create_test_dockerfile(tmp_path)
+
+        mock_factory = MockAWSClientFactory()
+        mock_factory.setup_session_mock(mock_boto3_clients)
+
+        # Keep the build context to the project directory
+        with patch("os.walk", return_value=[(str(tmp_path), [], ["test_agent.py", "Dockerfile"])]):
+            result = launch_bedrock_agentcore(config_path, local=False)
+
+        assert result.codebuild_id is not None
+        assert not list(tmp_path.glob("codebuild_source.*"))
+        cache_dir = tmp_path / ".bedrock_agentcore" / "test-agent"
+        assert (cache_dir / "codebuild_source.zip").exists()
+        assert (cache_dir / "codebuild_source.json").exists()
+
+    def test_launch_codebuild_records_step_profile(self, mock_boto3_clients, mock_container_runtime, tmp_path):
+        """Test the launch result carries the timing of each launch step, nested by workflow."""
+        config_path = create_test_config(
+            tmp_path,
+            execution_role="arn:aws:iam::123456789012:role/TestRole",
+            ecr_repository="123456789012.dkr.ecr.us-west-2.amazonaws.com/test-repo",
+        )
+        create_test_agent_file(tmp_path)
+        create_test_dockerfile(tmp_path)
+
+        mock_factory = MockAWSClientFactory()
+        mock_factory.setup_session_mock(mock_boto3_clients)
+
+        result = launch_bedrock_agentcore(config_path, local=False)
+
+        profile = result.profile
+        names = [step.name for step in profile.steps]
+        assert profile.agent_name == "test-agent"
+        assert profile.mode == "codebuild"
+        for name in ["memory", "build", "build/ecr", "build/source", "build/codebuild", "deploy", "endpoint_ready"]:
+            assert name in names
+        assert names.index("build") < names.index("build/ecr")
+        assert all(not step.failed for step in profile.steps)
+        assert all(0 <= step.start_seconds <= profile.total_seconds for step in profile.steps)
+
     def test_ensure_ecr_repository_no_auto_create_no_repo(self, mock_boto3_clients, mock_container_runtime, tmp_path):
         """Test error when ECR repository not configured and auto-create disabled."""
         config_path = create_test_config(
@@ -1182,7 +1281,7 @@ class TestLaunchBedrockAgentCore:
         with patch(
             "bedrock_agentcore_starter_toolkit.operations.runtime.launch._launch_with_codebuild"
         ) as mock_launch_with_codebuild:
-            mock_launch_with_codebuild.return_value = MagicMock()
+            mock_launch_with_codebuild.return_value = LaunchResult(mode="codebuild")
 
             # Run launch_bedrock_agentcore with use_codebuild=True and env_vars
             launch_bedrock_agentcore(config_path=config_path, use_codebuild=True, env_vars=test_env_vars)
@@ -1251,6 +1350,7 @@ class TestLaunchBedrockAgentCore:
                 "123456789012.dkr.ecr.us-west-2.amazonaws.com/test-repo",
                 "us-west-2",
                 "123456789012",
+                "123456789012.dkr.ecr.us-west-2.amazonaws.com/test-repo@sha256:abc",
             )
             mock_deploy.return_value = (
                 "agent-123",
@@ -1355,6 +1455,7 @@ class TestLaunchBedrockAgentCore:
                 "123456789012.dkr.ecr.us-west-2.amazonaws.com/test-repo",
                 "us-west-2",
                 "123456789012",
+                "123456789012.dkr.ecr.us-west-2.amazonaws.com/test-repo@sha256:abc",
             )
             mock_deploy.return_value = (
                 "agent-123",
@@ -1369,6 +1470,58 @@ class TestLaunchBedrockAgentCore:
             # Verify deployment succeeded
             assert result.mode == "codebuild"
 
+    def test_launch_codebuild_overlaps_memory_with_build(self, mock_boto3_clients, mock_container_runtime, tmp_path):
+        """Test memory provisioning runs alongside the build and deployment waits for both."""
+        config_path = create_test_config(
+            tmp_path,
+            execution_role="arn:aws:iam::123456789012:role/TestRole",
+            ecr_repository="123456789012.dkr.ecr.us-west-2.amazonaws.com/test-repo",
+        )
+        create_test_agent_file(tmp_path)
+        create_test_dockerfile(tmp_path)
+
+        build_started = threading.Event()
+        order = []
+
+        def provision_memory(*args, **kwargs):
+            # Only completes if the build was started while memory is still provisioning
+            assert build_started.wait(timeout=5)
+            order.append("memory")
+
+        def build(**kwargs):
+            build_started.set()
+            order.append("build")
+            return (
+                "build-123",
+                "123456789012.dkr.ecr.us-west-2.amazonaws.com/test-repo",
+                "us-west-2",
+                "123456789012",
+                "123456789012.dkr.ecr.us-west-2.amazonaws.com/test-repo@sha256:abc",
+            )
+
+        def deploy(*args, **kwargs):
+            order.append("deploy")
+            return "agent-123", "arn:aws:bedrock-agentcore:us-west-2:123456789012:agent-runtime/agent-123"
+
+        with (
+            patch(
+                "bedrock_agentcore_starter_toolkit.operations.runtime.launch._ensure_memory_for_agent",
+                side_effect=provision_memory,
+            ),
+            patch(
+                "bedrock_agentcore_starter_toolkit.operations.runtime.launch._execute_codebuild_workflow",
+                side_effect=build,
+            ),
+            patch(
+                "bedrock_agentcore_starter_toolkit.operations.runtime.launch._deploy_to_bedrock_agentcore",
+                side_effect=deploy,
+            ),
+        ):
+            result = launch_bedrock_agentcore(config_path, local=False)
+
+        assert result.mode == "codebuild"
+        assert order == ["build", "memory", "deploy"]
+
     def test_launch_with_memory_stm_only(self, mock_boto3_clients, mock_container_runtime, tmp_path):
         """Test launch with STM-only memory (no LTM strategies)."""
         from bedrock_agentcore_starter_toolkit.utils.runtime.schema import MemoryConfig
@@ -1428,6 +1581,7 @@ class TestLaunchBedrockAgentCore:
                 "123456789012.dkr.ecr.us-west-2.amazonaws.com/test-repo",
                 "us-west-2",
                 "123456789012",
+                "123456789012.dkr.ecr.us-west-2.amazonaws.com/test-repo@sha256:abc",
             )
             mock_deploy.return_value = (
                 "agent-123",
@@ -1580,6 +1734,7 @@ class TestLaunchBedrockAgentCore:
                 "123456789012.dkr.ecr.us-west-2.amazonaws.com/test-repo",
                 "us-west-2",
                 "123456789012",
+                "123456789012.dkr.ecr.us-west-2.amazonaws.com/test-repo@sha256:abc",
             )
             mock_deploy.return_value = (
                 "agent-123",
@@ -1649,6 +1804,7 @@ class TestLaunchBedrockAgentCore:
                 "123456789012.dkr.ecr.us-west-2.amazonaws.com/test-repo",
                 "us-west-2",
                 "123456789012",
+                "123456789012.dkr.ecr.us-west-2.amazonaws.com/test-repo@sha256:abc",
             )
             mock_deploy.return_value = ("agent-123", "arn:aws:bedrock-agentcore:us-west-2:123456789012:agent/agent-123")
 
@@ -1895,6 +2051,7 @@ class TestLaunchBedrockAgentCore:
                 "123456789012.dkr.ecr.us-west-2.amazonaws.com/test-repo",
                 "us-west-2",
                 "123456789012",
+                "123456789012.dkr.ecr.us-west-2.amazonaws.com/test-repo@sha256:abc",
             )
             mock_deploy.return_value = (
                 "agent-123",
@@ -1994,6 +2151,7 @@ class TestLaunchBedrockAgentCore:
                 "123456789012.dkr.ecr.us-west-2.amazonaws.com/test-repo",
                 "us-west-2",
                 "123456789012",
+                "123456789012.dkr.ecr.us-west-2.amazonaws.com/test-repo@sha256:abc",
             )
             mock_deploy.return_value = (
                 "agent-123",
@@ -2400,6 +2558,7 @@ class TestLaunchBedrockAgentCore:
                 "123456789012.dkr.ecr.us-west-2.amazonaws.com/test-repo",
                 "us-west-2",
                 "123456789012",
+                "123456789012.dkr.ecr.us-west-2.amazonaws.com/test-repo@sha256:abc",
             )
             mock_deploy.return_value = (
                 "agent-123",
@@ -2495,6 +2654,7 @@ class TestLaunchBedrockAgentCore:
                 "123456789012.dkr.ecr.us-west-2.amazonaws.com/test-repo",
                 "us-west-2",
                 "123456789012",
+                "123456789012.dkr.ecr.us-west-2.amazonaws.com/test-repo@sha256:abc",
             )
             mock_deploy.return_value = (
                 "agent-123",
@@ -2642,7 +2802,7 @@ class TestEnsureExecutionRole:
             patch(
                 "bedrock_agentcore_starter_toolkit.operations.runtime.launch.get_or_create_runtime_execution_role"
             ) as mock_get_or_create_role,
-            patch("bedrock_agentcore_starter_toolkit.operations.runtime.launch.save_config") as mock_save_config,
+            patch("bedrock_agentcore_starter_toolkit.operations.runtime.launch.save_agent_config") as mock_save_config,
         ):
             mock_get_or_create_role.return_value = created_role_arn
 
@@ -2667,7 +2827,7 @@ class TestEnsureExecutionRole:
             assert agent_config.aws.execution_role_auto_create is False
 
             # Verify config was saved
-            mock_save_config.assert_called_once_with(project_config, config_path)
+            mock_save_config.assert_called_once_with(agent_config, config_path)
 
             # Verify return value
             assert result == created_role_arn
@@ -2934,6 +3094,7 @@ class TestEnsureExecutionRole:
                 "123456789012.dkr.ecr.us-west-2.amazonaws.com/test-repo",
                 "us-west-2",
                 "123456789012",
+                "123456789012.dkr.ecr.us-west-2.amazonaws.com/test-repo@sha256:abc",
             )
 
             # Configure _deploy_to_bedrock_agentcore mock to return agent_id and agent_arn
@@ -3261,11 +3422,11 @@ class TestCodeZipDeployment:
                 "bedrock_agentcore_starter_toolkit.operations.runtime.launch._ensure_memory_for_agent"
             ) as mock_ensure_memory,
             patch(
-                "bedrock_agentcore_starter_toolkit.utils.runtime.package.CodeZipPackager.create_deployment_package"
-            ) as mock_create_package,
+                "bedrock_agentcore_starter_toolkit.utils.runtime.package.CodeZipPackager.stream_deployment_package"
+            ) as mock_stream_package,
             patch(
-                "bedrock_agentcore_starter_toolkit.utils.runtime.package.CodeZipPackager.upload_to_s3"
-            ) as mock_upload_s3,
+                "bedrock_agentcore_starter_toolkit.utils.runtime.package.CodeZipPackager.resolve_upload_location"
+            ) as mock_resolve_location,
             patch("shutil.which") as mock_which,
         ):
             # Setup mocks
@@ -3273,15 +3434,12 @@ class TestCodeZipDeployment:
             mock_ensure_role.return_value = "arn:aws:iam::123456789012:role/TestRole"
             mock_ensure_memory.return_value = None
 
-            # Mock deployment package creation (in subdirectory to avoid cleanup conflicts)
-            mock_deployment_dir = tmp_path / "mock_package"
-            mock_deployment_dir.mkdir()
-            mock_deployment_zip = mock_deployment_dir / "deployment.zip"
-            mock_deployment_zip.write_bytes(b"fake zip content")
-            mock_create_package.return_value = (mock_deployment_zip, False)  # (Path, has_otel_distro)
+            mock_stream_package.return_value = UploadedPackage(
+                "s3://test-bucket/test-agent/deployment.zip", False, "abc123", uploaded=True
+            )
 
-            # Mock S3 upload
-            mock_upload_s3.return_value = "s3://test-bucket/test-agent/deployment.zip"
+            # Mock default S3 location
+            mock_resolve_location.return_value = ("test-bucket", "test-agent/deployment.zip")
 
             # Execute launch
             result = launch_bedrock_agentcore(config_path, local=False)
@@ -3295,12 +3453,73 @@ class TestCodeZipDeployment:
             # Verify workflow steps called
             mock_ensure_role.assert_called_once()
             mock_ensure_memory.assert_called_once()
-            mock_create_package.assert_called_once()
-            mock_upload_s3.assert_called_once()
-            # Verify S3 upload was called with correct location
-            assert mock_upload_s3.return_value == "s3://test-bucket/test-agent/deployment.zip"
+            mock_stream_package.assert_called_once()
+            mock_resolve_location.assert_called_once()
+            # Verify the package was streamed to the resolved location
+            stream_kwargs = mock_stream_package.call_args[1]
+            assert stream_kwargs["bucket"] == "test-bucket"
+            assert stream_kwargs["s3_key"] == "test-agent/deployment.zip"
             mock_boto3_clients["bedrock_agentcore"].create_agent_runtime.assert_called_once()
 
+    def test_launch_with_direct_code_deploy_streaming_fallback(self, mock_boto3_clients, tmp_path):
+        """Test a failed streaming upload falls back to building and uploading a temp file."""
+        from bedrock_agentcore_starter_toolkit.services.s3 import StreamingUploadError
+
+        config_path = create_test_config(
+            tmp_path,
+            execution_role="arn:aws:iam::123456789012:role/TestRole",
+            deployment_type="direct_code_deploy",
+        )
+        create_test_agent_file(tmp_path, "test_agent.py", "def handler(event, context): return {}")
+
+        mock_factory = MockAWSClientFactory()
+        mock_factory.setup_full_session_mock(mock_boto3_clients)
+        mock_boto3_clients["bedrock_agentcore"].create_agent_runtime.return_value = {
+            "agentRuntimeId": "test-agent-123",
+            "agentRuntimeArn": "arn:aws:bedrock-agentcore:us-west-2:123456789012:runtime/test-agent-123",
+        }
+
+        with (
+            patch("bedrock_agentcore_starter_toolkit.operations.runtime.launch._ensure_execution_role"),
+            patch("bedrock_agentcore_starter_toolkit.operations.runtime.launch._ensure_memory_for_agent"),
+            patch(
+                "bedrock_agentcore_starter_toolkit.utils.runtime.package.CodeZipPackager.stream_deployment_package"
+            ) as mock_stream_package,
+            patch(
+                "bedrock_agentcore_starter_toolkit.utils.runtime.package.CodeZipPackager.create_deployment_package"
+            ) as mock_create_package,
+            patch(
+                "bedrock_agentcore_starter_toolkit.utils.runtime.package.CodeZipPackager.resolve_upload_location"
+            ) as mock_resolve_location,
+            patch("shutil.which") as mock_which,
+        ):
+            mock_which.side_effect = lambda cmd: f"/usr/bin/{cmd}" if cmd in ["uv", "zip"] else None
+            mock_resolve_location.return_value = ("test-bucket", "test-agent/deployment.zip")
+            mock_stream_package.side_effect = StreamingUploadError("create_multipart_upload failed")
+
+            # Create deployment.zip in a subdirectory to avoid cleanup removing config
+            mock_deployment_dir = tmp_path / "mock_package"
+            mock_deployment_dir.mkdir()
+            mock_deployment_zip = mock_deployment_dir / "deployment.zip"
+            mock_deployment_zip.write_bytes(b"fake zip")
+            mock_create_package.return_value = (mock_deployment_zip, False)
+
+            result = launch_bedrock_agentcore(config_path, local=False)
+
+            assert result.mode == "direct_code_deploy"
+            mock_create_package.assert_called_once()
+            mock_factory.s3_client.upload_file.assert_called_once_with(
+                str(mock_deployment_zip),
+                "test-bucket",
+                "test-agent/deployment.zip",
+                ExtraArgs={
+                    "ExpectedBucketOwner": "123456789012",
+                    "Metadata": {"agentcore-sha256": hashlib.sha256(b"fake zip").hexdigest()},
+                },
+            )
+            # Temp directory is cleaned up after the fallback upload
+            assert not mock_deployment_dir.exists()
+
     def test_launch_with_direct_code_deploy_package_creation_failure(self, mock_boto3_clients, tmp_path):
         """Test direct_code_deploy deployment handles create_deployment_package failure gracefully."""
         # Create config with direct_code_deploy deployment
@@ -3325,8 +3544,8 @@ class TestCodeZipDeployment:
                 "bedrock_agentcore_starter_toolkit.operations.runtime.launch._ensure_memory_for_agent"
             ) as mock_ensure_memory,
             patch(
-                "bedrock_agentcore_starter_toolkit.utils.runtime.package.CodeZipPackager.create_deployment_package"
-            ) as mock_create_package,
+                "bedrock_agentcore_starter_toolkit.utils.runtime.package.CodeZipPackager.stream_deployment_package"
+            ) as mock_stream_package,
             patch("shutil.which") as mock_which,
         ):
             # Setup mocks
@@ -3334,8 +3553,8 @@ class TestCodeZipDeployment:
             mock_ensure_role.return_value = "arn:aws:iam::123456789012:role/TestRole"
             mock_ensure_memory.return_value = None
 
-            # Simulate create_deployment_package failure
-            mock_create_package.side_effect = RuntimeError("Failed to install dependencies")
+            # Simulate package creation failure
+            mock_stream_package.side_effect = RuntimeError("Failed to install dependencies")
 
             # Execute launch and verify it raises the correct error
             with pytest.raises(RuntimeError, match="Failed to install dependencies"):
@@ -3344,7 +3563,7 @@ class TestCodeZipDeployment:
             # Verify that execution stopped at package creation
             mock_ensure_role.assert_called_once()
             mock_ensure_memory.assert_called_once()
-            mock_create_package.assert_called_once()
+            mock_stream_package.assert_called_once()
 
             # Verify agent was not created (since package creation failed)
             mock_boto3_clients["bedrock_agentcore"].create_agent_runtime.assert_not_called()
@@ -3405,24 +3624,21 @@ class TestCodeZipDeployment:
                 "bedrock_agentcore_starter_toolkit.operations.runtime.launch._ensure_memory_for_agent"
             ) as mock_ensure_memory,
             patch(
-                "bedrock_agentcore_starter_toolkit.utils.runtime.package.CodeZipPackager.create_deployment_package"
-            ) as mock_create_package,
+                "bedrock_agentcore_starter_toolkit.utils.runtime.package.CodeZipPackager.stream_deployment_package"
+            ) as mock_stream_package,
             patch(
-                "bedrock_agentcore_starter_toolkit.utils.runtime.package.CodeZipPackager.upload_to_s3"
-            ) as mock_upload_s3,
+                "bedrock_agentcore_starter_toolkit.utils.runtime.package.CodeZipPackager.resolve_upload_location"
+            ) as mock_resolve_location,
             patch("shutil.which") as mock_which,
         ):
             mock_which.side_effect = lambda cmd: f"/usr/bin/{cmd}" if cmd in ["uv", "zip"] else None
             mock_ensure_role.return_value = "arn:aws:iam::123456789012:role/TestRole"
             mock_ensure_memory.return_value = "memory-123"  # Memory created
 
-            # Create deployment.zip in a subdirectory to avoid cleanup removing config
-            mock_deployment_dir = tmp_path / "mock_package"
-            mock_deployment_dir.mkdir()
-            mock_deployment_zip = mock_deployment_dir / "deployment.zip"
-            mock_deployment_zip.write_bytes(b"fake zip")
-            mock_create_package.return_value = (mock_deployment_zip, False)
-            mock_upload_s3.return_value = "s3://test-bucket/test-agent/deployment.zip"
+            mock_stream_package.return_value = UploadedPackage(
+                "s3://test-bucket/test-agent/deployment.zip", False, "abc123", uploaded=True
+            )
+            mock_resolve_location.return_value = ("test-bucket", "test-agent/deployment.zip")
 
             result = launch_bedrock_agentcore(config_path, local=False)
 
@@ -3452,11 +3668,11 @@ class TestCodeZipDeployment:
                 "bedrock_agentcore_starter_toolkit.operations.runtime.launch._ensure_memory_for_agent"
             ) as mock_ensure_memory,
             patch(
-                "bedrock_agentcore_starter_toolkit.utils.runtime.package.CodeZipPackager.create_deployment_package"
-            ) as mock_create_package,
+                "bedrock_agentcore_starter_toolkit.utils.runtime.package.CodeZipPackager.stream_deployment_package"
+            ) as mock_stream_package,
             patch(
-                "bedrock_agentcore_starter_toolkit.utils.runtime.package.CodeZipPackager.upload_to_s3"
-            ) as mock_upload_s3,
+                "bedrock_agentcore_starter_toolkit.utils.runtime.package.CodeZipPackager.resolve_upload_location"
+            ) as mock_resolve_location,
             patch("bedrock_agentcore_starter_toolkit.services.runtime.BedrockAgentCoreClient") as mock_runtime_client,
             patch("shutil.which") as mock_which,
         ):
@@ -3464,13 +3680,10 @@ class TestCodeZipDeployment:
             mock_ensure_role.return_value = "arn:aws:iam::123456789012:role/TestRole"
             mock_ensure_memory.return_value = None
 
-            # Create deployment.zip in a subdirectory to avoid cleanup removing config
-            mock_deployment_dir = tmp_path / "mock_package"
-            mock_deployment_dir.mkdir()
-            mock_deployment_zip = mock_deployment_dir / "deployment.zip"
-            mock_deployment_zip.write_bytes(b"fake zip")
-            mock_create_package.return_value = (mock_deployment_zip, False)
-            mock_upload_s3.return_value = "s3://test-bucket/test-agent/deployment.zip"
+            mock_stream_package.return_value = UploadedPackage(
+                "s3://test-bucket/test-agent/deployment.zip", False, "abc123", uploaded=True
+            )
+            mock_resolve_location.return_value = ("test-bucket", "test-agent/deployment.zip")
 
             mock_client = Mock()
             mock_client.create_or_update_agent.return_value = {
@@ -3485,9 +3698,9 @@ class TestCodeZipDeployment:
 
             assert result.mode == "direct_code_deploy"
 
-            # Verify create_deployment_package was called with force_rebuild_deps=True
-            mock_create_package.assert_called_once()
-            call_kwargs = mock_create_package.call_args[1]
+            # Verify stream_deployment_package was called with force_rebuild_deps=True
+            mock_stream_package.assert_called_once()
+            call_kwargs = mock_stream_package.call_args[1]
             assert call_kwargs["force_rebuild_deps"] is True
 
     def test_launch_with_direct_code_deploy_with_env_vars(self, mock_boto3_clients, tmp_path):
@@ -3510,24 +3723,21 @@ class TestCodeZipDeployment:
                 "bedrock_agentcore_starter_toolkit.operations.runtime.launch._ensure_memory_for_agent"
             ) as mock_ensure_memory,
             patch(
-                "bedrock_agentcore_starter_toolkit.utils.runtime.package.CodeZipPackager.create_deployment_package"
-            ) as mock_create_package,
+                "bedrock_agentcore_starter_toolkit.utils.runtime.package.CodeZipPackager.stream_deployment_package"
+            ) as mock_stream_package,
             patch(
-                "bedrock_agentcore_starter_toolkit.utils.runtime.package.CodeZipPackager.upload_to_s3"
-            ) as mock_upload_s3,
+                "bedrock_agentcore_starter_toolkit.utils.runtime.package.CodeZipPackager.resolve_upload_location"
+            ) as mock_resolve_location,
             patch("shutil.which") as mock_which,
         ):
             mock_which.side_effect = lambda cmd: f"/usr/bin/{cmd}" if cmd in ["uv", "zip"] else None
             mock_ensure_role.return_value = "arn:aws:iam::123456789012:role/TestRole"
             mock_ensure_memory.return_value = None
 
-            # Create deployment.zip in a subdirectory to avoid cleanup removing config
-            mock_deployment_dir = tmp_path / "mock_package"
-            mock_deployment_dir.mkdir()
-            mock_deployment_zip = mock_deployment_dir / "deployment.zip"
-            mock_deployment_zip.write_bytes(b"fake zip")
-            mock_create_package.return_value = (mock_deployment_zip, False)
-            mock_upload_s3.return_value = "s3://test-bucket/test-agent/deployment.zip"
+            mock_stream_package.return_value = UploadedPackage(
+                "s3://test-bucket/test-agent/deployment.zip", False, "abc123", uploaded=True
+            )
+            mock_resolve_location.return_value = ("test-bucket", "test-agent/deployment.zip")
 
             # Launch with custom env vars
             custom_env = {"MY_VAR": "test_value", "DEBUG": "true"}
@@ -3566,11 +3776,11 @@ class TestCodeZipDeployment:
                 "bedrock_agentcore_starter_toolkit.operations.runtime.launch._ensure_memory_for_agent"
             ) as mock_ensure_memory,
             patch(
-                "bedrock_agentcore_starter_toolkit.utils.runtime.package.CodeZipPackager.create_deployment_package"
-            ) as mock_create_package,
+                "bedrock_agentcore_starter_toolkit.utils.runtime.package.CodeZipPackager.stream_deployment_package"
+            ) as mock_stream_package,
             patch(
-                "bedrock_agentcore_starter_toolkit.utils.runtime.package.CodeZipPackager.upload_to_s3"
-            ) as mock_upload_s3,
+                "bedrock_agentcore_starter_toolkit.utils.runtime.package.CodeZipPackager.resolve_upload_location"
+            ) as mock_resolve_location,
             patch("bedrock_agentcore_starter_toolkit.services.runtime.BedrockAgentCoreClient") as mock_runtime_client,
             patch(
                 "bedrock_agentcore_starter_toolkit.operations.runtime.launch.enable_transaction_search_if_needed"
@@ -3581,13 +3791,10 @@ class TestCodeZipDeployment:
             mock_ensure_role.return_value = "arn:aws:iam::123456789012:role/TestRole"
             mock_ensure_memory.return_value = None
 
-            # Create deployment.zip in a subdirectory to avoid cleanup removing config
-            mock_deployment_dir = tmp_path / "mock_package"
-            mock_deployment_dir.mkdir()
-            mock_deployment_zip = mock_deployment_dir / "deployment.zip"
-            mock_deployment_zip.write_bytes(b"fake zip")
-            mock_create_package.return_value = (mock_deployment_zip, False)
-            mock_upload_s3.return_value = "s3://test-bucket/test-agent/deployment.zip"
+            mock_stream_package.return_value = UploadedPackage(
+                "s3://test-bucket/test-agent/deployment.zip", False, "abc123", uploaded=True
+            )
+            mock_resolve_location.return_value = ("test-bucket", "test-agent/deployment.zip")
 
             mock_client = Mock()
             mock_client.create_or_update_agent.return_value = {
@@ -3625,24 +3832,21 @@ class TestCodeZipDeployment:
                 "bedrock_agentcore_starter_toolkit.operations.runtime.launch._ensure_memory_for_agent"
             ) as mock_ensure_memory,
             patch(
-                "bedrock_agentcore_starter_toolkit.utils.runtime.package.CodeZipPackager.create_deployment_package"
-            ) as mock_create_package,
+                "bedrock_agentcore_starter_toolkit.utils.runtime.package.CodeZipPackager.stream_deployment_package"
+            ) as mock_stream_package,
             patch(
-                "bedrock_agentcore_starter_toolkit.utils.runtime.package.CodeZipPackager.upload_to_s3"
-            ) as mock_upload_s3,
+                "bedrock_agentcore_starter_toolkit.utils.runtime.package.CodeZipPackager.resolve_upload_location"
+            ) as mock_resolve_location,
             patch("shutil.which") as mock_which,
         ):
             mock_which.side_effect = lambda cmd: f"/usr/bin/{cmd}" if cmd in ["uv", "zip"] else None
             mock_ensure_role.return_value = "arn:aws:iam::123456789012:role/TestRole"
             mock_ensure_memory.return_value = None
 
-            # Create deployment.zip in a subdirectory to avoid cleanup removing config
-            mock_deployment_dir = tmp_path / "mock_package"
-            mock_deployment_dir.mkdir()
-            mock_deployment_zip = mock_deployment_dir / "deployment.zip"
-            mock_deployment_zip.write_bytes(b"fake zip")
-            mock_create_package.return_value = (mock_deployment_zip, False)
-            mock_upload_s3.return_value = "s3://test-bucket/test-agent/deployment.zip"
+            mock_stream_package.return_value = UploadedPackage(
+                "s3://test-bucket/test-agent/deployment.zip", False, "abc123", uploaded=True
+            )
+            mock_resolve_location.return_value = ("test-bucket", "test-agent/deployment.zip")
 
             # Launch (should reset session_id)
             result = launch_bedrock_agentcore(config_path, local=False)
@@ -3657,6 +3861,63 @@ class TestCodeZipDeployment:
             agent = updated_config.agents["test-agent"]
             assert agent.bedrock_agentcore.agent_session_id is None
 
+    def test_launch_with_direct_code_deploy_skips_unchanged_update(self, mock_boto3_clients, tmp_path):
+        """Test a redeploy with the same package and settings does not update the agent."""
+        config_path = create_test_config(
+            tmp_path,
+            execution_role="arn:aws:iam::123456789012:role/TestRole",
+            deployment_type="direct_code_deploy",
+        )
+        create_test_agent_file(tmp_path)
+
+        mock_factory = MockAWSClientFactory()
+        mock_factory.setup_full_session_mock(mock_boto3_clients)
+
+        with (
+            patch("bedrock_agentcore_starter_toolkit.operations.runtime.launch._ensure_execution_role"),
+            patch("bedrock_agentcore_starter_toolkit.operations.runtime.launch._ensure_memory_for_agent"),
+            patch(
+                "bedrock_agentcore_starter_toolkit.utils.runtime.package.CodeZipPackager.stream_deployment_package"
+            ) as mock_stream_package,
+            patch(
+                "bedrock_agentcore_starter_toolkit.utils.runtime.package.CodeZipPackager.resolve_upload_location"
+            ) as mock_resolve_location,
+            patch(
+                "bedrock_agentcore_starter_toolkit.operations.runtime.launch.BedrockAgentCoreClient"
+            ) as mock_client_class,
+            patch("shutil.which") as mock_which,
+        ):
+            mock_which.side_effect = lambda cmd: f"/usr/bin/{cmd}" if cmd in ["uv", "zip"] else None
+            mock_resolve_location.return_value = ("test-bucket", "test-agent/deployment.zip")
+            mock_stream_package.return_value = UploadedPackage(
+                "s3://test-bucket/test-agent/deployment.zip", False, "abc123", uploaded=False
+            )
+            mock_client = mock_client_class.return_value
+            mock_client.create_or_update_agent.return_value = {
+                "id": "test-agent-123",
+                "arn": "arn:aws:bedrock-agentcore:us-west-2:123456789012:runtime/test-agent-123",
+            }
+            mock_client.get_agent_runtime.return_value = {"status": "READY"}
+
+            launch_bedrock_agentcore(config_path, local=False)
+            from bedrock_agentcore_starter_toolkit.utils.runtime.config import load_config
+
+            deployment = load_config(config_path).agents["test-agent"].bedrock_agentcore
+            assert deployment.package_digest == "abc123"
+            assert deployment.deployment_fingerprint is not None
+
+            # Same package and settings: no update call
+            result = launch_bedrock_agentcore(config_path, local=False)
+            assert mock_client.create_or_update_agent.call_count == 1
+            assert result.agent_id == "test-agent-123"
+
+            # New package contents: the agent is updated again
+            mock_stream_package.return_value = UploadedPackage(
+                "s3://test-bucket/test-agent/deployment.zip", False, "def456", uploaded=True
+            )
+            launch_bedrock_agentcore(config_path, local=False)
+            assert mock_client.create_or_update_agent.call_count == 2
+
     def test_validate_vpc_resources_public_mode(self, tmp_path):
         """Test VPC validation skips for PUBLIC network mode."""
         from bedrock_agentcore_starter_toolkit.operations.runtime.launch import _validate_vpc_resources
@@ -3976,6 +4237,41 @@ class TestCodeZipDeployment:
             call_args = mock_client.create_or_update_agent.call_args
             assert call_args.kwargs["lifecycle_config"] is not None
 
+    def test_deploy_to_bedrock_agentcore_does_not_record_unpinned_image(self, mock_boto3_clients, tmp_path):
+        """Test an image deployed by the latest tag is not recorded, so it never becomes a rollback target."""
+        from bedrock_agentcore_starter_toolkit.operations.runtime.launch import _deploy_to_bedrock_agentcore
+        from bedrock_agentcore_starter_toolkit.utils.runtime.config import load_config
+
+        ecr_uri = "123456789012.dkr.ecr.us-west-2.amazonaws.com/test-repo"
+        config_path = create_test_config(tmp_path, execution_role="arn:aws:iam::123456789012:role/TestRole")
+        project_config = load_config(config_path)
+        agent_config = project_config.agents["test-agent"]
+        agent_config.bedrock_agentcore.image_uri = f"{ecr_uri}@sha256:old"
+
+        with patch(
+            "bedrock_agentcore_starter_toolkit.operations.runtime.launch.BedrockAgentCoreClient"
+        ) as mock_client_class:
+            mock_client_class.return_value.create_or_update_agent.return_value = {
+                "id": "agent-123",
+                "arn": "arn:aws:bedrock-agentcore:us-west-2:123456789012:agent-runtime/agent-123",
+            }
+            _deploy_to_bedrock_agentcore(
+                agent_config=agent_config,
+                project_config=project_config,
+                config_path=config_path,
+                agent_name="test-agent",
+                ecr_uri=ecr_uri,
+                region="us-west-2",
+                account_id="123456789012",
+                enable_observability=False,
+            )
+
+        image_uri = mock_client_class.return_value.create_or_update_agent.call_args.kwargs["image_uri"]
+        assert image_uri == f"{ecr_uri}:latest"
+        deployment = load_config(config_path).get_agent_config("test-agent").bedrock_agentcore
+        assert deployment.image_uri is None
+        assert deployment.previous_image_uri == f"{ecr_uri}@sha256:old"
+
     def test_deploy_to_bedrock_agentcore_role_validation_retry(self, mock_boto3_clients, tmp_path):
         """Test deployment retries on role validation failure."""
         from botocore.exceptions import ClientError
@@ -0,0 +1,142 @@
+"""Tests for launching every agent of a project."""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from bedrock_agentcore_starter_toolkit.operations.runtime.launch_all import launch_all_bedrock_agentcore
+from bedrock_agentcore_starter_toolkit.operations.runtime.models import LaunchResult
+from bedrock_agentcore_starter_toolkit.utils.runtime.config import load_config, save_config
+from bedrock_agentcore_starter_toolkit.utils.runtime.schema import (
+    AWSConfig,
+    BedrockAgentCoreAgentSchema,
+    BedrockAgentCoreConfigSchema,
+    NetworkConfiguration,
+    ObservabilityConfig,
+)
+
+MODULE = "bedrock_agentcore_starter_toolkit.operations.runtime.launch_all"
+
+
+def create_project_config(tmp_path, agent_names, legacy_layout=False):
+    """Create a project configuration with several container agents.
+
+    Each agent has its own source directory unless legacy_layout is set, in which case
+    they all build from the project root.
+    """
+    config_path = tmp_path / ".bedrock_agentcore.yaml"
+    agents = {
+        name: BedrockAgentCoreAgentSchema(
+            name=name,
+            entrypoint=f"{name}.py",
+            deployment_type="container",
+            source_path=None if legacy_layout else str(tmp_path / name),
+            aws=AWSConfig(
+                region="us-west-2",
+                account="123456789012",
+                network_configuration=NetworkConfiguration(),
+                observability=ObservabilityConfig(),
+            ),
+        )
+        for name in agent_names
+    }
+    save_config(BedrockAgentCoreConfigSchema(default_agent=agent_names[0], agents=agents), config_path)
+    return config_path
+
+
+class TestLaunchAll:
+    """Test launch_all_bedrock_agentcore functionality."""
+
+    @patch(f"{MODULE}.launch_bedrock_agentcore")
+    def test_launches_are_bounded_by_max_workers(self, mock_launch, tmp_path):
+        """Test every agent is launched with at most max_workers launches running at once."""
+        names = [f"agent{i}" for i in range(6)]
+        config_path = create_project_config(tmp_path, names)
+
+        lock = threading.Lock()
+        running = []
+        peak = []
+
+        def fake_launch(path, agent_name, **kwargs):
+            with lock:
+                running.append(agent_name)
+                peak.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.remove(agent_name)
+            return LaunchResult(mode="codebuild", agent_arn=f"arn:{agent_name}")
+
+        mock_launch.side_effect = fake_launch
+
+        result = launch_all_bedrock_agentcore(config_path, max_workers=2)
+
+        assert [outcome.agent_name for outcome in result.results] == names
+        assert [outcome.result.agent_arn for outcome in result.results] == [f"arn:{name}" for name in names]
+        assert max(peak) == 2
+        assert result.max_workers == 2
+        assert all(call.kwargs["local"] is False for call in mock_launch.call_args_list)
+
+    @patch(f"{MODULE}.launch_bedrock_agentcore")
+    def test_agents_sharing_artifacts_launch_one_at_a_time(self, mock_launch, tmp_path):
+        """Test agents building from the project root never launch together, while the others still do."""
+        config_path = create_project_config(tmp_path, ["legacy1", "legacy2"], legacy_layout=True)
+        config = load_config(config_path)
+        config.agents["isolated"] = config.agents["legacy1"].model_copy(
+            update={"name": "isolated", "source_path": str(tmp_path / "isolated")}
+        )
+        save_config(config, config_path)
+
+        lock = threading.Lock()
+        running = []
+        together = []
+
+        def fake_launch(path, agent_name, **kwargs):
+            with lock:
+                running.append(agent_name)
+                together.append(set(running))
+            time.sleep(0.05)
+            with lock:
+                running.remove(agent_name)
+            return LaunchResult(mode="codebuild", agent_arn=f"arn:{agent_name}")
+
+        mock_launch.side_effect = fake_launch
+
+        result = launch_all_bedrock_agentcore(config_path, max_workers=4)
+
+        assert [outcome.agent_name for outcome in result.succeeded] == ["legacy1", "legacy2", "isolated"]
+        assert result.max_workers == 2
+        assert not any({"legacy1", "legacy2"} <= launched for launched in together)
+        assert any("isolated" in launched and len(launched) == 2 for launched in together)
+
+    @patch(f"{MODULE}.launch_bedrock_agentcore")
+    def test_failure_does_not_stop_other_agents(self, mock_launch, tmp_path):
+        """Test a failing agent is reported while the others are still launched."""
+        config_path = create_project_config(tmp_path, ["good", "bad", "also-good"])
+
+        def fake_launch(path, agent_name, **kwargs):
+            if agent_name == "bad":
+                raise RuntimeError("CodeBuild failed with status: FAILED")
+            return LaunchResult(mode="codebuild", agent_arn=f"arn:{agent_name}")
+
+        mock_launch.side_effect = fake_launch
+        events = []
+
+        result = launch_all_bedrock_agentcore(
+            config_path, progress=lambda name, event, outcome: events.append((name, event))
+        )
+
+        assert [outcome.agent_name for outcome in result.succeeded] == ["good", "also-good"]
+        assert [outcome.agent_name for outcome in result.failed] == ["bad"]
+        assert result.failed[0].error == "CodeBuild failed with status: FAILED"
+        assert ("bad", "started") in events
+        assert ("bad", "failed") in events
+        assert ("good", "succeeded") in events
+
+    def test_unknown_agent(self, tmp_path):
+        """Test agents missing from the configuration are rejected before anything is launched."""
+        config_path = create_project_config(tmp_path, ["agent1"])
+
+        with pytest.raises(ValueError, match="Agents not found in configuration: missing"):
+            launch_all_bedrock_agentcore(config_path, agent_names=["agent1", "missing"])
@@ -0,0 +1,119 @@
+"""Tests for Bedrock AgentCore rollback operation."""
+
+from unittest.mock import patch
+
+import pytest
+
+from bedrock_agentcore_starter_toolkit.operations.runtime.rollback import (
+    resolve_image_uri,
+    rollback_bedrock_agentcore,
+)
+from bedrock_agentcore_starter_toolkit.utils.runtime.config import save_config
+from bedrock_agentcore_starter_toolkit.utils.runtime.schema import (
+    AWSConfig,
+    BedrockAgentCoreAgentSchema,
+    BedrockAgentCoreConfigSchema,
+    BedrockAgentCoreDeploymentInfo,
+    NetworkConfiguration,
+    ObservabilityConfig,
+)
+
+REPO = "123456789012.dkr.ecr.us-west-2.amazonaws.com/test-repo"
+MODULE = "bedrock_agentcore_starter_toolkit.operations.runtime.rollback"
+
+
+def create_deployed_config(tmp_path, image_uri=f"{REPO}@sha256:new", previous_image_uri=f"{REPO}@sha256:old"):
+    """Create a configuration for a deployed container agent."""
+    config_path = tmp_path / ".bedrock_agentcore.yaml"
+    agent_config = BedrockAgentCoreAgentSchema(
+        name="test-agent",
+        entrypoint="test_agent.py",
+        container_runtime="docker",
+        aws=AWSConfig(
+            region="us-west-2",
+            account="123456789012",
+            execution_role="arn:aws:iam::123456789012:role/TestRole",
+            ecr_repository=REPO,
+            network_configuration=NetworkConfiguration(),
+            observability=ObservabilityConfig(),
+        ),
+        bedrock_agentcore=BedrockAgentCoreDeploymentInfo(
+            agent_id="test-agent-id",
+            agent_arn="arn:aws:bedrock-agentcore:us-west-2:123456789012:runtime/test-agent-id",
+            image_uri=image_uri,
+            previous_image_uri=previous_image_uri,
+        ),
+    )
+    save_config(
+        BedrockAgentCoreConfigSchema(default_agent="test-agent", agents={"test-agent": agent_config}), config_path
+    )
+    return config_path
+
+
+class TestResolveImageUri:
+    """Test resolve_image_uri functionality."""
+
+    def test_pinned_uri_and_digest(self):
+        """Test pinned URIs are used as-is and bare digests are pinned to the repository."""
+        assert resolve_image_uri(REPO, f"{REPO}@sha256:abc", "us-west-2") == f"{REPO}@sha256:abc"
+        assert resolve_image_uri(REPO, "sha256:abc", "us-west-2") == f"{REPO}@sha256:abc"
+
+    @patch(f"{MODULE}.get_image_digest")
+    def test_tag(self, mock_digest):
+        """Test tags are resolved to their current digest."""
+        mock_digest.return_value = "sha256:abc"
+        assert resolve_image_uri(REPO, "src-1234", "us-west-2") == f"{REPO}@sha256:abc"
+        mock_digest.assert_called_once_with(REPO, "src-1234", "us-west-2")
+
+        mock_digest.return_value = None
+        with pytest.raises(ValueError, match="No image tagged 'missing'"):
+            resolve_image_uri(REPO, "missing", "us-west-2")
+
+
+class TestRollbackOperation:
+    """Test rollback_bedrock_agentcore functionality."""
+
+    @patch(f"{MODULE}._deploy_to_bedrock_agentcore")
+    @patch(f"{MODULE}.BedrockAgentCoreClient")
+    def test_rollback_to_previous_image(self, mock_client_class, mock_deploy, tmp_path):
+        """Test the previous image is redeployed with the agent's current environment."""
+        config_path = create_deployed_config(tmp_path)
+        mock_client_class.return_value.get_agent_runtime.return_value = {"environmentVariables": {"KEY": "value"}}
+        mock_deploy.return_value = ("test-agent-id", "arn:aws:bedrock-agentcore:us-west-2:123:runtime/test-agent-id")
+
+        result = rollback_bedrock_agentcore(config_path)
+
+        assert result.image_uri == f"{REPO}@sha256:old"
+        kwargs = mock_deploy.call_args.kwargs
+        assert kwargs["image_uri"] == f"{REPO}@sha256:old"
+        assert kwargs["env_vars"] == {"KEY": "value"}
+        assert mock_deploy.call_args.args[4] == REPO
+        # Rolling back changes only the image, so observability is left as the launch set it up
+        assert kwargs["enable_observability"] is False
+
+    @patch(f"{MODULE}._deploy_to_bedrock_agentcore")
+    @patch(f"{MODULE}.BedrockAgentCoreClient")
+    def test_current_image_is_not_redeployed(self, mock_client_class, mock_deploy, tmp_path):
+        """Test rolling back to the image already deployed is a no-op."""
+        config_path = create_deployed_config(tmp_path)
+
+        result = rollback_bedrock_agentcore(config_path, image="sha256:new")
+
+        assert result.image_uri == f"{REPO}@sha256:new"
+        mock_deploy.assert_not_called()
+
+    def test_no_previous_image(self, tmp_path):
+        """Test an error is raised when there is nothing to roll back to."""
+        config_path = create_deployed_config(tmp_path, previous_image_uri=None)
+
+        with pytest.raises(ValueError, match="No previous image recorded"):
+            rollback_bedrock_agentcore(config_path)
+
+    @patch(f"{MODULE}._deploy_to_bedrock_agentcore")
+    def test_unpinned_previous_image(self, mock_deploy, tmp_path):
+        """Test a previous image recorded by tag is refused, as the tag may now name another image."""
+        config_path = create_deployed_config(tmp_path, previous_image_uri=f"{REPO}:latest")
+
+        with pytest.raises(ValueError, match="not pinned by digest"):
+            rollback_bedrock_agentcore(config_path)
+        mock_deploy.assert_not_called()
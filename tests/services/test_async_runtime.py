@@ -0,0 +1,271 @@
+"""Tests for the asyncio-native Bedrock AgentCore invocation clients."""
+
+import asyncio
+import json
+import threading
+from contextlib import aclosing
+from unittest.mock import Mock
+
+import boto3
+import httpx
+import pytest
+from botocore.credentials import ReadOnlyCredentials
+from botocore.exceptions import NoCredentialsError
+
+from bedrock_agentcore_starter_toolkit.services.async_runtime import (
+    AsyncBedrockAgentCoreClient,
+    AsyncHttpBedrockAgentCoreClient,
+    AsyncLocalBedrockAgentCoreClient,
+)
+
+AGENT_ARN = "arn:aws:bedrock-agentcore:us-west-2:123456789012:runtime/test-agent"
+
+
+def sse_response(*events, **kwargs):
+    """A streaming response carrying events."""
+    body = b"".join(f"data: {json.dumps(event)}\n\n".encode() for event in events)
+    return httpx.Response(200, headers={"content-type": "text/event-stream"}, content=body, **kwargs)
+
+
+def transport(handler, requests):
+    """A mock transport recording the requests it serves."""
+
+    def record(request):
+        requests.append(request)
+        return handler(request)
+
+    return httpx.MockTransport(record)
+
+
+@pytest.fixture
+def boto_session():
+    """A boto3 session with static credentials."""
+    return boto3.Session(aws_access_key_id="AKIDEXAMPLE", aws_secret_access_key="secret", region_name="us-west-2")
+
+
+class TestAsyncBedrockAgentCoreClient:
+    """Test the SigV4 client."""
+
+    @pytest.mark.asyncio
+    async def test_request_is_signed(self, boto_session):
+        """Test the invocation is signed for the data plane, custom headers included."""
+        requests = []
+        http_client = httpx.AsyncClient(transport=transport(lambda r: httpx.Response(200, text="ok"), requests))
+        client = AsyncBedrockAgentCoreClient("us-west-2", client=http_client, boto_session=boto_session)
+
+        result = await client.invoke_endpoint(
+            AGENT_ARN, '{"prompt": "hi"}', "session-123", user_id="user-1", custom_headers={"X-Custom": "1"}
+        )
+
+        assert result == {"response": "ok"}
+        request = requests[0]
+        assert request.method == "POST"
+        assert request.url.host == "bedrock-agentcore.us-west-2.amazonaws.com"
+        assert request.url.params["qualifier"] == "DEFAULT"
+        assert request.content == b'{"prompt": "hi"}'
+        assert request.headers["X-Amzn-Bedrock-AgentCore-Runtime-Session-Id"] == "session-123"
+        assert request.headers["X-Amzn-Bedrock-AgentCore-Runtime-User-Id"] == "user-1"
+        authorization = request.headers["Authorization"]
+        assert authorization.startswith("AWS4-HMAC-SHA256 Credential=AKIDEXAMPLE/")
+        assert "/us-west-2/bedrock-agentcore/aws4_request" in authorization
+        assert "x-custom" in authorization
+        assert "X-Amz-Date" in request.headers
+        await http_client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_streaming_invoke_collects_events(self, boto_session):
+        """Test a streaming response is collected into its decoded events."""
+        http_client = httpx.AsyncClient(transport=transport(lambda r: sse_response("Hel", "lo", {"done": True}), []))
+        client = AsyncBedrockAgentCoreClient("us-west-2", client=http_client, boto_session=boto_session)
+
+        assert await client.invoke_endpoint(AGENT_ARN, "{}", "session-123") == {
+            "response": ["Hel", "lo", {"done": True}]
+        }
+        await http_client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_missing_credentials(self, monkeypatch):
+        """Test invoking without credentials fails before sending anything."""
+        session = boto3.Session(region_name="us-west-2")
+        monkeypatch.setattr(session, "get_credentials", lambda: None)
+        requests = []
+        http_client = httpx.AsyncClient(transport=transport(lambda r: httpx.Response(200, text="ok"), requests))
+        client = AsyncBedrockAgentCoreClient("us-west-2", client=http_client, boto_session=session)
+
+        with pytest.raises(NoCredentialsError):
+            async for _ in client.invoke_stream(AGENT_ARN, "{}", "session-123"):
+                pass
+        with pytest.raises(NoCredentialsError):
+            await client.invoke_endpoint(AGENT_ARN, "{}", "session-123")
+
+        assert requests == []
+        await http_client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_credential_refresh_does_not_block_loop(self, boto_session):
+        """Test a credential refresh blocking on the network does not stall concurrent invocations."""
+        release = threading.Event()
+
+        class BlockingCredentials:
+            def get_frozen_credentials(self):
+                # Stands in for a refresh calling STS, SSO or instance metadata
+                if not release.wait(timeout=2):
+                    raise TimeoutError("credentials were never released")
+                return ReadOnlyCredentials("AKIDBLOCKED", "secret", None)
+
+        blocking_session = Mock()
+        blocking_session.get_credentials.return_value = BlockingCredentials()
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(lambda r: sse_response("a", "b")))
+        blocked = AsyncBedrockAgentCoreClient("us-west-2", client=http_client, boto_session=blocking_session)
+        free = AsyncBedrockAgentCoreClient("us-west-2", client=http_client, boto_session=boto_session)
+
+        blocked_task = asyncio.create_task(blocked.invoke_endpoint(AGENT_ARN, "{}", "session-1"))
+        await asyncio.sleep(0.05)
+
+        events = [event async for event in free.invoke_stream(AGENT_ARN, "{}", "session-2")]
+
+        assert events == ["a", "b"]
+        assert not blocked_task.done()
+        release.set()
+        assert await blocked_task == {"response": ["a", "b"]}
+        await http_client.aclose()
+
+
+class TestAsyncHttpBedrockAgentCoreClient:
+    """Test the bearer token client."""
+
+    @pytest.mark.asyncio
+    async def test_invoke_stream(self):
+        """Test events are yielded as parsed values and the request carries the bearer token."""
+        requests = []
+        http_client = httpx.AsyncClient(transport=transport(lambda r: sse_response("a", {"b": 1}), requests))
+
+        async with AsyncHttpBedrockAgentCoreClient("us-west-2", client=http_client) as client:
+            events = [event async for event in client.invoke_stream(AGENT_ARN, "not json", "session-123", "token")]
+
+        assert events == ["a", {"b": 1}]
+        assert requests[0].headers["Authorization"] == "Bearer token"
+        assert json.loads(requests[0].content) == {"payload": "not json"}
+        # A caller-provided client is left open
+        assert not http_client.is_closed
+        await http_client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_stream_cancelled_early(self):
+        """Test closing the iterator early closes the response."""
+        closed = asyncio.Event()
+
+        class Body(httpx.AsyncByteStream):
+            async def __aiter__(self):
+                yield b'data: "first"\n\n'
+                yield b'data: "second"\n\n'
+
+            async def aclose(self):
+                closed.set()
+
+        http_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(
+                lambda r: httpx.Response(200, headers={"content-type": "text/event-stream"}, stream=Body())
+            )
+        )
+        client = AsyncHttpBedrockAgentCoreClient("us-west-2", client=http_client)
+
+        async with aclosing(client.invoke_stream(AGENT_ARN, "{}", "session-123", "token")) as events:
+            async for event in events:
+                assert event == "first"
+                break
+
+        assert closed.is_set()
+        await http_client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_error_status(self):
+        """Test an error status is raised with the error body read."""
+        http_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda r: httpx.Response(403, json={"message": "Access denied"}))
+        )
+        client = AsyncHttpBedrockAgentCoreClient("us-west-2", client=http_client)
+
+        with pytest.raises(httpx.HTTPStatusError) as exc_info:
+            await client.invoke_endpoint(AGENT_ARN, "{}", "session-123", "token")
+
+        assert "Access denied" in exc_info.value.response.text
+        await http_client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_empty_response(self):
+        """Test an empty non-streaming response is rejected."""
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(lambda r: httpx.Response(200)))
+        client = AsyncHttpBedrockAgentCoreClient("us-west-2", client=http_client)
+
+        with pytest.raises(ValueError, match="Empty response"):
+            await client.invoke_endpoint(AGENT_ARN, "{}", "session-123", "token")
+        await http_client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_invocations(self):
+        """Test many invocations run concurrently on one event loop."""
+        in_flight = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, text=request.headers["X-Amzn-Bedrock-AgentCore-Runtime-Session-Id"])
+
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client = AsyncHttpBedrockAgentCoreClient("us-west-2", client=http_client)
+
+        results = await asyncio.gather(
+            *(client.invoke_endpoint(AGENT_ARN, "{}", f"session-{i}", "token") for i in range(50))
+        )
+
+        assert [result["response"] for result in results] == [f"session-{i}" for i in range(50)]
+        assert peak == 50
+        await http_client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_owned_client_closed(self):
+        """Test a client created by the invocation client is closed with it."""
+        client = AsyncHttpBedrockAgentCoreClient("us-west-2", max_connections=5, max_keepalive_connections=2)
+        await client.aclose()
+
+        assert client.client.is_closed
+
+
+class TestAsyncLocalBedrockAgentCoreClient:
+    """Test the agent container client."""
+
+    @pytest.mark.asyncio
+    async def test_invoke_stream(self):
+        """Test the request follows the container protocol and events are yielded."""
+        requests = []
+        http_client = httpx.AsyncClient(transport=transport(lambda r: sse_response("a", "b"), requests))
+        client = AsyncLocalBedrockAgentCoreClient("http://127.0.0.1:8080/", client=http_client)
+
+        events = [event async for event in client.invoke_stream("session-123", '{"prompt": "hi"}', "token", "cb")]
+
+        assert events == ["a", "b"]
+        request = requests[0]
+        assert str(request.url) == "http://127.0.0.1:8080/invocations"
+        assert request.content == b'{"prompt": "hi"}'
+        assert request.headers["X-Amzn-Bedrock-AgentCore-Runtime-Session-Id"] == "session-123"
+        assert request.headers["WorkloadAccessToken"] == "token"
+        assert request.headers["OAuth2CallbackUrl"] == "cb"
+        await http_client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_identity_headers_optional(self):
+        """Test a stand-in endpoint is invoked without workload identity headers."""
+        requests = []
+        http_client = httpx.AsyncClient(transport=transport(lambda r: httpx.Response(200, text="ok"), requests))
+        client = AsyncLocalBedrockAgentCoreClient("http://127.0.0.1:8080", client=http_client)
+
+        assert await client.invoke_endpoint("session-123", "{}", custom_headers={"X-Custom": "1"}) == {"response": "ok"}
+        assert "WorkloadAccessToken" not in requests[0].headers
+        assert "OAuth2CallbackUrl" not in requests[0].headers
+        assert requests[0].headers["X-Custom"] == "1"
+        await http_client.aclose()
@@ -1,12 +1,14 @@
 """Tests for Bedrock AgentCore CodeBuild service integration."""
 
 import json
+import zipfile
 from unittest.mock import Mock, mock_open, patch
 
 import pytest
 from botocore.exceptions import ClientError
 
 from bedrock_agentcore_starter_toolkit.services.codebuild import CodeBuildService
+from bedrock_agentcore_starter_toolkit.utils.runtime.archive import deflate_file
 
 
 class TestCodeBuildService:
@@ -27,6 +29,8 @@ class TestCodeBuildService:
             "s3": Mock(),
             "iam": Mock(),
             "sts": Mock(),
+            "ecr": Mock(),
+            "logs": Mock(),
         }
 
         # Configure STS mock
@@ -165,11 +169,12 @@ class TestCodeBuildService:
         )
 
     @patch("os.walk")
-    @patch("zipfile.ZipFile")
+    @patch("bedrock_agentcore_starter_toolkit.services.codebuild.hash_file", return_value="abc123")
+    @patch("bedrock_agentcore_starter_toolkit.services.codebuild.write_incremental_zip")
     @patch("tempfile.NamedTemporaryFile")
     @patch("os.unlink")
     def test_upload_source_success(
-        self, mock_unlink, mock_tempfile, mock_zipfile, mock_walk, codebuild_service, mock_clients
+        self, mock_unlink, mock_tempfile, mock_write_zip, mock_hash, mock_walk, codebuild_service, mock_clients
     ):
         """Test successful source upload."""
         # Mock file system
@@ -180,10 +185,6 @@ class TestCodeBuildService:
         mock_temp.name = "/tmp/test.zip"
         mock_tempfile.return_value.__enter__.return_value = mock_temp
 
-        # Mock zipfile
-        mock_zip = Mock()
-        mock_zipfile.return_value.__enter__.return_value = mock_zip
-
         # Test with fixed source.zip naming (no timestamp needed)
         result = codebuild_service.upload_source("test-agent")
 
@@ -195,7 +196,7 @@ class TestCodeBuildService:
             "/tmp/test.zip",
             "bedrock-agentcore-codebuild-sources-123456789012-us-west-2",
             "test-agent/source.zip",
-            ExtraArgs={"ExpectedBucketOwner": "123456789012"},
+            ExtraArgs={"ExpectedBucketOwner": "123456789012", "Metadata": {"agentcore-sha256": "abc123"}},
         )
         mock_unlink.assert_called_once_with("/tmp/test.zip")
 
@@ -293,6 +294,121 @@ class TestCodeBuildService:
             projectName="test-project", sourceLocationOverride="bucket/source.zip"
         )
 
+    def test_start_build_with_source_tag(self, codebuild_service, mock_clients):
+        """Test the current buildspec and the source tag are passed as overrides."""
+        codebuild_service.start_build("test-project", "s3://bucket/source.zip", "test-ecr-uri", "src-abc")
+
+        kwargs = mock_clients["codebuild"].start_build.call_args.kwargs
+        assert kwargs["buildspecOverride"] == codebuild_service._get_arm64_buildspec("test-ecr-uri")
+        assert kwargs["environmentVariablesOverride"] == [
+            {"name": "SOURCE_IMAGE_TAG", "value": "src-abc", "type": "PLAINTEXT"}
+        ]
+
+    def test_compute_source_digest(self, codebuild_service, tmp_path):
+        """Test the digest is stable, follows file content and ignores filtered files."""
+        source = tmp_path / "src"
+        (source / "node_modules").mkdir(parents=True)
+        (source / "agent.py").write_text("print('hi')")
+        (source / "node_modules" / "dep.js").write_text("1")
+        dockerfile_dir = tmp_path / "docker"
+        dockerfile_dir.mkdir()
+        (dockerfile_dir / "Dockerfile").write_text("FROM python:3.11")
+
+        with patch.object(codebuild_service, "_parse_dockerignore", return_value=["node_modules"]):
+            first = codebuild_service.compute_source_digest(str(source), str(dockerfile_dir))
+            (source / "node_modules" / "dep.js").write_text("2")
+            assert codebuild_service.compute_source_digest(str(source), str(dockerfile_dir)) == first
+
+            (dockerfile_dir / "Dockerfile").write_text("FROM python:3.12")
+            assert codebuild_service.compute_source_digest(str(source), str(dockerfile_dir)) != first
+
+        assert codebuild_service.source_image_tag(first) == f"src-{first}"
+
+    def test_upload_source_with_cache(self, codebuild_service, mock_clients, tmp_path):
+        """Test the cached source.zip is reused, patched on change and not re-uploaded when S3 matches."""
+        source = tmp_path / "src"
+        cache_dir = source / ".bedrock_agentcore" / "test-agent"
+        cache_dir.mkdir(parents=True)
+        (source / "agent.py").write_text("print('hi')")
+        (source / "model.bin").write_bytes(b"weights" * 1000)
+        (cache_dir / "Dockerfile").write_text("FROM python:3.11")
+
+        with patch.object(codebuild_service, "_parse_dockerignore", return_value=[]):
+            codebuild_service.upload_source("test-agent", str(source), str(cache_dir), cache_dir=str(cache_dir))
+            digest = mock_clients["s3"].upload_file.call_args.kwargs["ExtraArgs"]["Metadata"]["agentcore-sha256"]
+            with zipfile.ZipFile(cache_dir / "codebuild_source.zip") as zf:
+                names = zf.namelist()
+            assert "agent.py" in names and "model.bin" in names
+            assert not any(name.endswith("codebuild_source.zip") for name in names)
+
+            # Unchanged context and matching S3 object: no rebuild, no upload
+            mock_clients["s3"].head_object.return_value = {"Metadata": {"agentcore-sha256": digest}}
+            mock_clients["s3"].upload_file.reset_mock()
+            with patch("bedrock_agentcore_starter_toolkit.services.codebuild.write_incremental_zip") as mock_write_zip:
+                codebuild_service.upload_source("test-agent", str(source), str(cache_dir), cache_dir=str(cache_dir))
+            mock_write_zip.assert_not_called()
+            mock_clients["s3"].upload_file.assert_not_called()
+
+            # Changed file: only it is recompressed and the new archive is uploaded
+            (source / "agent.py").write_text("print('bye')")
+            with patch(
+                "bedrock_agentcore_starter_toolkit.utils.runtime.archive.deflate_file",
+                side_effect=deflate_file,
+            ) as mock_deflate:
+                codebuild_service.upload_source("test-agent", str(source), str(cache_dir), cache_dir=str(cache_dir))
+            assert [call.args[0].name for call in mock_deflate.call_args_list] == ["agent.py"]
+            mock_clients["s3"].upload_file.assert_called_once()
+            with zipfile.ZipFile(cache_dir / "codebuild_source.zip") as zf:
+                assert zf.read("agent.py") == b"print('bye')"
+                assert zf.read("model.bin") == b"weights" * 1000
+
+    def test_compute_source_digest_with_cache(self, codebuild_service, tmp_path):
+        """Test the digest is the same with and without the source manifest."""
+        source = tmp_path / "src"
+        source.mkdir()
+        (source / "agent.py").write_text("print('hi')")
+        cache_dir = tmp_path / "cache"
+
+        with patch.object(codebuild_service, "_parse_dockerignore", return_value=[]):
+            codebuild_service.upload_source("test-agent", str(source), cache_dir=str(cache_dir))
+            expected = codebuild_service.compute_source_digest(str(source))
+            with patch("bedrock_agentcore_starter_toolkit.services.codebuild.hash_file") as mock_hash:
+                assert codebuild_service.compute_source_digest(str(source), cache_dir=str(cache_dir)) == expected
+            mock_hash.assert_not_called()
+
+    def test_find_image_missing(self, codebuild_service, mock_clients):
+        """Test a missing tag is reported as no image."""
+        mock_clients["ecr"].describe_images.side_effect = ClientError(
+            {"Error": {"Code": "ImageNotFoundException"}}, "DescribeImages"
+        )
+
+        assert codebuild_service.find_image("123.dkr.ecr.us-west-2.amazonaws.com/repo", "src-abc") is None
+        mock_clients["ecr"].describe_images.assert_called_once_with(
+            repositoryName="repo", imageIds=[{"imageTag": "src-abc"}]
+        )
+
+    def test_reuse_image_retags_latest(self, codebuild_service, mock_clients):
+        """Test an existing source image is tagged as latest through its manifest."""
+        mock_clients["ecr"].describe_images.return_value = {"imageDetails": [{"imageTags": ["src-abc"]}]}
+        mock_clients["ecr"].batch_get_image.return_value = {
+            "images": [{"imageManifest": "{}", "imageManifestMediaType": "application/vnd.oci.image.manifest.v1+json"}]
+        }
+
+        assert codebuild_service.reuse_image("123.dkr.ecr.us-west-2.amazonaws.com/repo", "src-abc")
+        mock_clients["ecr"].put_image.assert_called_once_with(
+            repositoryName="repo",
+            imageManifest="{}",
+            imageManifestMediaType="application/vnd.oci.image.manifest.v1+json",
+            imageTag="latest",
+        )
+
+    def test_reuse_image_not_built(self, codebuild_service, mock_clients):
+        """Test nothing is tagged when no image was built from the source."""
+        mock_clients["ecr"].describe_images.return_value = {"imageDetails": []}
+
+        assert not codebuild_service.reuse_image("123.dkr.ecr.us-west-2.amazonaws.com/repo", "src-abc")
+        mock_clients["ecr"].put_image.assert_not_called()
+
     def test_wait_for_completion_success(self, codebuild_service, mock_clients):
         """Test successful build completion."""
         # Mock build progression
@@ -327,37 +443,122 @@ class TestCodeBuildService:
             with pytest.raises(TimeoutError, match="CodeBuild timed out"):
                 codebuild_service.wait_for_completion("test-build-id", timeout=1)
 
+    def test_wait_for_completion_backs_off_within_phase(self, codebuild_service, mock_clients):
+        """Test the poll interval starts per phase, grows while the phase lasts and resets on change."""
+        mock_clients["codebuild"].batch_get_builds.side_effect = [
+            {"builds": [{"buildStatus": "IN_PROGRESS", "currentPhase": "BUILD"}]},
+            {"builds": [{"buildStatus": "IN_PROGRESS", "currentPhase": "BUILD"}]},
+            {"builds": [{"buildStatus": "IN_PROGRESS", "currentPhase": "BUILD"}]},
+            {"builds": [{"buildStatus": "IN_PROGRESS", "currentPhase": "BUILD"}]},
+            {"builds": [{"buildStatus": "IN_PROGRESS", "currentPhase": "BUILD"}]},
+            {"builds": [{"buildStatus": "IN_PROGRESS", "currentPhase": "POST_BUILD"}]},
+            {"builds": [{"buildStatus": "SUCCEEDED", "currentPhase": "COMPLETED"}]},
+        ]
+
+        with patch("bedrock_agentcore_starter_toolkit.services.codebuild.time.sleep") as mock_sleep:
+            metrics = codebuild_service.wait_for_completion("test-build-id")
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [3.0, 4.5, 6.75, 10.0, 10.0, 2.0]
+        assert metrics.status == "SUCCEEDED"
+        assert metrics.status_polls == 7
+        assert list(metrics.phases) == ["BUILD", "POST_BUILD"]
+
+    def test_wait_for_completion_streams_logs(self, codebuild_service, mock_clients):
+        """Test log events are paged with tokens and resumed without repeating events."""
+        logs = {"groupName": "/aws/codebuild/test", "streamName": "stream-1"}
+        mock_clients["codebuild"].batch_get_builds.side_effect = [
+            {"builds": [{"buildStatus": "IN_PROGRESS", "currentPhase": "BUILD", "logs": logs}]},
+            {
+                "builds": [
+                    {
+                        "buildStatus": "SUCCEEDED",
+                        "currentPhase": "COMPLETED",
+                        "logs": logs,
+                        "phases": [
+                            {"phaseType": "BUILD", "durationInSeconds": 42},
+                            {"phaseType": "POST_BUILD", "durationInSeconds": 1},
+                            {"phaseType": "COMPLETED"},
+                        ],
+                    }
+                ]
+            },
+        ]
+        mock_clients["logs"].filter_log_events.side_effect = [
+            {"events": [{"timestamp": 1, "eventId": "a", "message": "#1 building\n"}], "nextToken": "t1"},
+            {"events": [{"timestamp": 2, "eventId": "b", "message": "#2 done\n"}]},
+            # Resumed from the last timestamp: "b" is returned again and skipped
+            {"events": [{"timestamp": 2, "eventId": "b", "message": "#2 done\n"}]},
+            {"events": [{"timestamp": 2, "eventId": "c", "message": "pushed\n"}]},
+        ]
+
+        with (
+            patch("bedrock_agentcore_starter_toolkit.services.codebuild.time.sleep"),
+            patch.object(codebuild_service.logger, "info") as mock_info,
+        ):
+            metrics = codebuild_service.wait_for_completion("test-build-id")
+
+        calls = mock_clients["logs"].filter_log_events.call_args_list
+        assert calls[0].kwargs == {"logGroupName": "/aws/codebuild/test", "logStreamNames": ["stream-1"]}
+        assert calls[1].kwargs["nextToken"] == "t1"
+        assert calls[2].kwargs["startTime"] == 2
+        assert "nextToken" not in calls[2].kwargs
+
+        streamed = [c.args[1] for c in mock_info.call_args_list if c.args[0] == "   │ %s"]
+        assert streamed == ["#1 building", "#2 done", "pushed"]
+        assert metrics.log_events == 3
+        assert metrics.phases == {"BUILD": 42.0, "POST_BUILD": 1.0}
+        assert metrics.to_dict()["log_requests"] == 4
+
+    def test_wait_for_completion_without_log_access(self, codebuild_service, mock_clients):
+        """Test the build is still monitored when its logs cannot be read."""
+        logs = {"groupName": "/aws/codebuild/test", "streamName": "stream-1"}
+        mock_clients["codebuild"].batch_get_builds.side_effect = [
+            {"builds": [{"buildStatus": "IN_PROGRESS", "currentPhase": "BUILD", "logs": logs}]},
+            {"builds": [{"buildStatus": "SUCCEEDED", "currentPhase": "COMPLETED", "logs": logs}]},
+        ]
+        mock_clients["logs"].filter_log_events.side_effect = ClientError(
+            {"Error": {"Code": "AccessDeniedException", "Message": "denied"}}, "FilterLogEvents"
+        )
+
+        with patch("bedrock_agentcore_starter_toolkit.services.codebuild.time.sleep"):
+            metrics = codebuild_service.wait_for_completion("test-build-id")
+
+        assert metrics.status == "SUCCEEDED"
+        mock_clients["logs"].filter_log_events.assert_called_once()
+
     def test_get_arm64_buildspec(self, codebuild_service):
-        """Test ARM64 buildspec generation - native build with parallel ECR auth."""
+        """Test ARM64 buildspec generation - BuildKit build with ECR layer cache."""
         buildspec = codebuild_service._get_arm64_buildspec("test-ecr-uri")
 
         assert "version: 0.2" in buildspec
         assert "test-ecr-uri" in buildspec
 
-        # Verify native Docker build (no buildx)
-        assert "docker build -t bedrock-agentcore-arm64 ." in buildspec
-        assert "docker buildx build" not in buildspec
-        assert "linux/arm64" not in buildspec
-
-        # Verify parallel operations with multi-line shell block
-        assert "Starting parallel Docker build and ECR authentication..." in buildspec
-        assert "- |" in buildspec  # Multi-line block syntax
-        assert "docker build -t bedrock-agentcore-arm64 . &" in buildspec
-        assert "BUILD_PID=$!" in buildspec
-        assert "aws ecr get-login-password" in buildspec
-        assert "AUTH_PID=$!" in buildspec
-
-        # Verify explicit error handling
-        assert "wait $BUILD_PID" in buildspec
-        assert "if [ $? -ne 0 ]; then" in buildspec
-        assert "Docker build failed" in buildspec
-        assert "wait $AUTH_PID" in buildspec
-        assert "ECR authentication failed" in buildspec
-        assert "Both build and auth completed successfully" in buildspec
-
-        # Verify final steps
-        assert "Tagging image..." in buildspec
-        assert "docker tag bedrock-agentcore-arm64:latest" in buildspec
+        # ECR authentication happens before the build so the cache can be pulled
+        assert buildspec.index("aws ecr get-login-password") < buildspec.index("docker buildx build")
+        assert "docker buildx create --name agentcore-builder --driver docker-container --use" in buildspec
+
+        # Verify native ARM64 BuildKit build with registry cache
+        assert "docker buildx build --platform linux/arm64" in buildspec
+        assert "--cache-from type=registry,ref=test-ecr-uri:buildcache" in buildspec
+        assert "--cache-to type=registry,ref=test-ecr-uri:buildcache,mode=max" in buildspec
+        assert "image-manifest=true" in buildspec
+        assert "ignore-error=true" in buildspec
+
+        # Verify tags and push
+        assert '--tag test-ecr-uri:latest"' in buildspec
+        assert "--tag test-ecr-uri:$SOURCE_IMAGE_TAG" in buildspec
+        assert "--provenance=false --push ." in buildspec
+
+    def test_project_uses_local_docker_layer_cache(self, codebuild_service, mock_clients):
+        """Test projects and builds enable CodeBuild's local Docker layer cache."""
+        codebuild_service.create_or_update_project(
+            "test-agent", "test-ecr-uri", "arn:aws:iam::123456:role/test-role", "s3://bucket/source.zip"
+        )
+        codebuild_service.start_build("test-project", "s3://bucket/source.zip", "test-ecr-uri")
+
+        expected = {"type": "LOCAL", "modes": ["LOCAL_DOCKER_LAYER_CACHE"]}
+        assert mock_clients["codebuild"].create_project.call_args.kwargs["cache"] == expected
+        assert mock_clients["codebuild"].start_build.call_args.kwargs["cacheOverride"] == expected
 
     def test_parse_dockerignore_from_template(self, codebuild_service):
         """Test parsing .dockerignore patterns from template."""
@@ -472,7 +673,8 @@ node_modules
         """Test source upload with negation patterns in .dockerignore."""
         with (
             patch("os.walk") as mock_walk,
-            patch("zipfile.ZipFile") as mock_zipfile,
+            patch("bedrock_agentcore_starter_toolkit.services.codebuild.write_incremental_zip") as mock_write_zip,
+            patch("bedrock_agentcore_starter_toolkit.services.codebuild.hash_file", return_value="abc123"),
             patch("tempfile.NamedTemporaryFile") as mock_tempfile,
             patch("os.unlink") as mock_unlink,
             patch.object(codebuild_service, "_parse_dockerignore") as mock_parse,
@@ -483,20 +685,17 @@ node_modules
             # Mock dockerignore with negation patterns
             mock_parse.return_value = ["*.log", "!important.log", "*.tmp", "!keep.tmp"]
 
-            # Mock temp file and zipfile
+            # Mock temp file
             mock_temp = Mock()
             mock_temp.name = "/tmp/test.zip"
             mock_tempfile.return_value.__enter__.return_value = mock_temp
 
-            mock_zip = Mock()
-            mock_zipfile.return_value.__enter__.return_value = mock_zip
-
             # Test with fixed source.zip naming
             codebuild_service.upload_source("test-agent")
 
             # Verify correct files were included/excluded
-            zip_calls = mock_zip.write.call_args_list
-            written_files = [call[0][1] for call in zip_calls]
+            sources = mock_write_zip.call_args[0][0]
+            written_files = [file_rel for _, file_rel in sources]
 
             assert "important.log" in written_files  # Negated, should be included
             assert "keep.tmp" in written_files  # Negated, should be included
@@ -528,7 +727,8 @@ node_modules
         """Test source upload respecting .dockerignore patterns."""
         with (
             patch("os.walk") as mock_walk,
-            patch("zipfile.ZipFile") as mock_zipfile,
+            patch("bedrock_agentcore_starter_toolkit.services.codebuild.write_incremental_zip") as mock_write_zip,
+            patch("bedrock_agentcore_starter_toolkit.services.codebuild.hash_file", return_value="abc123"),
             patch("tempfile.NamedTemporaryFile") as mock_tempfile,
             patch("os.unlink") as mock_unlink,
             patch.object(codebuild_service, "_parse_dockerignore") as mock_parse,
@@ -539,20 +739,17 @@ node_modules
             # Mock dockerignore patterns
             mock_parse.return_value = ["*.pyc", ".git"]
 
-            # Mock temp file and zipfile
+            # Mock temp file
             mock_temp = Mock()
             mock_temp.name = "/tmp/test.zip"
             mock_tempfile.return_value.__enter__.return_value = mock_temp
 
-            mock_zip = Mock()
-            mock_zipfile.return_value.__enter__.return_value = mock_zip
-
             # Test with fixed source.zip naming
             codebuild_service.upload_source("test-agent")
 
             # Verify only non-ignored files were added to zip
-            zip_calls = mock_zip.write.call_args_list
-            written_files = [call[0][1] for call in zip_calls]  # Second arg is the archive name
+            sources = mock_write_zip.call_args[0][0]
+            written_files = [file_rel for _, file_rel in sources]
 
             assert "test.py" in written_files
             assert "README.md" in written_files
@@ -568,7 +765,8 @@ node_modules
 
         with (
             patch("os.walk") as mock_walk,
-            patch("zipfile.ZipFile") as mock_zipfile,
+            patch("bedrock_agentcore_starter_toolkit.services.codebuild.write_incremental_zip") as mock_write_zip,
+            patch("bedrock_agentcore_starter_toolkit.services.codebuild.hash_file", return_value="abc123"),
             patch("tempfile.NamedTemporaryFile") as mock_tempfile,
             patch("os.unlink") as mock_unlink,
             patch.object(codebuild_service, "_parse_dockerignore") as mock_parse,
@@ -579,14 +777,11 @@ node_modules
             # Mock dockerignore patterns
             mock_parse.return_value = ["*.pyc", ".git"]
 
-            # Mock temp file and zipfile
+            # Mock temp file
             mock_temp = Mock()
             mock_temp.name = "/tmp/test.zip"
             mock_tempfile.return_value.__enter__.return_value = mock_temp
 
-            mock_zip = Mock()
-            mock_zipfile.return_value.__enter__.return_value = mock_zip
-
             # Create a mock Dockerfile in the dockerfile_dir
             # We'll mock Path to return the right exists() value
             original_path = Path
@@ -611,8 +806,8 @@ node_modules
                 )
 
             # Verify files were added to zip
-            zip_calls = mock_zip.write.call_args_list
-            written_files = [call[0][1] for call in zip_calls]  # Second arg is the archive name
+            sources = mock_write_zip.call_args[0][0]
+            written_files = [file_rel for _, file_rel in sources]
 
             # Should include source files
             assert "agent.py" in written_files
@@ -621,9 +816,8 @@ node_modules
             # Should include Dockerfile from separate directory
             assert "Dockerfile" in written_files
 
-            # Verify the Dockerfile was added with correct arguments
-            dockerfile_call = [call for call in zip_calls if "Dockerfile" in str(call)]
-            assert len(dockerfile_call) == 1
+            # Verify the Dockerfile was added exactly once
+            assert written_files.count("Dockerfile") == 1
 
             # Verify cleanup was called
             mock_unlink.assert_called_once_with("/tmp/test.zip")
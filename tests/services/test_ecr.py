@@ -1,11 +1,13 @@
 """Tests for Bedrock AgentCore ECR service integration."""
 
 import pytest
+from botocore.exceptions import ClientError
 
 from bedrock_agentcore_starter_toolkit.services.ecr import (
     create_ecr_repository,
     deploy_to_ecr,
     get_account_id,
+    get_image_digest,
     get_or_create_ecr_repository,
     get_region,
     sanitize_ecr_repo_name,
@@ -56,6 +58,37 @@ class TestECRService:
             "123456789012.dkr.ecr.us-west-2.amazonaws.com/test-repo:latest"
         )
 
+    def test_deploy_to_ecr_with_image_tag(self, mock_boto3_clients, mock_container_runtime):
+        """Test the image is also pushed under its immutable tag, which is returned."""
+        mock_container_runtime.login.return_value = True
+        mock_container_runtime.tag.return_value = True
+        mock_container_runtime.push.return_value = True
+
+        ecr_tag = deploy_to_ecr(
+            "local-image:latest", "test-repo", "us-west-2", mock_container_runtime, image_tag="img-abc123"
+        )
+
+        repo = "123456789012.dkr.ecr.us-west-2.amazonaws.com/test-repo"
+        assert ecr_tag == f"{repo}:img-abc123"
+        assert [c.args[0] for c in mock_container_runtime.push.call_args_list] == [
+            f"{repo}:latest",
+            f"{repo}:img-abc123",
+        ]
+
+    def test_get_image_digest(self, mock_boto3_clients):
+        """Test a tag resolves to its manifest digest, and missing tags to None."""
+        ecr = mock_boto3_clients["ecr"]
+        ecr.describe_images.return_value = {"imageDetails": [{"imageDigest": "sha256:abc"}]}
+
+        repo = "123456789012.dkr.ecr.us-west-2.amazonaws.com/test-repo"
+        assert get_image_digest(repo, "img-abc123", "us-west-2") == "sha256:abc"
+        ecr.describe_images.assert_called_once_with(repositoryName="test-repo", imageIds=[{"imageTag": "img-abc123"}])
+
+        ecr.describe_images.side_effect = ClientError(
+            {"Error": {"Code": "ImageNotFoundException", "Message": "not found"}}, "DescribeImages"
+        )
+        assert get_image_digest(repo, "missing", "us-west-2") is None
+
     def test_ecr_auth_failure(self, mock_boto3_clients, mock_container_runtime):
         """Test ECR authentication error handling."""
         # Mock login failure
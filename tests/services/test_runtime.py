@@ -1,5 +1,7 @@
 """Tests for Bedrock AgentCore runtime service integration."""
 
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
@@ -13,6 +15,7 @@ from bedrock_agentcore_starter_toolkit.services.runtime import (
     _handle_aws_response,
     _handle_streaming_response,
     generate_session_id,
+    get_http_session,
 )
 
 
@@ -54,8 +57,8 @@ def test_handle_streaming_response_json_decode_error():
 
     # Mock response with invalid JSON in data line
     mock_response = Mock()
-    mock_response.iter_lines.return_value = [
-        b"data: {invalid json}",  # This will cause JSONDecodeError
+    mock_response.iter_content.return_value = [
+        b"data: {invalid json}\n\n",  # This will cause JSONDecodeError
     ]
 
     # The console.print is called but with different arguments than expected
@@ -896,7 +899,7 @@ class TestHttpBedrockAgentCoreClient:
         mock_response.raise_for_status.return_value = None
         mock_response.headers = {"content-type": "application/json"}
 
-        with patch("requests.post", return_value=mock_response) as mock_post:
+        with patch.object(client.session, "post", return_value=mock_response) as mock_post:
             result = client.invoke_endpoint(
                 agent_arn="arn:aws:bedrock_agentcore:us-west-2:123456789012:agent-runtime/test-id",
                 payload='{"message": "hello"}',  # JSON string as it comes from invoke_bedrock_agentcore
@@ -943,7 +946,7 @@ class TestHttpBedrockAgentCoreClient:
         mock_response.raise_for_status.return_value = None
         mock_response.headers = {"content-type": "application/json"}
 
-        with patch("requests.post", return_value=mock_response) as mock_post:
+        with patch.object(client.session, "post", return_value=mock_response) as mock_post:
             client.invoke_endpoint(
                 agent_arn="arn:aws:bedrock_agentcore:us-east-1:123456789012:agent-runtime/test-id",
                 payload='"test payload"',  # JSON string as it would come from invoke_bedrock_agentcore
@@ -965,7 +968,7 @@ class TestHttpBedrockAgentCoreClient:
         mock_response = Mock()
         mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("404 Not Found")
 
-        with patch("requests.post", return_value=mock_response):
+        with patch.object(client.session, "post", return_value=mock_response):
             with pytest.raises(requests.exceptions.HTTPError):
                 client.invoke_endpoint(
                     agent_arn="arn:aws:bedrock_agentcore:us-west-2:123456789012:agent-runtime/nonexistent",
@@ -978,7 +981,7 @@ class TestHttpBedrockAgentCoreClient:
         """Test handling of connection errors."""
         client = HttpBedrockAgentCoreClient("us-west-2")
 
-        with patch("requests.post", side_effect=requests.exceptions.ConnectionError("Connection failed")):
+        with patch.object(client.session, "post", side_effect=requests.exceptions.ConnectionError("Connection failed")):
             with pytest.raises(requests.exceptions.ConnectionError):
                 client.invoke_endpoint(
                     agent_arn="arn:aws:bedrock_agentcore:us-west-2:123456789012:agent-runtime/test-id",
@@ -991,7 +994,7 @@ class TestHttpBedrockAgentCoreClient:
         """Test handling of request timeout."""
         client = HttpBedrockAgentCoreClient("us-west-2")
 
-        with patch("requests.post", side_effect=requests.exceptions.Timeout("Request timed out")):
+        with patch.object(client.session, "post", side_effect=requests.exceptions.Timeout("Request timed out")):
             with pytest.raises(requests.exceptions.Timeout):
                 client.invoke_endpoint(
                     agent_arn="arn:aws:bedrock_agentcore:us-west-2:123456789012:agent-runtime/test-id",
@@ -1011,7 +1014,7 @@ class TestHttpBedrockAgentCoreClient:
         mock_response.raise_for_status.return_value = None
         mock_response.headers = {"content-type": "application/json"}
 
-        with patch("requests.post", return_value=mock_response):
+        with patch.object(client.session, "post", return_value=mock_response):
             with pytest.raises(ValueError, match="Empty response from agent endpoint"):
                 client.invoke_endpoint(
                     agent_arn="arn:aws:bedrock_agentcore:us-west-2:123456789012:agent-runtime/test-id",
@@ -1031,7 +1034,7 @@ class TestHttpBedrockAgentCoreClient:
         mock_response.raise_for_status.return_value = None
         mock_response.headers = {"content-type": "application/json"}
 
-        with patch("requests.post", return_value=mock_response) as mock_post:
+        with patch.object(client.session, "post", return_value=mock_response) as mock_post:
             # ARN with special characters that need encoding
             complex_arn = "arn:aws:bedrock_agentcore:us-west-2:123456789012:agent-runtime/test-id:with:colons"
 
@@ -1066,7 +1069,7 @@ class TestHttpBedrockAgentCoreClient:
             ("invalid json string", {"payload": "invalid json string"}),  # Invalid JSON - fallback
         ]
 
-        with patch("requests.post", return_value=mock_response) as mock_post:
+        with patch.object(client.session, "post", return_value=mock_response) as mock_post:
             for payload_input, expected_body in test_cases:
                 client.invoke_endpoint(
                     agent_arn="arn:aws:bedrock_agentcore:us-west-2:123456789012:agent-runtime/test-id",
@@ -1093,7 +1096,7 @@ class TestHttpBedrockAgentCoreClient:
         mock_response.raise_for_status.return_value = None
         mock_response.headers = {"content-type": "application/json"}
 
-        with patch("requests.post", return_value=mock_response) as mock_post:
+        with patch.object(client.session, "post", return_value=mock_response) as mock_post:
             # Instead of checking log, verify the behavior directly
             client.invoke_endpoint(
                 agent_arn="arn:aws:bedrock:us-west-2:123456789012:agent-runtime/test-id",
@@ -1108,6 +1111,187 @@ class TestHttpBedrockAgentCoreClient:
             assert body == {"payload": "invalid json payload"}
 
 
+class TestHttpSessionPool:
+    """Test the keep-alive session shared by the HTTP clients."""
+
+    def test_clients_share_connection_pool(self):
+        """Test clients created per invocation reuse one pooled adapter, each with its own session."""
+        first = HttpBedrockAgentCoreClient("us-west-2")
+        second = HttpBedrockAgentCoreClient("us-east-1")
+        local = LocalBedrockAgentCoreClient("http://localhost:8080")
+
+        assert len({id(first.session), id(second.session), id(local.session)}) == 3
+        adapter = get_http_session().get_adapter("https://bedrock-agentcore.us-west-2.amazonaws.com")
+        assert first.session.get_adapter("https://bedrock-agentcore.us-west-2.amazonaws.com") is adapter
+        assert second.session.get_adapter("https://bedrock-agentcore.us-east-1.amazonaws.com") is adapter
+        assert local.session.get_adapter("http://localhost:8080") is adapter
+
+    def test_pool_configuration(self):
+        """Test pool sizes select a separately configured adapter."""
+        client = HttpBedrockAgentCoreClient("us-west-2", pool_connections=2, pool_maxsize=50)
+
+        url = "https://bedrock-agentcore.us-west-2.amazonaws.com"
+        adapter = client.session.get_adapter(url)
+        assert adapter is get_http_session(2, 50).get_adapter(url)
+        assert adapter is not get_http_session().get_adapter(url)
+        assert adapter._pool_connections == 2
+        assert adapter._pool_maxsize == 50
+
+    def test_cookies_not_carried_between_invocations(self):
+        """Test a cookie set by one invocation's response is not sent with the next one."""
+        received = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                received.append(self.headers.get("Cookie"))
+                self.rfile.read(int(self.headers["Content-Length"]))
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Set-Cookie", "AWSALB=sticky; Path=/")
+                self.send_header("Content-Length", "2")
+                self.end_headers()
+                self.wfile.write(b"{}")
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            endpoint = f"http://127.0.0.1:{server.server_address[1]}"
+            client = LocalBedrockAgentCoreClient(endpoint)
+            client.invoke_endpoint("session-1", "{}", "token-1", "callback")
+            client.invoke_endpoint("session-2", "{}", "token-2", "callback")
+            LocalBedrockAgentCoreClient(endpoint).invoke_endpoint("session-3", "{}", "token-3", "callback")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert received == [None, None, None]
+        assert len(client.session.cookies) == 0
+
+    def test_custom_session(self):
+        """Test a caller-provided session is used as-is."""
+        session = requests.Session()
+        assert LocalBedrockAgentCoreClient("http://localhost:8080", session=session).session is session
+
+    def test_response_released_after_invoke(self):
+        """Test the response is closed so its connection goes back to the pool."""
+        client = HttpBedrockAgentCoreClient("us-west-2", session=Mock())
+        mock_response = Mock()
+        mock_response.content = b"ok"
+        mock_response.text = "ok"
+        mock_response.headers = {"content-type": "application/json"}
+        client.session.post.return_value = mock_response
+
+        client.invoke_endpoint(
+            agent_arn="arn:aws:bedrock_agentcore:us-west-2:123456789012:agent-runtime/test-id",
+            payload="{}",
+            session_id="session-123",
+            bearer_token="token-456",
+        )
+
+        mock_response.close.assert_called_once()
+
+
+class TestInvokeStream:
+    """Test streaming invocation as a generator of events."""
+
+    AGENT_ARN = "arn:aws:bedrock_agentcore:us-west-2:123456789012:agent-runtime/test-id"
+
+    @staticmethod
+    def sse_response(chunks):
+        """Mock a streaming HTTP response delivering the given chunks."""
+        response = Mock()
+        response.headers = {"content-type": "text/event-stream"}
+        response.iter_content.return_value = iter(chunks)
+        return response
+
+    def test_http_events_are_yielded_lazily(self):
+        """Test events are yielded as they arrive and the request is sent on first iteration."""
+        client = HttpBedrockAgentCoreClient("us-west-2", session=Mock())
+        response = self.sse_response([b'data: "Hel', b'lo"\n\ndata: {"tool": "calc"}\n\n', b"data: not json\n\n"])
+        client.session.post.return_value = response
+
+        events = client.invoke_stream(self.AGENT_ARN, "{}", "session-123", "token-456")
+        client.session.post.assert_not_called()
+
+        assert next(events) == "Hello"
+        assert list(events) == [{"tool": "calc"}, "not json"]
+        assert client.session.post.call_args.kwargs["stream"] is True
+        response.close.assert_called_once()
+
+    def test_http_stream_cancelled(self):
+        """Test closing the generator early closes the response."""
+        client = HttpBedrockAgentCoreClient("us-west-2", session=Mock())
+        response = self.sse_response([b'data: "a"\n\n', b'data: "b"\n\n'])
+        client.session.post.return_value = response
+
+        for event in client.invoke_stream(self.AGENT_ARN, "{}", "session-123", "token-456"):
+            assert event == "a"
+            break
+
+        response.close.assert_called_once()
+
+    def test_http_non_streaming_response(self):
+        """Test a plain JSON response is yielded as a single event."""
+        client = LocalBedrockAgentCoreClient("http://localhost:8080", session=Mock())
+        response = Mock()
+        response.headers = {"content-type": "application/json"}
+        response.content = b'{"result": 42}'
+        response.text = '{"result": 42}'
+        client.session.post.return_value = response
+
+        events = list(client.invoke_stream("session-123", "{}", "token", "http://callback"))
+
+        assert events == [{"result": 42}]
+        response.close.assert_called_once()
+
+    def test_http_error(self):
+        """Test an HTTP error status is raised and the response is closed."""
+        client = HttpBedrockAgentCoreClient("us-west-2", session=Mock())
+        response = Mock()
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError("403 Forbidden")
+        client.session.post.return_value = response
+
+        with pytest.raises(requests.exceptions.HTTPError):
+            list(client.invoke_stream(self.AGENT_ARN, "{}", "session-123", "token-456"))
+        response.close.assert_called_once()
+
+    def test_aws_event_stream(self, mock_boto3_clients):
+        """Test the boto3 client streams events from the response body."""
+        body = Mock(spec=["_raw_stream", "close"])
+        body._raw_stream.stream.return_value = iter([b'data: "Hi"\n\ndata: [1, 2]\n', b"\n"])
+        mock_boto3_clients["bedrock_agentcore"].invoke_agent_runtime.return_value = {
+            "contentType": "text/event-stream",
+            "response": body,
+        }
+
+        client = BedrockAgentCoreClient("us-west-2")
+        events = client.invoke_stream(self.AGENT_ARN, "{}", "session-123", custom_headers={"X-Test": "1"})
+
+        assert list(events) == ["Hi", [1, 2]]
+        body.close.assert_called_once()
+        events_api = mock_boto3_clients["bedrock_agentcore"].meta.events
+        events_api.register_first.assert_called_once()
+        events_api.unregister.assert_called_once()
+
+    def test_aws_non_streaming_response(self, mock_boto3_clients):
+        """Test a non-streaming boto3 response is yielded as a single decoded event."""
+        body = Mock()
+        body.read.return_value = b'{"result": "done"}'
+        mock_boto3_clients["bedrock_agentcore"].invoke_agent_runtime.return_value = {
+            "contentType": "application/json",
+            "response": body,
+        }
+
+        client = BedrockAgentCoreClient("us-west-2")
+
+        assert list(client.invoke_stream(self.AGENT_ARN, "{}", "session-123")) == [{"result": "done"}]
+        body.close.assert_called_once()
+
+
 class TestLocalBedrockAgentCoreClient:
     """Test LocalBedrockAgentCoreClient functionality."""
 
@@ -1131,7 +1315,7 @@ class TestLocalBedrockAgentCoreClient:
         mock_response.headers = {"content-type": "application/json"}
 
         with (
-            patch("requests.post", return_value=mock_response) as mock_post,
+            patch.object(client.session, "post", return_value=mock_response) as mock_post,
             patch(
                 "bedrock_agentcore_starter_toolkit.services.runtime._handle_http_response",
                 return_value={"response": "test response"},
@@ -1184,7 +1368,7 @@ class TestLocalBedrockAgentCoreClient:
         mock_response.headers = {"content-type": "application/json"}
 
         with (
-            patch("requests.post", return_value=mock_response) as mock_post,
+            patch.object(client.session, "post", return_value=mock_response) as mock_post,
             patch(
                 "bedrock_agentcore_starter_toolkit.services.runtime._handle_http_response",
                 return_value={"response": "wrapped"},
@@ -1221,7 +1405,7 @@ class TestLocalBedrockAgentCoreClient:
         mock_response.headers = {"content-type": "application/json"}
 
         with (
-            patch("requests.post", return_value=mock_response) as mock_post,
+            patch.object(client.session, "post", return_value=mock_response) as mock_post,
             patch(
                 "bedrock_agentcore_starter_toolkit.services.runtime._handle_http_response",
                 return_value={"response": "local response with custom headers"},
@@ -1272,7 +1456,7 @@ class TestLocalBedrockAgentCoreClient:
         mock_response.headers = {"content-type": "application/json"}
 
         with (
-            patch("requests.post", return_value=mock_response) as mock_post,
+            patch.object(client.session, "post", return_value=mock_response) as mock_post,
             patch(
                 "bedrock_agentcore_starter_toolkit.services.runtime._handle_http_response",
                 return_value={"response": "local response"},
@@ -1319,7 +1503,7 @@ class TestLocalBedrockAgentCoreClient:
         mock_response.headers = {"content-type": "application/json"}
 
         with (
-            patch("requests.post", return_value=mock_response) as mock_post,
+            patch.object(client.session, "post", return_value=mock_response) as mock_post,
             patch(
                 "bedrock_agentcore_starter_toolkit.services.runtime._handle_http_response",
                 return_value={"response": "local response"},
@@ -1357,7 +1541,9 @@ class TestLocalBedrockAgentCoreClient:
         """Test LocalBedrockAgentCoreClient error handling."""
         client = LocalBedrockAgentCoreClient("http://localhost:8080")
 
-        with patch("requests.post", side_effect=requests.exceptions.ConnectionError("Connection refused")):
+        with patch.object(
+            client.session, "post", side_effect=requests.exceptions.ConnectionError("Connection refused")
+        ):
             # Just test the exception is propagated
             with pytest.raises(requests.exceptions.ConnectionError, match="Connection refused"):
                 client.invoke_endpoint(
@@ -1375,10 +1561,10 @@ class TestHandleStreamingResponse:
         """Test streaming response with data: prefixed lines."""
         # Mock response object with JSON data chunks
         mock_response = Mock()
-        mock_response.iter_lines.return_value = [
-            b'data: "Hello from agent"',
-            b'data: "This is a streaming response"',
-            b'data: "Final chunk"',
+        mock_response.iter_content.return_value = [
+            b'data: "Hello from agent"\n\ndata: "This is a str',
+            b'eaming response"\n',
+            b'\ndata: "Final chunk"\n\n',
         ]
 
         # Mock console to capture print calls
@@ -1394,6 +1580,7 @@ class TestHandleStreamingResponse:
             mock_console.print.assert_any_call("This is a streaming response", end="")
             mock_console.print.assert_any_call("Final chunk", end="")
             mock_console.print.assert_any_call()  # Final newline call
+            mock_response.iter_content.assert_called_once_with(chunk_size=None)
 
     def test_handle_aws_response_byte_parsing(self):
         """Test _handle_aws_response properly parses byte strings."""
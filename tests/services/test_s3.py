@@ -6,8 +6,13 @@ import pytest
 from botocore.exceptions import ClientError
 
 from bedrock_agentcore_starter_toolkit.services.s3 import (
+    MULTIPART_PART_SIZE,
+    MultipartUploadStream,
+    StreamingUploadError,
     create_s3_bucket,
+    get_object_digest,
     get_or_create_s3_bucket,
+    multipart_part_size,
     sanitize_s3_bucket_name,
 )
 
@@ -165,3 +170,104 @@ class TestCreateS3Bucket:
 
         with pytest.raises(RuntimeError, match="Failed to create S3 bucket"):
             create_s3_bucket("test-bucket", "us-east-1", "123456789012")
+
+
+class TestMultipartUploadStream:
+    """Test streaming uploads to S3."""
+
+    def _client(self):
+        client = Mock()
+        client.create_multipart_upload.return_value = {"UploadId": "upload-1"}
+        client.upload_part.side_effect = lambda **kwargs: {"ETag": f"etag-{kwargs['PartNumber']}"}
+        return client
+
+    def test_small_object_uses_put_object(self):
+        """Test data smaller than one part is sent with a single put_object."""
+        client = self._client()
+        stream = MultipartUploadStream(client, "bucket", "agent/deployment.zip", "123456789012", part_size=10)
+        stream.write(b"abc")
+
+        assert stream.complete() == "s3://bucket/agent/deployment.zip"
+        client.put_object.assert_called_once_with(
+            Bucket="bucket",
+            Key="agent/deployment.zip",
+            Body=b"abc",
+            Metadata={},
+            ExpectedBucketOwner="123456789012",
+        )
+        client.create_multipart_upload.assert_not_called()
+
+    def test_parts_uploaded_in_order(self):
+        """Test full parts are uploaded as written and completed in part order."""
+        client = self._client()
+        stream = MultipartUploadStream(client, "bucket", "key", "123456789012", part_size=4, max_concurrency=2)
+        for chunk in (b"aaa", b"abbb", b"bccc", b"cd"):
+            stream.write(chunk)
+        stream.complete()
+
+        bodies = {call.kwargs["PartNumber"]: call.kwargs["Body"] for call in client.upload_part.call_args_list}
+        assert bodies == {1: b"aaaa", 2: b"bbbb", 3: b"cccc", 4: b"d"}
+        client.complete_multipart_upload.assert_called_once_with(
+            Bucket="bucket",
+            Key="key",
+            UploadId="upload-1",
+            MultipartUpload={"Parts": [{"PartNumber": n, "ETag": f"etag-{n}"} for n in range(1, 5)]},
+            ExpectedBucketOwner="123456789012",
+        )
+        assert stream.bytes_written == 13
+
+    def test_failed_part_aborts_upload(self):
+        """Test a failed part surfaces as StreamingUploadError and aborts the upload."""
+        client = self._client()
+        client.upload_part.side_effect = ClientError({"Error": {"Code": "AccessDenied"}}, "UploadPart")
+        stream = MultipartUploadStream(client, "bucket", "key", "123456789012", part_size=4, max_concurrency=1)
+
+        # The failure surfaces on whichever call notices it first
+        with pytest.raises(StreamingUploadError, match="upload_part"):
+            stream.write(b"aaaabbbb")
+            stream.complete()
+        stream.abort()
+
+        client.abort_multipart_upload.assert_called_once_with(
+            Bucket="bucket", Key="key", UploadId="upload-1", ExpectedBucketOwner="123456789012"
+        )
+        client.complete_multipart_upload.assert_not_called()
+
+    def test_create_failure_raises_streaming_error(self):
+        """Test a refused multipart upload raises StreamingUploadError on write."""
+        client = self._client()
+        client.create_multipart_upload.side_effect = ClientError(
+            {"Error": {"Code": "AccessDenied"}}, "CreateMultipartUpload"
+        )
+        stream = MultipartUploadStream(client, "bucket", "key", "123456789012", part_size=4)
+
+        with pytest.raises(StreamingUploadError, match="create_multipart_upload"):
+            stream.write(b"aaaa")
+        stream.abort()
+        client.abort_multipart_upload.assert_not_called()
+
+    def test_multipart_part_size(self):
+        """Test part size grows so large objects stay within the part count limit."""
+        assert multipart_part_size(1024) == MULTIPART_PART_SIZE
+        assert multipart_part_size(200 * 1024**3) * 10000 >= 200 * 1024**3
+
+
+class TestGetObjectDigest:
+    """Test reading package digests from object metadata."""
+
+    def test_returns_recorded_digest(self):
+        """Test the digest is read from user metadata."""
+        client = Mock()
+        client.head_object.return_value = {"Metadata": {"agentcore-sha256": "abc123"}}
+
+        assert get_object_digest(client, "bucket", "key", "123456789012") == "abc123"
+        client.head_object.assert_called_once_with(Bucket="bucket", Key="key", ExpectedBucketOwner="123456789012")
+
+    def test_missing_object_or_metadata(self):
+        """Test a missing object or an object without a digest returns None."""
+        client = Mock()
+        client.head_object.return_value = {"Metadata": {}}
+        assert get_object_digest(client, "bucket", "key", "123456789012") is None
+
+        client.head_object.side_effect = ClientError({"Error": {"Code": "404"}}, "HeadObject")
+        assert get_object_digest(client, "bucket", "key", "123456789012") is None
@@ -0,0 +1,163 @@
+"""Tests for raw zip entry helpers."""
+
+import io
+import threading
+import time
+import zipfile
+
+import pytest
+
+from bedrock_agentcore_starter_toolkit.utils.runtime.archive import (
+    RawZipReader,
+    ZipWriter,
+    deflate_file,
+    hash_file,
+    ordered_map,
+    splice_zips,
+)
+
+
+class TestZipWriter:
+    """Test ZipWriter functionality."""
+
+    def test_add_file_produces_valid_zip(self, tmp_path):
+        """Test files compressed by the writer read back with zipfile."""
+        source = tmp_path / "agent.py"
+        source.write_text("print('hello')\n" * 100)
+
+        output = tmp_path / "out.zip"
+        with ZipWriter(output) as writer:
+            digest = writer.add_file(source, "agent.py")
+            writer.add_file(source, "pkg/ünicode.py")
+
+        assert digest == hash_file(source)
+        with zipfile.ZipFile(output) as zf:
+            assert zf.testzip() is None
+            assert zf.read("agent.py") == source.read_bytes()
+            assert zf.read("pkg/ünicode.py") == source.read_bytes()
+
+    def test_copy_entry_preserves_payload(self, tmp_path):
+        """Test raw copies keep the compressed bytes and decompress correctly."""
+        src_zip = tmp_path / "src.zip"
+        with zipfile.ZipFile(src_zip, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("a.txt", "alpha" * 1000)
+            zf.writestr("b.txt", "beta")
+
+        output = tmp_path / "out.zip"
+        with RawZipReader(src_zip) as reader, ZipWriter(output) as writer:
+            for info in reader.infolist():
+                written = writer.copy_entry(reader, info)
+                assert written.compress_size == info.compress_size
+                assert written.CRC == info.CRC
+
+        with zipfile.ZipFile(output) as zf:
+            assert zf.testzip() is None
+            assert zf.read("a.txt") == b"alpha" * 1000
+            assert zf.read("b.txt") == b"beta"
+
+    def test_writes_to_unseekable_stream(self, tmp_path):
+        """Test the writer only appends, so it can target a plain stream."""
+        source = tmp_path / "agent.py"
+        source.write_text("print('hello')")
+
+        class AppendOnly(io.RawIOBase):
+            def __init__(self):
+                self.data = bytearray()
+
+            def writable(self):
+                return True
+
+            def write(self, b):
+                self.data += b
+                return len(b)
+
+        stream = AppendOnly()
+        writer = ZipWriter(stream)
+        writer.add_file(source, "agent.py")
+        writer.close()
+
+        with zipfile.ZipFile(io.BytesIO(bytes(stream.data))) as zf:
+            assert zf.read("agent.py") == b"print('hello')"
+
+    def test_duplicate_entry_rejected(self, tmp_path):
+        """Test duplicate names raise instead of producing an ambiguous archive."""
+        source = tmp_path / "agent.py"
+        source.write_text("x")
+
+        with ZipWriter(tmp_path / "out.zip") as writer:
+            writer.add_file(source, "agent.py")
+            with pytest.raises(ValueError, match="Duplicate"):
+                writer.add_file(source, "agent.py")
+
+    def test_deflate_file_checksums(self, tmp_path):
+        """Test CRC, size and digest are computed in one pass."""
+        source = tmp_path / "data.bin"
+        source.write_bytes(b"\x00\x01" * 5000)
+
+        compressed = deflate_file(source)
+        try:
+            assert compressed.file_size == 10000
+            assert compressed.compress_size == len(b"".join(compressed.iter_chunks()))
+            assert compressed.sha256 == hash_file(source)
+        finally:
+            compressed.close()
+
+
+class TestSpliceZips:
+    """Test splice_zips functionality."""
+
+    def test_later_sources_override_and_filter(self, tmp_path):
+        """Test name filters apply per source and later sources win."""
+        first, second = tmp_path / "first.zip", tmp_path / "second.zip"
+        with zipfile.ZipFile(first, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("b.py", "old")
+            zf.writestr("c.py", "dropped")
+        with zipfile.ZipFile(second, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("b.py", "new")
+            zf.writestr("a.py", "a")
+
+        output = tmp_path / "out.zip"
+        taken = splice_zips([(first, ["b.py"]), (second, None)], output)
+
+        assert taken == {first: ["b.py"], second: ["b.py", "a.py"]}
+        with zipfile.ZipFile(output) as zf:
+            assert zf.namelist() == ["a.py", "b.py"]
+            assert zf.read("b.py") == b"new"
+
+    def test_missing_name_raises(self, tmp_path):
+        """Test requesting an absent entry raises KeyError."""
+        source = tmp_path / "source.zip"
+        with zipfile.ZipFile(source, "w") as zf:
+            zf.writestr("a.py", "a")
+
+        with pytest.raises(KeyError, match="missing.py"):
+            splice_zips([(source, ["missing.py"])], tmp_path / "out.zip")
+
+
+class TestOrderedMap:
+    """Test ordered_map functionality."""
+
+    def test_preserves_input_order(self):
+        """Test results come back in input order even when later items finish first."""
+
+        def slow_first(i):
+            time.sleep(0.05 if i == 0 else 0)
+            return i * 2
+
+        assert list(ordered_map(slow_first, range(10), workers=4)) == [i * 2 for i in range(10)]
+
+    def test_single_worker_runs_inline(self):
+        """Test one worker runs on the calling thread."""
+        caller = threading.get_ident()
+        assert list(ordered_map(lambda _: threading.get_ident(), range(3), workers=1)) == [caller] * 3
+
+    def test_propagates_errors(self):
+        """Test an exception raised by a worker surfaces to the caller."""
+
+        def fail_on_three(i):
+            if i == 3:
+                raise OSError("boom")
+            return i
+
+        with pytest.raises(OSError, match="boom"):
+            list(ordered_map(fail_on_three, range(10), workers=2))
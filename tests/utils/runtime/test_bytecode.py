@@ -0,0 +1,70 @@
+"""Tests for precompiled bytecode layers."""
+
+import importlib.util
+import sys
+import zipfile
+from unittest.mock import Mock, patch
+
+from bedrock_agentcore_starter_toolkit.utils.runtime.bytecode import (
+    build_bytecode_layer,
+    find_interpreter,
+    source_for_bytecode,
+)
+
+CURRENT = f"{sys.version_info.major}.{sys.version_info.minor}"
+
+
+class TestFindInterpreter:
+    """Test find_interpreter functionality."""
+
+    def test_current_interpreter_matches(self):
+        """Test the running interpreter is used when its version matches."""
+        assert find_interpreter(CURRENT) == sys.executable
+
+    @patch("bedrock_agentcore_starter_toolkit.utils.runtime.bytecode.subprocess.run")
+    @patch("bedrock_agentcore_starter_toolkit.utils.runtime.bytecode.shutil.which")
+    def test_falls_back_to_uv(self, mock_which, mock_run):
+        """Test uv is asked for an interpreter when none is on PATH."""
+        mock_which.side_effect = lambda name: "/usr/bin/uv" if name == "uv" else None
+        mock_run.return_value = Mock(returncode=0, stdout="/opt/python3.99/bin/python\n")
+
+        assert find_interpreter("3.99") == "/opt/python3.99/bin/python"
+        assert mock_run.call_args[0][0] == ["uv", "python", "find", "3.99"]
+
+    @patch("bedrock_agentcore_starter_toolkit.utils.runtime.bytecode.shutil.which", return_value=None)
+    def test_none_available(self, mock_which):
+        """Test None is returned when no interpreter can be found."""
+        assert find_interpreter("3.99") is None
+
+
+class TestBuildBytecodeLayer:
+    """Test build_bytecode_layer functionality."""
+
+    def test_source_for_bytecode(self):
+        """Test __pycache__ entries map back to their modules."""
+        assert source_for_bytecode("pkg/__pycache__/mod.cpython-311.pyc") == "pkg/mod.py"
+        assert source_for_bytecode("__pycache__/agent.cpython-311.pyc") == "agent.py"
+        assert source_for_bytecode("pkg/mod.py") is None
+
+    def test_compiles_unchecked_hash_pycs(self, tmp_path):
+        """Test modules compile to deterministic unchecked-hash pycs and bad modules are skipped."""
+        archive = tmp_path / "code.zip"
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("agent.py", "import pkg\n")
+            zf.writestr("pkg/__init__.py", "VALUE = 1\n")
+            zf.writestr("pkg/legacy.py", "print 'python 2'\n")
+            zf.writestr("pkg/data.txt", "not python")
+
+        first = build_bytecode_layer(archive, tmp_path / "first.zip", sys.executable, workers=2)
+        second = build_bytecode_layer(archive, tmp_path / "second.zip", sys.executable)
+
+        tag = sys.implementation.cache_tag
+        assert first.modules == 2
+        assert first.compile_seconds > 0
+        assert first.path.read_bytes() == second.path.read_bytes()
+        with zipfile.ZipFile(first.path) as zf:
+            assert zf.namelist() == [f"__pycache__/agent.{tag}.pyc", f"pkg/__pycache__/__init__.{tag}.pyc"]
+            pyc = zf.read(f"pkg/__pycache__/__init__.{tag}.pyc")
+        assert pyc[:4] == importlib.util.MAGIC_NUMBER
+        # PEP 552 flags: hash-based (0b01), check_source unset (0b10)
+        assert int.from_bytes(pyc[4:8], "little") == 0b01
@@ -13,6 +13,7 @@ from bedrock_agentcore_starter_toolkit.utils.runtime.config import (
     is_project_config_format,
     load_config,
     merge_agent_config,
+    save_agent_config,
     save_config,
 )
 from bedrock_agentcore_starter_toolkit.utils.runtime.schema import (
@@ -151,6 +152,26 @@ class TestProjectConfiguration:
         assert loaded_config.agents["chat-agent"].name == "chat-agent"
         assert loaded_config.agents["code-assistant"].name == "code-assistant"
 
+    def test_save_agent_config_keeps_other_agents(self, tmp_path):
+        """Test saving one agent from a stale copy does not undo another agent's saved changes."""
+        fixture_path = Path(__file__).parent.parent.parent / "fixtures" / "project_config_multiple.yaml"
+        config_path = tmp_path / ".bedrock_agentcore.yaml"
+        save_config(load_config(fixture_path), config_path)
+
+        # Two concurrent launches each hold their own copy of the project config
+        chat = load_config(config_path).agents["chat-agent"]
+        code = load_config(config_path).agents["code-assistant"]
+
+        chat.bedrock_agentcore.agent_id = "chat-id"
+        save_agent_config(chat, config_path)
+        code.bedrock_agentcore.agent_id = "code-id"
+        save_agent_config(code, config_path)
+
+        saved = load_config(config_path)
+        assert saved.agents["chat-agent"].bedrock_agentcore.agent_id == "chat-id"
+        assert saved.agents["code-assistant"].bedrock_agentcore.agent_id == "code-id"
+        assert [p.name for p in tmp_path.iterdir()] == [".bedrock_agentcore.yaml"]
+
     def test_is_project_config_format_detection(self):
         """Test project config format detection."""
 
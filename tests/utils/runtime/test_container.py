@@ -341,6 +341,90 @@ CMD ["python", "/app/{{ agent_file }}"]
                 context = call_args[1] if call_args[1] else call_args[0][0] if call_args[0] else {}
                 assert context.get("has_current_package") is True
 
+    def test_generate_multistage_dockerfile(self, tmp_path):
+        """Test the multistage template installs into a cached venv and ships a slim runtime stage."""
+        from bedrock_agentcore_starter_toolkit.utils.runtime.entrypoint import DependencyInfo
+
+        agent_file = tmp_path / "test_agent.py"
+        agent_file.write_text("# test agent")
+
+        with patch.object(ContainerRuntime, "_is_runtime_installed", return_value=True):
+            runtime = ContainerRuntime("docker")
+
+        with (
+            patch(
+                "bedrock_agentcore_starter_toolkit.utils.runtime.container.detect_dependencies",
+                return_value=DependencyInfo(file="requirements.txt", type="requirements"),
+            ),
+            patch("bedrock_agentcore_starter_toolkit.utils.runtime.container.get_python_version", return_value="3.11"),
+            patch.object(runtime, "_get_current_platform", return_value="linux/arm64"),
+        ):
+            dockerfile_path = runtime.generate_dockerfile(
+                agent_path=agent_file,
+                output_dir=tmp_path,
+                agent_name="test_agent",
+                aws_region="us-west-2",
+                dockerfile_template="multistage",
+            )
+
+        content = dockerfile_path.read_text()
+        assert "FROM ghcr.io/astral-sh/uv:python3.11-bookworm-slim AS builder" in content
+        assert "RUN --mount=type=cache,target=/root/.cache/uv \\\n    uv pip install -r requirements.txt" in content
+        assert "--invalidation-mode unchecked-hash" in content
+        runtime_stage = content.split("FROM python:3.11-slim-bookworm", 1)[1]
+        assert "COPY --from=builder /opt/venv /opt/venv" in runtime_stage
+        assert "COPY --from=builder /app /app" in runtime_stage
+        assert "uv pip install" not in runtime_stage
+        assert "AWS_REGION=us-west-2" in runtime_stage
+        assert 'CMD ["opentelemetry-instrument", "python", "-m", "test_agent"]' in runtime_stage
+
+    @pytest.mark.parametrize("dockerfile_template", ["standard", "multistage"])
+    def test_generate_dockerfile_installs_from_wheelhouse(self, tmp_path, dockerfile_template):
+        """Test a built wheelhouse is installed offline, including the OpenTelemetry distro it holds."""
+        from bedrock_agentcore_starter_toolkit.utils.runtime.entrypoint import DependencyInfo
+
+        agent_file = tmp_path / "test_agent.py"
+        agent_file.write_text("# test agent")
+        (tmp_path / "wheelhouse").mkdir()
+        (tmp_path / "wheelhouse" / "requirements.lock").write_text("aws-opentelemetry-distro==0.10.1\n")
+
+        with patch.object(ContainerRuntime, "_is_runtime_installed", return_value=True):
+            runtime = ContainerRuntime("docker")
+
+        with (
+            patch(
+                "bedrock_agentcore_starter_toolkit.utils.runtime.container.detect_dependencies",
+                return_value=DependencyInfo(file="requirements.txt", type="requirements"),
+            ),
+            patch("bedrock_agentcore_starter_toolkit.utils.runtime.container.get_python_version", return_value="3.11"),
+            patch.object(runtime, "_get_current_platform", return_value="linux/arm64"),
+        ):
+            dockerfile_path = runtime.generate_dockerfile(
+                agent_path=agent_file,
+                output_dir=tmp_path,
+                agent_name="test_agent",
+                dockerfile_template=dockerfile_template,
+            )
+
+        content = dockerfile_path.read_text()
+        assert "COPY wheelhouse wheelhouse" in content
+        assert "uv pip install --no-index --find-links wheelhouse -r wheelhouse/requirements.lock" in content
+        assert "-r requirements.txt" not in content
+        assert "aws-opentelemetry-distro" not in content
+
+    def test_generate_dockerfile_unknown_template(self, tmp_path):
+        """Test an unknown template mode is rejected."""
+        with patch.object(ContainerRuntime, "_is_runtime_installed", return_value=True):
+            runtime = ContainerRuntime("docker")
+
+        with pytest.raises(ValueError, match="Unknown Dockerfile template"):
+            runtime.generate_dockerfile(
+                agent_path=tmp_path / "agent.py",
+                output_dir=tmp_path,
+                agent_name="test_agent",
+                dockerfile_template="distroless",
+            )
+
     def test_is_runtime_installed_success(self):
         """Test _is_runtime_installed with successful runtime detection."""
         runtime = ContainerRuntime.__new__(ContainerRuntime)  # Create instance without __init__
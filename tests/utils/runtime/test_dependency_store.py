@@ -0,0 +1,110 @@
+"""Tests for the shared dependency store."""
+
+import zipfile
+
+import pytest
+
+from bedrock_agentcore_starter_toolkit.utils.runtime.dependency_store import (
+    STORE_ENV_VAR,
+    DependencyStore,
+    Distribution,
+    parse_resolved_requirements,
+)
+
+PLATFORM = "aarch64-manylinux2014"
+
+
+def install(target_dir, name, version, files):
+    """Lay out a fake installed distribution with a RECORD file."""
+    dist_info = f"{name}-{version}.dist-info"
+    (target_dir / dist_info).mkdir(parents=True)
+    for path, content in files.items():
+        (target_dir / path).parent.mkdir(parents=True, exist_ok=True)
+        (target_dir / path).write_text(content)
+    rows = [f"{path},sha256=x,1" for path in files] + [f"{dist_info}/RECORD,,"]
+    (target_dir / dist_info / "RECORD").write_text("\n".join(rows) + "\n")
+
+
+class TestParseResolvedRequirements:
+    """Test parsing resolved requirement files."""
+
+    def test_parses_pins_and_direct_references(self):
+        """Test pins, extras, comments and direct references are parsed and sorted."""
+        text = (
+            "# This file was autogenerated by uv\n"
+            "Requests[socks]==2.31.0 \\\n"
+            "    # via -r requirements.txt\n"
+            "my_pkg @ https://example.com/my_pkg-1.0-py3-none-any.whl\n"
+            "charset-normalizer==3.3.2  # via requests\n"
+            "--index-url https://pypi.org/simple\n"
+        )
+
+        dists = parse_resolved_requirements(text)
+
+        assert [(d.name, d.version) for d in dists][0] == ("charset-normalizer", "3.3.2")
+        assert dists[1].name == "my-pkg"
+        assert dists[1].version.startswith("url-")
+        assert dists[2] == Distribution("requests", "2.31.0", "Requests[socks]==2.31.0")
+
+    def test_rejects_unpinned_requirement(self):
+        """Test an unresolved requirement is rejected."""
+        with pytest.raises(ValueError, match="Unsupported requirement"):
+            parse_resolved_requirements("requests>=2\n")
+
+
+class TestDependencyStore:
+    """Test DependencyStore functionality."""
+
+    def test_for_project_honours_env_override(self, tmp_path, monkeypatch):
+        """Test the store location defaults to the project and can be overridden."""
+        monkeypatch.delenv(STORE_ENV_VAR, raising=False)
+        assert DependencyStore.for_project(tmp_path).root == tmp_path / ".bedrock_agentcore" / "dependency-store"
+
+        monkeypatch.setenv(STORE_ENV_VAR, str(tmp_path / "shared"))
+        assert DependencyStore.for_project(tmp_path).root == tmp_path / "shared"
+
+    def test_add_from_target(self, tmp_path):
+        """Test an install target is split into one fragment per distribution."""
+        target = tmp_path / "target"
+        install(target, "alpha", "1.0", {"alpha/__init__.py": "a", "alpha/data.txt": "d" * 1000})
+        install(target, "beta", "2.0", {"beta.py": "b"})
+        (target / "alpha" / "__pycache__").mkdir()
+        (target / "alpha" / "__pycache__" / "x.pyc").write_bytes(b"compiled")
+        alpha = Distribution("alpha", "1.0", "alpha==1.0")
+        beta = Distribution("beta", "2.0", "beta==2.0")
+
+        store = DependencyStore(tmp_path / "store")
+        assert store.missing([alpha, beta], PLATFORM, "3.11") == [alpha, beta]
+
+        store.add_from_target(target, [alpha, beta], PLATFORM, "3.11", workers=2)
+
+        assert store.missing([alpha, beta], PLATFORM, "3.11") == []
+        assert store.missing([alpha], PLATFORM, "3.12") == [alpha]
+        with zipfile.ZipFile(store.fragment(beta, PLATFORM, "3.11")) as zf:
+            assert zf.namelist() == ["beta-2.0.dist-info/RECORD", "beta.py"]
+        with zipfile.ZipFile(store.fragment(alpha, PLATFORM, "3.11")) as zf:
+            assert zf.testzip() is None
+            assert zf.namelist() == sorted(zf.namelist())
+            assert "alpha/__pycache__/x.pyc" not in zf.namelist()
+            assert zf.read("alpha/data.txt") == b"d" * 1000
+
+    def test_missing_record_raises(self, tmp_path):
+        """Test an installed distribution without RECORD is reported."""
+        store = DependencyStore(tmp_path / "store")
+        (tmp_path / "target").mkdir()
+
+        with pytest.raises(RuntimeError, match="no RECORD"):
+            store.add_from_target(tmp_path / "target", [Distribution("alpha", "1.0", "alpha==1.0")], PLATFORM, "3.11")
+
+    def test_publish_tolerates_concurrent_entry(self, tmp_path):
+        """Test publishing an already-stored distribution keeps the existing entry."""
+        target = tmp_path / "target"
+        install(target, "alpha", "1.0", {"alpha.py": "a"})
+        alpha = Distribution("alpha", "1.0", "alpha==1.0")
+        store = DependencyStore(tmp_path / "store")
+
+        store.add_from_target(target, [alpha], PLATFORM, "3.11")
+        store.add_from_target(target, [alpha], PLATFORM, "3.11")
+
+        partition = store.entry_dir(alpha, PLATFORM, "3.11").parent
+        assert [p.name for p in partition.iterdir()] == ["alpha-1.0"]
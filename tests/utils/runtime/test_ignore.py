@@ -0,0 +1,130 @@
+"""Tests for compiled dockerignore matching."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from bedrock_agentcore_starter_toolkit.utils.runtime.ignore import IgnoreMatcher, compile_ignore_patterns
+
+
+def touch(root, *paths):
+    """Create empty files below root."""
+    for path in paths:
+        target = root / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text("")
+
+
+class TestIgnoreMatcher:
+    """Test IgnoreMatcher functionality."""
+
+    @pytest.mark.parametrize(
+        "pattern,path,expected",
+        [
+            ("*.pyc", "a/b/c.pyc", True),
+            ("*.pyc", "a/b/c.py", False),
+            ("docs/*.md", "docs/readme.md", True),
+            ("docs/*.md", "docs/api/readme.md", False),
+            ("docs/*.md", "src/docs/readme.md", False),
+            ("/build", "build/out.txt", True),
+            ("/build", "src/build/out.txt", False),
+            ("build", "src/build/out.txt", True),
+            ("**/*.log", "a/b/app.log", True),
+            ("**/*.log", "app.log", True),
+            ("logs/**", "logs/2024/app.log", True),
+            ("a/**/b", "a/x/y/b", True),
+            ("a/**/b", "a/b", True),
+            ("file[0-9].txt", "file7.txt", True),
+            ("file[!0-9].txt", "file7.txt", False),
+            ("?.txt", "ab.txt", False),
+        ],
+    )
+    def test_pattern_semantics(self, pattern, path, expected):
+        """Test globbing, anchoring and ** behave as in .dockerignore."""
+        assert IgnoreMatcher([pattern]).is_ignored(path) is expected
+
+    def test_directory_only_patterns(self):
+        """Test a trailing slash only matches directories, and the files below them."""
+        matcher = IgnoreMatcher(["cache/"])
+
+        assert matcher.is_ignored("cache", is_dir=True)
+        assert matcher.is_ignored("cache/data.bin")
+        assert not matcher.is_ignored("cache")
+
+    def test_last_match_wins(self):
+        """Test later patterns override earlier ones in either direction."""
+        matcher = IgnoreMatcher(["*", "!*.py", "test.*", "!test.py", "# comment", ""])
+
+        assert not matcher.is_ignored("app.py")
+        assert matcher.is_ignored("test.txt")
+        assert not matcher.is_ignored("test.py")
+        assert matcher.is_ignored("README.md")
+
+    def test_negation_inside_ignored_directory(self):
+        """Test a negation re-includes a path below an ignored directory."""
+        matcher = IgnoreMatcher(["node_modules/", "!node_modules/important/"])
+
+        assert matcher.is_ignored("node_modules/lib/index.js")
+        assert not matcher.is_ignored("node_modules/important", is_dir=True)
+        assert not matcher.is_ignored("node_modules/important/index.js")
+
+    def test_compiled_matchers_are_reused(self):
+        """Test identical pattern lists share one compiled matcher."""
+        assert compile_ignore_patterns(["*.pyc"]) is compile_ignore_patterns(["*.pyc"])
+
+
+class TestWalk:
+    """Test IgnoreMatcher.walk functionality."""
+
+    @pytest.fixture
+    def project(self, tmp_path):
+        """Project with an installed node_modules tree and a virtualenv."""
+        touch(
+            tmp_path,
+            "agent.py",
+            "lib/util.py",
+            "lib/util.pyc",
+            "node_modules/left-pad/index.js",
+            "node_modules/important/keep.js",
+            ".venv/bin/python",
+        )
+        return tmp_path
+
+    def visited(self, matcher, root):
+        """Run walk and return (files, directories os.walk descended into)."""
+        descended = []
+        real_walk = os.walk
+
+        def tracking_walk(top, *args, **kwargs):
+            for current, dirs, files in real_walk(top, *args, **kwargs):
+                descended.append(os.path.relpath(current, root).replace(os.sep, "/"))
+                yield current, dirs, files
+
+        with patch("bedrock_agentcore_starter_toolkit.utils.runtime.ignore.os.walk", tracking_walk):
+            files = [rel for _, rel in matcher.walk(root)]
+        return files, descended
+
+    def test_prunes_ignored_directories(self, project):
+        """Test ignored directories are not walked when nothing below can be re-included."""
+        files, descended = self.visited(IgnoreMatcher(["node_modules", ".venv", "*.pyc"]), project)
+
+        assert files == ["agent.py", "lib/util.py"]
+        assert not any(path.startswith(("node_modules", ".venv")) for path in descended)
+
+    def test_descends_only_towards_negations(self, project):
+        """Test an anchored negation keeps only the directories leading to it walkable."""
+        files, descended = self.visited(IgnoreMatcher(["node_modules", ".venv", "!node_modules/important"]), project)
+
+        assert files == ["agent.py", "lib/util.py", "lib/util.pyc", "node_modules/important/keep.js"]
+        assert "node_modules" in descended
+        assert "node_modules/important" in descended
+        assert "node_modules/left-pad" not in descended
+        assert ".venv" not in descended
+
+    def test_unanchored_negation_disables_pruning(self, project):
+        """Test a negation that may match at any depth forces ignored directories to be walked."""
+        files, descended = self.visited(IgnoreMatcher(["node_modules", "!*.js"]), project)
+
+        assert "node_modules/left-pad/index.js" in files
+        assert "node_modules/left-pad" in descended
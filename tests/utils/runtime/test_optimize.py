@@ -0,0 +1,134 @@
+"""Tests for the package size optimizer."""
+
+import logging
+import os
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from bedrock_agentcore_starter_toolkit.utils.runtime.optimize import DEFAULT_RULES, PackageOptimizer
+
+
+def write(path, size=10, data=None):
+    """Create a file with the given size or content."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data if data is not None else b"x" * size)
+
+
+def elf_header(machine):
+    """Minimal little-endian ELF header for the given e_machine."""
+    return b"\x7fELF" + b"\x02\x01\x01" + b"\x00" * 11 + machine.to_bytes(2, "little") + b"\x00" * 100
+
+
+class TestPackageOptimizer:
+    """Test PackageOptimizer functionality."""
+
+    @pytest.fixture
+    def site_packages(self, tmp_path):
+        """Install target with something for every rule to remove."""
+        root = tmp_path / "package"
+        write(root / "pkg" / "__init__.py")
+        write(root / "pkg" / "core.py")
+        write(root / "pkg" / "tests" / "test_core.py", 100)
+        write(root / "pkg" / "core.pyi", 20)
+        write(root / "pkg" / "docs" / "index.rst", 30)
+        write(root / "pkg" / "doc" / "__init__.py")
+        write(root / "pkg" / "__pycache__" / "core.cpython-311.pyc", 40)
+        write(root / "pkg" / "locale" / "de" / "LC_MESSAGES" / "pkg.mo", 50)
+        write(root / "pkg" / "locale" / "en" / "LC_MESSAGES" / "pkg.mo", 50)
+        write(root / "tests" / "__init__.py")
+        write(root / "pkg-1.0.dist-info" / "RECORD")
+        return root
+
+    def test_removes_matching_paths_and_reports_per_rule(self, site_packages):
+        """Test each built-in rule removes its paths and is credited with the bytes."""
+        report = PackageOptimizer(rules=[rule for rule in DEFAULT_RULES if rule != "strip_debug"]).optimize(
+            site_packages
+        )
+
+        remaining = sorted(
+            os.path.relpath(os.path.join(dirpath, name), site_packages).replace(os.sep, "/")
+            for dirpath, _, files in os.walk(site_packages)
+            for name in files
+        )
+        assert remaining == [
+            "pkg-1.0.dist-info/RECORD",
+            "pkg/__init__.py",
+            "pkg/core.py",
+            "pkg/doc/__init__.py",
+            "pkg/locale/en/LC_MESSAGES/pkg.mo",
+            "tests/__init__.py",
+        ]
+        assert report.bytes_saved == {"tests": 100, "type_stubs": 20, "docs": 30, "bytecode": 40, "locale": 50}
+        assert report.total_bytes_saved == 240
+
+    def test_rules_are_configurable(self, site_packages):
+        """Test only selected rules run and custom patterns are credited separately."""
+        report = PackageOptimizer(rules=["type_stubs"], extra_patterns=["pkg/locale/"]).optimize(site_packages)
+
+        assert report.bytes_saved == {"type_stubs": 20, "custom": 100}
+        assert (site_packages / "pkg" / "tests").exists()
+        assert not (site_packages / "pkg" / "locale").exists()
+
+    def test_unknown_rule_rejected(self):
+        """Test unknown rules are rejected."""
+        with pytest.raises(ValueError, match="everything"):
+            PackageOptimizer(rules=["everything"])
+
+    def test_fingerprint_tracks_ruleset(self):
+        """Test the fingerprint changes with the ruleset but not rule order."""
+        assert PackageOptimizer(rules=["tests", "docs"]).fingerprint == PackageOptimizer(["docs", "tests"]).fingerprint
+        assert PackageOptimizer(rules=["tests"]).fingerprint != PackageOptimizer(rules=["docs"]).fingerprint
+
+    @patch("bedrock_agentcore_starter_toolkit.utils.runtime.optimize.shutil.which", return_value="/usr/bin/strip")
+    @patch("bedrock_agentcore_starter_toolkit.utils.runtime.optimize.subprocess.run")
+    def test_strips_only_target_architecture_libraries(self, mock_run, mock_which, tmp_path):
+        """Test debug symbols are stripped from aarch64 ELF libraries only."""
+        arm = tmp_path / "pkg" / "_arm.cpython-311-aarch64-linux-gnu.so"
+        x86 = tmp_path / "pkg" / "_x86.cpython-311-x86_64-linux-gnu.so"
+        text = tmp_path / "pkg" / "fake.so"
+        write(arm, data=elf_header(183) + b"\x00" * 1000)
+        write(x86, data=elf_header(62) + b"\x00" * 1000)
+        write(text, data=b"not an elf file")
+        os.chmod(arm, 0o755)
+
+        def fake_strip(cmd, **kwargs):
+            # strip --strip-debug -o <output> <library>
+            write(Path(cmd[3]), data=elf_header(183))
+            return Mock(returncode=0, stderr="")
+
+        mock_run.side_effect = fake_strip
+
+        report = PackageOptimizer(rules=["strip_debug"]).optimize(tmp_path, target_machine="aarch64")
+
+        assert mock_run.call_count == 1
+        assert mock_run.call_args[0][0][:2] == ["/usr/bin/strip", "--strip-debug"]
+        assert arm.read_bytes() == elf_header(183)
+        assert arm.stat().st_mode & 0o777 == 0o755
+        assert report.bytes_saved == {"strip_debug": 1000}
+
+    @patch("bedrock_agentcore_starter_toolkit.utils.runtime.optimize.shutil.which", return_value="/usr/bin/strip")
+    @patch("bedrock_agentcore_starter_toolkit.utils.runtime.optimize.subprocess.run")
+    def test_strip_failure_keeps_library(self, mock_run, mock_which, tmp_path):
+        """Test a library strip cannot handle is left untouched."""
+        library = tmp_path / "_native.so"
+        original = elf_header(183) + b"\x00" * 10
+        write(library, data=original)
+        mock_run.return_value = Mock(returncode=1, stderr="unsupported format")
+
+        report = PackageOptimizer(rules=["strip_debug"]).optimize(tmp_path)
+
+        assert library.read_bytes() == original
+        assert report.bytes_saved == {}
+
+    def test_log_summary(self, site_packages, caplog):
+        """Test the summary lists the savings of every rule."""
+        report = PackageOptimizer(rules=["tests", "docs"]).optimize(site_packages)
+
+        with caplog.at_level(logging.INFO):
+            report.log_summary()
+
+        assert "Package optimization saved" in caplog.text
+        assert "tests" in caplog.text
+        assert "docs" in caplog.text
@@ -1,10 +1,19 @@
 """Tests for code zip packaging with dependency caching."""
 
+import contextlib
 import hashlib
+import io
+import os
 import zipfile
+from pathlib import Path
 from unittest.mock import Mock, patch
 
-from bedrock_agentcore_starter_toolkit.utils.runtime.package import CodeZipPackager, PackageCache
+import pytest
+
+from bedrock_agentcore_starter_toolkit.utils.runtime.archive import deflate_file, hash_file
+from bedrock_agentcore_starter_toolkit.utils.runtime.bytecode import BytecodeLayer
+from bedrock_agentcore_starter_toolkit.utils.runtime.dependency_store import DependencyStore
+from bedrock_agentcore_starter_toolkit.utils.runtime.package import BytecodeLayers, CodeZipPackager, PackageCache
 
 
 class TestPackageCache:
@@ -246,7 +255,7 @@ class TestCodeZipPackager:
 
     @patch("subprocess.run")
     @patch("shutil.which")
-    def test_resolve_pyproject_with_uv(self, mock_which, mock_run, tmp_path):
+    def test_resolve_requirements_with_uv(self, mock_which, mock_run, tmp_path):
         """Test pyproject.toml resolution with uv."""
         mock_which.return_value = "/usr/local/bin/uv"
         mock_run.return_value = Mock(returncode=0)
@@ -258,12 +267,29 @@ class TestCodeZipPackager:
         output_dir.mkdir()
 
         packager = CodeZipPackager()
-        result = packager._resolve_pyproject_to_requirements(pyproject, output_dir)
+        result = packager._resolve_requirements(pyproject, output_dir)
 
         assert result == output_dir / "requirements.txt"
         mock_run.assert_called_once()
         assert "uv" in mock_run.call_args[0][0]
 
+    @patch("subprocess.run")
+    @patch("shutil.which")
+    def test_resolve_requirements_for_target_platform(self, mock_which, mock_run, tmp_path):
+        """Test cross-platform resolution pins the runtime's Python version and platform."""
+        mock_which.return_value = "/usr/local/bin/uv"
+        mock_run.return_value = Mock(returncode=0)
+
+        reqs = tmp_path / "requirements.txt"
+        reqs.write_text("requests\n")
+
+        CodeZipPackager()._resolve_requirements(reqs, tmp_path, python_version="3.11", cross=True)
+
+        cmd = mock_run.call_args[0][0]
+        assert cmd[cmd.index("--python-version") + 1] == "3.11"
+        assert cmd[cmd.index("--python-platform") + 1] == "aarch64-manylinux2014"
+        assert "--only-binary" in cmd
+
     @patch("subprocess.run")
     @patch("shutil.which")
     def test_install_dependencies_with_uv(self, mock_which, mock_run, tmp_path):
@@ -368,6 +394,334 @@ class TestCodeZipPackager:
             assert "agent.py" in names
             assert "utils/helper.py" in names
 
+    def test_build_direct_code_deploy_parallel_matches_serial(self, tmp_path):
+        """Test the archive layout does not depend on the number of workers."""
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        for i in range(20):
+            (source_dir / f"module_{i}.py").write_text(f"VALUE = {i}\n" * (i + 1) * 100)
+
+        CodeZipPackager(workers=1)._build_direct_code_deploy(source_dir, tmp_path / "serial.zip")
+        CodeZipPackager(workers=4)._build_direct_code_deploy(source_dir, tmp_path / "parallel.zip")
+
+        with zipfile.ZipFile(tmp_path / "serial.zip") as serial, zipfile.ZipFile(tmp_path / "parallel.zip") as parallel:
+            assert parallel.testzip() is None
+            assert serial.namelist() == parallel.namelist()
+            for name in serial.namelist():
+                assert serial.read(name) == parallel.read(name)
+
+    @staticmethod
+    def _fake_uv(packager, resolved, installs):
+        """Patch resolution and installation so the build runs without uv."""
+
+        def fake_install(requirements_file, target_dir, runtime_version, cross_compile, no_deps=False):
+            assert no_deps
+            installs.append(requirements_file.read_text())
+            for line in requirements_file.read_text().splitlines():
+                name, version = line.split("==")
+                (target_dir / f"{name}.py").write_text(f"{name} = '{version}'")
+                dist_info = target_dir / f"{name}-{version}.dist-info"
+                dist_info.mkdir()
+                (dist_info / "RECORD").write_text(f"{name}.py,,\n{dist_info.name}/RECORD,,\n")
+
+        stack = contextlib.ExitStack()
+        stack.enter_context(patch.object(packager, "_resolve_requirements", return_value=resolved))
+        stack.enter_context(patch.object(packager, "_install_dependencies", side_effect=fake_install))
+        stack.enter_context(patch.object(packager, "_should_cross_compile", return_value=True))
+        return stack
+
+    def test_build_dependencies_zip_installs_only_missing(self, tmp_path):
+        """Test distributions already in the dependency store are not reinstalled by another agent."""
+        packager = CodeZipPackager(workers=2, dependency_store=DependencyStore(tmp_path / "store"))
+        resolved = tmp_path / "resolved.txt"
+        resolved.write_text("alpha==1.0\nbeta==2.0\n")
+        first, second = PackageCache(tmp_path / "first"), PackageCache(tmp_path / "second")
+        installs = []
+
+        with self._fake_uv(packager, resolved, installs):
+            packager._build_dependencies_zip(tmp_path / "requirements.txt", first, "PYTHON_3_11")
+            resolved.write_text("alpha==1.0\nbeta==2.0\ngamma==3.0\n")
+            packager._build_dependencies_zip(tmp_path / "requirements.txt", second, "PYTHON_3_11")
+
+        assert installs == ["alpha==1.0\nbeta==2.0\n", "gamma==3.0\n"]
+        with zipfile.ZipFile(second.dependencies_zip) as zf:
+            assert zf.testzip() is None
+            assert zf.namelist() == sorted(zf.namelist())
+            assert zf.read("gamma.py") == b"gamma = '3.0'"
+            assert "alpha-1.0.dist-info/RECORD" in zf.namelist()
+
+    def test_build_dependencies_zip_is_incremental(self, tmp_path):
+        """Test only upgraded distributions are installed and removed ones are dropped."""
+        packager = CodeZipPackager(workers=2)
+        resolved = tmp_path / "resolved.txt"
+        resolved.write_text("alpha==1.0\nbeta==2.0\n")
+        cache = PackageCache(tmp_path / "cache")
+        installs = []
+
+        with self._fake_uv(packager, resolved, installs):
+            packager._build_dependencies_zip(tmp_path / "requirements.txt", cache, "PYTHON_3_11")
+            resolved.write_text("beta==2.1\ngamma==3.0\n")
+            packager._build_dependencies_zip(tmp_path / "requirements.txt", cache, "PYTHON_3_11")
+            built = cache.dependencies_zip.stat().st_mtime_ns
+            packager._build_dependencies_zip(tmp_path / "requirements.txt", cache, "PYTHON_3_11")
+
+        assert installs == ["alpha==1.0\nbeta==2.0\n", "beta==2.1\ngamma==3.0\n"]
+        assert cache.dependencies_zip.stat().st_mtime_ns == built
+        with zipfile.ZipFile(cache.dependencies_zip) as zf:
+            assert zf.testzip() is None
+            assert zf.namelist() == [
+                "beta-2.1.dist-info/RECORD",
+                "beta.py",
+                "gamma-3.0.dist-info/RECORD",
+                "gamma.py",
+            ]
+            assert zf.read("beta.py") == b"beta = '2.1'"
+        assert sorted(cache.load_dependencies_manifest("aarch64-manylinux2014", "3.11")) == ["beta-2.1", "gamma-3.0"]
+
+    def test_build_dependencies_zip_reuses_unchanged_entries(self, tmp_path):
+        """Test unchanged distributions are copied from the previous dependencies.zip."""
+        packager = CodeZipPackager()
+        resolved = tmp_path / "resolved.txt"
+        resolved.write_text("alpha==1.0\n")
+        cache = PackageCache(tmp_path / "cache")
+        installs = []
+
+        with self._fake_uv(packager, resolved, installs):
+            packager._build_dependencies_zip(tmp_path / "requirements.txt", cache, "PYTHON_3_11")
+            resolved.write_text("alpha==1.0\nbeta==2.0\n")
+            packager._build_dependencies_zip(tmp_path / "requirements.txt", cache, "PYTHON_3_11")
+            # A full rebuild ignores the previous archive
+            packager._build_dependencies_zip(tmp_path / "requirements.txt", cache, "PYTHON_3_11", incremental=False)
+
+        assert installs == ["alpha==1.0\n", "beta==2.0\n", "alpha==1.0\nbeta==2.0\n"]
+        with zipfile.ZipFile(cache.dependencies_zip) as zf:
+            assert zf.read("alpha.py") == b"alpha = '1.0'"
+
+    def test_build_dependencies_zip_applies_optimizer(self, tmp_path):
+        """Test new installs are optimized and cached apart from unoptimized ones."""
+        optimizer = Mock(fingerprint="abc123")
+        store = DependencyStore(tmp_path / "store")
+        packager = CodeZipPackager(dependency_store=store, optimizer=optimizer)
+        resolved = tmp_path / "resolved.txt"
+        resolved.write_text("alpha==1.0\n")
+        cache = PackageCache(tmp_path / "cache")
+
+        with self._fake_uv(packager, resolved, []):
+            packager._build_dependencies_zip(tmp_path / "requirements.txt", cache, "PYTHON_3_11")
+
+        optimizer.optimize.assert_called_once()
+        assert optimizer.optimize.call_args.kwargs == {"target_machine": "aarch64"}
+        assert (store.root / "v1" / "aarch64-manylinux2014-opt-abc123" / "py3.11" / "alpha-1.0").is_dir()
+        assert cache.load_dependencies_manifest("aarch64-manylinux2014-opt-abc123", "3.11")
+        assert not cache.load_dependencies_manifest("aarch64-manylinux2014", "3.11")
+
+    def test_invalid_workers_rejected(self):
+        """Test a non-positive worker count is rejected."""
+        with pytest.raises(ValueError, match="workers"):
+            CodeZipPackager(workers=0)
+
+    def test_build_direct_code_deploy_reuses_cached_entries(self, tmp_path):
+        """Test unchanged files are spliced from the source cache instead of recompressed."""
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        (source_dir / "agent.py").write_text("print('hello')")
+        (source_dir / "utils.py").write_text("def helper(): pass")
+
+        cache = PackageCache(tmp_path / "cache")
+        packager = CodeZipPackager()
+        packager._build_direct_code_deploy(source_dir, tmp_path / "first.zip", cache=cache)
+
+        assert cache.source_cache_zip.exists()
+        assert set(cache.load_source_manifest()) == {"agent.py", "utils.py"}
+
+        (source_dir / "agent.py").write_text("print('changed')")
+        packager._build_direct_code_deploy(source_dir, tmp_path / "second.zip", cache=cache)
+
+        with zipfile.ZipFile(tmp_path / "second.zip", "r") as zf:
+            assert zf.testzip() is None
+            assert zf.read("agent.py") == b"print('changed')"
+            assert zf.read("utils.py") == b"def helper(): pass"
+
+    def test_build_direct_code_deploy_only_compresses_changed_files(self, tmp_path):
+        """Test only new or modified files go through compression on a warm cache."""
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        (source_dir / "agent.py").write_text("print('hello')")
+        (source_dir / "utils.py").write_text("def helper(): pass")
+
+        cache = PackageCache(tmp_path / "cache")
+        packager = CodeZipPackager()
+        packager._build_direct_code_deploy(source_dir, tmp_path / "first.zip", cache=cache)
+
+        (source_dir / "agent.py").write_text("print('changed')")
+        (source_dir / "utils.py").rename(source_dir / "helpers.py")
+
+        with patch(
+            "bedrock_agentcore_starter_toolkit.utils.runtime.archive.deflate_file", side_effect=deflate_file
+        ) as mock_deflate:
+            packager._build_direct_code_deploy(source_dir, tmp_path / "second.zip", cache=cache)
+
+        # Renamed file is served by content hash; only the modified file is compressed
+        compressed = [call.args[0].name for call in mock_deflate.call_args_list]
+        assert compressed == ["agent.py"]
+
+        with zipfile.ZipFile(tmp_path / "second.zip", "r") as zf:
+            assert zf.testzip() is None
+            assert zf.read("helpers.py") == b"def helper(): pass"
+            assert "utils.py" not in zf.namelist()
+
+    def test_build_direct_code_deploy_skips_cache_artifacts(self, tmp_path):
+        """Test cache files are not packaged when the cache lives inside the source tree."""
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        (source_dir / "agent.py").write_text("print('hello')")
+
+        cache = PackageCache(source_dir)
+        cache.dependencies_zip.write_bytes(b"fake zip")
+        packager = CodeZipPackager()
+        packager._build_direct_code_deploy(source_dir, tmp_path / "first.zip", cache=cache)
+        packager._build_direct_code_deploy(source_dir, tmp_path / "second.zip", cache=cache)
+
+        with zipfile.ZipFile(tmp_path / "second.zip", "r") as zf:
+            assert zf.namelist() == ["agent.py"]
+
+    def test_load_source_manifest_ignores_corrupt_manifest(self, tmp_path):
+        """Test an unreadable manifest falls back to a cold build."""
+        cache = PackageCache(tmp_path)
+        cache.source_cache_zip.write_bytes(b"fake zip")
+        cache.source_manifest.write_text("{not json")
+
+        assert cache.load_source_manifest() == {}
+
+    def test_stream_deployment_package(self, tmp_path):
+        """Test the merged archive is uploaded without writing deployment.zip to disk."""
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        (source_dir / "agent.py").write_text("print('hello')")
+
+        s3_client = Mock()
+        session = Mock()
+        session.client.return_value = s3_client
+
+        packager = CodeZipPackager()
+        with patch.object(packager, "_merge_zips", wraps=packager._merge_zips) as mock_merge:
+            package = packager.stream_deployment_package(
+                source_dir=source_dir,
+                agent_name="test-agent",
+                cache_dir=tmp_path / "cache",
+                runtime_version="PYTHON_3_11",
+                session=session,
+                bucket="test-bucket",
+                s3_key="test-agent/deployment.zip",
+                account_id="123456789012",
+            )
+
+        assert package.s3_location == "s3://test-bucket/test-agent/deployment.zip"
+        assert package.has_otel_distro is False
+        assert package.uploaded is True
+        # Layers are merged once, straight into the upload
+        mock_merge.assert_called_once()
+        assert not isinstance(mock_merge.call_args.args[2], Path)
+
+        body = s3_client.put_object.call_args.kwargs["Body"]
+        assert s3_client.put_object.call_args.kwargs["Metadata"] == {"agentcore-sha256": package.digest}
+        with zipfile.ZipFile(io.BytesIO(body)) as zf:
+            assert zf.read("agent.py") == b"print('hello')"
+
+    def test_stream_deployment_package_skips_unchanged_upload(self, tmp_path):
+        """Test nothing is uploaded when S3 already holds a package with the same digest."""
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        (source_dir / "agent.py").write_text("print('hello')")
+
+        s3_client = Mock()
+        session = Mock()
+        session.client.return_value = s3_client
+        packager = CodeZipPackager()
+        kwargs = {
+            "source_dir": source_dir,
+            "agent_name": "test-agent",
+            "cache_dir": tmp_path / "cache",
+            "runtime_version": "PYTHON_3_11",
+            "session": session,
+            "bucket": "test-bucket",
+            "s3_key": "test-agent/deployment.zip",
+            "account_id": "123456789012",
+        }
+        first = packager.stream_deployment_package(**kwargs)
+
+        s3_client.reset_mock()
+        s3_client.head_object.return_value = {"Metadata": {"agentcore-sha256": first.digest}}
+        with patch.object(packager, "_merge_zips") as mock_merge:
+            second = packager.stream_deployment_package(**kwargs)
+
+        mock_merge.assert_not_called()
+        assert second.digest == first.digest
+        assert second.uploaded is False
+        s3_client.put_object.assert_not_called()
+        s3_client.create_multipart_upload.assert_not_called()
+
+    def test_package_key_follows_layers(self, tmp_path):
+        """Test the package key changes with code, dependencies or bytecode, and only then."""
+        cache = PackageCache(tmp_path / "cache")
+        code_zip = tmp_path / "code.zip"
+        with zipfile.ZipFile(code_zip, "w") as zf:
+            zf.writestr("agent.py", "print('hello')")
+        with zipfile.ZipFile(cache.dependencies_zip, "w") as zf:
+            zf.writestr("flask/__init__.py", "# flask")
+        cache.save_dependencies_manifest("host", "3.11", {"flask==3.0.0": ["flask/__init__.py"]})
+        packager = CodeZipPackager()
+
+        key = packager._package_key(cache, cache.dependencies_zip, code_zip)
+        assert packager._package_key(cache, cache.dependencies_zip, code_zip) == key
+        assert packager._package_key(cache, None, code_zip) != key
+
+        # Dependencies are keyed by their manifest, without reading dependencies.zip
+        with patch("bedrock_agentcore_starter_toolkit.utils.runtime.package.hash_file", wraps=hash_file) as mock_hash:
+            packager._package_key(cache, cache.dependencies_zip, code_zip)
+        assert cache.dependencies_zip not in [call.args[0] for call in mock_hash.call_args_list]
+
+        cache.save_dependencies_manifest("host", "3.11", {"flask==3.1.0": ["flask/__init__.py"]})
+        upgraded = packager._package_key(cache, cache.dependencies_zip, code_zip)
+        assert upgraded != key
+
+        with zipfile.ZipFile(code_zip, "w") as zf:
+            zf.writestr("agent.py", "print('changed')")
+        assert packager._package_key(cache, cache.dependencies_zip, code_zip) not in (key, upgraded)
+
+        source_bytecode = tmp_path / "code_bytecode.zip"
+        with zipfile.ZipFile(source_bytecode, "w") as zf:
+            zf.writestr("__pycache__/agent.cpython-311.pyc", b"pyc")
+        assert packager._package_key(
+            cache, cache.dependencies_zip, code_zip, BytecodeLayers(None, source_bytecode)
+        ) != packager._package_key(cache, cache.dependencies_zip, code_zip)
+
+    def test_deployment_package_is_deterministic(self, tmp_path):
+        """Test identical content gives identical bytes regardless of mtimes and umask."""
+        digests = []
+        for name, mtime, mode in (("a", 1_600_000_000, 0o600), ("b", 1_700_000_000, 0o664)):
+            source_dir = tmp_path / name
+            (source_dir / "pkg").mkdir(parents=True)
+            for rel in ("pkg/z.py", "agent.py", "pkg/a.py"):
+                path = source_dir / rel
+                path.write_text(f"# {rel}")
+                path.chmod(mode)
+                os.utime(path, (mtime, mtime))
+
+            code_zip = tmp_path / f"{name}.zip"
+            packager = CodeZipPackager()
+            packager._build_direct_code_deploy(source_dir, code_zip)
+            deployment_zip = tmp_path / f"{name}_deployment.zip"
+            packager._merge_zips(None, code_zip, deployment_zip)
+            digests.append(hashlib.sha256(deployment_zip.read_bytes()).hexdigest())
+
+            with zipfile.ZipFile(code_zip) as zf:
+                assert zf.namelist() == ["agent.py", "pkg/a.py", "pkg/z.py"]
+                assert {info.date_time for info in zf.infolist()} == {(1980, 1, 1, 0, 0, 0)}
+                assert {info.external_attr >> 16 & 0o777 for info in zf.infolist()} == {0o644}
+
+        assert digests[0] == digests[1]
+
     def test_merge_zips_with_dependencies(self, tmp_path):
         """Test merging dependencies and code zips."""
         # Create dependencies.zip
@@ -415,6 +769,122 @@ class TestCodeZipPackager:
             # User code should win
             assert "SETTING = 'user'" in content
 
+    def test_merge_zips_copies_compressed_entries(self, tmp_path):
+        """Test merged entries keep their compressed payloads and permissions."""
+        deps_zip = tmp_path / "dependencies.zip"
+        with zipfile.ZipFile(deps_zip, "w", zipfile.ZIP_DEFLATED) as zf:
+            info = zipfile.ZipInfo("bin/tool")
+            info.external_attr = 0o755 << 16
+            zf.writestr(info, "#!/bin/sh\n" * 100, compress_type=zipfile.ZIP_DEFLATED)
+            zf.writestr("data.bin", b"\x00" * 1000, compress_type=zipfile.ZIP_STORED)
+
+        direct_code_deploy = tmp_path / "code.zip"
+        with zipfile.ZipFile(direct_code_deploy, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("agent.py", "print('hello')")
+
+        output_zip = tmp_path / "deployment.zip"
+        CodeZipPackager()._merge_zips(deps_zip, direct_code_deploy, output_zip)
+
+        with zipfile.ZipFile(deps_zip) as src, zipfile.ZipFile(output_zip) as out:
+            assert out.testzip() is None
+            for name in ("bin/tool", "data.bin"):
+                assert out.getinfo(name).compress_size == src.getinfo(name).compress_size
+                assert out.getinfo(name).compress_type == src.getinfo(name).compress_type
+            assert out.getinfo("bin/tool").external_attr >> 16 & 0o777 == 0o755
+
+    def test_merge_zips_override_has_no_duplicates(self, tmp_path):
+        """Test overridden dependency files are dropped rather than duplicated."""
+        deps_zip = tmp_path / "dependencies.zip"
+        with zipfile.ZipFile(deps_zip, "w") as zf:
+            zf.writestr("config.py", "SETTING = 'dependency'")
+            zf.writestr("flask/__init__.py", "# flask")
+
+        direct_code_deploy = tmp_path / "code.zip"
+        with zipfile.ZipFile(direct_code_deploy, "w") as zf:
+            zf.writestr("config.py", "SETTING = 'user'")
+
+        output_zip = tmp_path / "deployment.zip"
+        CodeZipPackager()._merge_zips(deps_zip, direct_code_deploy, output_zip)
+
+        with zipfile.ZipFile(output_zip, "r") as zf:
+            assert sorted(zf.namelist()) == ["config.py", "flask/__init__.py"]
+
+    def test_merge_zips_drops_bytecode_for_overridden_modules(self, tmp_path):
+        """Test dependency bytecode is not shipped for modules user code overrides."""
+        deps_zip = tmp_path / "dependencies.zip"
+        with zipfile.ZipFile(deps_zip, "w") as zf:
+            zf.writestr("config.py", "SETTING = 'dependency'")
+            zf.writestr("flask/__init__.py", "# flask")
+        deps_bytecode = tmp_path / "deps_bytecode.zip"
+        with zipfile.ZipFile(deps_bytecode, "w") as zf:
+            zf.writestr("__pycache__/config.cpython-311.pyc", "dependency config")
+            zf.writestr("flask/__pycache__/__init__.cpython-311.pyc", "flask")
+
+        direct_code_deploy = tmp_path / "code.zip"
+        with zipfile.ZipFile(direct_code_deploy, "w") as zf:
+            zf.writestr("config.py", "SETTING = 'user'")
+            zf.writestr("agent.py", "import config")
+        source_bytecode = tmp_path / "code_bytecode.zip"
+        with zipfile.ZipFile(source_bytecode, "w") as zf:
+            zf.writestr("__pycache__/agent.cpython-311.pyc", "agent")
+
+        output_zip = tmp_path / "deployment.zip"
+        CodeZipPackager()._merge_zips(
+            deps_zip, direct_code_deploy, output_zip, bytecode=BytecodeLayers(deps_bytecode, source_bytecode)
+        )
+
+        with zipfile.ZipFile(output_zip, "r") as zf:
+            assert zf.namelist() == [
+                "__pycache__/agent.cpython-311.pyc",
+                "agent.py",
+                "config.py",
+                "flask/__init__.py",
+                "flask/__pycache__/__init__.cpython-311.pyc",
+            ]
+
+    def test_precompile_caches_dependency_bytecode(self, tmp_path):
+        """Test dependency bytecode is compiled once per dependencies.zip."""
+        cache = PackageCache(tmp_path / "cache")
+        with zipfile.ZipFile(cache.dependencies_zip, "w") as zf:
+            zf.writestr("dep/__init__.py", "VALUE = 1\n")
+        code_zip = tmp_path / "code.zip"
+        with zipfile.ZipFile(code_zip, "w") as zf:
+            zf.writestr("agent.py", "import dep\n")
+
+        def fake_build(archive, output_zip, interpreter, workers=1):
+            with zipfile.ZipFile(output_zip, "w"):
+                pass
+            return BytecodeLayer(output_zip, modules=1, compile_seconds=0.5)
+
+        packager = CodeZipPackager(precompile=True)
+        with (
+            patch("bedrock_agentcore_starter_toolkit.utils.runtime.package.find_interpreter", return_value="python"),
+            patch(
+                "bedrock_agentcore_starter_toolkit.utils.runtime.package.build_bytecode_layer", side_effect=fake_build
+            ) as mock_build,
+        ):
+            first = packager._build_bytecode_layers(cache, cache.dependencies_zip, code_zip, "PYTHON_3_11", tmp_path)
+            packager._build_bytecode_layers(cache, cache.dependencies_zip, code_zip, "PYTHON_3_11", tmp_path)
+            packager._build_bytecode_layers(cache, cache.dependencies_zip, code_zip, "PYTHON_3_12", tmp_path)
+
+        # dependencies + source, source only, then dependencies + source for the new runtime
+        assert [call.args[0] for call in mock_build.call_args_list] == [
+            cache.dependencies_zip,
+            code_zip,
+            code_zip,
+            cache.dependencies_zip,
+            code_zip,
+        ]
+        assert first.dependencies == cache.dependencies_bytecode_zip
+
+    @patch("bedrock_agentcore_starter_toolkit.utils.runtime.package.find_interpreter", return_value=None)
+    def test_precompile_skipped_without_interpreter(self, mock_find, tmp_path, caplog):
+        """Test packaging continues without bytecode when no matching interpreter exists."""
+        packager = CodeZipPackager(precompile=True)
+
+        assert packager._build_bytecode_layers(PackageCache(tmp_path), None, tmp_path, "PYTHON_3_99", tmp_path) is None
+        assert "skipping bytecode precompilation" in caplog.text
+
     def test_merge_zips_without_dependencies(self, tmp_path):
         """Test merging with no dependencies."""
         direct_code_deploy = tmp_path / "code.zip"
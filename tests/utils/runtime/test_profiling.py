@@ -0,0 +1,58 @@
+"""Tests for launch step profiling."""
+
+import pytest
+
+from bedrock_agentcore_starter_toolkit.utils.runtime.profiling import profile_launch, record_phases, timed_step
+from bedrock_agentcore_starter_toolkit.utils.runtime.step_graph import StepGraph
+
+
+class TestProfiling:
+    """Test profile_launch, timed_step and record_phases."""
+
+    def test_nested_and_concurrent_steps(self):
+        """Test steps are named by nesting, including steps run on StepGraph worker threads."""
+        with profile_launch() as profiler:
+            with timed_step("build"):
+                graph = StepGraph()
+                graph.add("ecr", lambda: None)
+                graph.add("project", lambda: None, depends_on=["ecr"])
+                graph.run()
+            with timed_step("deploy"):
+                pass
+
+        steps = {step.name: step for step in profiler.steps}
+        assert set(steps) == {"build", "build/ecr", "build/project", "deploy"}
+        assert [step.name for step in profiler.steps][0] == "build"
+        assert steps["build"].start <= steps["build/ecr"].start <= steps["build/project"].start
+        assert steps["build/project"].end <= steps["build"].end <= steps["deploy"].start
+        assert profiler.total_seconds >= steps["deploy"].end
+
+    def test_failed_step_is_recorded(self):
+        """Test a step that raises is recorded as failed and the error propagates."""
+        with profile_launch() as profiler:
+            with pytest.raises(RuntimeError, match="boom"):
+                with timed_step("memory"):
+                    raise RuntimeError("boom")
+
+        assert [(step.name, step.failed) for step in profiler.steps] == [("memory", True)]
+
+    def test_record_phases(self):
+        """Test externally timed phases are nested under the current step and laid out back to back."""
+        with profile_launch() as profiler:
+            with timed_step("codebuild"):
+                record_phases({"PROVISIONING": 2.0, "BUILD": 3.0})
+
+        steps = {step.name: step for step in profiler.steps}
+        assert steps["codebuild/PROVISIONING"].duration == pytest.approx(2.0)
+        assert steps["codebuild/BUILD"].start == pytest.approx(steps["codebuild/PROVISIONING"].end)
+        assert steps["codebuild/BUILD"].duration == pytest.approx(3.0)
+
+    def test_noop_outside_profiled_launch(self):
+        """Test timing calls outside of profile_launch do not record into a later profile."""
+        with timed_step("orphan"):
+            record_phases({"BUILD": 1.0})
+
+        with profile_launch() as profiler:
+            pass
+
+        assert profiler.steps == []
@@ -11,6 +11,7 @@ from bedrock_agentcore_starter_toolkit.utils.runtime.schema import (
     NetworkConfiguration,
     NetworkModeConfig,
     ObservabilityConfig,
+    PackageOptimizationConfig,
     ProtocolConfiguration,
 )
 
@@ -130,6 +131,26 @@ class TestAWSConfig:
         assert config.account is None
 
 
+class TestPackageOptimizationConfig:
+    """Test PackageOptimizationConfig schema validation."""
+
+    def test_defaults_disabled_with_all_rules(self):
+        """Test optimization is opt-in and applies every rule when none are listed."""
+        config = PackageOptimizationConfig()
+
+        assert config.enabled is False
+        assert config.rules is None
+        assert config.exclude_patterns == []
+
+    def test_unknown_rule_rejected(self):
+        """Test unknown rule names are rejected with the available rules."""
+        with pytest.raises(ValidationError) as exc_info:
+            PackageOptimizationConfig(enabled=True, rules=["tests", "everything"])
+
+        assert "everything" in str(exc_info.value)
+        assert "strip_debug" in str(exc_info.value)
+
+
 class TestBedrockAgentCoreAgentSchema:
     """Test BedrockAgentCoreAgentSchema validation."""
 
@@ -0,0 +1,132 @@
+"""Tests for incremental Server-Sent Events parsing."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from bedrock_agentcore_starter_toolkit.utils.runtime.sse import (
+    STREAM_CHUNK_SIZE,
+    SSEEvent,
+    SSEParser,
+    iter_sse_events,
+    iter_stream_chunks,
+)
+
+
+def parse(chunks):
+    """Feed chunks to a new parser and collect every event."""
+    parser = SSEParser()
+    events = []
+    for chunk in chunks:
+        events.extend(parser.feed(chunk))
+    events.extend(parser.close())
+    return events
+
+
+def split_every(data, size):
+    """Split bytes into chunks of a fixed size."""
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+class TestSSEParser:
+    """Test the incremental parser."""
+
+    STREAM = 'data: "Hello"\n\ndata: "wörld ✓"\n\nevent: done\ndata: {"n": 1}\n\n'.encode()
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 1024])
+    def test_chunk_boundaries_do_not_matter(self, size):
+        """Test lines and UTF-8 sequences split across chunks are reassembled."""
+        assert parse(split_every(self.STREAM, size)) == [
+            SSEEvent(data='"Hello"'),
+            SSEEvent(data='"wörld ✓"'),
+            SSEEvent(data='{"n": 1}', event="done"),
+        ]
+
+    def test_events_are_returned_as_soon_as_complete(self):
+        """Test each event is returned by the chunk that completes it."""
+        parser = SSEParser()
+        assert parser.feed(b'data: "a"\n') == []
+        assert parser.feed(b'\ndata: "b"') == [SSEEvent(data='"a"')]
+        assert parser.feed(b"\n\n") == [SSEEvent(data='"b"')]
+        assert parser.close() == []
+
+    @pytest.mark.parametrize("newline", [b"\r\n", b"\r", b"\n"])
+    def test_line_endings(self, newline):
+        """Test CRLF, CR and LF line endings, including a CRLF split across chunks."""
+        stream = b"data: one" + newline + newline + b"data: two" + newline + newline
+        expected = [SSEEvent(data="one"), SSEEvent(data="two")]
+        assert parse([stream]) == expected
+        assert parse(split_every(stream, 1)) == expected
+        assert parse([stream[:10], stream[10:]]) == expected
+
+    def test_multiline_data_and_comments(self):
+        """Test data lines of an event are joined with newlines and comments are skipped."""
+        stream = b": keep-alive\ndata: first\n: note\ndata:second\ndata\n\n"
+        assert parse([stream]) == [SSEEvent(data="first\nsecond\n")]
+
+    def test_id_and_retry(self):
+        """Test the last event ID persists across events and retry applies to its own event."""
+        stream = b"id: 7\nretry: 3000\ndata: a\n\ndata: b\n\nid: 8\nretry: soon\ndata: c\n\n"
+        assert parse([stream]) == [
+            SSEEvent(data="a", id="7", retry=3000),
+            SSEEvent(data="b", id="7"),
+            SSEEvent(data="c", id="8"),
+        ]
+
+    def test_events_without_data_are_not_dispatched(self):
+        """Test an event with no data lines is dropped."""
+        assert parse([b"event: ping\n\n\n\ndata: x\n\n"]) == [SSEEvent(data="x")]
+
+    def test_trailing_event_is_dispatched_on_close(self):
+        """Test an event the stream ends without a blank line after is still returned."""
+        assert parse([b'data: "a"\n\ndata: "last"']) == [SSEEvent(data='"a"'), SSEEvent(data='"last"')]
+
+    def test_leading_bom_is_stripped(self):
+        """Test a byte order mark starting the stream is ignored, even when split."""
+        stream = "\ufeffdata: x\n\n".encode()
+        assert parse(split_every(stream, 1)) == [SSEEvent(data="x")]
+
+
+class TestIterSSEEvents:
+    """Test reading events from streaming bodies."""
+
+    def test_requests_response(self):
+        """Test a requests response is read in the chunks it arrives in."""
+        response = Mock(spec=["iter_content"])
+        response.iter_content.return_value = iter([b"data: a\n", b"", b"\ndata: b\n\n"])
+
+        assert list(iter_sse_events(response)) == [SSEEvent(data="a"), SSEEvent(data="b")]
+        response.iter_content.assert_called_once_with(chunk_size=None)
+
+    def test_botocore_streaming_body(self):
+        """Test a botocore body is streamed from its urllib3 response."""
+        body = Mock(spec=["_raw_stream", "iter_chunks"])
+        body._raw_stream.stream.return_value = iter([b"data: a\n\n"])
+
+        assert list(iter_sse_events(body, chunk_size=512)) == [SSEEvent(data="a")]
+        body._raw_stream.stream.assert_called_once_with(512)
+        body.iter_chunks.assert_not_called()
+
+    def test_generic_streaming_body(self):
+        """Test bodies without a raw stream fall back to iter_chunks."""
+        body = Mock(spec=["iter_chunks"])
+        body.iter_chunks.return_value = iter([b"data: a\n\n"])
+
+        assert list(iter_stream_chunks(body)) == [b"data: a\n\n"]
+        body.iter_chunks.assert_called_once_with(STREAM_CHUNK_SIZE)
+
+    def test_events_are_parsed_lazily(self):
+        """Test an event is yielded before the rest of the body has been read."""
+        reads = []
+
+        def chunks():
+            for chunk in (b"data: a\n\n", b"data: b\n\n"):
+                reads.append(chunk)
+                yield chunk
+
+        response = Mock(spec=["iter_content"])
+        response.iter_content.return_value = chunks()
+        events = iter_sse_events(response)
+
+        assert next(events) == SSEEvent(data="a")
+        assert len(reads) == 1
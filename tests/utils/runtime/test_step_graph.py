@@ -0,0 +1,69 @@
+"""Tests for the launch step graph."""
+
+import threading
+import time
+
+import pytest
+
+from bedrock_agentcore_starter_toolkit.utils.runtime.step_graph import StepGraph
+
+
+class TestStepGraph:
+    """Test StepGraph functionality."""
+
+    def test_independent_steps_overlap(self):
+        """Test steps without dependencies between them run at the same time."""
+        barrier = threading.Barrier(3, timeout=5)
+        graph = StepGraph()
+        for name in ("ecr", "role", "memory"):
+            graph.add(name, lambda name=name: (barrier.wait(), name)[1])
+
+        assert graph.run() == {"ecr": "ecr", "role": "role", "memory": "memory"}
+
+    def test_dependencies_run_first_and_share_results(self):
+        """Test a step starts after its dependencies and can read their results."""
+        events = []
+        graph = StepGraph()
+
+        def bucket():
+            time.sleep(0.05)
+            events.append("bucket done")
+            return "bucket-name"
+
+        def location():
+            events.append("location started")
+            return f"s3://{graph.results['bucket']}/agent.zip"
+
+        graph.add("bucket", bucket)
+        graph.add("location", location, depends_on=["bucket"])
+
+        results = graph.run()
+
+        assert results["location"] == "s3://bucket-name/agent.zip"
+        assert events == ["bucket done", "location started"]
+
+    def test_failure_stops_dependents_and_is_reraised(self):
+        """Test the original exception is raised and steps depending on the failed one never run."""
+        ran = []
+        graph = StepGraph()
+
+        def fail():
+            raise RuntimeError("role creation failed")
+
+        graph.add("role", fail)
+        graph.add("memory", lambda: ran.append("memory"))
+        graph.add("deploy", lambda: ran.append("deploy"), depends_on=["role", "memory"])
+
+        with pytest.raises(RuntimeError, match="role creation failed"):
+            graph.run()
+        assert "deploy" not in ran
+
+    def test_invalid_steps(self):
+        """Test unknown dependencies and duplicate names are rejected when added."""
+        graph = StepGraph()
+        graph.add("build", lambda: None)
+
+        with pytest.raises(ValueError, match="depends on unknown steps: upload"):
+            graph.add("deploy", lambda: None, depends_on=["upload"])
+        with pytest.raises(ValueError, match="Duplicate step: build"):
+            graph.add("build", lambda: None)
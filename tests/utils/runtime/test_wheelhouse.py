@@ -0,0 +1,197 @@
+"""Tests for prebuilt wheelhouse generation."""
+
+import json
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from bedrock_agentcore_starter_toolkit.utils.runtime.wheelhouse import (
+    WHEELHOUSE_LOCK,
+    WHEELHOUSE_MANIFEST,
+    WHEELHOUSE_PIP_PLATFORM,
+    WHEELHOUSE_UV_PLATFORM,
+    build_wheelhouse,
+    load_wheelhouse,
+    wheelhouse_lock_hash,
+)
+
+MODULE = "bedrock_agentcore_starter_toolkit.utils.runtime.wheelhouse"
+
+
+class FakeTools:
+    """Stand-in for uv and pip: resolves to a fixed lock and "downloads" files for its pins."""
+
+    def __init__(self, lock, downloads, content="downloaded", built=None):
+        self.lock = lock
+        self.downloads = downloads
+        self.built = built or {}
+        self.content = content
+        self.calls = []
+
+    def __call__(self, cmd, **kwargs):
+        self.calls.append(cmd)
+        if cmd[:3] == ["uv", "pip", "compile"]:
+            output = cmd[cmd.index("--output-file") + 1]
+            with open(output, "w") as f:
+                f.write(self.lock)
+        elif "download" in cmd:
+            dest = cmd[cmd.index("--dest") + 1]
+            for name in self.downloads:
+                path = f"{dest}/{name}"
+                try:
+                    open(path, "x").write(self.content)
+                except FileExistsError:
+                    pass
+        elif "wheel" in cmd:
+            wheel_dir = cmd[cmd.index("--wheel-dir") + 1]
+            sdist = cmd[-1].rsplit("/", 1)[-1]
+            open(f"{wheel_dir}/{self.built[sdist]}", "w").write(sdist)
+        return subprocess.CompletedProcess(cmd, 0, "", "")
+
+    def count(self, verb):
+        return sum(1 for cmd in self.calls if verb in cmd)
+
+
+@pytest.fixture
+def requirements(tmp_path):
+    """A requirements file of an agent."""
+    path = tmp_path / "requirements.txt"
+    path.write_text("requests\n")
+    return path
+
+
+@pytest.fixture(autouse=True)
+def uv_available():
+    """Pretend uv is installed."""
+    with patch(f"{MODULE}.shutil.which", return_value="/usr/bin/uv"):
+        yield
+
+
+class TestBuildWheelhouse:
+    """Test building and refreshing a wheelhouse."""
+
+    def test_builds_wheelhouse_for_lock(self, tmp_path, requirements):
+        """Test the lock is resolved for ARM64 and its wheels are collected with a manifest."""
+        lock = "certifi==2024.2.2\nrequests==2.31.0\n"
+        tools = FakeTools(lock, ["certifi-2024.2.2-py3-none-any.whl", "requests-2.31.0-py3-none-any.whl"])
+
+        with patch(f"{MODULE}.subprocess.run", side_effect=tools):
+            wheelhouse = build_wheelhouse(requirements, tmp_path / "wheelhouse", "3.11")
+
+        assert wheelhouse.rebuilt
+        assert wheelhouse.wheels == ["certifi-2024.2.2-py3-none-any.whl", "requests-2.31.0-py3-none-any.whl"]
+        assert wheelhouse.lock_file.read_text() == lock
+        assert wheelhouse.lock_hash == wheelhouse_lock_hash(lock, "3.11")
+        assert all((tmp_path / "wheelhouse" / wheel).exists() for wheel in wheelhouse.wheels)
+
+        compile_cmd = tools.calls[0]
+        assert compile_cmd[compile_cmd.index("--python-platform") + 1] == WHEELHOUSE_UV_PLATFORM
+        download_cmd = next(cmd for cmd in tools.calls if "download" in cmd)
+        assert download_cmd[download_cmd.index("--platform") + 1] == WHEELHOUSE_PIP_PLATFORM
+        assert download_cmd[download_cmd.index("--python-version") + 1] == "3.11"
+
+    def test_up_to_date_wheelhouse_is_reused(self, tmp_path, requirements):
+        """Test nothing is downloaded when the lock and Python version are unchanged."""
+        tools = FakeTools("requests==2.31.0\n", ["requests-2.31.0-py3-none-any.whl"])
+
+        with patch(f"{MODULE}.subprocess.run", side_effect=tools):
+            build_wheelhouse(requirements, tmp_path / "wheelhouse", "3.11")
+            second = build_wheelhouse(requirements, tmp_path / "wheelhouse", "3.11")
+            assert tools.count("download") == 1
+            assert not second.rebuilt
+
+            # Another Python version is another key
+            build_wheelhouse(requirements, tmp_path / "wheelhouse", "3.12")
+            assert tools.count("download") == 2
+
+            build_wheelhouse(requirements, tmp_path / "wheelhouse", "3.12", force=True)
+            assert tools.count("download") == 3
+
+    def test_changed_lock_drops_stale_wheels(self, tmp_path, requirements):
+        """Test wheels of the previous lock that are no longer pinned are removed."""
+        wheelhouse_dir = tmp_path / "wheelhouse"
+        idna = "idna-3.6-py3-none-any.whl"
+        first = FakeTools("requests==2.31.0\nidna==3.6\n", ["requests-2.31.0-py3-none-any.whl", idna], "first")
+        second = FakeTools("requests==2.32.0\nidna==3.6\n", ["requests-2.32.0-py3-none-any.whl", idna], "second")
+
+        with patch(f"{MODULE}.subprocess.run", side_effect=first):
+            build_wheelhouse(requirements, wheelhouse_dir, "3.11")
+        with patch(f"{MODULE}.subprocess.run", side_effect=second):
+            wheelhouse = build_wheelhouse(requirements, wheelhouse_dir, "3.11")
+
+        assert sorted(p.name for p in wheelhouse_dir.glob("*.whl")) == wheelhouse.wheels
+        assert "requests-2.31.0-py3-none-any.whl" not in wheelhouse.wheels
+        # The shared wheel was kept from the previous wheelhouse, not downloaded again
+        assert (wheelhouse_dir / idna).read_text() == "first"
+        assert (wheelhouse_dir / "requests-2.32.0-py3-none-any.whl").read_text() == "second"
+
+    def test_pure_python_sdist_is_built(self, tmp_path, requirements):
+        """Test an sdist-only distribution is built into a pure-Python wheel."""
+        tools = FakeTools("tiny==1.0\n", ["tiny-1.0.tar.gz"], built={"tiny-1.0.tar.gz": "tiny-1.0-py3-none-any.whl"})
+
+        with patch(f"{MODULE}.subprocess.run", side_effect=tools):
+            wheelhouse = build_wheelhouse(requirements, tmp_path / "wheelhouse", "3.11")
+
+        assert wheelhouse.wheels == ["tiny-1.0-py3-none-any.whl"]
+        assert not list((tmp_path / "wheelhouse").glob("*.tar.gz"))
+
+    def test_native_sdist_fails_off_target(self, tmp_path, requirements):
+        """Test an sdist that builds a host-specific wheel is rejected off Linux ARM64."""
+        tools = FakeTools(
+            "native==1.0\n",
+            ["native-1.0.tar.gz"],
+            built={"native-1.0.tar.gz": "native-1.0-cp311-cp311-linux_x86_64.whl"},
+        )
+
+        with (
+            patch(f"{MODULE}.subprocess.run", side_effect=tools),
+            patch(f"{MODULE}._host_matches_target", return_value=False),
+            pytest.raises(RuntimeError, match="native-1.0.tar.gz"),
+        ):
+            build_wheelhouse(requirements, tmp_path / "wheelhouse", "3.11")
+
+        assert load_wheelhouse(tmp_path / "wheelhouse") is None
+
+    def test_extra_requirements_are_resolved(self, tmp_path, requirements):
+        """Test extra requirements are passed to the resolver alongside the dependency file."""
+        tools = FakeTools("requests==2.31.0\n", ["requests-2.31.0-py3-none-any.whl"])
+
+        with patch(f"{MODULE}.subprocess.run", side_effect=tools):
+            build_wheelhouse(requirements, tmp_path / "wheelhouse", "3.11", extra_requirements=["otel>=1"])
+
+        compile_cmd = tools.calls[0]
+        assert str(requirements) in compile_cmd
+        assert any(arg.endswith("extra-requirements.txt") for arg in compile_cmd)
+
+    def test_resolution_failure(self, tmp_path, requirements):
+        """Test a failed resolution is reported with uv's error."""
+        error = subprocess.CalledProcessError(1, "uv", stderr="no solution")
+        with (
+            patch(f"{MODULE}.subprocess.run", side_effect=error),
+            pytest.raises(RuntimeError, match="no solution"),
+        ):
+            build_wheelhouse(requirements, tmp_path / "wheelhouse", "3.11")
+
+    def test_requires_uv(self, tmp_path, requirements):
+        """Test a missing uv is reported."""
+        with (
+            patch(f"{MODULE}.shutil.which", return_value=None),
+            pytest.raises(RuntimeError, match="uv is required"),
+        ):
+            build_wheelhouse(requirements, tmp_path / "wheelhouse", "3.11")
+
+
+class TestLoadWheelhouse:
+    """Test loading a wheelhouse from disk."""
+
+    def test_incomplete_wheelhouse_is_ignored(self, tmp_path):
+        """Test a manifest listing a missing wheel does not count as a wheelhouse."""
+        (tmp_path / WHEELHOUSE_LOCK).write_text("requests==2.31.0\n")
+        (tmp_path / WHEELHOUSE_MANIFEST).write_text(
+            json.dumps({"version": 1, "lock_hash": "x", "wheels": ["requests-2.31.0-py3-none-any.whl"]})
+        )
+        assert load_wheelhouse(tmp_path) is None
+
+        (tmp_path / "requests-2.31.0-py3-none-any.whl").write_text("")
+        assert load_wheelhouse(tmp_path).lock_hash == "x"